@@ -10,7 +10,16 @@ from pandas import DataFrame, Series
 from datetime import datetime
 from freqtrade.strategy import merge_informative_pair, DecimalParameter, IntParameter, stoploss_from_open
 from functools import reduce
-from technical.indicators import RMI, zema, VIDYA
+from technical.indicators import RMI
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils import indicators
+from strategy_utils.pmax import pmax
+from strategy_utils.indicators import (
+    chaikin_money_flow, moderi, range_percent_change, top_percent_change, williams_r
+)
 
 
 # --------------------------------
@@ -19,88 +28,8 @@ def ha_typical_price(bars):
     return Series(index=bars.index, data=res)
 
 
-# Volume Weighted Moving Average
-def vwma(dataframe: DataFrame, length: int = 10):
-    """Indicator: Volume Weighted Moving Average (VWMA)"""
-    # Calculate Result
-    pv = dataframe['close'] * dataframe['volume']
-    vwma = Series(ta.SMA(pv, timeperiod=length) / ta.SMA(dataframe['volume'], timeperiod=length))
-    return vwma
-
-
-# Modified Elder Ray Index
-def moderi(dataframe: DataFrame, len_slow_ma: int = 32) -> Series:
-    slow_ma = Series(ta.EMA(vwma(dataframe, length=len_slow_ma), timeperiod=len_slow_ma))
-    return slow_ma >= slow_ma.shift(1)  # we just need true & false for ERI trend
-
-
 def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['low'] * 100
-    return emadif
-
-
-def range_percent_change(dataframe: DataFrame, method, length: int) -> float:
-    """
-    Rolling Percentage Change Maximum across interval.
-
-    :param dataframe: DataFrame The original OHLC dataframe
-    :param method: High to Low / Open to Close
-    :param length: int The length to look back
-    """
-    if method == 'HL':
-        return (dataframe['high'].rolling(length).max() - dataframe['low'].rolling(length).min()) / dataframe[
-            'low'].rolling(length).min()
-    elif method == 'OC':
-        return (dataframe['open'].rolling(length).max() - dataframe['close'].rolling(length).min()) / dataframe[
-            'close'].rolling(length).min()
-    else:
-        raise ValueError(f"Method {method} not defined!")
-
-
-# Williams %R
-def williams_r(dataframe: DataFrame, period: int = 14) -> Series:
-    """Williams %R, or just %R, is a technical analysis oscillator showing the current closing price in relation to the
-       high and low of the past N days (for a given N). It was developed by a publisher and promoter of trading
-       materials, Larry Williams.Its purpose is to tell whether a stock or commodity market is trading near the high or
-       the low, or somewhere in between,of its recent trading range.The oscillator is on a negative scale, from
-       âˆ’100 (lowest) up to 0 (highest).
-    """
-
-    highest_high = dataframe["high"].rolling(center=False, window=period).max()
-    lowest_low = dataframe["low"].rolling(center=False, window=period).min()
-
-    wr = Series(
-        (highest_high - dataframe["close"]) / (highest_high - lowest_low),
-        name=f"{period} Williams %R",
-        )
-
-    return wr * -100
-
-
-# Chaikin Money Flow
-def chaikin_money_flow(dataframe, n=20, fillna=False) -> Series:
-    """Chaikin Money Flow (CMF)
-    It measures the amount of Money Flow Volume over a specific period.
-    http://stockcharts.com/school/doku.php?id=chart_school:technical_indicators:chaikin_money_flow_cmf
-    Args:
-        dataframe(pandas.Dataframe): dataframe containing ohlcv
-        n(int): n period.
-        fillna(bool): if fill nan values.
-    Returns:
-        pandas.Series: New feature generated.
-    """
-    mfv = ((dataframe['close'] - dataframe['low']) - (dataframe['high'] - dataframe['close'])) / (
-                dataframe['high'] - dataframe['low'])
-    mfv = mfv.fillna(0.0)  # float division by zero
-    mfv *= dataframe['volume']
-    cmf = (mfv.rolling(n, min_periods=0).sum()
-           / dataframe['volume'].rolling(n, min_periods=0).sum())
-    if fillna:
-        cmf = cmf.replace([np.inf, -np.inf], np.nan).fillna(0)
-    return Series(cmf, name='cmf')
+    return indicators.EWO(dataframe, ema_length, ema2_length, base='low')
 
 
 def vmap_b(dataframe, window_size=20, num_of_std=1):
@@ -112,19 +41,6 @@ def vmap_b(dataframe, window_size=20, num_of_std=1):
     return df['vwap_low'], df['vwap'], df['vwap_high']
 
 
-def top_percent_change(dataframe: DataFrame, length: int) -> float:
-    """
-    Percentage change of the current close from the range maximum Open price
-
-    :param dataframe: DataFrame The original OHLC dataframe
-    :param length: int The length to look back
-    """
-    if length == 0:
-        return (dataframe['open'] - dataframe['close']) / dataframe['close']
-    else:
-        return (dataframe['open'].rolling(length).max() - dataframe['close']) / dataframe['close']
-
-
 class BBMod1(IStrategy):
     """
         BBMod1 modified from BB_RPB_TSL ( https://github.com/jilv220/BB_RPB_TSL )
@@ -701,7 +617,7 @@ class BBMod1(IStrategy):
         dataframe['adx'] = ta.ADX(dataframe)
 
         # Profit Maximizer - PMAX
-        dataframe['pm'], dataframe['pmx'] = pmax(heikinashi, ma_type=1, length=9, multiplier=27, period=10, src=3)
+        dataframe['pm'], dataframe['pmx'] = pmax(heikinashi, MAtype=1, length=9, multiplier=27, period=10, src=3)
         dataframe['source'] = (dataframe['high'] + dataframe['low'] + dataframe['open'] + dataframe['close'])/4
         dataframe['pmax_thresh'] = ta.EMA(dataframe['source'], timeperiod=9)
 
@@ -1052,85 +968,6 @@ class BBMod1(IStrategy):
         return dataframe
 
 
-# PMAX
-def pmax(df, period, multiplier, length, ma_type, src):
-
-    period = int(period)
-    multiplier = int(multiplier)
-    length = int(length)
-    ma_type = int(ma_type)
-    src = int(src)
-
-    mavalue = f'MA_{ma_type}_{length}'
-    atr = f'ATR_{period}'
-
-    if src == 1:
-        masrc = df["close"]
-    elif src == 2:
-        masrc = (df["high"] + df["low"]) / 2
-    elif src == 3:
-        masrc = (df["high"] + df["low"] + df["close"] + df["open"]) / 4
-
-    if ma_type == 1:
-        mavalue = ta.EMA(masrc, timeperiod=length)
-    elif ma_type == 2:
-        mavalue = ta.DEMA(masrc, timeperiod=length)
-    elif ma_type == 3:
-        mavalue = ta.T3(masrc, timeperiod=length)
-    elif ma_type == 4:
-        mavalue = ta.SMA(masrc, timeperiod=length)
-    elif ma_type == 5:
-        mavalue = VIDYA(df, length=length)
-    elif ma_type == 6:
-        mavalue = ta.TEMA(masrc, timeperiod=length)
-    elif ma_type == 7:
-        mavalue = ta.WMA(df, timeperiod=length)
-    elif ma_type == 8:
-        mavalue = vwma(df, length)
-    elif ma_type == 9:
-        mavalue = zema(df, period=length)
-
-    df[atr] = ta.ATR(df, timeperiod=period)
-    df['basic_ub'] = mavalue + ((multiplier/10) * df[atr])
-    df['basic_lb'] = mavalue - ((multiplier/10) * df[atr])
-
-    basic_ub = df['basic_ub'].values
-    final_ub = np.full(len(df), 0.00)
-    basic_lb = df['basic_lb'].values
-    final_lb = np.full(len(df), 0.00)
-
-    for i in range(period, len(df)):
-        final_ub[i] = basic_ub[i] if (
-            basic_ub[i] < final_ub[i - 1]
-            or mavalue[i - 1] > final_ub[i - 1]) else final_ub[i - 1]
-        final_lb[i] = basic_lb[i] if (
-            basic_lb[i] > final_lb[i - 1]
-            or mavalue[i - 1] < final_lb[i - 1]) else final_lb[i - 1]
-
-    df['final_ub'] = final_ub
-    df['final_lb'] = final_lb
-
-    pm_arr = np.full(len(df), 0.00)
-    for i in range(period, len(df)):
-        pm_arr[i] = (
-            final_ub[i] if (pm_arr[i - 1] == final_ub[i - 1]
-                            and mavalue[i] <= final_ub[i])
-            else final_lb[i] if (
-                    pm_arr[i - 1] == final_ub[i - 1]
-                    and mavalue[i] > final_ub[i]) else final_lb[i]
-            if (pm_arr[i - 1] == final_lb[i - 1]
-                and mavalue[i] >= final_lb[i]) else final_ub[i]
-            if (pm_arr[i - 1] == final_lb[i - 1]
-                and mavalue[i] < final_lb[i]) else 0.00)
-
-    pm = Series(pm_arr)
-
-    # Mark the trend direction up/down
-    pmx = np.where((pm_arr > 0.00), np.where((mavalue < pm_arr), 'down',  'up'), np.NaN)
-
-    return pm, pmx
-
-
 # Mom DIV
 def momdiv(dataframe: DataFrame, mom_length: int = 10, bb_length: int = 20, bb_dev: float = 2.0,
            lookback: int = 30) -> DataFrame:
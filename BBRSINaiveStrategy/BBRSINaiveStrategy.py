@@ -11,6 +11,11 @@ from freqtrade.strategy.interface import IStrategy
 # Add your lib to import here
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.incremental import IncrementalIndicators, Indicator
 
 
 class BBRSINaiveStrategy(IStrategy):
@@ -50,6 +55,14 @@ class BBRSINaiveStrategy(IStrategy):
     # Number of candles the strategy requires before producing valid signals
     startup_candle_count: int = 30
 
+    # RSI and Bollinger bands of the typical price, carried per pair in live/dry runs
+    incremental_indicators = IncrementalIndicators({
+        'rsi': Indicator('rsi', 'close', 14),
+        # qtpylib.bollinger_bands: min_periods=1 and pandas' sample std
+        'bb_mid': Indicator('sma', 'hlc3', 20, min_periods=1),
+        'bb_std': Indicator('std', 'hlc3', 20, ddof=1, min_periods=1),
+    })
+
     # Optional order type mapping.
     order_types = {
         'buy': 'limit',
@@ -91,6 +104,15 @@ class BBRSINaiveStrategy(IStrategy):
         return []
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            # Only the candles since the last call are computed
+            columns = self.incremental_indicators.update(metadata['pair'], dataframe)
+            dataframe['rsi'] = columns['rsi']
+            dataframe['bb_upperband'] = columns['bb_mid'] + columns['bb_std'] * 2
+            dataframe['bb_midband'] = columns['bb_mid']
+            dataframe['bb_lowerband'] = columns['bb_mid'] - columns['bb_std'] * 2
+            return dataframe
+
         # RSI
         dataframe['rsi'] = ta.RSI(dataframe)
 
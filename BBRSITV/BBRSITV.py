@@ -1,34 +1,19 @@
 # --- Do not remove these libs ---
 from freqtrade.strategy.interface import IStrategy
-from pandas import DataFrame, Series
+from pandas import DataFrame
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 import numpy as np
 from freqtrade.strategy import DecimalParameter, IntParameter, stoploss_from_open
 from datetime import datetime, timedelta
 from functools import reduce
+import sys
+from pathlib import Path
 
-# --------------------------------
-def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['close'] * 100
-    return emadif
-
-# Volume Weighted Moving Average
-def vwma(dataframe: DataFrame, length: int = 10):
-    """Indicator: Volume Weighted Moving Average (VWMA)"""
-    # Calculate Result
-    pv = dataframe['close'] * dataframe['volume']
-    vwma = Series(ta.SMA(pv, timeperiod=length) / ta.SMA(dataframe['volume'], timeperiod=length))
-    return vwma
-
-# Modified Elder Ray Index
-def moderi(dataframe: DataFrame, len_slow_ma: int = 32) -> Series:
-    slow_ma = Series(ta.EMA(vwma(dataframe, length=len_slow_ma), timeperiod=len_slow_ma))
-    return slow_ma >= slow_ma.shift(1)  # we just need true & false for ERI trend
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.indicators import EWO
 
+# --------------------------------
 class BBRSITV(IStrategy):
     INTERFACE_VERSION = 2
 
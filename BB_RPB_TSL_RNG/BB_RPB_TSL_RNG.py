@@ -6,38 +6,27 @@ import pandas_ta as pta
 
 from freqtrade.persistence import Trade
 from freqtrade.strategy.interface import IStrategy
-from pandas import DataFrame, Series, DatetimeIndex, merge
+from pandas import DataFrame, DatetimeIndex, merge
 from datetime import datetime, timedelta
 from freqtrade.strategy import merge_informative_pair, CategoricalParameter, DecimalParameter, IntParameter, stoploss_from_open
 from functools import reduce
 from technical.indicators import RMI, zema
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils import indicators
+from strategy_utils.indicator_bank import BankStore, add_banks
+from strategy_utils.indicators import williams_r
 
 # --------------------------------
 def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['low'] * 100
-    return emadif
-
-# Williams %R
-def williams_r(dataframe: DataFrame, period: int = 14) -> Series:
-    """Williams %R, or just %R, is a technical analysis oscillator showing the current closing price in relation to the high and low
-        of the past N days (for a given N). It was developed by a publisher and promoter of trading materials, Larry Williams.
-        Its purpose is to tell whether a stock or commodity market is trading near the high or the low, or somewhere in between,
-        of its recent trading range.
-        The oscillator is on a negative scale, from âˆ’100 (lowest) up to 0 (highest).
-    """
-
-    highest_high = dataframe["high"].rolling(center=False, window=period).max()
-    lowest_low = dataframe["low"].rolling(center=False, window=period).min()
-
-    WR = Series(
-        (highest_high - dataframe["close"]) / (highest_high - lowest_low),
-        name=f"{period} Williams %R",
-        )
+    return indicators.EWO(dataframe, ema_length, ema2_length, base='low')
+
+def rmi_mom4(dataframe, length):
+    """RMI with a momentum of 4 candles, the family of the ``rmi_length_*`` columns."""
+    return RMI(dataframe, length=length, mom=4)
 
-    return WR * -100
 
 class BB_RPB_TSL_RNG(IStrategy):
     '''
@@ -113,6 +102,10 @@ class BB_RPB_TSL_RNG(IStrategy):
     use_custom_stoploss = True
     use_sell_signal = True
 
+    # Hyperopt ranges of indicators, one contiguous array per family, kept per pair and
+    # saved to disk only when the config sets "indicator_bank": {"persist": true}
+    indicator_banks = BankStore()
+
     ############################################################################
 
     ## Buy params
@@ -260,16 +253,16 @@ class BB_RPB_TSL_RNG(IStrategy):
         dataframe['bb_delta'] = ((dataframe['bb_lowerband2'] - dataframe['bb_lowerband3']) / dataframe['bb_lowerband2'])
         dataframe['bb_bottom_cross'] = qtpylib.crossed_below(dataframe['close'], dataframe['bb_lowerband3']).astype('int')
 
-        # CCI hyperopt
-        for val in self.buy_cci_length.range:
-            dataframe[f'cci_length_{val}'] = ta.CCI(dataframe, val)
+        # CCI / RMI hyperopt
+        banks = self.indicator_banks.configure(self.config)
+        dataframe = add_banks(dataframe, {
+            'cci_length_': banks.get(metadata['pair'], dataframe, 'CCI', self.buy_cci_length.range),
+            'rmi_length_': banks.get(metadata['pair'], dataframe, rmi_mom4, self.buy_rmi_length.range),
+        })
 
         dataframe['cci'] = ta.CCI(dataframe, 26)
         dataframe['cci_long'] = ta.CCI(dataframe, 170)
 
-        # RMI hyperopt
-        for val in self.buy_rmi_length.range:
-            dataframe[f'rmi_length_{val}'] = RMI(dataframe, length=val, mom=4)
         #dataframe['rmi'] = RMI(dataframe, length=8, mom=4)
 
         # SRSI hyperopt ?
@@ -319,8 +312,9 @@ class BB_RPB_TSL_RNG(IStrategy):
 
 
         # Calculate all ma_sell values
-        for val in self.base_nb_candles_sell.range:
-            dataframe[f'ma_sell_{val}'] = ta.EMA(dataframe, timeperiod=val)        
+        dataframe = add_banks(dataframe, {
+            'ma_sell_': banks.get(metadata['pair'], dataframe, 'EMA', self.base_nb_candles_sell.range),
+        })
 
         return dataframe
 
@@ -54,14 +54,6 @@ from functools import reduce
 ##                                                                                                       ##
 ###########################################################################################################
 
-def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['close'] * 100
-    return emadif
-
-
 class BigZ04_TSL4(IStrategy):
     INTERFACE_VERSION = 2
 
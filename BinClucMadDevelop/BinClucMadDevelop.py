@@ -760,24 +760,3 @@ class BinClucMadDevelop(IStrategy):
             dataframe.loc[reduce(lambda x, y: x | y, conditions), "sell"] = 1
 
         return dataframe
-
-
-# --- custom indicators ---------------------------------------------------------------------------
-
-
-def SSLChannels_ATR(dataframe, length=7):
-    """
-    SSL Channels with ATR: https://www.tradingview.com/script/SKHqWzql-SSL-ATR-channel/
-    Credit to @JimmyNixx for python
-    """
-    df = dataframe.copy()
-
-    df["ATR"] = ta.ATR(df, timeperiod=14)
-    df["smaHigh"] = df["high"].rolling(length).mean() + df["ATR"]
-    df["smaLow"] = df["low"].rolling(length).mean() - df["ATR"]
-    df["hlv"] = np.where(df["close"] > df["smaHigh"], 1, np.where(df["close"] < df["smaLow"], -1, np.NAN))
-    df["hlv"] = df["hlv"].ffill()
-    df["sslDown"] = np.where(df["hlv"] < 0, df["smaHigh"], df["smaLow"])
-    df["sslUp"] = np.where(df["hlv"] < 0, df["smaLow"], df["smaHigh"])
-
-    return df["sslDown"], df["sslUp"]
@@ -14,6 +14,11 @@ from freqtrade.strategy import (BooleanParameter, DecimalParameter,
 from freqtrade.strategy.interface import IStrategy
 from pandas import DataFrame, Series
 from skopt.space import Dimension, Integer
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils import indicators
 
 def bollinger_bands(stock_price, window_size, num_of_std):
     rolling_mean = stock_price.rolling(window=window_size).mean()
@@ -467,8 +472,4 @@ def pct_change(a, b):
     return (b - a) / a
 
 def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['low'] * 100
-    return emadif
+    return indicators.EWO(dataframe, ema_length, ema2_length, base='low')
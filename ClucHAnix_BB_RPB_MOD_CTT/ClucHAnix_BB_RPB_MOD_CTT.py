@@ -16,6 +16,11 @@ import technical.indicators as ftt
 from freqtrade.persistence import Trade, PairLocks
 from freqtrade.strategy import (BooleanParameter, DecimalParameter, IntParameter, stoploss_from_open, merge_informative_pair)
 from skopt.space import Dimension, Integer
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils import indicators
 
 logger = logging.getLogger(__name__)
 
@@ -510,11 +515,7 @@ def pct_change(a, b):
     return (b - a) / a
 
 def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['low'] * 100
-    return emadif
+    return indicators.EWO(dataframe, ema_length, ema2_length, base='low')
 
 class ClucHAnix_BB_RPB_MOD_CTT_STB(ClucHAnix_BB_RPB_MOD_CTT):
     # Original idea by @MukavaValkku, code by @tirail and @stash86
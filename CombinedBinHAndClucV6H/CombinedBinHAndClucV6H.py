@@ -10,6 +10,11 @@ from freqtrade.strategy import IStrategy, IntParameter, DecimalParameter, Catego
 from freqtrade.persistence import Trade
 from datetime import datetime, timedelta
 from functools import reduce
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.indicators import SSLChannels_ATR
 
 
 ###########################################################################################################
@@ -428,20 +433,3 @@ class CombinedBinHAndClucV6H(IStrategy):
 
 
 # --- custom indicators ---------------------------------------------------------------------------
-
-def SSLChannels_ATR(dataframe, length=7):
-    """
-    SSL Channels with ATR: https://www.tradingview.com/script/SKHqWzql-SSL-ATR-channel/
-    Credit to @JimmyNixx for python
-    """
-    df = dataframe.copy()
-
-    df['ATR'] = ta.ATR(df, timeperiod=14)
-    df['smaHigh'] = df['high'].rolling(length).mean() + df['ATR']
-    df['smaLow'] = df['low'].rolling(length).mean() - df['ATR']
-    df['hlv'] = np.where(df['close'] > df['smaHigh'], 1, np.where(df['close'] < df['smaLow'], -1, np.NAN))
-    df['hlv'] = df['hlv'].ffill()
-    df['sslDown'] = np.where(df['hlv'] < 0, df['smaHigh'], df['smaLow'])
-    df['sslUp'] = np.where(df['hlv'] < 0, df['smaLow'], df['smaHigh'])
-
-    return df['sslDown'], df['sslUp']
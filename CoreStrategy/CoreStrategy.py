@@ -14,6 +14,11 @@ from freqtrade.strategy import (
 )
 from functools import reduce
 import logging
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.indicators import EWO
 # -------------------------------------------------------------------------------------------------
 # --- logger for parameter merging output, only remove if you remove it further down too! ---------
 logger = logging.getLogger(__name__)
@@ -1168,26 +1173,6 @@ class CoreStrategy(IStrategy):
 # --- custom indicators ---------------------------------------------------------------------------
 
 
-def SSLChannels_ATR(dataframe, length=7):
-    """
-    SSL Channels with ATR: https://www.tradingview.com/script/SKHqWzql-SSL-ATR-channel/
-    Credit to @JimmyNixx for python
-    """
-    df = dataframe.copy()
-
-    df["ATR"] = ta.ATR(df, timeperiod=14)
-    df["smaHigh"] = df["high"].rolling(length).mean() + df["ATR"]
-    df["smaLow"] = df["low"].rolling(length).mean() - df["ATR"]
-    df["hlv"] = np.where(
-        df["close"] > df["smaHigh"], 1, np.where(df["close"] < df["smaLow"], -1, np.NAN)
-    )
-    df["hlv"] = df["hlv"].ffill()
-    df["sslDown"] = np.where(df["hlv"] < 0, df["smaHigh"], df["smaLow"])
-    df["sslUp"] = np.where(df["hlv"] < 0, df["smaLow"], df["smaHigh"])
-
-    return df["sslDown"], df["sslUp"]
-
-
 # SSL Channels
 def SSLChannels(dataframe, length=7):
     df = dataframe.copy()
@@ -1203,14 +1188,6 @@ def SSLChannels(dataframe, length=7):
     return df["sslDown"], df["sslUp"]
 
 
-def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df["close"] * 100
-    return emadif
-
-
 class BinClucMadv1(CoreStrategy):
     INTERFACE_VERSION = 2
 
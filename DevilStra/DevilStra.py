@@ -18,13 +18,17 @@
 import numpy as np
 from functools import reduce
 import freqtrade.vendor.qtpylib.indicators as qtpylib
-import talib.abstract as ta
 import random
 from freqtrade.strategy.hyper import CategoricalParameter, DecimalParameter, IntParameter
 
 from numpy.lib import math
 from freqtrade.strategy.interface import IStrategy
 from pandas import DataFrame
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.genes import GeneCache, gene_calculator, reachable_genes
 
 # ########################## SETTINGS ##############################
 # pairlist lenght(use exact count of pairs you used in whitelist size+1):
@@ -33,6 +37,10 @@ PAIR_LIST_LENGHT = 269
 TREND_CHECK_CANDLES = 4
 # Set the pain range of devil(2~9999)
 PAIN_RANGE = 1000
+# Compute every gene the parameter spaces can reach in populate_indicators, spread over
+# PRECOMPUTE_PROCESSES worker processes (None: one per CPU), instead of on first use.
+PRECOMPUTE_GENES = False
+PRECOMPUTE_PROCESSES = None
 # Add "GodStraNew" Generated Results As spells inside SPELLS.
 # Set them unic phonemes like 'Zi' 'Gu' or 'Lu'!
 # * Use below replacement on GodStraNew results to
@@ -328,93 +336,26 @@ def spell_finder(index, space):
     return SPELLS[index][space+"_params"]
 
 
-def normalize(df):
-    df = (df-df.min())/(df.max()-df.min())
-    return df
-
-
-def gene_calculator(dataframe, indicator):
-    # Cuz Timeperiods not effect calculating CDL patterns recognations
-    if 'CDL' in indicator:
-        splited_indicator = indicator.split('-')
-        splited_indicator[1] = "0"
-        new_indicator = "-".join(splited_indicator)
-        # print(indicator, new_indicator)
-        indicator = new_indicator
+def spell_values(kind):
+    # Every indicator / operator any spell uses
+    return [value for spell in SPELLS.values() for params in spell.values()
+            for key, value in params.items() if kind in key]
 
-    gene = indicator.split("-")
 
-    gene_name = gene[0]
-    gene_len = len(gene)
-
-    if indicator in dataframe.keys():
-        # print(f"{indicator}, calculated befoure")
-        # print(len(dataframe.keys()))
-        return dataframe[indicator]
-    else:
-        result = None
-        # For Pattern Recognations
-        if gene_len == 1:
-            # print('gene_len == 1\t', indicator)
-            result = getattr(ta, gene_name)(
-                dataframe
-            )
-            return normalize(result)
-        elif gene_len == 2:
-            # print('gene_len == 2\t', indicator)
-            gene_timeperiod = int(gene[1])
-            result = getattr(ta, gene_name)(
-                dataframe,
-                timeperiod=gene_timeperiod,
-            )
-            return normalize(result)
-        # For
-        elif gene_len == 3:
-            # print('gene_len == 3\t', indicator)
-            gene_timeperiod = int(gene[2])
-            gene_index = int(gene[1])
-            result = getattr(ta, gene_name)(
-                dataframe,
-                timeperiod=gene_timeperiod,
-            ).iloc[:, gene_index]
-            return normalize(result)
-        # For trend operators(MA-5-SMA-4)
-        elif gene_len == 4:
-            # print('gene_len == 4\t', indicator)
-            gene_timeperiod = int(gene[1])
-            sharp_indicator = f'{gene_name}-{gene_timeperiod}'
-            dataframe[sharp_indicator] = getattr(ta, gene_name)(
-                dataframe,
-                timeperiod=gene_timeperiod,
-            )
-            return normalize(ta.SMA(dataframe[sharp_indicator].fillna(0), TREND_CHECK_CANDLES))
-        # For trend operators(STOCH-0-4-SMA-4)
-        elif gene_len == 5:
-            # print('gene_len == 5\t', indicator)
-            gene_timeperiod = int(gene[2])
-            gene_index = int(gene[1])
-            sharp_indicator = f'{gene_name}-{gene_index}-{gene_timeperiod}'
-            dataframe[sharp_indicator] = getattr(ta, gene_name)(
-                dataframe,
-                timeperiod=gene_timeperiod,
-            ).iloc[:, gene_index]
-            return normalize(ta.SMA(dataframe[sharp_indicator].fillna(0), TREND_CHECK_CANDLES))
-
-
-def condition_generator(dataframe, operator, indicator, crossed_indicator, real_num):
+def condition_generator(dataframe, operator, indicator, crossed_indicator, real_num, genes=None):
 
     condition = (dataframe['volume'] > 10)
 
     # TODO : it ill callculated in populate indicators.
 
-    dataframe[indicator] = gene_calculator(dataframe, indicator)
+    dataframe[indicator] = gene_calculator(dataframe, indicator, genes)
     dataframe[crossed_indicator] = gene_calculator(
-        dataframe, crossed_indicator)
+        dataframe, crossed_indicator, genes)
 
     indicator_trend_sma = f"{indicator}-SMA-{TREND_CHECK_CANDLES}"
     if operator in ["UT", "DT", "OT", "CUT", "CDT", "COT"]:
         dataframe[indicator_trend_sma] = gene_calculator(
-            dataframe, indicator_trend_sma)
+            dataframe, indicator_trend_sma, genes)
 
     if operator == ">":
         condition = (
@@ -562,6 +503,9 @@ class DevilStra(IStrategy):
     # 𝖂𝖔𝖗𝖘𝖙, 𝖀𝖓𝖎𝖉𝖊𝖆𝖑, 𝕾𝖚𝖇𝖔𝖕𝖙𝖎𝖒𝖆𝖑, 𝕸𝖆𝖑𝖆𝖕𝖗𝖔𝖕𝖔𝖘 𝕬𝖓𝖉 𝕯𝖎𝖘𝖒𝖆𝖑 𝖙𝖎𝖒𝖊𝖋𝖗𝖆𝖒𝖊 𝖋𝖔𝖗 𝖙𝖍𝖎𝖘 𝖘𝖙𝖗𝖆𝖙𝖊𝖌𝖞:
     timeframe = '4h'
 
+    # Genes computed so far, reused by every hyperopt epoch of this process
+    gene_cache = GeneCache(trend_candles=TREND_CHECK_CANDLES)
+
     spell_pot = [
         ",".join(
             tuple(
@@ -581,6 +525,10 @@ class DevilStra(IStrategy):
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
+        if PRECOMPUTE_GENES:
+            self.gene_cache.precompute(metadata['pair'], dataframe, reachable_genes(
+                spell_values('indicator'), spell_values('operator'), TREND_CHECK_CANDLES),
+                PRECOMPUTE_PROCESSES)
         return dataframe
 
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -602,6 +550,7 @@ class DevilStra(IStrategy):
         buy_params_index = buy_spells[pair_index]
 
         params = spell_finder(buy_params_index, 'buy')
+        genes = self.gene_cache.bind(metadata['pair'], dataframe)
         conditions = list()
         # TODO: Its not dry code!
         buy_indicator = params['buy_indicator0']
@@ -613,7 +562,8 @@ class DevilStra(IStrategy):
             buy_operator,
             buy_indicator,
             buy_crossed_indicator,
-            buy_real_num
+            buy_real_num,
+            genes
         )
         conditions.append(condition)
         # backup
@@ -627,7 +577,8 @@ class DevilStra(IStrategy):
             buy_operator,
             buy_indicator,
             buy_crossed_indicator,
-            buy_real_num
+            buy_real_num,
+            genes
         )
         conditions.append(condition)
 
@@ -640,7 +591,8 @@ class DevilStra(IStrategy):
             buy_operator,
             buy_indicator,
             buy_crossed_indicator,
-            buy_real_num
+            buy_real_num,
+            genes
         )
         conditions.append(condition)
 
@@ -673,6 +625,7 @@ class DevilStra(IStrategy):
 
         params = spell_finder(sell_params_index, 'sell')
 
+        genes = self.gene_cache.bind(metadata['pair'], dataframe)
         conditions = list()
         # TODO: Its not dry code!
         sell_indicator = params['sell_indicator0']
@@ -684,7 +637,8 @@ class DevilStra(IStrategy):
             sell_operator,
             sell_indicator,
             sell_crossed_indicator,
-            sell_real_num
+            sell_real_num,
+            genes
         )
         conditions.append(condition)
 
@@ -697,7 +651,8 @@ class DevilStra(IStrategy):
             sell_operator,
             sell_indicator,
             sell_crossed_indicator,
-            sell_real_num
+            sell_real_num,
+            genes
         )
         conditions.append(condition)
 
@@ -710,7 +665,8 @@ class DevilStra(IStrategy):
             sell_operator,
             sell_indicator,
             sell_crossed_indicator,
-            sell_real_num
+            sell_real_num,
+            genes
         )
         conditions.append(condition)
 
@@ -13,8 +13,14 @@ from datetime import datetime, timedelta
 from freqtrade.persistence import Trade
 from freqtrade.strategy import stoploss_from_open, merge_informative_pair, DecimalParameter, IntParameter, CategoricalParameter
 import technical.indicators as ftt
-import math
 import logging
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils import indicators
+from strategy_utils.dca import DcaTracker, safety_order_ladder
+from strategy_utils.reference import ReferenceIndicators
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +28,7 @@ logger = logging.getLogger(__name__)
 
 
 def EWO(dataframe, ema_length=5, ema2_length=3):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['close'] * 100
-    return emadif
+    return indicators.EWO(dataframe, ema_length, ema2_length)
 
 
 
@@ -168,6 +170,9 @@ class EI3v2_tag_cofi_green(IStrategy):
     process_only_new_candles = True
     startup_candle_count = 400
 
+    # BTC informative indicators, computed once per candle for all pairs
+    btc_indicators = ReferenceIndicators()
+
     plot_config = {
         'main_plot': {
             'ma_buy': {'color': 'orange'},
@@ -246,14 +251,16 @@ class EI3v2_tag_cofi_green(IStrategy):
         else:
             btc_info_pair = "BTC/USDT"
 
-        btc_info_tf = self.dp.get_pair_dataframe(btc_info_pair, self.inf_1h)
-        btc_info_tf = self.info_tf_btc_indicators(btc_info_tf, metadata)
+        btc_info_tf = self.btc_indicators.get(
+            (btc_info_pair, self.inf_1h), self.dp.get_pair_dataframe(btc_info_pair, self.inf_1h),
+            lambda btc: self.info_tf_btc_indicators(btc, metadata))
         dataframe = merge_informative_pair(dataframe, btc_info_tf, self.timeframe, self.inf_1h, ffill=True)
         drop_columns = [f"{s}_{self.inf_1h}" for s in ['date', 'open', 'high', 'low', 'close', 'volume']]
         dataframe.drop(columns=dataframe.columns.intersection(drop_columns), inplace=True)
 
-        btc_base_tf = self.dp.get_pair_dataframe(btc_info_pair, self.timeframe)
-        btc_base_tf = self.base_tf_btc_indicators(btc_base_tf, metadata)
+        btc_base_tf = self.btc_indicators.get(
+            (btc_info_pair, self.timeframe), self.dp.get_pair_dataframe(btc_info_pair, self.timeframe),
+            lambda btc: self.base_tf_btc_indicators(btc, metadata))
         dataframe = merge_informative_pair(dataframe, btc_base_tf, self.timeframe, self.timeframe, ffill=True)
         drop_columns = [f"{s}_{self.timeframe}" for s in ['date', 'open', 'high', 'low', 'close', 'volume']]
         dataframe.drop(columns=dataframe.columns.intersection(drop_columns), inplace=True)
@@ -420,6 +427,9 @@ class EI3v2_tag_cofi_dca_green(EI3v2_tag_cofi_green):
     safety_order_step_scale = 1.2
     safety_order_volume_scale = 1.4
 
+    # Filled buys of the open trades, kept up to date from their new orders
+    dca_tracker = DcaTracker()
+
     buy_params = {
         "dca_min_rsi": 35,
     }
@@ -440,36 +450,35 @@ class EI3v2_tag_cofi_dca_green(EI3v2_tag_cofi_green):
         if current_profit > self.initial_safety_order_trigger:
             return None
 
+        ladder = safety_order_ladder(self.initial_safety_order_trigger, self.max_safety_orders,
+                                     self.safety_order_step_scale, self.safety_order_volume_scale)
+        count_of_buys = self.dca_tracker.count_of_buys(trade)
+        if not ladder.is_due(count_of_buys, current_profit):
+            return None
+
         # credits to reinuvader for not blindly executing safety orders
         # Obtain pair dataframe.
         dataframe, _ = self.dp.get_analyzed_dataframe(trade.pair, self.timeframe)
         # Only buy when it seems it's climbing back up
-        last_candle = dataframe.iloc[-1].squeeze()
-        previous_candle = dataframe.iloc[-2].squeeze()
-        if last_candle['close'] < previous_candle['close']:
+        close = dataframe['close']
+        if close.iat[-1] < close.iat[-2]:
+            return None
+
+        try:
+            stake_amount = self.wallets.get_trade_stake_amount(trade.pair, None)
+            stake_amount = stake_amount * ladder.stake_multiplier(count_of_buys)
+            amount = stake_amount / current_rate
+            logger.info(f"Initiating safety order buy #{count_of_buys} for {trade.pair} with stake amount of {stake_amount} which equals {amount}")
+            return stake_amount
+        except Exception as exception:
+            logger.info(f'Error occured while trying to get stake amount for {trade.pair}: {str(exception)}') 
             return None
 
-        count_of_buys = 0
-        for order in trade.orders:
-            if order.ft_is_open or order.ft_order_side != 'buy':
-                continue
-            if order.status == "closed":
-                count_of_buys += 1
-
-        if 1 <= count_of_buys <= self.max_safety_orders:
-            
-            safety_order_trigger = abs(self.initial_safety_order_trigger) + (abs(self.initial_safety_order_trigger) * self.safety_order_step_scale * (math.pow(self.safety_order_step_scale,(count_of_buys - 1)) - 1) / (self.safety_order_step_scale - 1))
-
-            if current_profit <= (-1 * abs(safety_order_trigger)):
-                try:
-                    stake_amount = self.wallets.get_trade_stake_amount(trade.pair, None)
-                    stake_amount = stake_amount * math.pow(self.safety_order_volume_scale,(count_of_buys - 1))
-                    amount = stake_amount / current_rate
-                    logger.info(f"Initiating safety order buy #{count_of_buys} for {trade.pair} with stake amount of {stake_amount} which equals {amount}")
-                    return stake_amount
-                except Exception as exception:
-                    logger.info(f'Error occured while trying to get stake amount for {trade.pair}: {str(exception)}') 
-                    return None
-
-        return None
+    def order_filled(self, pair: str, trade: Trade, order, current_time: datetime, **kwargs) -> None:
+        self.dca_tracker.order_filled(trade)
+
+    def bot_loop_start(self, **kwargs) -> None:
+        # Drop the trades closed since the last loop, by a sell signal as well as by the
+        # stoploss on exchange or a force exit
+        self.dca_tracker.retain(Trade.get_open_trades())
 
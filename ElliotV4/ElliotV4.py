@@ -13,14 +13,11 @@ from datetime import datetime, timedelta
 from freqtrade.persistence import Trade
 from freqtrade.strategy import stoploss_from_open, merge_informative_pair, DecimalParameter, IntParameter, CategoricalParameter
 import technical.indicators as ftt
+import sys
+from pathlib import Path
 
-
-def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['close'] * 100
-    return emadif
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.indicators import EWO
 
 
 def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -15,6 +15,11 @@ from freqtrade.strategy import stoploss_from_open, merge_informative_pair, Decim
 import technical.indicators as ftt
 from freqtrade.exchange import timeframe_to_prev_date, timeframe_to_seconds
 import pandas_ta as pta
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.indicators import EWO
 
 # Buy hyperspace params:
 buy_params = {
@@ -47,14 +52,6 @@ sell_params = {
 }
 
 
-def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['close'] * 100
-    return emadif
-
-
 def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
     # Momentum Indicators
@@ -17,10 +17,14 @@ from numpy.lib import math
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.hyper import IntParameter
 from pandas import DataFrame
-import talib.abstract as ta
-import numpy as np
-import time
+from itertools import product
 import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.bands import TREND_DOWN, TREND_UP
+from strategy_utils.supertrend import supertrend_batch
 
 class FastSupertrend(IStrategy):
     # Buy params, Sell params, ROI, Stoploss and Trailing Stop are values generated by 'freqtrade hyperopt --strategy Supertrend --hyperopt-loss ShortTradeDurHyperOptLoss --timerange=20210101- --timeframe=1h --spaces all'
@@ -82,38 +86,22 @@ class FastSupertrend(IStrategy):
     sell_p3 = IntParameter(7, 21, default=14)
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        for multiplier in self.buy_m1.range:
-            for period in self.buy_p1.range:
-                dataframe[f'supertrend_1_buy_{multiplier}_{period}'] = self.supertrend(dataframe, multiplier, period)['STX']
-
-        for multiplier in self.buy_m2.range:
-            for period in self.buy_p2.range:
-                dataframe[f'supertrend_2_buy_{multiplier}_{period}'] = self.supertrend(dataframe, multiplier, period)['STX']
-
-        for multiplier in self.buy_m3.range:
-            for period in self.buy_p3.range:
-                dataframe[f'supertrend_3_buy_{multiplier}_{period}'] = self.supertrend(dataframe, multiplier, period)['STX']
-
-        for multiplier in self.sell_m1.range:
-            for period in self.sell_p1.range:
-                dataframe[f'supertrend_1_sell_{multiplier}_{period}'] = self.supertrend(dataframe, multiplier, period)['STX']
-
-        for multiplier in self.sell_m2.range:
-            for period in self.sell_p2.range:
-                dataframe[f'supertrend_2_sell_{multiplier}_{period}'] = self.supertrend(dataframe, multiplier, period)['STX']
-
-        for multiplier in self.sell_m3.range:
-            for period in self.sell_p3.range:
-                dataframe[f'supertrend_3_sell_{multiplier}_{period}'] = self.supertrend(dataframe, multiplier, period)['STX']
+        # Every (multiplier, period) pair reachable from the parameter ranges, computed in one batch
+        params = set()
+        for m, p in [(self.buy_m1, self.buy_p1), (self.buy_m2, self.buy_p2), (self.buy_m3, self.buy_p3),
+                     (self.sell_m1, self.sell_p1), (self.sell_m2, self.sell_p2), (self.sell_m3, self.sell_p3)]:
+            params.update(product(m.range, p.range))
+        supertrend = supertrend_batch(dataframe, sorted(params))
+        dataframe = pd.concat([dataframe, supertrend.trend_frame(dataframe.index)], axis=1)
 
         return dataframe
 
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         dataframe.loc[
             (
-               (dataframe[f'supertrend_1_buy_{self.buy_m1.value}_{self.buy_p1.value}'] == 'up') &
-               (dataframe[f'supertrend_2_buy_{self.buy_m2.value}_{self.buy_p2.value}'] == 'up') &
-               (dataframe[f'supertrend_3_buy_{self.buy_m3.value}_{self.buy_p3.value}'] == 'up') & # The three indicators are 'up' for the current candle
+               (dataframe[f'supertrend_{self.buy_m1.value}_{self.buy_p1.value}'] == TREND_UP) &
+               (dataframe[f'supertrend_{self.buy_m2.value}_{self.buy_p2.value}'] == TREND_UP) &
+               (dataframe[f'supertrend_{self.buy_m3.value}_{self.buy_p3.value}'] == TREND_UP) & # The three indicators are 'up' for the current candle
                (dataframe['volume'] > 0) # There is at least some trading volume
         ),
             'buy'] = 1
@@ -123,62 +111,11 @@ class FastSupertrend(IStrategy):
     def populate_sell_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         dataframe.loc[
             (
-               (dataframe[f'supertrend_1_sell_{self.sell_m1.value}_{self.sell_p1.value}'] == 'down') &
-               (dataframe[f'supertrend_2_sell_{self.sell_m2.value}_{self.sell_p2.value}'] == 'down') &
-               (dataframe[f'supertrend_3_sell_{self.sell_m3.value}_{self.sell_p3.value}'] == 'down') & # The three indicators are 'down' for the current candle
+               (dataframe[f'supertrend_{self.sell_m1.value}_{self.sell_p1.value}'] == TREND_DOWN) &
+               (dataframe[f'supertrend_{self.sell_m2.value}_{self.sell_p2.value}'] == TREND_DOWN) &
+               (dataframe[f'supertrend_{self.sell_m3.value}_{self.sell_p3.value}'] == TREND_DOWN) & # The three indicators are 'down' for the current candle
                (dataframe['volume'] > 0) # There is at least some trading volume
             ),
             'sell'] = 1
 
         return dataframe
-
-    """
-        Supertrend Indicator; adapted for freqtrade
-        from: https://github.com/freqtrade/freqtrade-strategies/issues/30
-    """
-    def supertrend(self, dataframe: DataFrame, multiplier, period):
-        start_time = time.time()
-
-        df = dataframe.copy()
-        last_row = dataframe.tail(1).index.item()
-
-        df['TR'] = ta.TRANGE(df)
-        df['ATR'] = ta.SMA(df['TR'], period)
-
-        st = 'ST_' + str(period) + '_' + str(multiplier)
-        stx = 'STX_' + str(period) + '_' + str(multiplier)
-
-        # Compute basic upper and lower bands
-        BASIC_UB = ((df['high'] + df['low']) / 2 + multiplier * df['ATR']).values
-        BASIC_LB = ((df['high'] + df['low']) / 2 - multiplier * df['ATR']).values
-        FINAL_UB = np.zeros(last_row + 1)
-        FINAL_LB = np.zeros(last_row + 1)
-        ST = np.zeros(last_row + 1)
-        CLOSE = df['close'].values
-
-        # Compute final upper and lower bands
-        for i in range(period, last_row):
-            FINAL_UB[i] = BASIC_UB[i] if BASIC_UB[i] < FINAL_UB[i - 1] or CLOSE[i - 1] > FINAL_UB[i - 1] else FINAL_UB[i - 1]
-            FINAL_LB[i] = BASIC_LB[i] if BASIC_LB[i] > FINAL_LB[i - 1] or CLOSE[i - 1] < FINAL_LB[i - 1] else FINAL_LB[i - 1]
-
-        # Set the Supertrend value
-        for i in range(period, last_row):
-            ST[i] = FINAL_UB[i] if ST[i - 1] == FINAL_UB[i - 1] and CLOSE[i] <= FINAL_UB[i] else \
-                    FINAL_LB[i] if ST[i - 1] == FINAL_UB[i - 1] and CLOSE[i] >  FINAL_UB[i] else \
-                    FINAL_LB[i] if ST[i - 1] == FINAL_LB[i - 1] and CLOSE[i] >= FINAL_LB[i] else \
-                    FINAL_UB[i] if ST[i - 1] == FINAL_LB[i - 1] and CLOSE[i] <  FINAL_LB[i] else 0.00
-        df_ST = pd.DataFrame(ST, columns=[st])
-        df = pd.concat([df, df_ST],axis=1)
-
-        # Mark the trend direction up/down
-        df[stx] = np.where((df[st] > 0.00), np.where((df['close'] < df[st]), 'down',  'up'), np.NaN)
-
-        df.fillna(0, inplace=True)
-
-        end_time = time.time()
-        # print("total time taken this loop: ", end_time - start_time)
-
-        return DataFrame(index=df.index, data={
-            'ST' : df[st],
-            'STX' : df[stx]
-        })
@@ -14,11 +14,15 @@ from pandas import DataFrame
 
 # Add your lib to import here
 # TODO: talib is fast but have not more indicators
-import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from functools import reduce
 import numpy as np
 from random import shuffle
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.genes import GeneCache, gene_calculator, reachable_genes
 #  TODO: this gene is removed 'MAVP' cuz or error on periods
 all_god_genes = {
     'Overlap Studies': {
@@ -225,6 +229,10 @@ operators = [
 ]
 # number of candles to check up,don,off trend.
 TREND_CHECK_CANDLES = 4
+# Compute every gene the parameter spaces can reach in populate_indicators, spread over
+# PRECOMPUTE_PROCESSES worker processes (None: one per CPU), instead of on first use.
+PRECOMPUTE_GENES = False
+PRECOMPUTE_PROCESSES = None
 DECIMALS = 1
 ########################### END SETTINGS ##########################
 # DATAFRAME = DataFrame()
@@ -248,91 +256,18 @@ if len(operators) == 1:
     operators = operators*2
 
 
-def normalize(df):
-    df = (df-df.min())/(df.max()-df.min())
-    return df
-
-
-def gene_calculator(dataframe, indicator):
-    # Cuz Timeperiods not effect calculating CDL patterns recognations
-    if 'CDL' in indicator:
-        splited_indicator = indicator.split('-')
-        splited_indicator[1] = "0"
-        new_indicator = "-".join(splited_indicator)
-        # print(indicator, new_indicator)
-        indicator = new_indicator
-
-    gene = indicator.split("-")
-
-    gene_name = gene[0]
-    gene_len = len(gene)
-
-    if indicator in dataframe.keys():
-        # print(f"{indicator}, calculated befoure")
-        # print(len(dataframe.keys()))
-        return dataframe[indicator]
-    else:
-        result = None
-        # For Pattern Recognations
-        if gene_len == 1:
-            # print('gene_len == 1\t', indicator)
-            result = getattr(ta, gene_name)(
-                dataframe
-            )
-            return normalize(result)
-        elif gene_len == 2:
-            # print('gene_len == 2\t', indicator)
-            gene_timeperiod = int(gene[1])
-            result = getattr(ta, gene_name)(
-                dataframe,
-                timeperiod=gene_timeperiod,
-            )
-            return normalize(result)
-        # For
-        elif gene_len == 3:
-            # print('gene_len == 3\t', indicator)
-            gene_timeperiod = int(gene[2])
-            gene_index = int(gene[1])
-            result = getattr(ta, gene_name)(
-                dataframe,
-                timeperiod=gene_timeperiod,
-            ).iloc[:, gene_index]
-            return normalize(result)
-        # For trend operators(MA-5-SMA-4)
-        elif gene_len == 4:
-            # print('gene_len == 4\t', indicator)
-            gene_timeperiod = int(gene[1])
-            sharp_indicator = f'{gene_name}-{gene_timeperiod}'
-            dataframe[sharp_indicator] = getattr(ta, gene_name)(
-                dataframe,
-                timeperiod=gene_timeperiod,
-            )
-            return normalize(ta.SMA(dataframe[sharp_indicator].fillna(0), TREND_CHECK_CANDLES))
-        # For trend operators(STOCH-0-4-SMA-4)
-        elif gene_len == 5:
-            # print('gene_len == 5\t', indicator)
-            gene_timeperiod = int(gene[2])
-            gene_index = int(gene[1])
-            sharp_indicator = f'{gene_name}-{gene_index}-{gene_timeperiod}'
-            dataframe[sharp_indicator] = getattr(ta, gene_name)(
-                dataframe,
-                timeperiod=gene_timeperiod,
-            ).iloc[:, gene_index]
-            return normalize(ta.SMA(dataframe[sharp_indicator].fillna(0), TREND_CHECK_CANDLES))
-
-
-def condition_generator(dataframe, operator, indicator, crossed_indicator, real_num):
+def condition_generator(dataframe, operator, indicator, crossed_indicator, real_num, genes=None):
 
     condition = (dataframe['volume'] > 10)
 
     # TODO : it ill callculated in populate indicators.
 
-    dataframe[indicator] = gene_calculator(dataframe, indicator)
-    dataframe[crossed_indicator] = gene_calculator(dataframe, crossed_indicator)
+    dataframe[indicator] = gene_calculator(dataframe, indicator, genes)
+    dataframe[crossed_indicator] = gene_calculator(dataframe, crossed_indicator, genes)
 
     indicator_trend_sma = f"{indicator}-SMA-{TREND_CHECK_CANDLES}"
     if operator in ["UT", "DT", "OT", "CUT", "CDT", "COT"]:
-        dataframe[indicator_trend_sma] = gene_calculator(dataframe, indicator_trend_sma)
+        dataframe[indicator_trend_sma] = gene_calculator(dataframe, indicator_trend_sma, genes)
 
     if operator == ">":
         condition = (
@@ -551,6 +486,9 @@ class GodStraNew_SMAonly(IStrategy):
     # Buy hypers
     timeframe = '5m'
 
+    # Genes computed so far, reused by every hyperopt epoch of this process
+    gene_cache = GeneCache(trend_candles=TREND_CHECK_CANDLES)
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         '''
         It's good to calculate all indicators in all time periods here and so optimize the strategy.
@@ -559,10 +497,15 @@ class GodStraNew_SMAonly(IStrategy):
         Also, this method (populate_indicators) just calculates default value of hyperoptable params
         so using this method have not big benefits instade of calculating useable things inside buy and sell trand populators
         '''
+        if PRECOMPUTE_GENES:
+            self.gene_cache.precompute(metadata['pair'], dataframe, reachable_genes(
+                god_genes_with_timeperiod, operators, TREND_CHECK_CANDLES),
+                PRECOMPUTE_PROCESSES)
         return dataframe
 
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
+        genes = self.gene_cache.bind(metadata['pair'], dataframe)
         conditions = list()
 
         # TODO: Its not dry code!
@@ -575,7 +518,8 @@ class GodStraNew_SMAonly(IStrategy):
             buy_operator,
             buy_indicator,
             buy_crossed_indicator,
-            buy_real_num
+            buy_real_num,
+            genes
         )
         conditions.append(condition)
         # backup
@@ -589,7 +533,8 @@ class GodStraNew_SMAonly(IStrategy):
             buy_operator,
             buy_indicator,
             buy_crossed_indicator,
-            buy_real_num
+            buy_real_num,
+            genes
         )
         conditions.append(condition)
 
@@ -602,7 +547,8 @@ class GodStraNew_SMAonly(IStrategy):
             buy_operator,
             buy_indicator,
             buy_crossed_indicator,
-            buy_real_num
+            buy_real_num,
+            genes
         )
         conditions.append(condition)
 
@@ -617,6 +563,7 @@ class GodStraNew_SMAonly(IStrategy):
 
     def populate_sell_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
+        genes = self.gene_cache.bind(metadata['pair'], dataframe)
         conditions = list()
         # TODO: Its not dry code!
         sell_indicator = self.sell_indicator0.value
@@ -628,7 +575,8 @@ class GodStraNew_SMAonly(IStrategy):
             sell_operator,
             sell_indicator,
             sell_crossed_indicator,
-            sell_real_num
+            sell_real_num,
+            genes
         )
         conditions.append(condition)
 
@@ -641,7 +589,8 @@ class GodStraNew_SMAonly(IStrategy):
             sell_operator,
             sell_indicator,
             sell_crossed_indicator,
-            sell_real_num
+            sell_real_num,
+            genes
         )
         conditions.append(condition)
 
@@ -654,7 +603,8 @@ class GodStraNew_SMAonly(IStrategy):
             sell_operator,
             sell_indicator,
             sell_crossed_indicator,
-            sell_real_num
+            sell_real_num,
+            genes
         )
         conditions.append(condition)
 
@@ -3,11 +3,10 @@
 
 # --- Do not remove these libs ---
 import datetime
-from typing import List, Tuple
-import numpy as np  # noqa
+from typing import List
 import pandas as pd  # noqa
 pd.options.mode.chained_assignment = None
-from pandas import DataFrame, Series
+from pandas import DataFrame
 from technical.util import resample_to_interval, resampled_merge
 from freqtrade.strategy import IStrategy, merge_informative_pair
 from freqtrade.strategy import CategoricalParameter, DecimalParameter, IntParameter
@@ -17,7 +16,12 @@ from freqtrade.strategy import CategoricalParameter, DecimalParameter, IntParame
 # Add your lib to import here
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
-from collections import deque
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.divergence import divergences, pivot_points
+from strategy_utils.indicators import chaikin_money_flow
 
 
 class PlotConfig():
@@ -331,18 +335,10 @@ class HarmonicDivergence(IStrategy):
         # Full documentation of this method, see below
  
 
-        initialize_divergences_lists(informative)
-        add_divergences(informative, 'rsi')
-        add_divergences(informative, 'stoch')
-        add_divergences(informative, 'roc')
-        add_divergences(informative, 'uo')
-        add_divergences(informative, 'ao')
-        add_divergences(informative, 'macd')
-        add_divergences(informative, 'cci')
-        add_divergences(informative, 'cmf')
-        add_divergences(informative, 'obv')
-        add_divergences(informative, 'mfi')
-        add_divergences(informative, 'adx')
+        # All indicators are checked against the same pivots in one pass
+        dataframe = pd.concat([informative, divergences(informative, [
+            'rsi', 'stoch', 'roc', 'uo', 'ao', 'macd', 'cci', 'cmf', 'obv', 'mfi', 'adx'
+        ])], axis=1)
 
         # print("-------------------informative-------------------")
         # print(informative)
@@ -504,233 +500,6 @@ def ema_check(dataframe):
         & (dataframe[resample('ema50')] < dataframe[resample('ema200')]))
     return ~check
 
-def initialize_divergences_lists(dataframe: DataFrame):
-    dataframe["total_bullish_divergences"] = np.empty(len(dataframe['close'])) * np.nan
-    dataframe["total_bullish_divergences_count"] = np.empty(len(dataframe['close'])) * np.nan
-    dataframe["total_bullish_divergences_count"] = [0 if x != x else x for x in dataframe["total_bullish_divergences_count"]]
-    dataframe["total_bullish_divergences_names"] = np.empty(len(dataframe['close'])) * np.nan
-    dataframe["total_bullish_divergences_names"] = ['' if x != x else x for x in dataframe["total_bullish_divergences_names"]]
-    dataframe["total_bearish_divergences"] = np.empty(len(dataframe['close'])) * np.nan
-    dataframe["total_bearish_divergences_count"] = np.empty(len(dataframe['close'])) * np.nan
-    dataframe["total_bearish_divergences_count"] = [0 if x != x else x for x in dataframe["total_bearish_divergences_count"]]
-    dataframe["total_bearish_divergences_names"] = np.empty(len(dataframe['close'])) * np.nan
-    dataframe["total_bearish_divergences_names"] = ['' if x != x else x for x in dataframe["total_bearish_divergences_names"]]
-
-def add_divergences(dataframe: DataFrame, indicator: str):
-    (bearish_divergences, bearish_lines, bullish_divergences, bullish_lines) = divergence_finder_dataframe(dataframe, indicator)
-    dataframe['bearish_divergence_' + indicator + '_occurence'] = bearish_divergences
-    # for index, bearish_line in enumerate(bearish_lines):
-    #     dataframe['bearish_divergence_' + indicator + '_line_'+ str(index)] = bearish_line
-    dataframe['bullish_divergence_' + indicator + '_occurence'] = bullish_divergences
-    # for index, bullish_line in enumerate(bullish_lines):
-    #     dataframe['bullish_divergence_' + indicator + '_line_'+ str(index)] = bullish_line
-
-def divergence_finder_dataframe(dataframe: DataFrame, indicator_source: str) -> Tuple[pd.Series, pd.Series]:
-    bearish_lines = [np.empty(len(dataframe['close'])) * np.nan]
-    bearish_divergences = np.empty(len(dataframe['close'])) * np.nan
-    bullish_lines = [np.empty(len(dataframe['close'])) * np.nan]
-    bullish_divergences = np.empty(len(dataframe['close'])) * np.nan
-    low_iterator = []
-    high_iterator = []
-
-    for index, row in enumerate(dataframe.itertuples(index=True, name='Pandas')):
-        if np.isnan(row.pivot_lows):
-            low_iterator.append(0 if len(low_iterator) == 0 else low_iterator[-1])
-        else:
-            low_iterator.append(index)
-        if np.isnan(row.pivot_highs):
-            high_iterator.append(0 if len(high_iterator) == 0 else high_iterator[-1])
-        else:
-            high_iterator.append(index)
-
-    for index, row in enumerate(dataframe.itertuples(index=True, name='Pandas')):
-
-        bearish_occurence = bearish_divergence_finder(dataframe,
-            dataframe[indicator_source],
-            high_iterator,
-            index)
-
-        if bearish_occurence != None:
-            (prev_pivot , current_pivot) = bearish_occurence 
-            bearish_prev_pivot = dataframe['close'][prev_pivot]
-            bearish_current_pivot = dataframe['close'][current_pivot]
-            bearish_ind_prev_pivot = dataframe[indicator_source][prev_pivot]
-            bearish_ind_current_pivot = dataframe[indicator_source][current_pivot]
-            length = current_pivot - prev_pivot
-            bearish_lines_index = 0
-            can_exist = True
-            while(True):
-                can_draw = True
-                if bearish_lines_index <= len(bearish_lines):
-                    bearish_lines.append(np.empty(len(dataframe['close'])) * np.nan)
-                actual_bearish_lines = bearish_lines[bearish_lines_index]
-                for i in range(length + 1):
-                    point = bearish_prev_pivot + (bearish_current_pivot - bearish_prev_pivot) * i / length
-                    indicator_point =  bearish_ind_prev_pivot + (bearish_ind_current_pivot - bearish_ind_prev_pivot) * i / length
-                    if i != 0 and i != length:
-                        if (point <= dataframe['close'][prev_pivot + i] 
-                        or indicator_point <= dataframe[indicator_source][prev_pivot + i]):
-                            can_exist = False
-                    if not np.isnan(actual_bearish_lines[prev_pivot + i]):
-                        can_draw = False
-                if not can_exist:
-                    break
-                if can_draw:
-                    for i in range(length + 1):
-                        actual_bearish_lines[prev_pivot + i] = bearish_prev_pivot + (bearish_current_pivot - bearish_prev_pivot) * i / length
-                    break
-                bearish_lines_index = bearish_lines_index + 1
-            if can_exist:
-                bearish_divergences[index] = row.close
-                dataframe["total_bearish_divergences"][index] = row.close
-                if index > 30:
-                    dataframe["total_bearish_divergences_count"][index-30] = dataframe["total_bearish_divergences_count"][index-30] + 1
-                    dataframe["total_bearish_divergences_names"][index-30] = dataframe["total_bearish_divergences_names"][index-30] + indicator_source.upper() + '<br>'
-
-        bullish_occurence = bullish_divergence_finder(dataframe,
-            dataframe[indicator_source],
-            low_iterator,
-            index)
-        
-        if bullish_occurence != None:
-            (prev_pivot , current_pivot) = bullish_occurence
-            bullish_prev_pivot = dataframe['close'][prev_pivot]
-            bullish_current_pivot = dataframe['close'][current_pivot]
-            bullish_ind_prev_pivot = dataframe[indicator_source][prev_pivot]
-            bullish_ind_current_pivot = dataframe[indicator_source][current_pivot]
-            length = current_pivot - prev_pivot
-            bullish_lines_index = 0
-            can_exist = True
-            while(True):
-                can_draw = True
-                if bullish_lines_index <= len(bullish_lines):
-                    bullish_lines.append(np.empty(len(dataframe['close'])) * np.nan)
-                actual_bullish_lines = bullish_lines[bullish_lines_index]
-                for i in range(length + 1):
-                    point = bullish_prev_pivot + (bullish_current_pivot - bullish_prev_pivot) * i / length
-                    indicator_point =  bullish_ind_prev_pivot + (bullish_ind_current_pivot - bullish_ind_prev_pivot) * i / length
-                    if i != 0 and i != length:
-                        if (point >= dataframe['close'][prev_pivot + i] 
-                        or indicator_point >= dataframe[indicator_source][prev_pivot + i]):
-                            can_exist = False
-                    if not np.isnan(actual_bullish_lines[prev_pivot + i]):
-                        can_draw = False
-                if not can_exist:
-                    break
-                if can_draw:
-                    for i in range(length + 1):
-                        actual_bullish_lines[prev_pivot + i] = bullish_prev_pivot + (bullish_current_pivot - bullish_prev_pivot) * i / length
-                    break
-                bullish_lines_index = bullish_lines_index + 1
-            if can_exist:
-                bullish_divergences[index] = row.close
-                dataframe["total_bullish_divergences"][index] = row.close
-                if index > 30:
-                    dataframe["total_bullish_divergences_count"][index-30] = dataframe["total_bullish_divergences_count"][index-30] + 1
-                    dataframe["total_bullish_divergences_names"][index-30] = dataframe["total_bullish_divergences_names"][index-30] + indicator_source.upper() + '<br>'
-    
-    return (bearish_divergences, bearish_lines, bullish_divergences, bullish_lines)
-
-def bearish_divergence_finder(dataframe, indicator, high_iterator, index):
-    if high_iterator[index] == index:
-        current_pivot = high_iterator[index]
-        occurences = list(dict.fromkeys(high_iterator))
-        current_index = occurences.index(high_iterator[index])
-        for i in range(current_index-1,current_index-6,-1):            
-            prev_pivot = occurences[i]
-            if np.isnan(prev_pivot):
-                return
-            if ((dataframe['pivot_highs'][current_pivot] < dataframe['pivot_highs'][prev_pivot] and indicator[current_pivot] > indicator[prev_pivot])
-            or (dataframe['pivot_highs'][current_pivot] > dataframe['pivot_highs'][prev_pivot] and indicator[current_pivot] < indicator[prev_pivot])):
-                return (prev_pivot , current_pivot)
-    return None
-
-def bullish_divergence_finder(dataframe, indicator, low_iterator, index):
-    if low_iterator[index] == index:
-        current_pivot = low_iterator[index]
-        occurences = list(dict.fromkeys(low_iterator))
-        current_index = occurences.index(low_iterator[index])
-        for i in range(current_index-1,current_index-6,-1):
-            prev_pivot = occurences[i]
-            if np.isnan(prev_pivot):
-                return 
-            if ((dataframe['pivot_lows'][current_pivot] < dataframe['pivot_lows'][prev_pivot] and indicator[current_pivot] > indicator[prev_pivot])
-            or (dataframe['pivot_lows'][current_pivot] > dataframe['pivot_lows'][prev_pivot] and indicator[current_pivot] < indicator[prev_pivot])):
-                return (prev_pivot, current_pivot)
-    return None
-
-from enum import Enum
-class PivotSource(Enum):
-    HighLow = 0
-    Close = 1
-
-def pivot_points(dataframe: DataFrame, window: int = 5, pivot_source: PivotSource = PivotSource.Close) -> DataFrame:
-    high_source = None
-    low_source = None
-
-    if pivot_source == PivotSource.Close:
-        high_source = 'close'
-        low_source = 'close'
-    elif pivot_source == PivotSource.HighLow:
-        high_source = 'high'
-        low_source = 'low'
-
-    pivot_points_lows = np.empty(len(dataframe['close'])) * np.nan
-    pivot_points_highs = np.empty(len(dataframe['close'])) * np.nan
-    last_values = deque()
-    
-    # find pivot points
-    for index, row in enumerate(dataframe.itertuples(index=True, name='Pandas')):
-        last_values.append(row)
-        if len(last_values) >= window * 2 + 1:
-            current_value = last_values[window]
-            is_greater = True
-            is_less = True
-            for window_index in range(0, window):
-                left = last_values[window_index]
-                right = last_values[2 * window - window_index]
-                local_is_greater, local_is_less = check_if_pivot_is_greater_or_less(current_value, high_source, low_source, left, right)
-                is_greater &= local_is_greater
-                is_less &= local_is_less
-            if is_greater:
-                pivot_points_highs[index - window] = getattr(current_value, high_source)
-            if is_less:
-                pivot_points_lows[index - window] = getattr(current_value, low_source)
-            last_values.popleft()
-   
-    # find last one
-    if len(last_values) >= window + 2:
-        current_value = last_values[-2]
-        is_greater = True
-        is_less = True
-        for window_index in range(0, window):
-            left = last_values[-2 - window_index - 1]
-            right = last_values[-1]
-            local_is_greater, local_is_less = check_if_pivot_is_greater_or_less(current_value, high_source, low_source, left, right)
-            is_greater &= local_is_greater
-            is_less &= local_is_less
-        if is_greater:
-            pivot_points_highs[index - 1] = getattr(current_value, high_source)
-        if is_less:
-            pivot_points_lows[index - 1] = getattr(current_value, low_source)
-
-    return pd.DataFrame(index=dataframe.index, data={
-        'pivot_lows': pivot_points_lows,
-        'pivot_highs': pivot_points_highs
-    })
-
-def check_if_pivot_is_greater_or_less(current_value, high_source: str, low_source: str, left, right) -> Tuple[bool, bool]:
-    is_greater = True
-    is_less = True
-    if (getattr(current_value, high_source) < getattr(left, high_source) or
-        getattr(current_value, high_source) < getattr(right, high_source)):
-        is_greater = False
-
-    if (getattr(current_value, low_source) > getattr(left, low_source) or
-        getattr(current_value, low_source) > getattr(right, low_source)):
-        is_less = False
-    return (is_greater, is_less)
-
 def emaKeltner(dataframe):
     keltner = {}
     atr = qtpylib.atr(dataframe, window=10)
@@ -739,24 +508,3 @@ def emaKeltner(dataframe):
     keltner['mid'] = ema20
     keltner['lower'] = ema20 - atr
     return keltner
-
-def chaikin_money_flow(dataframe, n=20, fillna=False) -> Series:
-    """Chaikin Money Flow (CMF)
-    It measures the amount of Money Flow Volume over a specific period.
-    http://stockcharts.com/school/doku.php?id=chart_school:technical_indicators:chaikin_money_flow_cmf
-    Args:
-        dataframe(pandas.Dataframe): dataframe containing ohlcv
-        n(int): n period.
-        fillna(bool): if True, fill nan values.
-    Returns:
-        pandas.Series: New feature generated.
-    """
-    df = dataframe.copy()
-    mfv = ((df['close'] - df['low']) - (df['high'] - df['close'])) / (df['high'] - df['low'])
-    mfv = mfv.fillna(0.0)  # float division by zero
-    mfv *= df['volume']
-    cmf = (mfv.rolling(n, min_periods=0).sum()
-           / df['volume'].rolling(n, min_periods=0).sum())
-    if fillna:
-        cmf = cmf.replace([np.inf, -np.inf], np.nan).fillna(0)
-    return Series(cmf, name='cmf')
\ No newline at end of file
@@ -17,6 +17,11 @@ import freqtrade.vendor.qtpylib.indicators as qtpylib
 import numpy # noqa
 from freqtrade.persistence import Trade
 from datetime import datetime, timedelta
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.reference import ReferenceIndicators
 
 class InverseV2(IStrategy):
     
@@ -64,6 +69,9 @@ class InverseV2(IStrategy):
     # Number of candles the strategy requires before producing valid signals
     startup_candle_count: int = 200
 
+    # BTC informative indicators, computed once per candle for all pairs
+    btc_indicators = ReferenceIndicators()
+
     # Optional order type mapping.
     order_types = {
         'buy': 'limit',
@@ -147,9 +155,9 @@ class InverseV2(IStrategy):
         
         informative_btc = self.dp.get_pair_dataframe(pair="BTC/USDT", timeframe=self.info_timeframe)
         
-        informative_btc['btc_cci'] = ta.CCI(informative_btc)
-        
-        return informative_btc
+        return self.btc_indicators.get(
+            ("BTC/USDT", self.info_timeframe), informative_btc,
+            lambda btc: btc.assign(btc_cci=ta.CCI(btc)))
     
     def normal_tf_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         
@@ -13,6 +13,12 @@ from freqtrade.strategy import CategoricalParameter, DecimalParameter, IntParame
 # Add your lib to import here
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.recurrences import adaptive_average, supertrend_bands
+from strategy_utils.parallel import PairPool
  
 def LUX_SuperTrendOscillator(dtloc, source = 'close', length = 6, mult = 9, smooth = 72):
     """
@@ -44,68 +50,14 @@ def LUX_SuperTrendOscillator(dtloc, source = 'close', length = 6, mult = 9, smoo
     dtS[hl2col] =  (dtS['high'] + dtS['low'] )/2
     dtS[upcol] =  dtS[hl2col] + dtS[atrcol]
     dtS[dncol] =  dtS[hl2col] - dtS[atrcol]
-    def calc_upper(dfr, init=0):
-        global calc_Lux_STO_upper
-        global calc_Lux_STO_src
-        if init == 1:
-            calc_Lux_STO_upper = 0.0
-            calc_Lux_STO_src = 0.0
-            return
-        if calc_Lux_STO_src < calc_Lux_STO_upper:
-            calc_Lux_STO_upper = min(dfr[upcol], calc_Lux_STO_upper)
-        else:
-            calc_Lux_STO_upper = dfr[upcol]
-        calc_Lux_STO_src = dfr[source]
-        return calc_Lux_STO_upper
-    calc_upper(None, init=1)
-    dtS[uppercol] = dtS.apply(calc_upper, axis = 1)
-    def calc_lower(dfr, init=0):
-        global calc_Lux_STO_lower
-        global calc_Lux_STO_src
-        if init == 1:
-            calc_Lux_STO_lower = 0.0
-            calc_Lux_STO_src = 0.0
-            return
-        if calc_Lux_STO_src > calc_Lux_STO_lower:
-            calc_Lux_STO_lower= max(dfr[dncol], calc_Lux_STO_lower)
-        else:
-            calc_Lux_STO_lower = dfr[dncol]
-        calc_Lux_STO_src = dfr[source]
-        return calc_Lux_STO_lower
-    calc_lower(None, init=1)
-    dtS[lowercol] = dtS.apply(calc_lower, axis = 1)
-    def calc_trend(dfr, init=0):
-        global calc_Lux_STO_trend
-        global calc_Lux_STO_lower
-        global calc_Lux_STO_upper
-        if init == 1:
-            calc_Lux_STO_trend = 0.0
-            calc_Lux_STO_lower = 0.0
-            calc_Lux_STO_upper = 0.0
-            return
-        if dfr[source] > calc_Lux_STO_upper:
-            calc_Lux_STO_trend = 1
-        elif dfr[source] < calc_Lux_STO_lower:
-            calc_Lux_STO_trend = 0
-        calc_Lux_STO_upper = dfr[uppercol]
-        calc_Lux_STO_lower = dfr[lowercol]
-        return calc_Lux_STO_trend
-    calc_trend(None, init=1)
-    dtS[trendcol] = dtS.apply(calc_trend, axis = 1)
+    # Upper and lower bands ratchet while the source stays inside them, trend flips on a break
+    dtS[uppercol], dtS[lowercol], dtS[trendcol], _ = supertrend_bands(dtS[source], dtS[upcol], dtS[dncol])
     dtS[sptcol] = dtS[trendcol] * dtS[lowercol] + (1-dtS[trendcol] ) * dtS[uppercol]
     dtS[osc1col] = (dtS[source] - dtS[sptcol]) / (dtS[uppercol] - dtS[lowercol])
     dtS[osc2col] = np.where(dtS[osc1col] < 1, dtS[osc1col], 1 )
     dtS[osccol] = np.where(dtS[osc2col] > -1, dtS[osc2col], -1)
     dtS[alphacol] = dtS[osccol].pow(2)/length
-    def calc_ama(dfr, init=0):
-        global calc_Lux_STO_ama
-        if init == 1:
-            calc_Lux_STO_ama = 0.0
-            return
-        calc_Lux_STO_ama = calc_Lux_STO_ama + dfr[alphacol] * (dfr[osccol] - calc_Lux_STO_ama)
-        return calc_Lux_STO_ama
-    calc_ama(None, init=1)
-    dtS[amacol] = dtS.apply(calc_ama, axis = 1)
+    dtS[amacol], _ = adaptive_average(dtS[osccol], dtS[alphacol])
     dtS[histcol] = ta.EMA((dtS[osccol]- dtS[amacol]),timeperiod = smooth)
 
     return dtS[osccol] * 100,  dtS[amacol] * 100 , dtS[histcol]  * 100, dtS[sptcol]
@@ -180,9 +132,29 @@ class LuxOSC(IStrategy):
         }
     }
 
+    # Compute the oscillator of every whitelisted pair in a pool of pair_threads threads at the
+    # start of each bot loop (live/dry runs), populate_indicators then picks up its pair's columns
+    analyze_pairs_in_threads = False
+    pair_threads = None
+    pair_pool = PairPool()
+
+    def bot_loop_start(self, **kwargs) -> None:
+        if self.analyze_pairs_in_threads and self.config['runmode'].value in ('live', 'dry_run'):
+            self.pair_pool.precompute({pair: self.dp.ohlcv(pair, self.timeframe) for pair in self.dp.current_whitelist()},
+                                      self.oscillator_columns, self.pair_threads)
+
+    def oscillator_columns(self, dataframe: DataFrame) -> dict:
+        osc, signal, histogram, supertrend = LUX_SuperTrendOscillator(dataframe, length = int(self.length_buy.value), mult = int(self.mult_buy.value), smooth = int(self.smooth_buy.value))
+        return {'osc': osc.to_numpy(), 'signal': signal.to_numpy(), 'histogram': histogram.to_numpy(), 'supertrend': supertrend.to_numpy()}
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         
-        dataframe['osc'],  dataframe['signal'] , dataframe['histogram'], dataframe['supertrend'] = LUX_SuperTrendOscillator(dataframe, length = int(self.length_buy.value), mult = int(self.mult_buy.value), smooth = int(self.smooth_buy.value)) 
+        if self.analyze_pairs_in_threads:
+            columns = self.pair_pool.get(metadata['pair'], dataframe, self.oscillator_columns)
+        else:
+            columns = self.oscillator_columns(dataframe)
+        for name, values in columns.items():
+            dataframe[name] = values
         return dataframe
 
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -18,6 +18,11 @@ from freqtrade.persistence import Trade
 from freqtrade.strategy import (BooleanParameter, DecimalParameter,
                                 IntParameter, merge_informative_pair)
 from freqtrade.strategy.interface import IStrategy
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils import indicators
 
 logger = logging.getLogger(__name__)
 
@@ -296,11 +301,7 @@ def pct_change(a, b):
 
 
 def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['low'] * 100
-    return emadif
+    return indicators.EWO(dataframe, ema_length, ema2_length, base='low')
 
 
 class MiniLambo_TBS(MiniLambo):
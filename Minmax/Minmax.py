@@ -7,8 +7,12 @@ from pandas import DataFrame
 
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
-from scipy.signal import argrelextrema
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.extrema import ExtremaTracker, causal_extrema
 
 
 class Minmax(IStrategy):
@@ -25,33 +29,30 @@ class Minmax(IStrategy):
 
     process_only_new_candles = False
 
+    # Closes confirmed as local extrema, carried per pair in live/dry runs (order of lookback_size)
+    extrema_tracker = ExtremaTracker(before=100, after=1)
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
-        dataframe_copy = dataframe.copy()
         frame_size = 500
         len_df = len(dataframe)
-        dataframe['buy_signal'] = False
-        dataframe['sell_signal'] = False
         lookback_size = 100
-        # Let's calculate argrelextrema on separated data slices and get only last result to avoid lookahead bias!
-        for i in range(len_df):
-            if i + frame_size < len_df:
-                slice = dataframe_copy[i : i+frame_size]
-                min_peaks = argrelextrema(slice['close'].values, np.less, order=lookback_size)
-                max_peaks = argrelextrema(slice['close'].values, np.greater, order=lookback_size)
-                # Somehow we never getting last index of a frame as min or max. What a surprise :)
-                # So lets take penultimate result and use it as a signal to buy/sell.
-                if len(min_peaks[0]) and min_peaks[0][-1] == frame_size - 2:
-                    # signal that penultimate candle is min
-                    # lets buy here
-                    dataframe.at[i + frame_size,'buy_signal'] = True
-                if len(max_peaks[0]) and max_peaks[0][-1] == frame_size - 2:
-                    # oh it seams that penultimate candle is max
-                    # lets sell ASAP
-                    dataframe.at[i + frame_size, 'sell_signal'] = True
-
-                if i + frame_size == len_df - 1:
-                    print(min_peaks)
+        # argrelextrema on separated data slices used to give the last result only, to avoid lookahead bias.
+        # The penultimate candle of a slice is its last min (max) when it is below (above) the lookback_size
+        # candles before it and the last candle of the slice (the last index of a frame is never a min or max),
+        # so the signal on the candle after the slice is a causal extremum of order (lookback_size, 1)
+        # confirmed by the candle before the signal.
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            min_peaks, max_peaks = self.extrema_tracker.update(metadata['pair'], dataframe)
+        else:
+            min_peaks, max_peaks = causal_extrema(dataframe['close'].values, lookback_size, 1)
+        buy_signal = np.zeros(len_df, dtype=bool)
+        sell_signal = np.zeros(len_df, dtype=bool)
+        # The first slice starts at the first candle
+        buy_signal[frame_size:] = min_peaks[frame_size - 1:-1]
+        sell_signal[frame_size:] = max_peaks[frame_size - 1:-1]
+        dataframe['buy_signal'] = buy_signal
+        dataframe['sell_signal'] = sell_signal
 
         #                                                                               A
         # Wow what a pathetic results!!!Where is my Trillions of BTC?!?!?!              |
@@ -1,16 +1,22 @@
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from typing import Dict, List
-import numpy as np
 import talib.abstract as ta
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy import (merge_informative_pair,
                                 DecimalParameter, IntParameter, BooleanParameter, timeframe_to_minutes, stoploss_from_open)
-from pandas import DataFrame, Series
+from pandas import DataFrame
 from functools import reduce
 from freqtrade.persistence import Trade
 from datetime import datetime, timedelta
 from freqtrade.exchange import timeframe_to_prev_date
-from technical.indicators import zema, VIDYA
+from technical.indicators import zema
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.pmax import pmax
+from strategy_utils.heikin_ashi import heikin_ashi
+from strategy_utils.indicators import EWO, pump_warning
 
 
 ###########################################################################################################
@@ -772,137 +778,7 @@ class MultiMA_TSL3a(MultiMA_TSL3):
         return dataframe
 
 
-# Elliot Wave Oscillator
-def EWO(dataframe, sma1_length=5, sma2_length=35):
-    df = dataframe.copy()
-    sma1 = ta.EMA(df, timeperiod=sma1_length)
-    sma2 = ta.EMA(df, timeperiod=sma2_length)
-    smadif = (sma1 - sma2) / df['close'] * 100
-    return smadif
-
-
-# PMAX
-def pmax(df, period, multiplier, length, MAtype, src):
-    period = int(period)
-    multiplier = int(multiplier)
-    length = int(length)
-    MAtype = int(MAtype)
-    src = int(src)
-
-    mavalue = f'MA_{MAtype}_{length}'
-    atr = f'ATR_{period}'
-    pm = f'pm_{period}_{multiplier}_{length}_{MAtype}'
-    pmx = f'pmX_{period}_{multiplier}_{length}_{MAtype}'
-
-    # MAtype==1 --> EMA
-    # MAtype==2 --> DEMA
-    # MAtype==3 --> T3
-    # MAtype==4 --> SMA
-    # MAtype==5 --> VIDYA
-    # MAtype==6 --> TEMA
-    # MAtype==7 --> WMA
-    # MAtype==8 --> VWMA
-    # MAtype==9 --> zema
-    if src == 1:
-        masrc = df["close"]
-    elif src == 2:
-        masrc = (df["high"] + df["low"]) / 2
-    elif src == 3:
-        masrc = (df["high"] + df["low"] + df["close"] + df["open"]) / 4
-
-    if MAtype == 1:
-        mavalue = ta.EMA(masrc, timeperiod=length)
-    elif MAtype == 2:
-        mavalue = ta.DEMA(masrc, timeperiod=length)
-    elif MAtype == 3:
-        mavalue = ta.T3(masrc, timeperiod=length)
-    elif MAtype == 4:
-        mavalue = ta.SMA(masrc, timeperiod=length)
-    elif MAtype == 5:
-        mavalue = VIDYA(df, length=length)
-    elif MAtype == 6:
-        mavalue = ta.TEMA(masrc, timeperiod=length)
-    elif MAtype == 7:
-        mavalue = ta.WMA(df, timeperiod=length)
-    elif MAtype == 8:
-        mavalue = vwma(df, length)
-    elif MAtype == 9:
-        mavalue = zema(df, period=length)
-
-    df[atr] = ta.ATR(df, timeperiod=period)
-    df['basic_ub'] = mavalue + ((multiplier / 10) * df[atr])
-    df['basic_lb'] = mavalue - ((multiplier / 10) * df[atr])
-
-    basic_ub = df['basic_ub'].values
-    final_ub = np.full(len(df), 0.00)
-    basic_lb = df['basic_lb'].values
-    final_lb = np.full(len(df), 0.00)
-
-    for i in range(period, len(df)):
-        final_ub[i] = basic_ub[i] if (
-                basic_ub[i] < final_ub[i - 1]
-                or mavalue[i - 1] > final_ub[i - 1]) else final_ub[i - 1]
-        final_lb[i] = basic_lb[i] if (
-                basic_lb[i] > final_lb[i - 1]
-                or mavalue[i - 1] < final_lb[i - 1]) else final_lb[i - 1]
-
-    df['final_ub'] = final_ub
-    df['final_lb'] = final_lb
-
-    pm_arr = np.full(len(df), 0.00)
-    for i in range(period, len(df)):
-        pm_arr[i] = (
-            final_ub[i] if (pm_arr[i - 1] == final_ub[i - 1]
-                            and mavalue[i] <= final_ub[i])
-            else final_lb[i] if (
-                    pm_arr[i - 1] == final_ub[i - 1]
-                    and mavalue[i] > final_ub[i]) else final_lb[i]
-            if (pm_arr[i - 1] == final_lb[i - 1]
-                and mavalue[i] >= final_lb[i]) else final_ub[i]
-            if (pm_arr[i - 1] == final_lb[i - 1]
-                and mavalue[i] < final_lb[i]) else 0.00)
-
-    pm = Series(pm_arr)
-
-    # Mark the trend direction up/down
-    pmx = np.where((pm_arr > 0.00), np.where((mavalue < pm_arr), 'down', 'up'), np.NaN)
-
-    return pm, pmx
-
-
 # smoothed Heiken Ashi
 def HA(dataframe, smoothing=None):
-    df = dataframe.copy()
-
-    df['HA_Close'] = (df['open'] + df['high'] + df['low'] + df['close']) / 4
-
-    df.reset_index(inplace=True)
-
-    ha_open = [(df['open'][0] + df['close'][0]) / 2]
-    [ha_open.append((ha_open[i] + df['HA_Close'].values[i]) / 2) for i in range(0, len(df) - 1)]
-    df['HA_Open'] = ha_open
-
-    df.set_index('index', inplace=True)
-
-    df['HA_High'] = df[['HA_Open', 'HA_Close', 'high']].max(axis=1)
-    df['HA_Low'] = df[['HA_Open', 'HA_Close', 'low']].min(axis=1)
-
-    if smoothing is not None:
-        sml = abs(int(smoothing))
-        if sml > 0:
-            df['Smooth_HA_O'] = ta.EMA(df['HA_Open'], sml)
-            df['Smooth_HA_C'] = ta.EMA(df['HA_Close'], sml)
-            df['Smooth_HA_H'] = ta.EMA(df['HA_High'], sml)
-            df['Smooth_HA_L'] = ta.EMA(df['HA_Low'], sml)
-
-    return df
-
+    return heikin_ashi(dataframe, smoothing)
 
-def pump_warning(dataframe, perc=15):
-    # NOTE: segna "1" se c'è un pump
-    df = dataframe.copy()
-    df["change"] = df["high"] - df["low"]
-    df["test1"] = (df["close"] > df["open"])
-    df["test2"] = ((df["change"] / df["low"]) > (perc / 100))
-    df["result"] = (df["test1"] & df["test2"]).astype('int')
-    return df['result']
\ No newline at end of file
@@ -14,30 +14,18 @@ from logging import FATAL
 from pandas import DataFrame
 from technical.util import resample_to_interval, resampled_merge
 from typing import Dict, List
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils import indicators
+from strategy_utils.indicators import VWAPB, top_percent_change
 
 logger = logging.getLogger(__name__)
 
 def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['low'] * 100
-    return emadif
+    return indicators.EWO(dataframe, ema_length, ema2_length, base='low')
     
-def VWAPB(dataframe, window_size=20, num_of_std=1):
-    df = dataframe.copy()
-    df['vwap'] = qtpylib.rolling_vwap(df,window=window_size)
-    rolling_std = df['vwap'].rolling(window=window_size).std()
-    df['vwap_low'] = df['vwap'] - (rolling_std * num_of_std)
-    df['vwap_high'] = df['vwap'] + (rolling_std * num_of_std)
-    return df['vwap_low'], df['vwap'], df['vwap_high']
-
-def top_percent_change(dataframe: DataFrame, length: int) -> float:
-    if length == 0:
-        return (dataframe['open'] - dataframe['close']) / dataframe['close']
-    else:
-        return (dataframe['open'].rolling(length).max() - dataframe['close']) / dataframe['close']
-
 class NASOSv5_mod1_DanMod(IStrategy):
     INTERFACE_VERSION = 2
 
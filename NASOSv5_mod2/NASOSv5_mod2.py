@@ -17,6 +17,11 @@ from freqtrade.strategy import stoploss_from_open, merge_informative_pair, Decim
 import technical.indicators as ftt
 import logging
 import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils import indicators
 
 
 logger = logging.getLogger(__name__)
@@ -28,11 +33,7 @@ logger = logging.getLogger(__name__)
 
 
 def EWO(dataframe, ema_length=5, ema2_length=50):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['low'] * 120
-    return emadif
+    return indicators.EWO(dataframe, ema_length, ema2_length, base='low', scale=120)
 
 
 class NASOSv5_mod2(IStrategy):
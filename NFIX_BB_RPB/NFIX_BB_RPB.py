@@ -15,8 +15,20 @@ from typing import Dict
 from freqtrade.persistence import Trade
 from datetime import datetime, timedelta
 from technical.util import resample_to_interval, resampled_merge
-from technical.indicators import zema, VIDYA, ichimoku, RMI
+from technical.indicators import zema, ichimoku, RMI
 import time
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.pmax import pmax
+from strategy_utils.ranking import CoinRanking, grossing_rate, traded_volume
+from strategy_utils.pivots import fractal_highs, fractal_lows
+from strategy_utils.reference import ReferenceIndicators
+from strategy_utils.indicators import (
+    EWO, T3, chaikin_money_flow, range_percent_change, simple_heikin_ashi, top_percent_change,
+    williams_r
+)
 
 log = logging.getLogger(__name__)
 #log.setLevel(logging.DEBUG)
@@ -145,11 +157,11 @@ class NFIX_BB_RPB(IStrategy):
     coin_metrics['top_traded_enabled'] = False
     coin_metrics['top_traded_updated'] = False
     coin_metrics['top_traded_len'] = 10
-    coin_metrics['tt_dataframe'] = DataFrame()
+    coin_metrics['tt_ranking'] = None
     coin_metrics['top_grossing_enabled'] = False
     coin_metrics['top_grossing_updated'] = False
     coin_metrics['top_grossing_len'] = 20
-    coin_metrics['tg_dataframe'] = DataFrame()
+    coin_metrics['tg_ranking'] = None
     coin_metrics['current_whitelist'] = []
 
     # Run "populate_indicators()" only for new candle.
@@ -165,6 +177,9 @@ class NFIX_BB_RPB(IStrategy):
     # Number of candles the strategy requires before producing valid signals
     startup_candle_count: int = 480
 
+    # BTC informative indicators, computed once per candle for all pairs
+    btc_indicators = ReferenceIndicators()
+
     # Optional order type mapping.
     order_types = {
         'buy': 'limit',
@@ -2251,55 +2266,27 @@ class NFIX_BB_RPB(IStrategy):
             # Move up BTC for largest data footprint
             self.coin_metrics['current_whitelist'].insert(0, self.coin_metrics['current_whitelist'].pop(self.coin_metrics['current_whitelist'].index(f"BTC/{self.config['stake_currency']}")))
 
+    def coin_metrics_pair_dataframe(self, coin_pair: str) -> DataFrame:
+        return self.dp.get_pair_dataframe(pair=coin_pair, timeframe=self.info_timeframe_1d)
+
+    def coin_metrics_ranking(self, key: str, metric, top_length: int) -> CoinRanking:
+        if self.coin_metrics[key] is None:
+            # Live only ranks the last week, backtests rank over the whole range
+            window = 7 if self.config['runmode'].value in ('live', 'dry_run') else None
+            self.coin_metrics[key] = CoinRanking(metric, top_length, window)
+        return self.coin_metrics[key]
+
     def top_traded_list(self):
         log.info("Updating top traded pairlist...")
         tik = time.perf_counter()
 
-        self.coin_metrics['tt_dataframe'] = DataFrame()
-
-        # Build traded volume dataframe
-        for coin_pair in self.coin_metrics['current_whitelist']:
-            coin = coin_pair.split('/')[0]
-
-            # Get the volume for the daily informative timeframe and name the column for the coin
-            pair_dataframe = self.dp.get_pair_dataframe(pair=coin_pair, timeframe=self.info_timeframe_1d)
-            pair_dataframe.set_index('date')
-
-            if self.config['runmode'].value in ('live', 'dry_run'):
-                pair_dataframe = pair_dataframe.iloc[-7:,:]
-
-            # Set the date index of the self.coin_metrics['tt_dataframe'] once
-            if not 'date' in self.coin_metrics['tt_dataframe']:
-                self.coin_metrics['tt_dataframe']['date'] = pair_dataframe['date']
-                self.coin_metrics['tt_dataframe'].set_index('date')
-
-            # Calculate daily traded volume
-            pair_dataframe[coin] = pair_dataframe['volume'] * qtpylib.typical_price(pair_dataframe)
-
-            # Drop the columns we don't need
-            pair_dataframe.drop(columns=['open', 'high', 'low', 'close', 'volume'], inplace=True)
+        # Daily traded volume of every whitelisted pair, only pairs new to the whitelist are computed
+        ranking = self.coin_metrics_ranking('tt_ranking', traded_volume, self.coin_metrics['top_traded_len'])
+        ranking.set_pairs(self.coin_metrics['current_whitelist'], self.coin_metrics_pair_dataframe)
 
-            # Merge it in on the date key
-            self.coin_metrics['tt_dataframe'] = self.coin_metrics['tt_dataframe'].merge(pair_dataframe, on='date', how='left')
-
-        # Forward fill empty cells (due to different df shapes)
-        self.coin_metrics['tt_dataframe'].fillna(0, inplace=True)
-
-        # Store and drop date column for value sorting
-        pair_dates = self.coin_metrics['tt_dataframe']['date']
-        self.coin_metrics['tt_dataframe'].drop(columns=['date'], inplace=True)
-
-        # Build columns and top traded coins
-        column_names = [f"Coin #{i}" for i in range(1, self.coin_metrics['top_traded_len'] + 1)]
-        self.coin_metrics['tt_dataframe'][column_names] = self.coin_metrics['tt_dataframe'].apply(lambda x: x.nlargest(self.coin_metrics['top_traded_len']).index.values, axis=1, result_type='expand')
-        self.coin_metrics['tt_dataframe'].drop(columns=[col for col in self.coin_metrics['tt_dataframe'] if col not in column_names], inplace=True)
-
-        # Re-add stored date column
-        self.coin_metrics['tt_dataframe'].insert(loc = 0, column = 'date', value = pair_dates)
-        self.coin_metrics['tt_dataframe'].set_index('date')
         self.coin_metrics['top_traded_updated'] = True
         log.info("Updated top traded pairlist (tail-5):")
-        log.info(f"\n{self.coin_metrics['tt_dataframe'].tail(5)}")
+        log.info(f"\n{ranking.to_frame(tail=5)}")
 
         tok = time.perf_counter()
         log.info(f"Updating top traded pairlist took {tok - tik:0.4f} seconds...")
@@ -2308,76 +2295,17 @@ class NFIX_BB_RPB(IStrategy):
         log.info("Updating top grossing pairlist...")
         tik = time.perf_counter()
 
-        self.coin_metrics['tg_dataframe'] = DataFrame()
-
-        # Build grossing volume dataframe
-        for coin_pair in self.coin_metrics['current_whitelist']:
-            coin = coin_pair.split('/')[0]
-
-            # Get the volume for the daily informative timeframe and name the column for the coin
-            pair_dataframe = self.dp.get_pair_dataframe(pair=coin_pair, timeframe=self.info_timeframe_1d)
-            pair_dataframe.set_index('date')
-
-            if self.config['runmode'].value in ('live', 'dry_run'):
-                pair_dataframe = pair_dataframe.iloc[-7:,:]
-
-            # Set the date index of the self.coin_metrics['tg_dataframe'] once
-            if not 'date' in self.coin_metrics['tg_dataframe']:
-                self.coin_metrics['tg_dataframe']['date'] = pair_dataframe['date']
-                self.coin_metrics['tg_dataframe'].set_index('date')
-
-            # Calculate daily grossing rate
-            pair_dataframe[coin] = pair_dataframe['close'].pct_change() * 100
+        # Daily grossing rate of every whitelisted pair, only pairs new to the whitelist are computed
+        ranking = self.coin_metrics_ranking('tg_ranking', grossing_rate, self.coin_metrics['top_grossing_len'])
+        ranking.set_pairs(self.coin_metrics['current_whitelist'], self.coin_metrics_pair_dataframe)
 
-            # Drop the columns we don't need
-            pair_dataframe.drop(columns=['open', 'high', 'low', 'close', 'volume'], inplace=True)
-
-            # Merge it in on the date key
-            self.coin_metrics['tg_dataframe'] = self.coin_metrics['tg_dataframe'].merge(pair_dataframe, on='date', how='left')
-
-        # Forward fill empty cells (due to different df shapes)
-        self.coin_metrics['tg_dataframe'].fillna(0, inplace=True)
-
-        # Store and drop date column for value sorting
-        pair_dates = self.coin_metrics['tg_dataframe']['date']
-        self.coin_metrics['tg_dataframe'].drop(columns=['date'], inplace=True)
-
-        # Build columns and top grossing coins
-        column_names = [f"Coin #{i}" for i in range(1, self.coin_metrics['top_grossing_len'] + 1)]
-        self.coin_metrics['tg_dataframe'][column_names] = self.coin_metrics['tg_dataframe'].apply(lambda x: x.nlargest(self.coin_metrics['top_grossing_len']).index.values, axis=1, result_type='expand')
-        self.coin_metrics['tg_dataframe'].drop(columns=[col for col in self.coin_metrics['tg_dataframe'] if col not in column_names], inplace=True)
-
-        # Re-add stored date column
-        self.coin_metrics['tg_dataframe'].insert(loc = 0, column = 'date', value = pair_dates)
-        self.coin_metrics['tg_dataframe'].set_index('date')
         self.coin_metrics['top_grossing_updated'] = True
         log.info("Updated top grossing pairlist (tail-5):")
-        log.info(f"\n{self.coin_metrics['tg_dataframe'].tail(5)}")
+        log.info(f"\n{ranking.to_frame(tail=5)}")
 
         tok = time.perf_counter()
         log.info(f"Updating top grossing pairlist took {tok - tik:0.4f} seconds...")
 
-    def is_top_coin(self, coin_pair, row_data, top_length) -> bool:
-        return coin_pair.split('/')[0] in row_data.loc['Coin #1':f"Coin #{top_length}"].values
-
-    def is_support(self, row_data) -> bool:
-        conditions = []
-        for row in range(len(row_data)-1):
-            if row < len(row_data)/2:
-                conditions.append(row_data[row] > row_data[row+1])
-            else:
-                conditions.append(row_data[row] < row_data[row+1])
-        return reduce(lambda x, y: x & y, conditions)
-
-    def is_resistance(self, row_data) -> bool:
-        conditions = []
-        for row in range(len(row_data)-1):
-            if row < len(row_data)/2:
-                conditions.append(row_data[row] < row_data[row+1])
-            else:
-                conditions.append(row_data[row] > row_data[row+1])
-        return reduce(lambda x, y: x & y, conditions)
-
     def bot_loop_start(self, **kwargs) -> None:
         """
         Called at the start of the bot iteration (one loop).
@@ -2393,6 +2321,10 @@ class NFIX_BB_RPB(IStrategy):
             self.top_traded_list()
         if self.coin_metrics['top_grossing_enabled'] and not self.coin_metrics['top_grossing_updated']:
             self.top_grossing_list()
+        # Append new daily candles to the rankings
+        for key in ('tt_ranking', 'tg_ranking'):
+            if self.coin_metrics[key] is not None:
+                self.coin_metrics[key].update(self.coin_metrics_pair_dataframe)
 
         if self.config["runmode"].value not in ("live", "dry_run"):
             return super().bot_loop_start(**kwargs)
@@ -6683,12 +6615,7 @@ class NFIX_BB_RPB(IStrategy):
         :param method: High to Low / Open to Close
         :param length: int The length to look back
         """
-        if method == 'HL':
-            return (dataframe['high'].rolling(length).max() - dataframe['low'].rolling(length).min()) / dataframe['low'].rolling(length).min()
-        elif method == 'OC':
-            return (dataframe['open'].rolling(length).max() - dataframe['close'].rolling(length).min()) / dataframe['close'].rolling(length).min()
-        else:
-            raise ValueError(f"Method {method} not defined!")
+        return range_percent_change(dataframe, method, length)
 
     def top_percent_change(self, dataframe: DataFrame, length: int) -> float:
         """
@@ -6697,10 +6624,7 @@ class NFIX_BB_RPB(IStrategy):
         :param dataframe: DataFrame The original OHLC dataframe
         :param length: int The length to look back
         """
-        if length == 0:
-            return (dataframe['open'] - dataframe['close']) / dataframe['close']
-        else:
-            return (dataframe['open'].rolling(length).max() - dataframe['close']) / dataframe['close']
+        return top_percent_change(dataframe, length)
 
     def informative_pairs(self):
         # get access to all pairs available in whitelist.
@@ -6730,16 +6654,10 @@ class NFIX_BB_RPB(IStrategy):
 
         # Top traded coins
         if self.coin_metrics['top_traded_enabled']:
-            informative_1d = informative_1d.merge(self.coin_metrics['tt_dataframe'], on='date', how='left')
-            informative_1d['is_top_traded'] = informative_1d.apply(lambda row: self.is_top_coin(metadata['pair'], row, self.coin_metrics['top_traded_len']), axis=1)
-            column_names = [f"Coin #{i}" for i in range(1, self.coin_metrics['top_traded_len'] + 1)]
-            informative_1d.drop(columns = column_names, inplace=True)
+            informative_1d['is_top_traded'] = self.coin_metrics['tt_ranking'].top_mask(metadata['pair'], informative_1d['date'])
         # Top grossing coins
         if self.coin_metrics['top_grossing_enabled']:
-            informative_1d = informative_1d.merge(self.coin_metrics['tg_dataframe'], on='date', how='left')
-            informative_1d['is_top_grossing'] = informative_1d.apply(lambda row: self.is_top_coin(metadata['pair'], row, self.coin_metrics['top_grossing_len']), axis=1)
-            column_names = [f"Coin #{i}" for i in range(1, self.coin_metrics['top_grossing_len'] + 1)]
-            informative_1d.drop(columns = column_names, inplace=True)
+            informative_1d['is_top_grossing'] = self.coin_metrics['tg_ranking'].top_mask(metadata['pair'], informative_1d['date'])
 
         # Pivots
         informative_1d['pivot'], informative_1d['res1'], informative_1d['res2'], informative_1d['res3'], informative_1d['sup1'], informative_1d['sup2'], informative_1d['sup3'] = pivot_points(informative_1d, mode='fibonacci')
@@ -6748,8 +6666,8 @@ class NFIX_BB_RPB(IStrategy):
         informative_1d['open_sha'], informative_1d['close_sha'], informative_1d['low_sha'] = heikin_ashi(informative_1d, smooth_inputs=True, smooth_outputs=False, length=10)
 
         # S/R
-        res_series = informative_1d['high'].rolling(window = 5, center=True).apply(lambda row: self.is_resistance(row), raw=True).shift(2)
-        sup_series = informative_1d['low'].rolling(window = 5, center=True).apply(lambda row: self.is_support(row), raw=True).shift(2)
+        res_series = fractal_highs(informative_1d['high'], left=3, right=1)
+        sup_series = fractal_lows(informative_1d['low'], left=3, right=1)
         informative_1d['res_level'] = Series(np.where(res_series, np.where(informative_1d['close'] > informative_1d['open'], informative_1d['close'], informative_1d['open']), float('NaN'))).ffill()
         informative_1d['res_hlevel'] = Series(np.where(res_series, informative_1d['high'], float('NaN'))).ffill()
         informative_1d['sup_level'] = Series(np.where(sup_series, np.where(informative_1d['close'] < informative_1d['open'], informative_1d['close'], informative_1d['open']), float('NaN'))).ffill()
@@ -6822,8 +6740,8 @@ class NFIX_BB_RPB(IStrategy):
         informative_1h['T3'] = T3(informative_1h)
 
         # S/R
-        res_series = informative_1h['high'].rolling(window = 5, center=True).apply(lambda row: self.is_resistance(row), raw=True).shift(2)
-        sup_series = informative_1h['low'].rolling(window = 5, center=True).apply(lambda row: self.is_support(row), raw=True).shift(2)
+        res_series = fractal_highs(informative_1h['high'], left=3, right=1)
+        sup_series = fractal_lows(informative_1h['low'], left=3, right=1)
         informative_1h['res_level'] = Series(np.where(res_series, np.where(informative_1h['close'] > informative_1h['open'], informative_1h['close'], informative_1h['open']), float('NaN'))).ffill()
         informative_1h['res_hlevel'] = Series(np.where(res_series, informative_1h['high'], float('NaN'))).ffill()
         informative_1h['sup_level'] = Series(np.where(sup_series, np.where(informative_1h['close'] < informative_1h['open'], informative_1h['close'], informative_1h['open']), float('NaN'))).ffill()
@@ -7145,22 +7063,25 @@ class NFIX_BB_RPB(IStrategy):
             btc_info_pair = "BTC/USDT"
 
         if self.has_BTC_daily_tf:
-            btc_daily_tf = self.dp.get_pair_dataframe(btc_info_pair, '1d')
-            btc_daily_tf = self.daily_tf_btc_indicators(btc_daily_tf, metadata)
+            btc_daily_tf = self.btc_indicators.get(
+                (btc_info_pair, '1d'), self.dp.get_pair_dataframe(btc_info_pair, '1d'),
+                lambda btc: self.daily_tf_btc_indicators(btc, metadata))
             dataframe = merge_informative_pair(dataframe, btc_daily_tf, self.timeframe, '1d', ffill=True)
             drop_columns = [f"{s}_1d" for s in ['date', 'open', 'high', 'low', 'close', 'volume']]
             dataframe.drop(columns=dataframe.columns.intersection(drop_columns), inplace=True)
 
         if self.has_BTC_info_tf:
-            btc_info_tf = self.dp.get_pair_dataframe(btc_info_pair, self.info_timeframe_1h)
-            btc_info_tf = self.info_tf_btc_indicators(btc_info_tf, metadata)
+            btc_info_tf = self.btc_indicators.get(
+                (btc_info_pair, self.info_timeframe_1h), self.dp.get_pair_dataframe(btc_info_pair, self.info_timeframe_1h),
+                lambda btc: self.info_tf_btc_indicators(btc, metadata))
             dataframe = merge_informative_pair(dataframe, btc_info_tf, self.timeframe, self.info_timeframe_1h, ffill=True)
             drop_columns = [f"{s}_{self.info_timeframe_1h}" for s in ['date', 'open', 'high', 'low', 'close', 'volume']]
             dataframe.drop(columns=dataframe.columns.intersection(drop_columns), inplace=True)
 
         if self.has_BTC_base_tf:
-            btc_base_tf = self.dp.get_pair_dataframe(btc_info_pair, self.timeframe)
-            btc_base_tf = self.base_tf_btc_indicators(btc_base_tf, metadata)
+            btc_base_tf = self.btc_indicators.get(
+                (btc_info_pair, self.timeframe), self.dp.get_pair_dataframe(btc_info_pair, self.timeframe),
+                lambda btc: self.base_tf_btc_indicators(btc, metadata))
             dataframe = merge_informative_pair(dataframe, btc_base_tf, self.timeframe, self.timeframe, ffill=True)
             drop_columns = [f"{s}_{self.timeframe}" for s in ['date', 'open', 'high', 'low', 'close', 'volume']]
             dataframe.drop(columns=dataframe.columns.intersection(drop_columns), inplace=True)
@@ -8217,50 +8138,7 @@ class NFIX_BB_RPB(IStrategy):
 
 # Elliot Wave Oscillator
 def ewo(dataframe, sma1_length=5, sma2_length=35):
-    sma1 = ta.EMA(dataframe, timeperiod=sma1_length)
-    sma2 = ta.EMA(dataframe, timeperiod=sma2_length)
-    smadif = (sma1 - sma2) / dataframe['close'] * 100
-    return smadif
-
-# Chaikin Money Flow
-def chaikin_money_flow(dataframe, n=20, fillna=False) -> Series:
-    """Chaikin Money Flow (CMF)
-    It measures the amount of Money Flow Volume over a specific period.
-    http://stockcharts.com/school/doku.php?id=chart_school:technical_indicators:chaikin_money_flow_cmf
-    Args:
-        dataframe(pandas.Dataframe): dataframe containing ohlcv
-        n(int): n period.
-        fillna(bool): if True, fill nan values.
-    Returns:
-        pandas.Series: New feature generated.
-    """
-    mfv = ((dataframe['close'] - dataframe['low']) - (dataframe['high'] - dataframe['close'])) / (dataframe['high'] - dataframe['low'])
-    mfv = mfv.fillna(0.0)  # float division by zero
-    mfv *= dataframe['volume']
-    cmf = (mfv.rolling(n, min_periods=0).sum()
-           / dataframe['volume'].rolling(n, min_periods=0).sum())
-    if fillna:
-        cmf = cmf.replace([np.inf, -np.inf], np.nan).fillna(0)
-    return Series(cmf, name='cmf')
-
-# Williams %R
-def williams_r(dataframe: DataFrame, period: int = 14) -> Series:
-    """Williams %R, or just %R, is a technical analysis oscillator showing the current closing price in relation to the high and low
-        of the past N days (for a given N). It was developed by a publisher and promoter of trading materials, Larry Williams.
-        Its purpose is to tell whether a stock or commodity market is trading near the high or the low, or somewhere in between,
-        of its recent trading range.
-        The oscillator is on a negative scale, from −100 (lowest) up to 0 (highest).
-    """
-
-    highest_high = dataframe["high"].rolling(center=False, window=period).max()
-    lowest_low = dataframe["low"].rolling(center=False, window=period).min()
-
-    WR = Series(
-        (highest_high - dataframe["close"]) / (highest_high - lowest_low),
-        name=f"{period} Williams %R",
-        )
-
-    return WR * -100
+    return EWO(dataframe, sma1_length, sma2_length)
 
 # Volume Weighted Moving Average
 def vwma(dataframe: DataFrame, length: int = 10):
@@ -8297,127 +8175,7 @@ def pivot_points(dataframe: DataFrame, mode = 'fibonacci') -> Series:
     return hlc3_pivot, res1, res2, res3, sup1, sup2, sup3
 
 def heikin_ashi(dataframe, smooth_inputs = False, smooth_outputs = False, length = 10):
-    df = dataframe[['open','close','high','low']].copy().fillna(0)
-    if smooth_inputs:
-        df['open_s']  = ta.EMA(df['open'], timeframe = length)
-        df['high_s']  = ta.EMA(df['high'], timeframe = length)
-        df['low_s']   = ta.EMA(df['low'],  timeframe = length)
-        df['close_s'] = ta.EMA(df['close'],timeframe = length)
-
-        open_ha  = (df['open_s'].shift(1) + df['close_s'].shift(1)) / 2
-        high_ha  = df.loc[:, ['high_s', 'open_s', 'close_s']].max(axis=1)
-        low_ha   = df.loc[:, ['low_s', 'open_s', 'close_s']].min(axis=1)
-        close_ha = (df['open_s'] + df['high_s'] + df['low_s'] + df['close_s'])/4
-    else:
-        open_ha  = (df['open'].shift(1) + df['close'].shift(1)) / 2
-        high_ha  = df.loc[:, ['high', 'open', 'close']].max(axis=1)
-        low_ha   = df.loc[:, ['low', 'open', 'close']].min(axis=1)
-        close_ha = (df['open'] + df['high'] + df['low'] + df['close'])/4
-
-    open_ha = open_ha.fillna(0)
-    high_ha = high_ha.fillna(0)
-    low_ha  = low_ha.fillna(0)
-    close_ha = close_ha.fillna(0)
-
-    if smooth_outputs:
-        open_sha  = ta.EMA(open_ha, timeframe = length)
-        high_sha  = ta.EMA(high_ha, timeframe = length)
-        low_sha   = ta.EMA(low_ha, timeframe = length)
-        close_sha = ta.EMA(close_ha, timeframe = length)
-
-        return open_sha, close_sha, low_sha
-    else:
-        return open_ha, close_ha, low_ha
-
-# PMAX
-def pmax(df, period, multiplier, length, MAtype, src):
-
-    period = int(period)
-    multiplier = int(multiplier)
-    length = int(length)
-    MAtype = int(MAtype)
-    src = int(src)
-
-    mavalue = f'MA_{MAtype}_{length}'
-    atr = f'ATR_{period}'
-    pm = f'pm_{period}_{multiplier}_{length}_{MAtype}'
-    pmx = f'pmX_{period}_{multiplier}_{length}_{MAtype}'
-
-    # MAtype==1 --> EMA
-    # MAtype==2 --> DEMA
-    # MAtype==3 --> T3
-    # MAtype==4 --> SMA
-    # MAtype==5 --> VIDYA
-    # MAtype==6 --> TEMA
-    # MAtype==7 --> WMA
-    # MAtype==8 --> VWMA
-    # MAtype==9 --> zema
-    if src == 1:
-        masrc = df["close"]
-    elif src == 2:
-        masrc = (df["high"] + df["low"]) / 2
-    elif src == 3:
-        masrc = (df["high"] + df["low"] + df["close"] + df["open"]) / 4
-
-    if MAtype == 1:
-        mavalue = ta.EMA(masrc, timeperiod=length)
-    elif MAtype == 2:
-        mavalue = ta.DEMA(masrc, timeperiod=length)
-    elif MAtype == 3:
-        mavalue = ta.T3(masrc, timeperiod=length)
-    elif MAtype == 4:
-        mavalue = ta.SMA(masrc, timeperiod=length)
-    elif MAtype == 5:
-        mavalue = VIDYA(df, length=length)
-    elif MAtype == 6:
-        mavalue = ta.TEMA(masrc, timeperiod=length)
-    elif MAtype == 7:
-        mavalue = ta.WMA(df, timeperiod=length)
-    elif MAtype == 8:
-        mavalue = vwma(df, length)
-    elif MAtype == 9:
-        mavalue = zema(df, period=length)
-
-    df[atr] = ta.ATR(df, timeperiod=period)
-    df['basic_ub'] = mavalue + ((multiplier/10) * df[atr])
-    df['basic_lb'] = mavalue - ((multiplier/10) * df[atr])
-
-
-    basic_ub = df['basic_ub'].values
-    final_ub = np.full(len(df), 0.00)
-    basic_lb = df['basic_lb'].values
-    final_lb = np.full(len(df), 0.00)
-
-    for i in range(period, len(df)):
-        final_ub[i] = basic_ub[i] if (
-            basic_ub[i] < final_ub[i - 1]
-            or mavalue[i - 1] > final_ub[i - 1]) else final_ub[i - 1]
-        final_lb[i] = basic_lb[i] if (
-            basic_lb[i] > final_lb[i - 1]
-            or mavalue[i - 1] < final_lb[i - 1]) else final_lb[i - 1]
-
-    df['final_ub'] = final_ub
-    df['final_lb'] = final_lb
-
-    pm_arr = np.full(len(df), 0.00)
-    for i in range(period, len(df)):
-        pm_arr[i] = (
-            final_ub[i] if (pm_arr[i - 1] == final_ub[i - 1]
-                                    and mavalue[i] <= final_ub[i])
-        else final_lb[i] if (
-            pm_arr[i - 1] == final_ub[i - 1]
-            and mavalue[i] > final_ub[i]) else final_lb[i]
-        if (pm_arr[i - 1] == final_lb[i - 1]
-            and mavalue[i] >= final_lb[i]) else final_ub[i]
-        if (pm_arr[i - 1] == final_lb[i - 1]
-            and mavalue[i] < final_lb[i]) else 0.00)
-
-    pm = Series(pm_arr)
-
-    # Mark the trend direction up/down
-    pmx = np.where((pm_arr > 0.00), np.where((mavalue < pm_arr), 'down',  'up'), np.NaN)
-
-    return pm, pmx
+    return simple_heikin_ashi(dataframe, smooth_inputs, smooth_outputs)
 
 # Mom DIV
 def momdiv(dataframe: DataFrame, mom_length: int = 10, bb_length: int = 20, bb_dev: float = 2.0, lookback: int = 30) -> DataFrame:
@@ -8440,28 +8198,6 @@ def momdiv(dataframe: DataFrame, mom_length: int = 10, bb_length: int = 20, bb_d
         }, index=dataframe['close'].index)
     return df
 
-def T3(dataframe, length=5):
-    """
-    T3 Average by HPotter on Tradingview
-    https://www.tradingview.com/script/qzoC9H1I-T3-Average/
-    """
-    df = dataframe.copy()
-
-    df['xe1'] = ta.EMA(df['close'], timeperiod=length)
-    df['xe2'] = ta.EMA(df['xe1'], timeperiod=length)
-    df['xe3'] = ta.EMA(df['xe2'], timeperiod=length)
-    df['xe4'] = ta.EMA(df['xe3'], timeperiod=length)
-    df['xe5'] = ta.EMA(df['xe4'], timeperiod=length)
-    df['xe6'] = ta.EMA(df['xe5'], timeperiod=length)
-    b = 0.7
-    c1 = -b * b * b
-    c2 = 3 * b * b + 3 * b * b * b
-    c3 = -6 * b * b - 3 * b - 3 * b * b * b
-    c4 = 1 + 3 * b + b * b * b + 3 * b * b
-    df['T3Average'] = c1 * df['xe6'] + c2 * df['xe5'] + c3 * df['xe4'] + c4 * df['xe3']
-
-    return df['T3Average']
-
 # Modified Elder Ray Index
 def moderi(dataframe: DataFrame, len_slow_ma: int = 32) -> Series:
     slow_ma = Series(ta.EMA(vwma(dataframe, length=len_slow_ma), timeperiod=len_slow_ma))
@@ -1,9 +1,13 @@
 import freqtrade.vendor.qtpylib.indicators as qtpylib
-import numpy as np
 import talib.abstract as ta
 from freqtrade.strategy.interface import IStrategy
 from pandas import DataFrame
 from datetime import datetime, timedelta
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.normalizer import FIBONACCI_LOOKBACKS, MinmaxNormTracker, minmax_norm
 
 
 """
@@ -97,19 +101,20 @@ class NormalizerStrategyHO2(IStrategy):
             return 0.01
         return 0.99
 
+    # Normalized closes carried per pair in live/dry runs
+    norm_tracker = MinmaxNormTracker(FIBONACCI_LOOKBACKS)
+
     def fischer_norm(self, x, lookback):
-        res = np.zeros_like(x)
-        for i in range(lookback, len(x)):
-            x_min = np.min(x[i-lookback: i +1])
-            x_max = np.max(x[i-lookback: i +1])
-            #res[i] = (2*(x[i] - x_min) / (x_max - x_min)) - 1
-            res[i] = (x[i] - x_min) / (x_max - x_min)
-        return res
+        return minmax_norm(x, [lookback])[:, 0]
     
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        lookback = [13, 21, 34, 55, 89, 144, 233, 377, 610]
-        for look in lookback:
-            dataframe[f"norm_{look}"] = self.fischer_norm(dataframe["close"].values, look)
+        # All lookbacks in one pass, only the new candles in live/dry runs
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            norm = self.norm_tracker.update(metadata['pair'], dataframe)
+        else:
+            norm = minmax_norm(dataframe["close"].values, FIBONACCI_LOOKBACKS)
+        for i, look in enumerate(FIBONACCI_LOOKBACKS):
+            dataframe[f"norm_{look}"] = norm[:, i]
         collist = [col for col in dataframe.columns if col.startswith("norm")]
         dataframe["pct_sum"] = dataframe[collist].sum(axis=1)
 
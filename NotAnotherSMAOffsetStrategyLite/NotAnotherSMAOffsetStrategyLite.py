@@ -9,16 +9,17 @@ import freqtrade.vendor.qtpylib.indicators as qtpylib
 from datetime import datetime, timedelta
 from freqtrade.persistence import Trade
 from freqtrade.strategy import stoploss_from_open, DecimalParameter, IntParameter, CategoricalParameter
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.indicators import EWO
 
 # @Rallipanos
 
 
 def ewo(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['close'] * 100
-    return emadif
+    return EWO(dataframe, ema_length, ema2_length)
 
 
 class NotAnotherSMAOffsetStrategyLite(IStrategy):
@@ -10,6 +10,11 @@ import datetime
 from datetime import datetime
 from freqtrade.persistence import Trade
 from freqtrade.strategy import  DecimalParameter, IntParameter
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.indicators import EWO
 
 
 # @Rallipanos mod. Uzirox
@@ -31,15 +36,6 @@ order_types = {
     'stoploss_on_exchange': False
     }    
 
-def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['close'] * 100
-    return emadif
-
-
-
 class NotAnotherSMAOffsetStrategy_uzi3(IStrategy):
     INTERFACE_VERSION = 2
 
@@ -24,18 +24,17 @@ from datetime import datetime, timedelta
 import technical.indicators as indicators
 from freqtrade.exchange import timeframe_to_prev_date
 from finta import TA
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.averages import linear_wma
+from strategy_utils.latch import latch_signal
 
-def wma(series: Series, length: int) -> Series:
-    norm = 0
-    sum = 0
-
-    for i in range(1, length - 1):
-        weight = (length - i) * length
-        norm = norm + weight
-        sum = sum + series.shift(i) * weight
 
-    return sum / norm
+def wma(series: Series, length: int) -> Series:
+    # Weights (length - i) * length of the candles 1 to length - 2 before the current one
+    return Series(linear_wma(series, length, 1, length - 2), index=series.index)
 
 
 def hma(series: Series, length: int) -> Series:
@@ -186,15 +185,12 @@ class NowoIchimoku1hV1(IStrategy):
                            close_above_shifted_conversion_line & \
                            close_above_double_shifted_upper_cloud
 
-        df['buy_allowed'] = -df['is_cloud_green']
-        for i in range(101, len(df)):
-            df.loc[i, 'buy_allowed'] = df.loc[i - 1, 'buy_allowed']
-
-            if df.loc[i - 1, 'buy']:
-                df.loc[i, 'buy_allowed'] = False
-
-            elif not df.loc[i, 'is_cloud_green']:
-                df[i, 'buy_allowed'] = True
+        # From candle 101 on a buy latches buy_allowed until the cloud is red again, candle 100
+        # (allowed on a red cloud like the ones before it) can latch it with its own buy
+        is_cloud_red = ~df['is_cloud_green'].to_numpy()
+        buy_allowed, _ = latch_signal(df['should_buy'], is_cloud_red, start=100, armed=False)
+        buy_allowed[:100] = is_cloud_red[:100]
+        df['buy_allowed'] = buy_allowed
 
         df.loc[
             (df['buy_allowed'] & df['should_buy'])
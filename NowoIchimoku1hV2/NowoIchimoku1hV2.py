@@ -23,18 +23,17 @@ from datetime import datetime, timedelta
 import technical.indicators as indicators
 from freqtrade.exchange import timeframe_to_prev_date
 from finta import TA
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.averages import linear_wma
+from strategy_utils.latch import latch_signal
 
-def wma(series: Series, length: int) -> Series:
-    norm = 0
-    sum = 0
-
-    for i in range(1, length - 1):
-        weight = (length - i) * length
-        norm = norm + weight
-        sum = sum + series.shift(i) * weight
 
-    return sum / norm
+def wma(series: Series, length: int) -> Series:
+    # Weights (length - i) * length of the candles 1 to length - 2 before the current one
+    return Series(linear_wma(series, length, 1, length - 2), index=series.index)
 
 
 def hma(series: Series, length: int) -> Series:
@@ -214,19 +213,8 @@ class NowoIchimoku1hV2(IStrategy):
                            close_above_shifted_conversion_line & \
                            close_above_double_shifted_upper_cloud
 
-        df['buy'] = False
-        df['buy_allowed'] = True
-        for row in df.itertuples():
-            if row.Index > 100:
-                df.loc[row.Index, 'buy_allowed'] = df.at[row.Index - 1, 'buy_allowed']
-
-                if df.at[row.Index - 1, 'buy']:
-                    df.loc[row.Index, 'buy_allowed'] = False
-
-                if not df.at[row.Index, 'is_cloud_green']:
-                    df.loc[row.Index, 'buy_allowed'] = True
-
-                df.loc[row.Index, 'buy'] = df.at[row.Index, 'buy_allowed'] & df.at[row.Index, 'should_buy']
+        # From candle 101 on a buy latches buy_allowed until the cloud is red again
+        df['buy_allowed'], df['buy'] = latch_signal(df['should_buy'], ~df['is_cloud_green'], start=101)
 
         return df
 
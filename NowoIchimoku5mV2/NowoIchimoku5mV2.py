@@ -26,6 +26,12 @@ from datetime import datetime, timedelta
 import technical.indicators as indicators
 from freqtrade.exchange import timeframe_to_prev_date
 from finta import TA
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.averages import linear_wma
+from strategy_utils.latch import latch_signal
 
 
 def merge_informative_pair(dataframe: pd.DataFrame, informative: pd.DataFrame,
@@ -84,15 +90,8 @@ def merge_informative_pair(dataframe: pd.DataFrame, informative: pd.DataFrame,
 
 
 def wma(series: Series, length: int) -> Series:
-    norm = 0
-    sum = 0
-
-    for i in range(1, length - 1):
-        weight = (length - i) * length
-        norm = norm + weight
-        sum = sum + series.shift(i) * weight
-
-    return sum / norm
+    # Weights (length - i) * length of the candles 1 to length - 2 before the current one
+    return Series(linear_wma(series, length, 1, length - 2), index=series.index)
 
 
 def hma(series: Series, length: int) -> Series:
@@ -289,19 +288,8 @@ class NowoIchimoku5mV2(IStrategy):
                            close_above_shifted_conversion_line & \
                            close_above_double_shifted_upper_cloud
 
-        df['buy'] = False
-        df['buy_allowed'] = True
-
-        for i in range(1, len(df)):
-            df.loc[i, 'buy_allowed'] = df.at[i - 1, 'buy_allowed']
-
-            if df.at[i - 1, 'buy']:
-                df.loc[i, 'buy_allowed'] = False
-
-            if not df.at[i, 'is_cloud_green']:
-                df.loc[i, 'buy_allowed'] = True
-
-            df.loc[i, 'buy'] = df.at[i, 'buy_allowed'] & df.at[i, 'should_buy']
+        # A buy latches buy_allowed until the cloud is red again
+        df['buy_allowed'], df['buy'] = latch_signal(df['should_buy'], ~df['is_cloud_green'], start=1)
 
         return df
 
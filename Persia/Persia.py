@@ -20,6 +20,11 @@ import talib.abstract as ta
 from functools import reduce
 import pandas as pd
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.indicator_store import IndicatorCache
 ###################################### SETINGS ######################################
 
 # INDICATORS
@@ -138,6 +143,8 @@ class Persia(IStrategy):
     timeframe = '5m'
     # #################### END OF RESULT PLACE ####################
 
+    indicator_cache = IndicatorCache(shift=1)
+
     ###############################################################
     # BUY HYPEROPTABLE PARAMS:
     formula0 = CategoricalParameter(
@@ -2555,30 +2562,14 @@ class Persia(IStrategy):
     ###############################################################
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        dataframe1 = dataframe.shift(1)
-        # print(timeframes)
-        for indicator in indicators:
-            for tf_idx in timeframes:
-                tf_idx = int(tf_idx)
-                try:
-                    dataframe[f'{indicator}-{tf_idx}'] = getattr(
-                        ta, indicator)(dataframe1, timeperiod=tf_idx)
-                except:
-                    try:
-                        dataframe[f'{indicator}-{tf_idx}'] = getattr(
-                            ta, indicator)(dataframe1, timeperiod=float(tf_idx))
-                    except:
-                        try:
-                            dataframe[f'{indicator}-{tf_idx}'] = getattr(ta, indicator)(
-                                dataframe1,  timeperiod=tf_idx).iloc[:, 0]
-                        except:
-                            raise
-        # print(dataframe.keys())
-        # print("\t",metadata['pair'],end="\h")
+        # Indicators are computed on the previous candle, lazily: only the columns the
+        # current parameters read are built, and hyperopt epochs reuse them per pair
+        self.indicator_cache.store(metadata['pair'], dataframe)
         return dataframe
 
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         conditions = []
+        store = self.indicator_cache.store(metadata['pair'], dataframe)
 
         for i in range(CONDITIONS):
             i = str(i)
@@ -2588,8 +2579,8 @@ class Persia(IStrategy):
             crossed_timeframe = f'{getattr(self,"crossed_timeframe"+i).value}'
             formula = f'{getattr(self,"formula"+i).value}'
 
-            A = dataframe[f'{indicator}-{timeframe}']
-            B = dataframe[f'{crossed}-{crossed_timeframe}']
+            A = store.get(indicator, timeframe)
+            B = store.get(crossed, crossed_timeframe)
             R = pd.Series([float(f'{getattr(self,"real"+i).value}')]*len(A))
             df = pd.DataFrame({'A': A, 'B': A, 'R': R})
 
@@ -2610,6 +2601,7 @@ class Persia(IStrategy):
         i = 0
         last_df = pd.DataFrame
         last_opr = None
+        store = self.indicator_cache.store(metadata['pair'], dataframe)
         for i in range(CONDITIONS):
             i = str(i)
             indicator = f'{getattr(self,"sell_indicator"+i).value}'
@@ -2618,8 +2610,8 @@ class Persia(IStrategy):
             crossed_timeframe_idx = f'{getattr(self,"sell_crossed_timeframe"+i).value}'
             formula = f'{getattr(self,"sell_formula"+i).value}'
 
-            A = dataframe[f'{indicator}-{tf_idx}']
-            B = dataframe[f'{crossed}-{crossed_timeframe_idx}']
+            A = store.get(indicator, tf_idx)
+            B = store.get(crossed, crossed_timeframe_idx)
             R = pd.Series([float(f'{getattr(self,"sell_real"+i).value}')]*len(A))
             df = pd.DataFrame({'A': A, 'B': A, 'R': R})
 
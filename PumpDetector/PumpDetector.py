@@ -15,6 +15,12 @@ import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 
 import math
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.recurrences import xsa_average
+from strategy_utils.parallel import PairPool
 
 """
     https://fr.tradingview.com/script/vDX9m7PJ-L2-KDJ-with-Whale-Pump-Detector/
@@ -23,30 +29,9 @@ import math
 
 
 def xsa(dataframe, source, len, wei):
-    df = dataframe.copy().fillna(0)
-    def calc_xsa(dfr, init=0):
-        global calc_sumf_value
-        global calc_src_value
-        global calc_out_value
-        if init == 1:
-            calc_sumf_value = [0.0] * len
-            calc_src_value = [0.0] * len
-            calc_out_value = [0.0] * len
-            return
-        calc_src_value.pop(0)
-        calc_src_value.append(dfr[source])
-        sumf_val = calc_sumf_value[-1] - calc_src_value[0] 
-        ma_val = sumf_val / len
-        out_val = (calc_src_value[-1] * wei + calc_out_value[-1] * (len-wei))/len
-        calc_sumf_value.pop(0)
-        calc_sumf_value.append(sumf_val)
-        calc_out_value.pop(0)
-        calc_out_value.append(out_val)
-        return out_val
-    calc_xsa(None, init=1)
-    df['retxsa'] = df.apply(calc_xsa, axis = 1)
-    
-    return df['retxsa']    
+    # (src * wei + previous * (len - wei)) / len, from 0 with NaN sources taken as 0
+    values, _ = xsa_average(dataframe[source].fillna(0), len, wei)
+    return pd.Series(values, index=dataframe.index, name='retxsa')
 
 class PumpDetector(IStrategy):
 
@@ -104,8 +89,31 @@ class PumpDetector(IStrategy):
             } 
         }
     }
+
+    # Compute the indicators of every whitelisted pair in a pool of pair_threads threads at the
+    # start of each bot loop (live/dry runs), populate_indicators then picks up its pair's columns
+    analyze_pairs_in_threads = False
+    pair_threads = None
+    pair_pool = PairPool()
+
+    def bot_loop_start(self, **kwargs) -> None:
+        if self.analyze_pairs_in_threads and self.config['runmode'].value in ('live', 'dry_run'):
+            self.pair_pool.precompute({pair: self.dp.ohlcv(pair, self.timeframe) for pair in self.dp.current_whitelist()},
+                                      self.pump_columns, self.pair_threads)
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        
+        if self.analyze_pairs_in_threads:
+            columns = self.pair_pool.get(metadata['pair'], dataframe, self.pump_columns)
+        else:
+            columns = self.pump_columns(dataframe)
+        for name, values in columns.items():
+            dataframe[name] = values
+        return dataframe
+
+    def pump_columns(self, dataframe: DataFrame) -> dict:
+        """The indicator columns for the candles of ``dataframe``, which is left untouched."""
+        source = dataframe
+        dataframe = dataframe.copy()
 
         n1 = 18
         m1 = 4
@@ -137,7 +145,7 @@ class PumpDetector(IStrategy):
 
        
 
-        return dataframe
+        return {name: dataframe[name].to_numpy() for name in dataframe.columns if name not in source.columns}
 
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
      
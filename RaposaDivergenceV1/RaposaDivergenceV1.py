@@ -11,7 +11,11 @@ from collections import deque
 import talib.abstract as ta
 from freqtrade.strategy import IntParameter, IStrategy
 from pandas import DataFrame
-from scipy.signal import argrelextrema
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.extrema import relative_extrema
 
 
 class RaposaDivergenceV1(IStrategy):
@@ -159,7 +163,7 @@ def getHigherLows(data: np.array, order=5, K=2):
     K determines how many consecutive lows need to be higher.
     """
     # Get lows
-    low_idx = argrelextrema(data, np.less, order=order)[0]
+    low_idx = relative_extrema(data, order)[0]
     lows = data[low_idx]
     # Ensure consecutive lows are higher than previous lows
     extrema = []
@@ -185,7 +189,7 @@ def getLowerHighs(data: np.array, order=5, K=2):
     K determines how many consecutive highs need to be lower.
     """
     # Get highs
-    high_idx = argrelextrema(data, np.greater, order=order)[0]
+    high_idx = relative_extrema(data, order)[1]
     highs = data[high_idx]
     # Ensure consecutive highs are lower than previous highs
     extrema = []
@@ -211,7 +215,7 @@ def getHigherHighs(data: np.array, order=5, K=2):
     K determines how many consecutive highs need to be higher.
     """
     # Get highs
-    high_idx = argrelextrema(data, np.greater, order=5)[0]
+    high_idx = relative_extrema(data, 5)[1]
     highs = data[high_idx]
     # Ensure consecutive highs are higher than previous highs
     extrema = []
@@ -237,7 +241,7 @@ def getLowerLows(data: np.array, order=5, K=2):
     K determines how many consecutive lows need to be lower.
     """
     # Get lows
-    low_idx = argrelextrema(data, np.less, order=order)[0]
+    low_idx = relative_extrema(data, order)[0]
     lows = data[low_idx]
     # Ensure consecutive lows are lower than previous lows
     extrema = []
@@ -14,6 +14,12 @@ from datetime import datetime, timedelta
 from freqtrade.persistence import Trade
 from freqtrade.strategy import stoploss_from_open, merge_informative_pair, DecimalParameter, IntParameter, CategoricalParameter
 import technical.indicators as ftt
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.indicator_bank import BankStore, add_banks
+from strategy_utils.indicators import EWO
 
 ######################################## Warning ########################################
 # You won't get a lot of benefits by simply changing to this strategy                   #
@@ -27,14 +33,6 @@ import technical.indicators as ftt
 
 
 
-def EWO(dataframe, ema_length=5, ema2_length=35):
-    #df = dataframe.copy()
-    ema1 = ta.EMA(dataframe, timeperiod=ema_length)
-    ema2 = ta.EMA(dataframe, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / dataframe['close'] * 100
-    return emadif
-
-
 class SMAOffsetProtectOptV1_kkeue_20210619(IStrategy):
     # Modified Buy / Sell params - 20210619
     # Buy hyperspace params:
@@ -104,6 +102,10 @@ class SMAOffsetProtectOptV1_kkeue_20210619(IStrategy):
     process_only_new_candles = True
     startup_candle_count: int = 30
 
+    # Hyperopt ranges of indicators, one contiguous array per family, kept per pair and
+    # saved to disk only when the config sets "indicator_bank": {"persist": true}
+    indicator_banks = BankStore()
+
     plot_config = {
         'main_plot': {
             'ma_buy': {'color': 'orange'},
@@ -129,13 +131,12 @@ class SMAOffsetProtectOptV1_kkeue_20210619(IStrategy):
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
-        # Calculate all ma_buy values
-        for val in self.base_nb_candles_buy.range:
-            dataframe[f'ma_buy_{val}'] = ta.EMA(dataframe, timeperiod=val)
-
-        # Calculate all ma_sell values
-        for val in self.base_nb_candles_sell.range:
-            dataframe[f'ma_sell_{val}'] = ta.EMA(dataframe, timeperiod=val)
+        # Calculate all ma_buy / ma_sell values
+        banks = self.indicator_banks.configure(self.config)
+        dataframe = add_banks(dataframe, {
+            'ma_buy_': banks.get(metadata['pair'], dataframe, 'EMA', self.base_nb_candles_buy.range),
+            'ma_sell_': banks.get(metadata['pair'], dataframe, 'EMA', self.base_nb_candles_sell.range),
+        })
 
         # Elliot
         dataframe['EWO'] = EWO(dataframe, self.fast_ewo, self.slow_ewo)
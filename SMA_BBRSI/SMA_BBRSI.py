@@ -3,7 +3,7 @@
 from freqtrade.strategy.interface import IStrategy
 from typing import Dict, List
 from functools import reduce
-from pandas import DataFrame, Series
+from pandas import DataFrame
 # --------------------------------
 
 import talib.abstract as ta
@@ -18,6 +18,11 @@ import technical.indicators as ftt
 
 import math
 import pandas_ta as pta
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.indicators import EWO, moderi
 
 ######################################## Warning ########################################
 # You won't get a lot of benefits by simply changing to this strategy                   #
@@ -56,28 +61,6 @@ sell_params = {
     "rsi_high": 72,
 }
 
-# Volume Weighted Moving Average
-def vwma(dataframe: DataFrame, length: int = 10):
-    """Indicator: Volume Weighted Moving Average (VWMA)"""
-    # Calculate Result
-    pv = dataframe['close'] * dataframe['volume']
-    vwma = Series(ta.SMA(pv, timeperiod=length) / ta.SMA(dataframe['volume'], timeperiod=length))
-    return vwma
-
-
-# Modified Elder Ray Index
-def moderi(dataframe: DataFrame, len_slow_ma: int = 32) -> Series:
-    slow_ma = Series(ta.EMA(vwma(dataframe, length=len_slow_ma), timeperiod=len_slow_ma))
-    return slow_ma >= slow_ma.shift(1)  # we just need true & false for ERI trend
-
-def EWO(dataframe, ema_length=5, ema2_length=35):
-    df = dataframe.copy()
-    ema1 = ta.EMA(df, timeperiod=ema_length)
-    ema2 = ta.EMA(df, timeperiod=ema2_length)
-    emadif = (ema1 - ema2) / df['close'] * 100
-    return emadif
-
-
 class SMA_BBRSI(IStrategy):
     INTERFACE_VERSION = 2
 
@@ -1,7 +1,6 @@
 import numpy as np
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
-import arrow
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy import merge_informative_pair
 from pandas import DataFrame, Series
@@ -9,9 +8,13 @@ from functools import reduce
 from datetime import datetime
 from freqtrade.persistence import Trade
 from technical.indicators import RMI
-from statistics import mean
 from cachetools import TTLCache
 from scipy.signal import argrelextrema
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.trade_snapshot import TradeSnapshot
 
 class Schism2MM(IStrategy):
 
@@ -46,6 +49,7 @@ class Schism2MM(IStrategy):
 
     custom_trade_info = {}
     custom_current_price_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
+    trade_snapshot: TradeSnapshot = None
 
     def informative_pairs(self):
         pairs = self.dp.current_whitelist()
@@ -148,6 +152,12 @@ class Schism2MM(IStrategy):
         
         return dataframe
 
+    # Snapshot the open trades and their rates once per loop, for every pair's populate_trades
+    def bot_loop_start(self, **kwargs) -> None:
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            self.trade_snapshot = TradeSnapshot.take(self.dp, self.config, Trade.get_open_trades())
+            self.custom_current_price_cache.update(self.trade_snapshot.rates)
+
     def populate_trades(self, pair: str) -> dict:
         if not pair in self.custom_trade_info:
             self.custom_trade_info[pair] = {}
@@ -156,39 +166,11 @@ class Schism2MM(IStrategy):
         trade_data['active_trade'] = trade_data['other_trades'] = trade_data['biggest_loser'] = False
 
         if self.config['runmode'].value in ('live', 'dry_run'):
-            
-            active_trade = Trade.get_trades([Trade.pair == pair, Trade.is_open.is_(True),]).all()
-
-            if active_trade:
-                current_rate = self.get_current_price(pair, True)
-                active_trade[0].adjust_min_max_rates(current_rate)
-
-                present = arrow.utcnow()
-                trade_start  = arrow.get(active_trade[0].open_date)
-                open_minutes = (present - trade_start).total_seconds() // 60 
-
-                trade_data['active_trade']   = True
-                trade_data['current_profit'] = active_trade[0].calc_profit_ratio(current_rate)
-                trade_data['peak_profit']    = max(0, active_trade[0].calc_profit_ratio(active_trade[0].max_rate))
-                trade_data['open_minutes']   : int = open_minutes
-                trade_data['open_candles']   : int = (open_minutes // active_trade[0].timeframe)
-            else: 
-                trade_data['current_profit'] = trade_data['peak_profit']  = 0.0
-                trade_data['open_minutes']   = trade_data['open_candles'] = 0
-
-            other_trades = Trade.get_trades([Trade.pair != pair, Trade.is_open.is_(True),]).all()
-
-            if other_trades:
-                trade_data['other_trades'] = True
-                other_profit = tuple(trade.calc_profit_ratio(self.get_current_price(trade.pair, False)) for trade in other_trades)
-                trade_data['avg_other_profit'] = mean(other_profit) 
-                if trade_data['current_profit'] < min(other_profit):
-                    trade_data['biggest_loser'] = True
-            else:
-                trade_data['avg_other_profit'] = 0
+            # Read from the snapshot of the open trades taken at the start of the bot loop
+            if self.trade_snapshot is None:
+                self.bot_loop_start()
+            trade_data = self.trade_snapshot.trade_data(pair)
 
-            open_trades = len(Trade.get_open_trades())
-            trade_data['free_slots'] = max(0, self.config['max_open_trades'] - open_trades)
         return trade_data
 
     def get_current_price(self, pair: str, refresh: bool) -> float:
@@ -1,7 +1,6 @@
 import numpy as np
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
-import arrow
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy import merge_informative_pair
 from typing import Dict, List, Optional, Tuple
@@ -10,8 +9,12 @@ from functools import reduce
 from datetime import datetime
 from freqtrade.persistence import Trade
 from technical.indicators import RMI
-from statistics import mean
 from cachetools import TTLCache
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.trade_snapshot import TradeSnapshot
 
 
 """
@@ -67,6 +70,7 @@ class Schism4(IStrategy):
     custom_trade_info = {}
     custom_fiat = "USD"
     custom_current_price_cache: TTLCache = TTLCache(maxsize=100, ttl=300) # 5 minutes
+    trade_snapshot: TradeSnapshot = None
     
     """
     Informative Pair Definitions
@@ -248,6 +252,12 @@ class Schism4(IStrategy):
     """
     Custom Methods
     """
+    # Snapshot the open trades and their rates once per loop, for every pair's populate_trades
+    def bot_loop_start(self, **kwargs) -> None:
+        if self.config['runmode'].value in ('live', 'dry_run'):
+            self.trade_snapshot = TradeSnapshot.take(self.dp, self.config, Trade.get_open_trades())
+            self.custom_current_price_cache.update(self.trade_snapshot.rates)
+
     # Populate trades_data from the database
     def populate_trades(self, pair: str) -> dict:
         # Initialize the trades dict if it doesn't exist, persist it otherwise
@@ -261,48 +271,10 @@ class Schism4(IStrategy):
 
         # active trade stuff only works in live and dry, not backtest
         if self.config['runmode'].value in ('live', 'dry_run'):
-            
-            # find out if we have an open trade for this pair
-            active_trade = Trade.get_trades([Trade.pair == pair, Trade.is_open.is_(True),]).all()
-
-            # if so, get some information
-            if active_trade:
-                # get current price and update the min/max rate
-                current_rate = self.get_current_price(pair, True)
-                active_trade[0].adjust_min_max_rates(current_rate)
-
-                # get how long the trade has been open in minutes and candles
-                present = arrow.utcnow()
-                trade_start  = arrow.get(active_trade[0].open_date)
-                open_minutes = (present - trade_start).total_seconds() // 60  # floor
-
-                # set up the things we use in the strategy
-                trade_data['active_trade']   = True
-                trade_data['current_profit'] = active_trade[0].calc_profit_ratio(current_rate)
-                trade_data['peak_profit']    = max(0, active_trade[0].calc_profit_ratio(active_trade[0].max_rate))
-                trade_data['open_minutes']   : int = open_minutes
-                trade_data['open_candles']   : int = (open_minutes // active_trade[0].timeframe) # floor
-            else: 
-                trade_data['current_profit'] = trade_data['peak_profit']  = 0.0
-                trade_data['open_minutes']   = trade_data['open_candles'] = 0
-
-            # if there are open trades not including the current pair, get some information
-            # future reference, for *all* open trades: open_trades = Trade.get_open_trades()
-            other_trades = Trade.get_trades([Trade.pair != pair, Trade.is_open.is_(True),]).all()
-
-            if other_trades:
-                trade_data['other_trades'] = True
-                other_profit = tuple(trade.calc_profit_ratio(self.get_current_price(trade.pair, False)) for trade in other_trades)
-                trade_data['avg_other_profit'] = mean(other_profit) 
-                # find which of our trades is the biggest loser
-                if trade_data['current_profit'] < min(other_profit):
-                    trade_data['biggest_loser'] = True
-            else:
-                trade_data['avg_other_profit'] = 0
-
-            # get the number of free trade slots, storing in every pairs dict due to laziness
-            open_trades = len(Trade.get_open_trades())
-            trade_data['free_slots'] = max(0, self.config['max_open_trades'] - open_trades)
+            # Read from the snapshot of the open trades taken at the start of the bot loop
+            if self.trade_snapshot is None:
+                self.bot_loop_start()
+            trade_data = self.trade_snapshot.trade_data(pair)
 
         return trade_data
 
@@ -17,8 +17,14 @@ from numpy.lib import math
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.hyper import IntParameter
 from pandas import DataFrame
-import talib.abstract as ta
-import numpy as np
+from itertools import product
+import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.bands import TREND_DOWN, TREND_UP
+from strategy_utils.supertrend import supertrend_batch
 
 class Supertrend(IStrategy):
     # Buy params, Sell params, ROI, Stoploss and Trailing Stop are values generated by 'freqtrade hyperopt --strategy Supertrend --hyperopt-loss ShortTradeDurHyperOptLoss --timerange=20210101- --timeframe=1h --spaces all'
@@ -80,38 +86,22 @@ class Supertrend(IStrategy):
     sell_p3 = IntParameter(7, 21, default=14)
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        for multiplier in self.buy_m1.range:
-            for period in self.buy_p1.range:
-                dataframe[f'supertrend_1_buy_{multiplier}_{period}'] = self.supertrend(dataframe, multiplier, period)['STX']
-
-        for multiplier in self.buy_m2.range:
-            for period in self.buy_p2.range:
-                dataframe[f'supertrend_2_buy_{multiplier}_{period}'] = self.supertrend(dataframe, multiplier, period)['STX']
-
-        for multiplier in self.buy_m3.range:
-            for period in self.buy_p3.range:
-                dataframe[f'supertrend_3_buy_{multiplier}_{period}'] = self.supertrend(dataframe, multiplier, period)['STX']
-
-        for multiplier in self.sell_m1.range:
-            for period in self.sell_p1.range:
-                dataframe[f'supertrend_1_sell_{multiplier}_{period}'] = self.supertrend(dataframe, multiplier, period)['STX']
-
-        for multiplier in self.sell_m2.range:
-            for period in self.sell_p2.range:
-                dataframe[f'supertrend_2_sell_{multiplier}_{period}'] = self.supertrend(dataframe, multiplier, period)['STX']
-
-        for multiplier in self.sell_m3.range:
-            for period in self.sell_p3.range:
-                dataframe[f'supertrend_3_sell_{multiplier}_{period}'] = self.supertrend(dataframe, multiplier, period)['STX']
+        # Every (multiplier, period) pair reachable from the parameter ranges, computed in one batch
+        params = set()
+        for m, p in [(self.buy_m1, self.buy_p1), (self.buy_m2, self.buy_p2), (self.buy_m3, self.buy_p3),
+                     (self.sell_m1, self.sell_p1), (self.sell_m2, self.sell_p2), (self.sell_m3, self.sell_p3)]:
+            params.update(product(m.range, p.range))
+        supertrend = supertrend_batch(dataframe, sorted(params))
+        dataframe = pd.concat([dataframe, supertrend.trend_frame(dataframe.index)], axis=1)
 
         return dataframe
 
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         dataframe.loc[
             (
-               (dataframe[f'supertrend_1_buy_{self.buy_m1.value}_{self.buy_p1.value}'] == 'up') &
-               (dataframe[f'supertrend_2_buy_{self.buy_m2.value}_{self.buy_p2.value}'] == 'up') &
-               (dataframe[f'supertrend_3_buy_{self.buy_m3.value}_{self.buy_p3.value}'] == 'up') & # The three indicators are 'up' for the current candle
+               (dataframe[f'supertrend_{self.buy_m1.value}_{self.buy_p1.value}'] == TREND_UP) &
+               (dataframe[f'supertrend_{self.buy_m2.value}_{self.buy_p2.value}'] == TREND_UP) &
+               (dataframe[f'supertrend_{self.buy_m3.value}_{self.buy_p3.value}'] == TREND_UP) & # The three indicators are 'up' for the current candle
                (dataframe['volume'] > 0) # There is at least some trading volume
         ),
             'buy'] = 1
@@ -121,57 +111,11 @@ class Supertrend(IStrategy):
     def populate_sell_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         dataframe.loc[
             (
-               (dataframe[f'supertrend_1_sell_{self.sell_m1.value}_{self.sell_p1.value}'] == 'down') &
-               (dataframe[f'supertrend_2_sell_{self.sell_m2.value}_{self.sell_p2.value}'] == 'down') &
-               (dataframe[f'supertrend_3_sell_{self.sell_m3.value}_{self.sell_p3.value}'] == 'down') & # The three indicators are 'down' for the current candle
+               (dataframe[f'supertrend_{self.sell_m1.value}_{self.sell_p1.value}'] == TREND_DOWN) &
+               (dataframe[f'supertrend_{self.sell_m2.value}_{self.sell_p2.value}'] == TREND_DOWN) &
+               (dataframe[f'supertrend_{self.sell_m3.value}_{self.sell_p3.value}'] == TREND_DOWN) & # The three indicators are 'down' for the current candle
                (dataframe['volume'] > 0) # There is at least some trading volume
             ),
             'sell'] = 1
 
         return dataframe
-
-
-
-    """
-        Supertrend Indicator; adapted for freqtrade
-        from: https://github.com/freqtrade/freqtrade-strategies/issues/30
-    """
-    def supertrend(self, dataframe: DataFrame, multiplier, period):
-        df = dataframe.copy()
-
-        df['TR'] = ta.TRANGE(df)
-        df['ATR'] = ta.SMA(df['TR'], period)
-
-        st = 'ST_' + str(period) + '_' + str(multiplier)
-        stx = 'STX_' + str(period) + '_' + str(multiplier)
-
-        # Compute basic upper and lower bands
-        df['basic_ub'] = (df['high'] + df['low']) / 2 + multiplier * df['ATR']
-        df['basic_lb'] = (df['high'] + df['low']) / 2 - multiplier * df['ATR']
-
-        # Compute final upper and lower bands
-        df['final_ub'] = 0.00
-        df['final_lb'] = 0.00
-        for i in range(period, len(df)):
-            df['final_ub'].iat[i] = df['basic_ub'].iat[i] if df['basic_ub'].iat[i] < df['final_ub'].iat[i - 1] or df['close'].iat[i - 1] > df['final_ub'].iat[i - 1] else df['final_ub'].iat[i - 1]
-            df['final_lb'].iat[i] = df['basic_lb'].iat[i] if df['basic_lb'].iat[i] > df['final_lb'].iat[i - 1] or df['close'].iat[i - 1] < df['final_lb'].iat[i - 1] else df['final_lb'].iat[i - 1]
-
-        # Set the Supertrend value
-        df[st] = 0.00
-        for i in range(period, len(df)):
-            df[st].iat[i] = df['final_ub'].iat[i] if df[st].iat[i - 1] == df['final_ub'].iat[i - 1] and df['close'].iat[i] <= df['final_ub'].iat[i] else \
-                            df['final_lb'].iat[i] if df[st].iat[i - 1] == df['final_ub'].iat[i - 1] and df['close'].iat[i] >  df['final_ub'].iat[i] else \
-                            df['final_lb'].iat[i] if df[st].iat[i - 1] == df['final_lb'].iat[i - 1] and df['close'].iat[i] >= df['final_lb'].iat[i] else \
-                            df['final_ub'].iat[i] if df[st].iat[i - 1] == df['final_lb'].iat[i - 1] and df['close'].iat[i] <  df['final_lb'].iat[i] else 0.00
-        # Mark the trend direction up/down
-        df[stx] = np.where((df[st] > 0.00), np.where((df['close'] < df[st]), 'down',  'up'), np.NaN)
-
-        # Remove basic and final bands from the columns
-        df.drop(['basic_ub', 'basic_lb', 'final_ub', 'final_lb'], inplace=True, axis=1)
-
-        df.fillna(0, inplace=True)
-
-        return DataFrame(index=df.index, data={
-            'ST' : df[st],
-            'STX' : df[stx]
-        })
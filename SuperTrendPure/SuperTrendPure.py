@@ -3,9 +3,12 @@ from numpy.lib import math
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.hyper import IntParameter
 from pandas import DataFrame
-import talib.abstract as ta
-import numpy as np
 import freqtrade.vendor.qtpylib.indicators as qtpylib
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.supertrend import supertrend
 
 
 class SuperTrendPure(IStrategy):
@@ -31,9 +34,9 @@ class SuperTrendPure(IStrategy):
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
-        supertrend = self.supertrend(dataframe, 2, 8)
-        dataframe['st'] = supertrend['ST']
-        dataframe['stx'] = supertrend['STX']
+        st = supertrend(dataframe, 2, 8)
+        dataframe['st'] = st['ST']
+        dataframe['stx'] = st['STX']
 
         return dataframe
 
@@ -56,56 +59,3 @@ class SuperTrendPure(IStrategy):
             'sell'] = 1
 
         return dataframe
-
-    """
-        Supertrend Indicator; adapted for freqtrade
-        from: https://github.com/freqtrade/freqtrade-strategies/issues/30
-    """
-
-    def supertrend(self, dataframe: DataFrame, multiplier, period):
-        df = dataframe.copy()
-
-        df['TR'] = ta.TRANGE(df)
-        df['ATR'] = ta.SMA(df['TR'], period)
-
-        st = 'ST_' + str(period) + '_' + str(multiplier)
-        stx = 'STX_' + str(period) + '_' + str(multiplier)
-
-        # Compute basic upper and lower bands
-        df['basic_ub'] = (df['high'] + df['low']) / 2 + multiplier * df['ATR']
-        df['basic_lb'] = (df['high'] + df['low']) / 2 - multiplier * df['ATR']
-
-        # Compute final upper and lower bands
-        df['final_ub'] = 0.00
-        df['final_lb'] = 0.00
-        for i in range(period, len(df)):
-            df['final_ub'].iat[i] = df['basic_ub'].iat[i] if df['basic_ub'].iat[i] < df['final_ub'].iat[i - 1] or \
-                                                             df['close'].iat[i - 1] > df['final_ub'].iat[i - 1] else \
-            df['final_ub'].iat[i - 1]
-            df['final_lb'].iat[i] = df['basic_lb'].iat[i] if df['basic_lb'].iat[i] > df['final_lb'].iat[i - 1] or \
-                                                             df['close'].iat[i - 1] < df['final_lb'].iat[i - 1] else \
-            df['final_lb'].iat[i - 1]
-
-        # Set the Supertrend value
-        df[st] = 0.00
-        for i in range(period, len(df)):
-            df[st].iat[i] = df['final_ub'].iat[i] if df[st].iat[i - 1] == df['final_ub'].iat[i - 1] and df['close'].iat[
-                i] <= df['final_ub'].iat[i] else \
-                df['final_lb'].iat[i] if df[st].iat[i - 1] == df['final_ub'].iat[i - 1] and df['close'].iat[i] > \
-                                         df['final_ub'].iat[i] else \
-                    df['final_lb'].iat[i] if df[st].iat[i - 1] == df['final_lb'].iat[i - 1] and df['close'].iat[i] >= \
-                                             df['final_lb'].iat[i] else \
-                        df['final_ub'].iat[i] if df[st].iat[i - 1] == df['final_lb'].iat[i - 1] and df['close'].iat[i] < \
-                                                 df['final_lb'].iat[i] else 0.00
-        # Mark the trend direction up/down
-        df[stx] = np.where((df[st] > 0.00), np.where((df['close'] < df[st]), 'down', 'up'), np.NaN)
-
-        # Remove basic and final bands from the columns
-        df.drop(['basic_ub', 'basic_lb', 'final_ub', 'final_lb'], inplace=True, axis=1)
-
-        df.fillna(0, inplace=True)
-
-        return DataFrame(index=df.index, data={
-            'ST': df[st],
-            'STX': df[stx]
-        })
\ No newline at end of file
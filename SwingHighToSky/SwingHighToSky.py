@@ -14,9 +14,13 @@ from freqtrade.strategy import IntParameter
 from functools import reduce
 from pandas import DataFrame
 
-import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 import numpy
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.indicator_bank import BankStore, add_banks
 
 
 
@@ -42,6 +46,10 @@ class SwingHighToSky(IStrategy):
 
     minimal_roi = {"0": 0.27058, "33": 0.0853, "64": 0.04093, "244": 0}
 
+    # Hyperopt ranges of indicators, one contiguous array per family, kept per pair and
+    # saved to disk only when the config sets "indicator_bank": {"persist": true}
+    indicator_banks = BankStore()
+
     buy_cci = IntParameter(low=-200, high=200, default=100, space='buy', optimize=True)
     buy_cciTime = IntParameter(low=10, high=80, default=20, space='buy', optimize=True)
     buy_rsi = IntParameter(low=10, high=90, default=30, space='buy', optimize=True)
@@ -73,19 +81,14 @@ class SwingHighToSky(IStrategy):
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
-        for val in self.buy_cciTime.range:
-            dataframe[f'cci-{val}'] = ta.CCI(dataframe, timeperiod=val)
-
-        for val in self.sell_cciTime.range:
-            dataframe[f'cci-sell-{val}'] = ta.CCI(dataframe, timeperiod=val)
-
-        for val in self.buy_rsiTime.range:
-            dataframe[f'rsi-{val}'] = ta.RSI(dataframe, timeperiod=val)
-
-        for val in self.sell_rsiTime.range:
-            dataframe[f'rsi-sell-{val}'] = ta.RSI(dataframe, timeperiod=val)
-
-        return dataframe
+        banks = self.indicator_banks.configure(self.config)
+        pair = metadata['pair']
+        return add_banks(dataframe, {
+            'cci-': banks.get(pair, dataframe, 'CCI', self.buy_cciTime.range),
+            'cci-sell-': banks.get(pair, dataframe, 'CCI', self.sell_cciTime.range),
+            'rsi-': banks.get(pair, dataframe, 'RSI', self.buy_rsiTime.range),
+            'rsi-sell-': banks.get(pair, dataframe, 'RSI', self.sell_rsiTime.range),
+        })
 
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
@@ -1,31 +1,14 @@
 # --- Do not remove these libs ---
 from freqtrade.strategy.interface import IStrategy
 from pandas import DataFrame
-import freqtrade.vendor.qtpylib.indicators as qtpylib
 import pandas_ta as pta
 import talib.abstract as ta
-# --------------------------------
-
-# VWAP bands
-def VWAPB(dataframe, window_size=20, num_of_std=1):
-    df = dataframe.copy()
-    df['vwap'] = qtpylib.rolling_vwap(df,window=window_size)
-    rolling_std = df['vwap'].rolling(window=window_size).std()
-    df['vwap_low'] = df['vwap'] - (rolling_std * num_of_std)
-    df['vwap_high'] = df['vwap'] + (rolling_std * num_of_std)
-    return df['vwap_low'], df['vwap'], df['vwap_high']
+import sys
+from pathlib import Path
 
-def top_percent_change(dataframe: DataFrame, length: int) -> float:
-        """
-        Percentage change of the current close from the range maximum Open price
-
-        :param dataframe: DataFrame The original OHLC dataframe
-        :param length: int The length to look back
-        """
-        if length == 0:
-            return (dataframe['open'] - dataframe['close']) / dataframe['close']
-        else:
-            return (dataframe['open'].rolling(length).max() - dataframe['close']) / dataframe['close']
+sys.path.append(str(Path(__file__).parent.parent))
+from strategy_utils.indicators import VWAPB, top_percent_change
+# --------------------------------
 
 class VWAP(IStrategy):
     """
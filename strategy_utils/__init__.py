@@ -0,0 +1,7 @@
+"""
+Shared, vectorised indicator and state helpers for the strategies in this repository.
+
+Strategies live one per directory, so they pull this package in with
+    sys.path.append(str(Path(__file__).parent.parent))
+before importing from ``strategy_utils``.
+"""
@@ -0,0 +1,34 @@
+"""
+Optional numba support.
+
+Sequential recurrences (PMAX, Supertrend, ...) cannot be vectorised, so the kernels are
+written as plain loops over arrays. When numba is installed they are compiled, otherwise they
+run as regular Python over lists, which is still several times faster than indexing numpy
+arrays or pandas objects element by element.
+"""
+import logging
+from functools import wraps
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+    logger.info("numba not installed, strategy_utils kernels run in pure Python")
+
+HAS_NUMBA = njit is not None
+
+
+def jit(func):
+    """Compile ``func`` with numba when available, otherwise feed it Python lists."""
+    if HAS_NUMBA:
+        return njit(cache=True, nogil=True)(func)
+
+    @wraps(func)
+    def wrapper(*args):
+        return func(*[a.tolist() if isinstance(a, np.ndarray) else a for a in args])
+
+    return wrapper
@@ -0,0 +1,70 @@
+"""
+Linearly weighted moving averages in O(n).
+
+Every candle of a linearly weighted window loses one unit of weight when the window moves
+on, so the weighted sum follows from the previous one, the plain sum of the window and the
+candles entering and leaving it: a compiled pass over the values for any length, instead of
+one shifted copy of the series per candle of the window.
+
+A window containing NaN gives NaN, like the shifted-sum versions.
+"""
+import math
+
+import numpy as np
+
+from ._compat import jit
+
+
+@jit
+def _linear_wma_kernel(x, top, first, last):
+    n = len(x)
+    out = np.full(n, np.nan)
+    norm = 0.0
+    for i in range(first, last + 1):
+        norm += top - i
+    weighted = 0.0
+    total = 0.0
+    nans = 0
+    for t in range(n):
+        # The window of candle t is x[t - last] .. x[t - first], x[t - i] weighing top - i
+        enter = t - first
+        leave = t - last - 1
+        weighted -= total
+        if leave >= 0:
+            v = x[leave]
+            if v != v:
+                nans -= 1
+            else:
+                weighted -= (top - last - 1) * v
+                total -= v
+        if enter >= 0:
+            v = x[enter]
+            if v != v:
+                nans += 1
+            else:
+                weighted += (top - first) * v
+                total += v
+        if leave >= -1 and nans == 0:
+            out[t] = weighted / norm
+    return out
+
+
+def linear_wma(values, top: int, first: int, last: int) -> np.ndarray:
+    """
+    Average of the candles ``first`` to ``last`` before the current one (0 being the current
+    candle), the candle ``i`` before weighing ``top - i``.
+    """
+    if last < first:
+        raise ValueError(f"Empty window from candle {first} to candle {last}")
+    return np.asarray(_linear_wma_kernel(np.asarray(values, dtype=np.float64), int(top), int(first), int(last)))
+
+
+def wma(values, length: int) -> np.ndarray:
+    """Weighted moving average of talib / Pine ``wma``: weights ``length`` down to 1."""
+    return linear_wma(values, length, 0, length - 1)
+
+
+def hma(values, length: int) -> np.ndarray:
+    """Hull moving average: ``wma(2 * wma(length / 2) - wma(length), sqrt(length))``."""
+    h = 2 * wma(values, math.floor(length / 2)) - wma(values, length)
+    return wma(h, math.floor(math.sqrt(length)))
@@ -0,0 +1,60 @@
+"""
+Trailing band recurrence shared by PMAX and Supertrend.
+
+Both indicators build an upper and lower band around a source series (a moving average for
+PMAX, the close for Supertrend), ratchet the bands so they only tighten while price stays
+inside them, and flip the output line between the two when the source crosses it.
+"""
+import numpy as np
+
+from ._compat import jit
+
+TREND_UP = 1
+TREND_DOWN = -1
+
+
+@jit
+def band_recurrence(basic_ub, basic_lb, src, start, fub_prev, flb_prev, line_prev, src_prev):
+    """
+    Walk the final bands and the trailing line from ``start`` onwards.
+
+    Rows before ``start`` are left at 0. ``*_prev`` are the values of the row before ``start``
+    (all 0 and ``src[start - 1]`` for a fresh run).
+    """
+    n = len(src)
+    final_ub = np.zeros(n)
+    final_lb = np.zeros(n)
+    line = np.zeros(n)
+    for i in range(start, n):
+        bub = basic_ub[i]
+        blb = basic_lb[i]
+        cur = src[i]
+
+        fub = bub if (bub < fub_prev or src_prev > fub_prev) else fub_prev
+        flb = blb if (blb > flb_prev or src_prev < flb_prev) else flb_prev
+
+        if line_prev == fub_prev and cur <= fub:
+            value = fub
+        elif line_prev == fub_prev and cur > fub:
+            value = flb
+        elif line_prev == flb_prev and cur >= flb:
+            value = flb
+        elif line_prev == flb_prev and cur < flb:
+            value = fub
+        else:
+            value = 0.0
+
+        final_ub[i] = fub
+        final_lb[i] = flb
+        line[i] = value
+        fub_prev = fub
+        flb_prev = flb
+        line_prev = value
+        src_prev = cur
+    return final_ub, final_lb, line
+
+
+def band_trend(line: np.ndarray, src: np.ndarray) -> np.ndarray:
+    """int8 trend: 1 up, -1 down (source below the line), 0 while the line is not defined."""
+    with np.errstate(invalid='ignore'):
+        return np.where(line > 0.0, np.where(src < line, TREND_DOWN, TREND_UP), 0).astype(np.int8)
@@ -0,0 +1,528 @@
+"""
+Strategy benchmark on synthetic candles.
+
+Finds every ``IStrategy`` subclass defined in the strategy directories of the repository and
+runs it on deterministic synthetic OHLCV: ``startup_candle_count`` plus ``--candles`` candles
+at the strategy's own timeframe, informative pairs and timeframes served by a stub
+``DataProvider`` from the same generator (every frame ending on the same date, so merges
+line up). ``populate_indicators``, the buy (entry) and the sell (exit) trend are timed
+separately over ``--repeat`` runs, then run once more under ``tracemalloc`` for the peak
+memory they allocate. Every run starts cold: a new strategy instance, its class-level caches
+reset and candles from another seed, so a cache keyed on the candles cannot make a later run
+look cheap. The first run is the one reported, the best and median runs are kept next to it.
+The number of columns is recorded after each step.
+
+Each strategy file runs in a child process: a strategy that crashes, leaks or hangs past
+``--timeout`` is reported as such without stopping the others. The JSON report can be
+compared with a previous one (``--baseline``) to list the strategies that got slower, started
+failing or now add another number of columns; the exit status is 1 when there is any. Slower
+means the best and the median runs both are, the cold run is only reported. Timings only
+compare on the same machine: a baseline made with other Python, platform or library versions
+only has its statuses and columns compared.
+
+No baseline is committed, a strategy missing one of its dependencies would be recorded as an
+import error. Make one on your machine, with the freqtrade version the strategies are written
+for and their dependencies (TA-Lib, technical, finta, ta, arrow, scikit-optimize...)
+installed, before changing a strategy, and compare with it afterwards:
+
+    python -m strategy_utils.benchmark --output benchmark_baseline.json
+    python -m strategy_utils.benchmark --filter 'NostalgiaForInfinity' --baseline benchmark_baseline.json
+
+``live_candle_fraction`` is the share of a candle that analysing ``--live-pairs`` pairs
+(80 by default) one after the other takes: above 1 the strategy cannot keep up live.
+"""
+import argparse
+import copy
+import gc
+import importlib.abc
+import importlib.util
+import inspect
+import json
+import logging
+import multiprocessing
+import platform
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parent.parent
+# Every synthetic frame ends here, whatever its timeframe
+END_DATE = pd.Timestamp('2022-01-01', tz='UTC')
+STAKE_CURRENCY = 'USDT'
+WHITELIST = [f'{base}/{STAKE_CURRENCY}' for base in ('ETH', 'BTC', 'BNB', 'ADA', 'XRP', 'SOL', 'DOT', 'LTC')]
+STEPS = ('indicators', 'buy', 'sell')
+
+
+# --- Synthetic data ------------------------------------------------------------------------
+
+def synthetic_ohlcv(pair: str, timeframe: str, candles: int, seed: int = 0) -> DataFrame:
+    """Geometric random walk candles of ``pair``, the same for the same arguments."""
+    from freqtrade.exchange import timeframe_to_minutes
+
+    minutes = timeframe_to_minutes(timeframe)
+    rng = np.random.default_rng([seed, zlib.crc32(f'{pair}|{timeframe}'.encode())])
+    # Volatility grows with the square root of the candle length, like a real market's
+    sigma = 0.0015 * np.sqrt(minutes)
+    start_price = 10 ** rng.uniform(-2, 4)
+    close = start_price * np.exp(np.cumsum(rng.normal(0, sigma, candles)))
+    open_ = np.r_[start_price, close[:-1]] * np.exp(rng.normal(0, sigma / 10, candles))
+    high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, sigma / 2, candles)))
+    low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, sigma / 2, candles)))
+    volume = rng.lognormal(10, 1, candles)
+    end = END_DATE.floor(f'{minutes}min')
+    dates = pd.date_range(end=end, periods=candles, freq=f'{minutes}min')
+    return DataFrame({'date': dates, 'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume})
+
+
+class SyntheticDataProvider:
+    """What strategies ask the ``DataProvider`` for, answered with synthetic candles."""
+
+    def __init__(self, config: Mapping, candles: int, seed: int = 0):
+        self._config = config
+        self.candles = candles
+        self.seed = seed
+        self._frames: Dict[Tuple[str, str], DataFrame] = {}
+        self._analyzed: Dict[Tuple[str, str], DataFrame] = {}
+
+    @property
+    def runmode(self):
+        return self._config['runmode']
+
+    def current_whitelist(self) -> List[str]:
+        return list(self._config['exchange']['pair_whitelist'])
+
+    def available_pairs(self) -> List[Tuple[str, str]]:
+        return [(pair, self._config['timeframe']) for pair in self.current_whitelist()]
+
+    def ohlcv(self, pair: str, timeframe: Optional[str] = None, copy: bool = True, candle_type: str = '',
+              **kwargs) -> DataFrame:
+        key = (pair, timeframe or self._config['timeframe'])
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._frames[key] = synthetic_ohlcv(key[0], key[1], self.candles, self.seed)
+        return frame.copy() if copy else frame
+
+    def historic_ohlcv(self, pair: str, timeframe: Optional[str] = None, candle_type: str = '') -> DataFrame:
+        return self.ohlcv(pair, timeframe)
+
+    def get_pair_dataframe(self, pair: str, timeframe: Optional[str] = None, candle_type: str = '') -> DataFrame:
+        return self.ohlcv(pair, timeframe)
+
+    def _set_cached_df(self, pair: str, timeframe: str, dataframe: DataFrame, *args) -> None:
+        self._analyzed[(pair, timeframe)] = dataframe
+
+    def get_analyzed_dataframe(self, pair: str, timeframe: str) -> Tuple[DataFrame, datetime]:
+        frame = self._analyzed.get((pair, timeframe))
+        if frame is None:
+            frame = self.ohlcv(pair, timeframe)
+        return frame, END_DATE.to_pydatetime()
+
+    def ticker(self, pair: str) -> dict:
+        last = self.ohlcv(pair, copy=False).iloc[-1]
+        return {'symbol': pair, 'last': last['close'], 'bid': last['close'], 'ask': last['close'],
+                'high': last['high'], 'low': last['low'], 'quoteVolume': last['volume'] * last['close']}
+
+    def orderbook(self, pair: str, maximum: int) -> dict:
+        close = self.ohlcv(pair, copy=False)['close'].iloc[-1]
+        return {'bids': [[close * (1 - 0.0005 * i), 1.0] for i in range(1, maximum + 1)],
+                'asks': [[close * (1 + 0.0005 * i), 1.0] for i in range(1, maximum + 1)]}
+
+    def market(self, pair: str) -> dict:
+        base, quote = pair.split('/')
+        return {'symbol': pair, 'base': base, 'quote': quote.split(':')[0], 'active': True}
+
+    def send_msg(self, *args, **kwargs) -> None:
+        pass
+
+
+# --- Discovery -----------------------------------------------------------------------------
+
+class _StrategyFinder(importlib.abc.MetaPathFinder):
+    """Resolve ``import Name`` to ``Name/Name.py``, as strategies import their parent strategies."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def find_spec(self, fullname, path=None, target=None):
+        if '.' in fullname:
+            return None
+        candidate = self.root / fullname / f'{fullname}.py'
+        if candidate.is_file():
+            return importlib.util.spec_from_file_location(fullname, candidate)
+        return None
+
+
+def strategy_files(root: Path = ROOT, pattern: Optional[str] = None) -> List[Path]:
+    """The strategy files of the repository, ``pattern`` searched in their relative path."""
+    files = []
+    for path in sorted(root.glob('*/*.py')):
+        relative = path.relative_to(root).as_posix()
+        if path.parent.name.startswith(('.', '_')) or path.parent.name == 'strategy_utils':
+            continue
+        if pattern and not re.search(pattern, relative):
+            continue
+        files.append(path)
+    return files
+
+
+def load_strategies(path: Path, root: Path = ROOT) -> Dict[str, type]:
+    """The ``IStrategy`` subclasses defined in ``path``, by class name."""
+    from freqtrade.strategy.interface import IStrategy
+
+    if not any(isinstance(finder, _StrategyFinder) for finder in sys.meta_path):
+        sys.meta_path.append(_StrategyFinder(root))
+    # Loaded under its own name, like freqtrade does, so its subclasses import it once
+    name = path.stem if path.stem == path.parent.name else f'_benchmark_{path.parent.name}_{path.stem}'
+    module = sys.modules.get(name)
+    if module is None or getattr(module, '__file__', None) != str(path):
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(name, None)
+            raise
+    return {cls.__name__: cls for cls in vars(module).values()
+            if inspect.isclass(cls) and issubclass(cls, IStrategy) and cls is not IStrategy
+            and cls.__module__ == module.__name__}
+
+
+# --- Running -------------------------------------------------------------------------------
+
+def strategy_config(timeframe: str, user_data_dir: Path) -> dict:
+    try:
+        from freqtrade.enums import RunMode
+    except ImportError:  # freqtrade < 2021.8
+        from freqtrade.state import RunMode
+
+    config = {
+        'runmode': RunMode.BACKTEST,
+        'timeframe': timeframe,
+        'stake_currency': STAKE_CURRENCY,
+        'stake_amount': 'unlimited',
+        'dry_run': True,
+        'max_open_trades': 5,
+        'exchange': {'name': 'binance', 'pair_whitelist': WHITELIST},
+        'ask_strategy': {}, 'bid_strategy': {}, 'exit_pricing': {}, 'entry_pricing': {},
+        'user_data_dir': user_data_dir,
+        'datadir': user_data_dir / 'data',
+    }
+    try:
+        from freqtrade.enums import CandleType, TradingMode
+    except ImportError:  # freqtrade < 2022.1, spot only
+        return config
+    # What freqtrade's configuration loader adds, @informative strategies need candle_type_def
+    config.update(trading_mode=TradingMode.SPOT, candle_type_def=CandleType.SPOT)
+    return config
+
+
+def _trend_methods(strategy) -> Tuple[object, object]:
+    cls = type(strategy)
+    buy = strategy.populate_entry_trend if _overrides(cls, 'populate_entry_trend') else strategy.populate_buy_trend
+    sell = strategy.populate_exit_trend if _overrides(cls, 'populate_exit_trend') else strategy.populate_sell_trend
+    return buy, sell
+
+
+def _overrides(cls: type, method: str) -> bool:
+    from freqtrade.strategy.interface import IStrategy
+
+    return method in dir(cls) and getattr(cls, method) is not getattr(IStrategy, method, None)
+
+
+def reset_caches(cls: type) -> int:
+    """
+    Empty the ``strategy_utils`` caches and trackers ``cls`` and its bases keep as class
+    attributes (indicator banks, gene and indicator caches, reference indicators, ...), so the
+    next run computes everything again. Returns how many were reset.
+    """
+    count = 0
+    for klass in cls.__mro__:
+        for value in vars(klass).values():
+            if type(value).__module__.startswith(f'{__package__}.') and callable(getattr(value, 'reset', None)):
+                value.reset()
+                count += 1
+    return count
+
+
+def benchmark_strategy(cls: type, candles: int = 500, repeat: int = 3, live_pairs: int = 80, seed: int = 0,
+                       memory: bool = True) -> dict:
+    """
+    Timings, peak memory and column counts of one strategy class.
+
+    Every run builds a new strategy on candles of its own seed, with the class-level caches
+    reset, so no run reuses what an earlier one computed. ``{step}_s`` and ``total_s`` are the
+    first, cold run (lazy imports and JIT compilation included), ``{step}_best_s`` and
+    ``{step}_median_s`` are over the ``repeat`` runs. The live estimate uses the best run: a
+    live bot analyses new candles every loop, with its code already warm.
+    """
+    from freqtrade.exchange import timeframe_to_minutes
+
+    # Strategies older than freqtrade 2020.12 name it ticker_interval
+    timeframe = getattr(cls, 'timeframe', None) or getattr(cls, 'ticker_interval', None)
+    startup = int(getattr(cls, 'startup_candle_count', 0) or 0)
+    if timeframe is None:
+        return {'status': 'error', 'step': 'init', 'error': 'No timeframe'}
+    result = {'status': 'ok', 'timeframe': timeframe, 'startup_candle_count': startup,
+              'candles': startup + candles, 'runs': max(1, repeat)}
+    step = 'init'
+
+    def run(config: dict, run_seed: int, timings: Optional[Dict[str, list]] = None) -> Dict[str, int]:
+        nonlocal step
+        step = 'init'
+        reset_caches(cls)
+        config = copy.deepcopy(config)
+        strategy = cls(config)
+        # Like freqtrade's StrategyResolver, for strategies still declaring ticker_interval
+        strategy.timeframe = timeframe
+        dp = SyntheticDataProvider(config, startup + candles, run_seed)
+        strategy.dp = dp
+        strategy.wallets = None
+        if hasattr(strategy, 'ft_bot_start'):
+            strategy.ft_bot_start()
+        populate_buy, populate_sell = _trend_methods(strategy)
+        dataframe = dp.ohlcv(WHITELIST[0], timeframe)
+        columns = {'source': len(dataframe.columns)}
+        # advise_indicators runs the @informative merges before populate_indicators
+        for step, populate in (('indicators', strategy.advise_indicators), ('buy', populate_buy),
+                               ('sell', populate_sell)):
+            start = time.perf_counter()
+            dataframe = populate(dataframe, {'pair': WHITELIST[0]})
+            if timings is not None:
+                timings[step].append(time.perf_counter() - start)
+            columns[step] = len(dataframe.columns)
+        return columns
+
+    try:
+        with tempfile.TemporaryDirectory() as user_data_dir:
+            config = strategy_config(timeframe, Path(user_data_dir))
+            timings = {name: [] for name in STEPS}
+            for i in range(max(1, repeat)):
+                gc.collect()
+                columns = run(config, seed + i, timings)
+            if memory:
+                # Emptied before tracing, so the memory they free does not offset the peak
+                reset_caches(cls)
+                gc.collect()
+                tracemalloc.start()
+                try:
+                    baseline = tracemalloc.get_traced_memory()[0]
+                    run(config, seed + max(1, repeat))
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+                result['peak_memory_mb'] = round((peak - baseline) / 2 ** 20, 3)
+    except Exception as e:
+        result.update(status='error', step=step, error=f'{type(e).__name__}: {e}'[:500])
+        return result
+    finally:
+        reset_caches(cls)
+
+    for name in STEPS:
+        result[f'{name}_s'] = round(timings[name][0], 6)
+        result[f'{name}_best_s'] = round(min(timings[name]), 6)
+        result[f'{name}_median_s'] = round(float(np.median(timings[name])), 6)
+    result['total_s'] = round(sum(result[f'{name}_s'] for name in STEPS), 6)
+    result['total_best_s'] = round(sum(result[f'{name}_best_s'] for name in STEPS), 6)
+    result['total_median_s'] = round(float(np.median(np.sum([timings[name] for name in STEPS], axis=0))), 6)
+    result['columns'] = columns['sell']
+    result['added_columns'] = columns['indicators'] - columns.pop('source')
+    result['columns_by_step'] = columns
+    result['live_loop_s'] = round(result['total_best_s'] * live_pairs, 3)
+    result['live_candle_fraction'] = round(result['live_loop_s'] / (timeframe_to_minutes(timeframe) * 60), 4)
+    return result
+
+
+def _benchmark_file(path: Path, root: Path, options: dict, connection) -> None:
+    """Child process: every strategy of ``path``, results sent one by one."""
+    logging.disable(logging.WARNING)
+    try:
+        strategies = load_strategies(path, root)
+    except BaseException as e:
+        connection.send((None, {'status': 'import_error', 'error': f'{type(e).__name__}: {e}'[:500]}))
+        connection.close()
+        return
+    for name, cls in strategies.items():
+        connection.send((name, {'status': 'running'}))
+        connection.send((name, benchmark_strategy(cls, **options)))
+    connection.close()
+
+
+def run_benchmarks(files: Iterable[Path], root: Path = ROOT, timeout: float = 300, **options) -> Dict[str, dict]:
+    """Results by ``relative/path.py:Class``, each file in its own process."""
+    # Imported once here: fork hands pandas and freqtrade to every child already imported
+    import freqtrade.strategy.interface  # noqa: F401
+    context = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+    results = {}
+    for path in files:
+        relative = path.relative_to(root).as_posix()
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_benchmark_file, args=(path, root, options, sender), daemon=True)
+        process.start()
+        sender.close()
+        deadline = time.monotonic() + timeout
+        current = None
+        while True:
+            if not receiver.poll(max(0.0, deadline - time.monotonic())):
+                process.kill()
+                key = f'{relative}:{current}' if current else relative
+                results[key] = {'status': 'timeout', 'error': f'Still running after {timeout}s'}
+                break
+            try:
+                name, result = receiver.recv()
+            except EOFError:
+                break
+            key = f'{relative}:{name}' if name else relative
+            if result['status'] == 'running':
+                # A new strategy of the file: the timeout is per strategy
+                current = name
+                deadline = time.monotonic() + timeout
+                results[key] = {'status': 'crashed', 'error': 'The process died'}
+                continue
+            results[key] = result
+            current = None
+        process.join(1)
+        if process.is_alive():
+            process.kill()
+        logger.info(f'{relative}: ' + ', '.join(f"{k.split(':')[-1]} {v['status']}"
+                                                for k, v in results.items() if k.startswith(relative)))
+    return results
+
+
+def _environment() -> dict:
+    environment = {'python': platform.python_version(), 'platform': platform.platform(),
+                   'numpy': np.__version__, 'pandas': pd.__version__}
+    for module in ('freqtrade', 'talib', 'numba'):
+        try:
+            environment[module] = getattr(importlib.import_module(module), '__version__', 'installed')
+        except ImportError:
+            environment[module] = None
+    return environment
+
+
+# --- Reports -------------------------------------------------------------------------------
+
+def make_report(results: Dict[str, dict], options: dict) -> dict:
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'environment': _environment(),
+        'options': options,
+        'strategies': dict(sorted(results.items())),
+    }
+
+
+def compare_reports(report: Mapping, baseline: Mapping, threshold: float = 0.25,
+                    min_seconds: float = 0.005, timings: bool = True) -> List[dict]:
+    """
+    Regressions of ``report`` against ``baseline``: a strategy that ran there and fails now or
+    ends with another number of columns, or (``timings``) a step or the total whose best and
+    median runs are both at least ``threshold`` (relative) and ``min_seconds`` slower. The cold
+    first run (lazy imports, JIT compilation) is too noisy to compare.
+    """
+    regressions = []
+    for key, old in baseline.get('strategies', {}).items():
+        new = report.get('strategies', {}).get(key)
+        if new is None or old.get('status') != 'ok':
+            continue
+        if new.get('status') != 'ok':
+            regressions.append({'strategy': key, 'metric': 'status', 'baseline': 'ok', 'current': new.get('status'),
+                                'error': new.get('error')})
+            continue
+        if old.get('columns') != new.get('columns'):
+            regressions.append({'strategy': key, 'metric': 'columns', 'baseline': old.get('columns'),
+                                'current': new.get('columns')})
+        if not timings:
+            continue
+        for name in STEPS + ('total',):
+            slower = []
+            for metric in (f'{name}_best_s', f'{name}_median_s'):
+                before, after = old.get(metric), new.get(metric)
+                if before is None or after is None:
+                    break
+                if after - before < min_seconds or after < before * (1 + threshold):
+                    break
+                slower.append((metric, before, after))
+            else:
+                for metric, before, after in slower:
+                    regressions.append({'strategy': key, 'metric': metric, 'baseline': before, 'current': after,
+                                        'ratio': round(after / before, 3) if before else None})
+    return regressions
+
+
+def same_environment(report: Mapping, baseline: Mapping) -> bool:
+    """Whether both reports come from the same Python, platform and library versions."""
+    return report.get('environment') == baseline.get('environment')
+
+
+def _summary(report: Mapping, top: int = 20) -> str:
+    strategies = report['strategies']
+    ok = {k: v for k, v in strategies.items() if v['status'] == 'ok'}
+    statuses = pd.Series([v['status'] for v in strategies.values()], dtype=object).value_counts()
+    lines = [f"{len(strategies)} strategies: "
+             + ', '.join(f'{count} {status}' for status, count in sorted(statuses.items()))]
+    lines.append(f"{'strategy':60s} {'tf':>4s} {'total s':>9s} {'best s':>9s} {'ind s':>9s} {'buy s':>9s} "
+                 f"{'sell s':>9s} {'MB':>8s} {'cols':>5s} {'live':>7s}")
+    for key, v in sorted(ok.items(), key=lambda item: -item[1]['total_s'])[:top]:
+        lines.append(f"{key[-60:]:60s} {v['timeframe']:>4s} {v['total_s']:9.4f} {v['total_best_s']:9.4f} "
+                     f"{v['indicators_s']:9.4f} {v['buy_s']:9.4f} {v['sell_s']:9.4f} {v.get('peak_memory_mb', float('nan')):8.1f} "
+                     f"{v['columns']:5d} {v['live_candle_fraction']:7.3f}")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m strategy_utils.benchmark', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--root', type=Path, default=ROOT, help='Repository root (default: %(default)s)')
+    parser.add_argument('--filter', help='Regex searched in the strategy file paths')
+    parser.add_argument('--candles', type=int, default=500, help='Candles after the startup candles')
+    parser.add_argument('--repeat', type=int, default=3, help='Cold runs per strategy, the first one is reported')
+    parser.add_argument('--live-pairs', type=int, default=80, help='Pairs for live_candle_fraction')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic candles')
+    parser.add_argument('--timeout', type=float, default=300, help='Seconds allowed per strategy')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc run')
+    parser.add_argument('--output', type=Path, help='Where to write the JSON report')
+    parser.add_argument('--baseline', type=Path, help='Report made with --output to compare with')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Relative slowdown counted as a regression')
+    parser.add_argument('--min-seconds', type=float, default=0.005, help='Smallest slowdown counted as a regression')
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    root = args.root.resolve()
+    options = {'candles': args.candles, 'repeat': args.repeat, 'live_pairs': args.live_pairs, 'seed': args.seed,
+               'memory': not args.no_memory}
+    files = strategy_files(root, args.filter)
+    logger.info(f'Benchmarking {len(files)} strategy files')
+    report = make_report(run_benchmarks(files, root, args.timeout, **options), {**options, 'timeout': args.timeout})
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, default=str) + '\n')
+    print(_summary(report))
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        timings = same_environment(report, baseline)
+        if not timings:
+            print(f'{args.baseline} comes from another environment, only statuses and columns are compared')
+        regressions = compare_reports(report, baseline, args.threshold, args.min_seconds, timings)
+        report['regressions'] = regressions
+        if args.output:
+            args.output.write_text(json.dumps(report, indent=2, default=str) + '\n')
+        for regression in regressions:
+            print(f"REGRESSION {regression['strategy']} {regression['metric']}: "
+                  f"{regression['baseline']} -> {regression['current']}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
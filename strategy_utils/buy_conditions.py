@@ -0,0 +1,178 @@
+"""
+Buy condition engine of the NostalgiaForInfinity strategies.
+
+Every enabled buy condition combines the standard protections selected by its
+``buy_protection_params`` entry with its own logic. Rebuilding the protections for every
+condition evaluates the same comparisons dozens of times (most conditions share
+``ema_slow_len``, dip and pump thresholds, the BTC trend, ...). ``ProtectionMasks`` breaks
+each entry into atomic comparisons and keeps every distinct comparison, and every distinct
+combination, as one boolean array per frame.
+
+The fired conditions are recorded as bits of uint64 words by ``BuySignals`` rather than by
+appending to the ``buy_tag`` string column once per condition. Tags are only decoded for the
+candles that signal, once per distinct combination of conditions, giving the same
+``"1 5 "`` strings in the same condition order.
+"""
+from typing import Dict, Hashable, Iterable, List, Mapping, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from .latch import as_flags
+
+# Atomic protections: ('above', a, b, mult) is ``a > b * mult``, ('below', a, b, mult) is
+# ``a < b * mult``, ('under', column, value) is ``column < value``, ('rising', column, k) is
+# ``column > column.shift(k)`` and ('flag', column) a boolean column, NaN being False.
+Protection = Tuple[Hashable, ...]
+
+# Thresholds of the dip / pump protections and the column they bound
+_THRESHOLD_COLUMNS = {
+    'safe_dips_threshold_0': 'tpct_change_0',
+    'safe_dips_threshold_2': 'tpct_change_2',
+    'safe_dips_threshold_12': 'tpct_change_12',
+    'safe_dips_threshold_144': 'tpct_change_144',
+    'safe_pump_6h_threshold': 'hl_pct_change_6_1h',
+    'safe_pump_12h_threshold': 'hl_pct_change_12_1h',
+    'safe_pump_24h_threshold': 'hl_pct_change_24_1h',
+    'safe_pump_36h_threshold': 'hl_pct_change_36_1h',
+    'safe_pump_48h_threshold': 'hl_pct_change_48_1h',
+}
+
+
+def standard_protections(params: Mapping) -> Tuple[Protection, ...]:
+    """The atomic protections selected by one ``buy_protection_params`` entry."""
+    atoms: List[Protection] = []
+    if params['ema_fast']:
+        atoms.append(('above', f"ema_{params['ema_fast_len']}", 'ema_200', 1.0))
+    if params['ema_slow']:
+        atoms.append(('above', f"ema_{params['ema_slow_len']}_1h", 'ema_200_1h', 1.0))
+    if params['close_above_ema_fast']:
+        atoms.append(('above', 'close', f"ema_{params['close_above_ema_fast_len']}", 1.0))
+    if params['close_above_ema_slow']:
+        atoms.append(('above', 'close', f"ema_{params['close_above_ema_slow_len']}_1h", 1.0))
+    if params['sma200_rising']:
+        atoms.append(('rising', 'sma_200', int(params['sma200_rising_val'])))
+    if params['sma200_1h_rising']:
+        atoms.append(('rising', 'sma_200_1h', int(params['sma200_1h_rising_val'])))
+    for threshold, column in _THRESHOLD_COLUMNS.items():
+        if params[threshold] is not None:
+            atoms.append(('under', column, params[threshold]))
+    if params['btc_1h_not_downtrend']:
+        atoms.append(('flag', 'btc_not_downtrend_1h'))
+    if params['close_over_pivot_type'] != 'none':
+        atoms.append(('above', 'close', f"{params['close_over_pivot_type']}_1d", params['close_over_pivot_offset']))
+    if params['close_under_pivot_type'] != 'none':
+        atoms.append(('below', 'close', f"{params['close_under_pivot_type']}_1d", params['close_under_pivot_offset']))
+    return tuple(atoms)
+
+
+class ProtectionMasks:
+    """Boolean arrays of protections over one frame, each distinct one computed once."""
+
+    def __init__(self, dataframe: DataFrame):
+        self.dataframe = dataframe
+        self._columns: Dict[str, np.ndarray] = {}
+        self._masks: Dict[Tuple[Protection, ...], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._masks)
+
+    def column(self, name: str) -> np.ndarray:
+        values = self._columns.get(name)
+        if values is None:
+            values = self._columns[name] = self.dataframe[name].to_numpy()
+        return values
+
+    def mask(self, protections: Iterable[Protection]) -> np.ndarray:
+        """All of ``protections``, every candle True when there is none. Do not modify."""
+        key = tuple(protections)
+        mask = self._masks.get(key)
+        if mask is None:
+            if not key:
+                mask = np.ones(len(self.dataframe), dtype=bool)
+            elif len(key) == 1:
+                mask = self._evaluate(key[0])
+            else:
+                mask = self.mask(key[:-1]) & self.mask(key[-1:])
+            self._masks[key] = mask
+        return mask
+
+    def _evaluate(self, atom: Protection) -> np.ndarray:
+        kind = atom[0]
+        if kind == 'flag':
+            return as_flags(self.column(atom[1]))
+        a = self.column(atom[1]).astype(np.float64, copy=False)
+        if kind == 'under':
+            return a < atom[2]
+        if kind == 'rising':
+            return a > _shifted(a, atom[2])
+        b = self.column(atom[2]).astype(np.float64, copy=False) * atom[3]
+        if kind == 'above':
+            return a > b
+        if kind == 'below':
+            return a < b
+        raise ValueError(f"Unknown protection {atom}")
+
+
+def all_of(terms: Iterable, length: int) -> np.ndarray:
+    """AND of boolean Series / arrays / scalars into one contiguous array, NaN being False."""
+    out = np.ones(length, dtype=bool)
+    for term in terms:
+        if isinstance(term, (bool, np.bool_)):
+            if not term:
+                out[:] = False
+            continue
+        np.logical_and(out, as_flags(term), out=out)
+    return out
+
+
+class BuySignals:
+    """Which of the buy conditions fired on every candle, one bit per condition."""
+
+    def __init__(self, length: int, labels: Iterable):
+        self.labels = list(labels)
+        self._bit = {label: i for i, label in enumerate(self.labels)}
+        self.words = np.zeros(((len(self.labels) + 63) // 64, length), dtype=np.uint64)
+
+    def record(self, label, fired: np.ndarray) -> None:
+        word, bit = divmod(self._bit[label], 64)
+        self.words[word] |= fired.astype(np.uint64) << np.uint64(bit)
+
+    @property
+    def buy(self) -> np.ndarray:
+        return (self.words != 0).any(axis=0)
+
+    def tags(self, separator: str = ' ') -> np.ndarray:
+        """``"{label}{separator}"`` of every fired condition, in label order, '' when none."""
+        tags = np.full(self.words.shape[1], '', dtype=object)
+        rows = np.flatnonzero(self.buy)
+        if len(rows) == 0:
+            return tags
+        combinations, inverse = np.unique(self.words[:, rows].T, axis=0, return_inverse=True)
+        decoded = np.array([self._decode(words, separator) for words in combinations], dtype=object)
+        tags[rows] = decoded[inverse.reshape(-1)]
+        return tags
+
+    def _decode(self, words: np.ndarray, separator: str) -> str:
+        tag = []
+        for w, value in enumerate(words):
+            value = int(value)
+            while value:
+                low = value & -value
+                tag.append(f"{self.labels[w * 64 + low.bit_length() - 1]}{separator}")
+                value ^= low
+        return ''.join(tag)
+
+
+def _shifted(values: np.ndarray, periods: int) -> np.ndarray:
+    """``Series.shift`` of a float array."""
+    out = np.full(len(values), np.nan)
+    if abs(periods) >= len(values):
+        return out
+    if periods == 0:
+        out[:] = values
+    elif periods > 0:
+        out[periods:] = values[:-periods]
+    else:
+        out[:periods] = values[-periods:]
+    return out
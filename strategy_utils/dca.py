@@ -0,0 +1,134 @@
+"""
+Safety order (DCA) state for ``adjust_trade_position``.
+
+``adjust_trade_position`` runs for every open trade on every bot loop. Counting the filled
+buys by walking ``trade.orders`` costs more the longer the trade lives, and the geometric
+trigger and stake of the next safety order only depend on that count and the configuration.
+
+``SafetyOrderLadder`` computes the trigger and stake multiplier of every safety order once per
+configuration. ``DcaTracker`` keeps per trade the number of filled buys and how far into
+``trade.orders`` the orders are settled (no longer ``ft_is_open``): orders are only appended
+and a settled order does not change, so each call only looks at the orders placed or still
+open since the last one, usually none. ``order_filled`` moves the state on as fills come in.
+The per-loop check is then a comparison of the profit against the ladder's next trigger.
+"""
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Hashable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class SafetyOrderLadder:
+    """Trigger and stake multiplier of every safety order, by number of filled buys."""
+    initial_trigger: float
+    max_orders: int
+    step_scale: float
+    volume_scale: float
+    triggers: Tuple[float, ...] = field(init=False, repr=False)
+    stake_multipliers: Tuple[float, ...] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        first = abs(self.initial_trigger)
+        triggers, multipliers = [], []
+        for count in range(1, self.max_orders + 1):
+            if self.step_scale == 1:
+                # The geometric sum divides by zero here (the strategies' formula raised
+                # ZeroDivisionError, so no safety order was ever placed); its limit is evenly
+                # spaced triggers
+                triggers.append(first * count)
+            else:
+                triggers.append(first + (first * self.step_scale * (math.pow(self.step_scale, (count - 1)) - 1)
+                                         / (self.step_scale - 1)))
+            multipliers.append(math.pow(self.volume_scale, (count - 1)))
+        object.__setattr__(self, 'triggers', tuple(triggers))
+        object.__setattr__(self, 'stake_multipliers', tuple(multipliers))
+
+    def trigger(self, count_of_buys: int) -> Optional[float]:
+        """Loss (positive) at which the next safety order buys, None when there is none left."""
+        if 1 <= count_of_buys <= self.max_orders:
+            return self.triggers[count_of_buys - 1]
+        return None
+
+    def stake_multiplier(self, count_of_buys: int) -> float:
+        return self.stake_multipliers[count_of_buys - 1]
+
+    def is_due(self, count_of_buys: int, current_profit: float) -> bool:
+        trigger = self.trigger(count_of_buys)
+        return trigger is not None and current_profit <= -trigger
+
+
+@lru_cache(maxsize=None)
+def safety_order_ladder(initial_trigger: float, max_orders: int, step_scale: float,
+                        volume_scale: float) -> SafetyOrderLadder:
+    """The ladder of one configuration, built the first time it is asked for."""
+    return SafetyOrderLadder(initial_trigger, max_orders, step_scale, volume_scale)
+
+
+@dataclass
+class DcaState:
+    """Filled buys of one trade, from its first ``settled`` orders and the open ones after."""
+    filled_buys: int = 0
+    settled: int = 0
+    pending_buys: int = 0
+
+    @property
+    def count_of_buys(self) -> int:
+        return self.filled_buys + self.pending_buys
+
+
+class DcaTracker:
+    """``DcaState`` per open trade, brought up to date with the orders not yet settled."""
+
+    def __init__(self):
+        self._states: Dict[Hashable, DcaState] = {}
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def state(self, trade) -> DcaState:
+        key = _trade_key(trade)
+        state = self._states.get(key)
+        orders = trade.orders
+        if state is None or state.settled > len(orders):
+            state = self._states[key] = DcaState()
+        pending_buys = 0
+        for order in orders[state.settled:]:
+            if order.ft_is_open:
+                # Settled orders stop here, the ones after are looked at again next time
+                pending_buys = _counted_after(orders, state.settled)
+                break
+            state.settled += 1
+            state.filled_buys += _is_filled_buy(order)
+        state.pending_buys = pending_buys
+        return state
+
+    def count_of_buys(self, trade) -> int:
+        """Filled buy orders of ``trade``, like counting the closed, not open buys of ``trade.orders``."""
+        return self.state(trade).count_of_buys
+
+    def order_filled(self, trade) -> None:
+        """Take in the order fills of ``trade`` as they happen."""
+        self.state(trade)
+
+    def retain(self, open_trades) -> None:
+        """Drop the state of every trade not in ``open_trades``, however it was closed."""
+        keys = {_trade_key(trade) for trade in open_trades}
+        for key in [key for key in self._states if key not in keys]:
+            del self._states[key]
+
+    def reset(self) -> None:
+        self._states.clear()
+
+
+def _trade_key(trade) -> Hashable:
+    return trade.id, trade.pair, trade.open_date
+
+
+def _is_filled_buy(order) -> bool:
+    return not order.ft_is_open and order.ft_order_side == 'buy' and order.status == 'closed'
+
+
+def _counted_after(orders, start: int) -> int:
+    # Settled orders past an open one, counted but re-examined on the next call
+    return sum(_is_filled_buy(order) for order in orders[start:])
@@ -0,0 +1,163 @@
+"""
+Pivot-to-pivot divergences (HarmonicDivergence).
+
+A bearish divergence pairs a pivot high with one of the ``lookback`` previous pivot highs where
+price and indicator move in opposite directions, as long as neither the straight price line nor
+the straight indicator line between the two pivots is crossed by the candles in between. Bullish
+divergences are the mirror image on pivot lows. The nearest diverging pivot wins; when its lines
+are crossed the candle has no divergence.
+
+The pivot positions are computed once and every indicator is checked against them in one
+batched pass: candidate pairs are an (pivots x lookback x indicators) array and the line checks
+run over the flattened candles between the chosen pivots.
+"""
+from enum import Enum
+from typing import List, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+
+class PivotSource(Enum):
+    HighLow = 0
+    Close = 1
+
+
+def _pivots(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    ``(is_high, is_low)``: candles not exceeded (high) / not undercut (low) by the ``window``
+    candles on each side. The second to last candle is also checked against the ``window``
+    candles before it and the last candle only. NaN neighbours never disqualify a candle.
+    """
+    n = len(values)
+    is_high = np.zeros(n, dtype=bool)
+    is_low = np.zeros(n, dtype=bool)
+    span = 2 * window + 1
+    with np.errstate(invalid='ignore'):
+        if n >= span:
+            windows = np.lib.stride_tricks.sliding_window_view(values, span)
+            center = windows[:, window:window + 1]
+            neighbours = np.delete(windows, window, axis=1)
+            is_high[window:n - window] = ~(center < neighbours).any(axis=1)
+            is_low[window:n - window] = ~(center > neighbours).any(axis=1)
+        if n >= window + 2:
+            current = values[n - 2]
+            neighbours = np.append(values[n - 2 - window:n - 2], values[n - 1])
+            is_high[n - 2] = not (current < neighbours).any()
+            is_low[n - 2] = not (current > neighbours).any()
+    return is_high, is_low
+
+
+def pivot_points(dataframe: DataFrame, window: int = 5, pivot_source: PivotSource = PivotSource.Close) -> DataFrame:
+    if pivot_source == PivotSource.Close:
+        high_source = low_source = 'close'
+    elif pivot_source == PivotSource.HighLow:
+        high_source, low_source = 'high', 'low'
+    else:
+        raise ValueError(f"Unknown pivot source {pivot_source}")
+
+    highs = dataframe[high_source].to_numpy(dtype=np.float64)
+    lows = dataframe[low_source].to_numpy(dtype=np.float64)
+    is_high, _ = _pivots(highs, window)
+    _, is_low = _pivots(lows, window)
+    return DataFrame(index=dataframe.index, data={
+        'pivot_lows': np.where(is_low, lows, np.nan),
+        'pivot_highs': np.where(is_high, highs, np.nan)
+    })
+
+
+def find_divergences(close: np.ndarray, pivots: np.ndarray, indicators: np.ndarray,
+                     bearish: bool, lookback: int = 5) -> np.ndarray:
+    """
+    Divergence mask of shape (candles, indicators).
+
+    :param close: close prices, the price line between two pivots is drawn on them
+    :param pivots: pivot values, NaN on candles that are not a pivot
+    :param indicators: one column per indicator
+    :param bearish: True for pivot highs, False for pivot lows
+    """
+    n, k = indicators.shape
+    found = np.zeros((n, k), dtype=bool)
+    pos = np.flatnonzero(~np.isnan(pivots))
+    if len(pos) < 2 or k == 0:
+        return found
+
+    # Candidate previous pivots for every pivot, nearest first
+    prev_idx = np.arange(len(pos))[:, None] - np.arange(1, lookback + 1)[None, :]
+    valid = prev_idx >= 0
+    prev = pos[np.maximum(prev_idx, 0)]
+    cur = pos[:, None]
+
+    with np.errstate(invalid='ignore'):
+        price_lower = (pivots[cur] < pivots[prev])[:, :, None]
+        price_higher = (pivots[cur] > pivots[prev])[:, :, None]
+        ind_cur = indicators[cur]
+        ind_prev = indicators[prev]
+        diverging = (price_lower & (ind_cur > ind_prev)) | (price_higher & (ind_cur < ind_prev))
+    diverging &= valid[:, :, None]
+
+    # First diverging candidate per (pivot, indicator)
+    pair_pivot, pair_col = np.nonzero(diverging.any(axis=1))
+    if len(pair_pivot) == 0:
+        return found
+    choice = diverging.argmax(axis=1)[pair_pivot, pair_col]
+    start = prev[pair_pivot, choice]
+    end = pos[pair_pivot]
+    length = end - start
+
+    # Every candle strictly between the two pivots of every pair
+    inner = np.maximum(length - 1, 0)
+    pair = np.repeat(np.arange(len(start)), inner)
+    step = np.arange(len(pair)) - np.repeat(np.cumsum(inner) - inner, inner) + 1
+    candle = start[pair] + step
+    col = pair_col[pair]
+
+    # Same arithmetic as drawing the lines point by point so ties resolve identically
+    price_line = close[start[pair]] + (close[end[pair]] - close[start[pair]]) * step / length[pair]
+    ind_start = indicators[start[pair], col]
+    ind_line = ind_start + (indicators[end[pair], col] - ind_start) * step / length[pair]
+    with np.errstate(invalid='ignore'):
+        if bearish:
+            crossed = (price_line <= close[candle]) | (ind_line <= indicators[candle, col])
+        else:
+            crossed = (price_line >= close[candle]) | (ind_line >= indicators[candle, col])
+    broken = np.bincount(pair, weights=crossed, minlength=len(start)) > 0
+
+    found[end[~broken], pair_col[~broken]] = True
+    return found
+
+
+def divergences(dataframe: DataFrame, indicators: List[str], lookback: int = 5,
+                count_shift: int = 30) -> DataFrame:
+    """
+    Per indicator ``bearish_divergence_<ind>_occurence`` / ``bullish_divergence_<ind>_occurence``
+    (close on the pivot candle, NaN elsewhere) and the ``total_*_divergences`` columns.
+
+    ``total_*_divergences_count`` / ``_names`` are written ``count_shift`` candles before the
+    pivot, where the plot labels them. Needs the ``pivot_highs`` / ``pivot_lows`` columns.
+    """
+    close = dataframe['close'].to_numpy(dtype=np.float64)
+    values = np.column_stack([dataframe[ind].to_numpy(dtype=np.float64) for ind in indicators]) \
+        if indicators else np.zeros((len(close), 0))
+    names = np.array([ind.upper() + '<br>' for ind in indicators], dtype=object)
+    n = len(close)
+
+    columns = {}
+    for side, pivot_column in (('bearish', 'pivot_highs'), ('bullish', 'pivot_lows')):
+        found = find_divergences(close, dataframe[pivot_column].to_numpy(dtype=np.float64), values,
+                                 bearish=side == 'bearish', lookback=lookback)
+        for i, ind in enumerate(indicators):
+            columns[f'{side}_divergence_{ind}_occurence'] = np.where(found[:, i], close, np.nan)
+
+        any_found = found.any(axis=1)
+        count = np.zeros(n, dtype=np.int64)
+        label = np.full(n, '', dtype=object)
+        rows = np.flatnonzero(any_found[count_shift + 1:]) + count_shift + 1
+        count[rows - count_shift] = found[rows].sum(axis=1)
+        for row in rows:
+            label[row - count_shift] = ''.join(names[found[row]])
+        columns[f'total_{side}_divergences'] = np.where(any_found, close, np.nan)
+        columns[f'total_{side}_divergences_count'] = count
+        columns[f'total_{side}_divergences_names'] = label
+
+    return DataFrame(columns, index=dataframe.index)
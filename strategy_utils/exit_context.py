@@ -0,0 +1,114 @@
+"""
+Candle context for ``custom_sell``.
+
+``custom_sell`` runs for every open trade on every bot loop, but the analyzed frame of a pair
+only changes once per candle. ``ExitContextCache`` keeps one ``ExitContext`` per pair and
+builds a new one only when the frame does, so trades of the same pair and later loops of the
+same candle share it.
+
+The candles are handed out as ``CandleRecord`` objects instead of full rows: a record reads
+a column the first time it is asked for it and keeps the value, so only the columns the sell
+functions actually look at are ever touched. The candle a trade was bought on is found by a
+binary search over the dates and remembered per open date.
+"""
+from typing import Dict, Hashable, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame, Timestamp
+
+from .indicator_store import frame_fingerprint
+from .tail import as_dates
+
+
+class CandleRecord:
+    """One candle of an ``ExitContext``, indexed by column name like a row Series."""
+
+    __slots__ = ('_context', '_pos', '_values')
+
+    def __init__(self, context: 'ExitContext', pos: int):
+        self._context = context
+        self._pos = pos
+        self._values: Dict[str, object] = {}
+
+    def __getitem__(self, column: str):
+        try:
+            return self._values[column]
+        except KeyError:
+            value = self._values[column] = self._context.column(column)[self._pos]
+            return value
+
+    def __contains__(self, column: str) -> bool:
+        return column in self._context.dataframe.columns
+
+    def get(self, column: str, default=None):
+        return self[column] if column in self else default
+
+
+class ExitContext:
+    """The candles of one analyzed frame that the sell logic looks at."""
+
+    def __init__(self, dataframe: DataFrame):
+        self.dataframe = dataframe
+        self._columns: Dict[str, np.ndarray] = {}
+        self._records: Dict[int, CandleRecord] = {}
+        self._dates: Optional[np.ndarray] = None
+        self._signal_candles: Dict[object, Optional[CandleRecord]] = {}
+
+    def __len__(self) -> int:
+        return len(self.dataframe)
+
+    def column(self, name: str) -> np.ndarray:
+        values = self._columns.get(name)
+        if values is None:
+            values = self._columns[name] = self.dataframe[name].to_numpy()
+        return values
+
+    def candle(self, shift: int = 0) -> CandleRecord:
+        """The last candle (``shift`` 0) or the one ``shift`` candles before it."""
+        if not 0 <= shift < len(self):
+            raise IndexError(f"No candle {shift} candles before the last of {len(self)}")
+        return self._record(len(self) - 1 - shift)
+
+    def signal_candle(self, open_date) -> Optional[CandleRecord]:
+        """The last candle dated before ``open_date``, None when there is none."""
+        if open_date in self._signal_candles:
+            return self._signal_candles[open_date]
+        if self._dates is None:
+            self._dates = as_dates(self.dataframe['date'])
+        pos = int(np.searchsorted(self._dates, _as_date64(open_date), side='left')) - 1
+        record = self._signal_candles[open_date] = self._record(pos) if pos >= 0 else None
+        return record
+
+    def _record(self, pos: int) -> CandleRecord:
+        record = self._records.get(pos)
+        if record is None:
+            record = self._records[pos] = CandleRecord(self, pos)
+        return record
+
+
+class ExitContextCache:
+    """``ExitContext`` per pair, rebuilt only when the pair's analyzed frame changes."""
+
+    def __init__(self):
+        self._contexts: Dict[str, Tuple[Hashable, ExitContext]] = {}
+
+    def context(self, pair: str, dataframe: DataFrame) -> ExitContext:
+        key = frame_fingerprint(dataframe)
+        cached = self._contexts.get(pair)
+        if cached is None or cached[0] != key:
+            cached = self._contexts[pair] = (key, ExitContext(dataframe))
+        return cached[1]
+
+    def reset(self, pair: Optional[str] = None) -> None:
+        if pair is None:
+            self._contexts.clear()
+        else:
+            self._contexts.pop(pair, None)
+
+
+def _as_date64(date) -> np.datetime64:
+    # Frame dates are UTC datetime64 once the time zone is dropped
+    date = Timestamp(date)
+    if date.tzinfo is not None:
+        date = date.tz_convert('UTC').tz_localize(None)
+    return date.to_datetime64()
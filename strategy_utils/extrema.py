@@ -0,0 +1,221 @@
+"""
+Local extrema in one pass, without looking ahead.
+
+A candle is a local minimum (maximum) of order (``before``, ``after``) when it is strictly
+below (above) the ``before`` candles before it and the ``after`` candles after it, windows
+clipped at the start of the data like ``scipy.signal.argrelextrema(..., mode='clip')``.
+Whether a candle is one is only known ``after`` candles later, so the causal results are
+aligned on that confirmation candle.
+
+Both sides come from a single monotonic stack per direction: when a candle is pushed, the
+nearest earlier candle that is not above (below) it is on the stack, and a candle is popped
+by the first later candle that is not above (below) it. Every candle is pushed and popped at
+most once, O(n) for any order instead of the O(n * order) of comparing every window.
+
+Candles with a NaN value are never extrema and block every candle whose window contains
+them, as the comparisons of ``argrelextrema`` fail on NaN.
+"""
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from ._compat import jit
+from .tail import as_dates, frame_overlap
+
+
+@jit
+def _extrema_kernel(x, before, after, clip_end):
+    n = len(x)
+    lows = np.zeros(n, dtype=np.bool_)
+    highs = np.zeros(n, dtype=np.bool_)
+    back_low = np.zeros(n, dtype=np.bool_)
+    back_high = np.zeros(n, dtype=np.bool_)
+    # First later candle not above (below) the candle, n while none was seen
+    next_low = np.full(n, n, dtype=np.int64)
+    next_high = np.full(n, n, dtype=np.int64)
+    # Candle positions with increasing (low stack) / decreasing (high stack) values
+    low_stack = np.zeros(n, dtype=np.int64)
+    high_stack = np.zeros(n, dtype=np.int64)
+    low_top = 0
+    high_top = 0
+    last_nan = -1
+    for t in range(n + (after if clip_end else 0)):
+        if t < n:
+            v = x[t]
+            start = max(t - before, 0)
+            if v != v:
+                last_nan = t
+            else:
+                prev = -1
+                while low_top > 0 and x[low_stack[low_top - 1]] >= v:
+                    low_top -= 1
+                    next_low[low_stack[low_top]] = t
+                    if x[low_stack[low_top]] == v:
+                        prev = low_stack[low_top]
+                if prev < 0 and low_top > 0:
+                    prev = low_stack[low_top - 1]
+                back_low[t] = t >= 1 and prev < start and last_nan < start
+                low_stack[low_top] = t
+                low_top += 1
+
+                prev = -1
+                while high_top > 0 and x[high_stack[high_top - 1]] <= v:
+                    high_top -= 1
+                    next_high[high_stack[high_top]] = t
+                    if x[high_stack[high_top]] == v:
+                        prev = high_stack[high_top]
+                if prev < 0 and high_top > 0:
+                    prev = high_stack[high_top - 1]
+                back_high[t] = t >= 1 and prev < start and last_nan < start
+                high_stack[high_top] = t
+                high_top += 1
+
+        # Candle confirmed by candle t, or by the last one when the window is clipped
+        j = t - after
+        if j < 0 or j >= n - 1 and clip_end:
+            continue
+        last = min(t, n - 1)
+        if last_nan <= j:
+            lows[j] = back_low[j] and next_low[j] > last
+            highs[j] = back_high[j] and next_high[j] > last
+    return lows, highs
+
+
+def relative_extrema(x, order: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Positions of the local minima and maxima of ``x``, the same as
+    ``argrelextrema(x, np.less, order=order)[0]`` and its ``np.greater`` counterpart.
+    The last ``order`` candles are judged on the candles after them that exist (lookahead).
+    """
+    if order < 1:
+        raise ValueError("Order must be an int >= 1")
+    lows, highs = _extrema_kernel(np.asarray(x, dtype=np.float64), int(order), int(order), True)
+    return np.flatnonzero(lows), np.flatnonzero(highs)
+
+
+def causal_extrema(x, before: int, after: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Boolean arrays of the candles on which a local minimum / maximum of order (``before``,
+    ``after``) is confirmed, i.e. candle ``t`` is True when candle ``t - after`` is one.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    lows, highs = _extrema_kernel(x, int(before), int(after), False)
+    return _confirmed(np.asarray(lows), after), _confirmed(np.asarray(highs), after)
+
+
+def _confirmed(flags: np.ndarray, after: int) -> np.ndarray:
+    out = np.zeros(len(flags), dtype=bool)
+    out[after:] = flags[:max(len(flags) - after, 0)]
+    return out
+
+
+class ExtremaDetector:
+    """Streaming ``causal_extrema``: ``append`` one value, get the (low, high) flags of its candle."""
+
+    def __init__(self, before: int, after: int = 1):
+        self.before = int(before)
+        self.after = int(after)
+        self.count = 0
+        self._last_nan = -1
+        # [position, value] entries, older than any window are dropped
+        self._lows = deque()
+        self._highs = deque()
+        # [back_low, back_high, forward_low, forward_high] of the last ``after + 1`` candles
+        self._pending = deque()
+
+    def append(self, value: float) -> Tuple[bool, bool]:
+        t = self.count
+        self.count += 1
+        flags = [False, False, True, True]
+        if value != value:
+            self._last_nan = t
+            flags = [False, False, False, False]
+            for pending in self._pending:
+                pending[2] = pending[3] = False
+        else:
+            flags[0] = self._push(self._lows, t, value, lambda a, b: a >= b, 2)
+            flags[1] = self._push(self._highs, t, value, lambda a, b: a <= b, 3)
+        self._pending.append(flags)
+
+        horizon = t - max(self.before, self.after)
+        for stack in (self._lows, self._highs):
+            while stack and stack[0][0] < horizon:
+                stack.popleft()
+        if len(self._pending) <= self.after:
+            return False, False
+        back_low, back_high, forward_low, forward_high = self._pending.popleft()
+        return back_low and forward_low, back_high and forward_high
+
+    def extend(self, values) -> Tuple[np.ndarray, np.ndarray]:
+        values = np.asarray(values, dtype=np.float64)
+        lows = np.zeros(len(values), dtype=bool)
+        highs = np.zeros(len(values), dtype=bool)
+        for i, value in enumerate(values):
+            lows[i], highs[i] = self.append(value)
+        return lows, highs
+
+    def _push(self, stack: deque, t: int, value: float, pops, forward: int) -> bool:
+        """Push candle ``t``, whether it is an extremum of the ``before`` candles before it."""
+        prev = -1
+        while stack and pops(stack[-1][1], value):
+            position, stacked = stack.pop()
+            pending = position - (t - len(self._pending))
+            if pending >= 0:
+                self._pending[pending][forward] = False
+            if stacked == value:
+                prev = position
+        if prev < 0 and stack:
+            prev = stack[-1][0]
+        stack.append((t, value))
+        start = max(t - self.before, 0)
+        return t >= 1 and prev < start and self._last_nan < start
+
+
+class ExtremaTracker:
+    """
+    Per-pair ``causal_extrema`` of a column for live/dry runs.
+
+    Flags of candles seen before are reused and only the new candles are appended to the
+    pair's ``ExtremaDetector``. A frame that does not continue the stored history is
+    computed from scratch.
+    """
+
+    def __init__(self, before: int, after: int = 1, column: str = 'close'):
+        self.before = int(before)
+        self.after = int(after)
+        self.column = column
+        self._pairs: Dict[str, dict] = {}
+
+    def reset(self, pair: Optional[str] = None) -> None:
+        if pair is None:
+            self._pairs.clear()
+        else:
+            self._pairs.pop(pair, None)
+
+    def update(self, pair: str, dataframe: DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        dates = as_dates(dataframe['date'])
+        values = dataframe[self.column].to_numpy(dtype=np.float64)
+        cached = self._pairs.get(pair)
+        overlap = frame_overlap(cached['dates'] if cached else None, dates)
+        if overlap is None:
+            lows, highs = causal_extrema(values, self.before, self.after)
+            detector = self._warm(values)
+        else:
+            first, known = overlap
+            detector = cached['detector']
+            new_lows, new_highs = detector.extend(values[known:])
+            lows = np.concatenate((cached['lows'][first:], new_lows))
+            highs = np.concatenate((cached['highs'][first:], new_highs))
+
+        self._pairs[pair] = {'dates': dates, 'lows': lows, 'highs': highs, 'detector': detector}
+        return lows, highs
+
+    def _warm(self, values: np.ndarray) -> ExtremaDetector:
+        # The state only depends on the windows of the candles still to be confirmed
+        detector = ExtremaDetector(self.before, self.after)
+        keep = min(len(values), self.before + self.after + 1)
+        detector.count = len(values) - keep
+        detector.extend(values[len(values) - keep:])
+        return detector
@@ -0,0 +1,210 @@
+"""
+GodStra genes: talib indicators named ``NAME-period``, ``NAME-output-period`` or, for the
+trend operators, ``NAME-period-SMA-n`` / ``NAME-output-period-SMA-n``, min-max normalized over
+the frame.
+
+``gene_calculator`` is the helper GodStraNew and its forks used to copy. It can draw from a
+``GeneCache``, which keeps computed genes per (pair, candles, gene) across hyperopt epochs
+with a memory bound and least-recently-used eviction, and can warm every gene a parameter
+space can reach in worker processes before the first epoch.
+"""
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+import talib.abstract as ta
+from pandas import DataFrame, Series
+
+from .indicator_store import OHLCV, frame_fingerprint
+
+TREND_CHECK_CANDLES = 4
+TREND_OPERATORS = ["UT", "DT", "OT", "CUT", "CDT", "COT"]
+
+# (normalized values, (raw column name, raw values) written next to trend genes or None)
+GeneValues = Tuple[np.ndarray, Optional[Tuple[str, np.ndarray]]]
+
+
+def normalize(df):
+    df = (df-df.min())/(df.max()-df.min())
+    return df
+
+
+def gene_name(indicator: str) -> str:
+    """Canonical gene: timeperiods do not affect CDL pattern recognitions, they all use 0."""
+    if 'CDL' in indicator:
+        splited_indicator = indicator.split('-')
+        splited_indicator[1] = "0"
+        indicator = "-".join(splited_indicator)
+    return indicator
+
+
+def trend_gene(indicator: str, trend_candles: int = TREND_CHECK_CANDLES) -> str:
+    return f"{indicator}-SMA-{trend_candles}"
+
+
+def compute_gene(dataframe: DataFrame, indicator: str,
+                 trend_candles: int = TREND_CHECK_CANDLES) -> Tuple[Series, Optional[Tuple[str, Series]]]:
+    """
+    Normalized gene of ``dataframe``. Trend genes also return the raw indicator they smooth,
+    with the column name ``gene_calculator`` stores it under.
+    """
+    gene = gene_name(indicator).split("-")
+    name = gene[0]
+    gene_len = len(gene)
+    # For Pattern Recognations
+    if gene_len == 1:
+        return normalize(getattr(ta, name)(dataframe)), None
+    elif gene_len == 2:
+        return normalize(getattr(ta, name)(dataframe, timeperiod=int(gene[1]))), None
+    elif gene_len == 3:
+        result = getattr(ta, name)(dataframe, timeperiod=int(gene[2])).iloc[:, int(gene[1])]
+        return normalize(result), None
+    # For trend operators(MA-5-SMA-4)
+    elif gene_len == 4:
+        sharp_indicator = f'{name}-{int(gene[1])}'
+        raw = getattr(ta, name)(dataframe, timeperiod=int(gene[1]))
+    # For trend operators(STOCH-0-4-SMA-4)
+    elif gene_len == 5:
+        sharp_indicator = f'{name}-{int(gene[1])}-{int(gene[2])}'
+        raw = getattr(ta, name)(dataframe, timeperiod=int(gene[2])).iloc[:, int(gene[1])]
+    else:
+        raise ValueError(f"Unknown gene {indicator}")
+    return normalize(ta.SMA(raw.fillna(0), trend_candles)), (sharp_indicator, raw)
+
+
+def _compute_values(source: DataFrame, genes: List[str], trend_candles: int) -> List[Tuple[str, GeneValues]]:
+    """Worker entry point of ``GeneCache.precompute``."""
+    result = []
+    for gene in genes:
+        values, sharp = compute_gene(source, gene, trend_candles)
+        result.append((gene, _as_entry(values, sharp)))
+    return result
+
+
+class PairGenes:
+    """The genes of one pair's frame, as handed to ``gene_calculator``."""
+
+    def __init__(self, cache: 'GeneCache', pair: str, dataframe: DataFrame):
+        self.cache = cache
+        self.pair = pair
+        self.dataframe = dataframe
+        self.fingerprint = frame_fingerprint(dataframe)
+
+    def get(self, indicator: str) -> Tuple[Series, Optional[Tuple[str, Series]]]:
+        values, sharp = self.cache.values(self.pair, self.fingerprint, self.dataframe, indicator)
+        index = self.dataframe.index
+        return Series(values, index=index), (sharp[0], Series(sharp[1], index=index)) if sharp else None
+
+
+class GeneCache:
+    """
+    Normalized genes keyed by (pair, candle fingerprint, gene), least recently used evicted
+    once ``max_bytes`` is exceeded. One instance per process: hyperopt workers each keep
+    their own and reuse it for every epoch they run.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, trend_candles: int = TREND_CHECK_CANDLES):
+        self.max_bytes = max_bytes
+        self.trend_candles = trend_candles
+        self.nbytes = 0
+        self._entries: 'OrderedDict[Tuple[str, Hashable, str], GeneValues]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def bind(self, pair: str, dataframe: DataFrame) -> PairGenes:
+        return PairGenes(self, pair, dataframe)
+
+    def reset(self, pair: Optional[str] = None) -> None:
+        if pair is None:
+            self._entries.clear()
+            self.nbytes = 0
+            return
+        for key in [key for key in self._entries if key[0] == pair]:
+            self.nbytes -= _entry_bytes(self._entries.pop(key))
+
+    def values(self, pair: str, fingerprint: Hashable, dataframe: DataFrame, indicator: str) -> GeneValues:
+        key = (pair, fingerprint, gene_name(indicator))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        values, sharp = compute_gene(dataframe, key[2], self.trend_candles)
+        entry = _as_entry(values, sharp)
+        self._put(key, entry)
+        return entry
+
+    def _put(self, key, entry: GeneValues) -> None:
+        self._entries[key] = entry
+        self.nbytes += _entry_bytes(entry)
+        # Never evict the entry just added, even when it alone is over the limit
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            _, old = self._entries.popitem(last=False)
+            self.nbytes -= _entry_bytes(old)
+
+    def precompute(self, pair: str, dataframe: DataFrame, genes: Iterable[str],
+                   processes: Optional[int] = None) -> int:
+        """
+        Compute every gene of ``genes`` not cached yet for ``pair``, spread over ``processes``
+        worker processes (all CPUs by default, 1 computes in this process).
+        Returns the number of genes computed.
+        """
+        fingerprint = frame_fingerprint(dataframe)
+        todo = list(dict.fromkeys(
+            g for g in map(gene_name, genes) if (pair, fingerprint, g) not in self._entries))
+        if not todo:
+            return 0
+        source = dataframe[OHLCV]
+        if processes == 1 or len(todo) == 1:
+            results = _compute_values(source, todo, self.trend_candles)
+        else:
+            workers = min(processes or os.cpu_count() or 1, len(todo))
+            # One batch per worker, so the candles are sent to each worker once
+            batches = [todo[i::workers] for i in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = [r for batch in executor.map(_compute_values, [source] * workers, batches,
+                                                       [self.trend_candles] * workers)
+                           for r in batch]
+        for gene, entry in results:
+            self._put((pair, fingerprint, gene), entry)
+        return len(results)
+
+
+def reachable_genes(indicators: Iterable[str], operators: Iterable[str],
+                    trend_candles: int = TREND_CHECK_CANDLES) -> List[str]:
+    """Every gene a parameter space of ``indicators`` x ``operators`` can ask for."""
+    indicators = list(dict.fromkeys(map(gene_name, indicators)))
+    genes = list(indicators)
+    if any(op in TREND_OPERATORS for op in operators):
+        genes += [trend_gene(i, trend_candles) for i in indicators]
+    return genes
+
+
+def gene_calculator(dataframe: DataFrame, indicator: str, genes: Optional[PairGenes] = None):
+    """
+    The gene column for ``dataframe``: an existing column of that name wins, otherwise it is
+    taken from ``genes`` (or computed). Trend genes store the raw indicator they smooth under
+    ``NAME-period`` like before.
+    """
+    indicator = gene_name(indicator)
+    if indicator in dataframe.keys():
+        return dataframe[indicator]
+    if genes is not None:
+        result, sharp = genes.get(indicator)
+    else:
+        result, sharp = compute_gene(dataframe, indicator)
+    if sharp is not None:
+        dataframe[sharp[0]] = sharp[1]
+    return result
+
+
+def _as_entry(values, sharp) -> GeneValues:
+    # talib hands back a bare array for some functions, a Series for others
+    return np.asarray(values), (sharp[0], np.asarray(sharp[1])) if sharp is not None else None
+
+
+def _entry_bytes(entry: GeneValues) -> int:
+    values, sharp = entry
+    return values.nbytes + (sharp[1].nbytes if sharp else 0)
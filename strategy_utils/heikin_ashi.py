@@ -0,0 +1,102 @@
+"""
+Heikin-Ashi candles and the Bollinger band width expansion signal.
+
+The Heikin-Ashi open is the midpoint of the previous Heikin-Ashi candle's body,
+
+    ha_open[0] = (open[0] + close[0]) / 2
+    ha_open[t] = (ha_open[t - 1] + ha_close[t - 1]) / 2
+
+a first order IIR filter of the lagged ``ha_close``. ``scipy.signal.lfilter`` runs it in C
+with the first open as initial state, instead of a Python loop appending to a list. Halving
+is exact, so the values are the same as the loop's. A NaN close poisons every later open,
+like in the loop.
+
+``simple_heikin_ashi`` is the variant of the NostalgiaForInfinity strategies, whose open is
+the midpoint of the previous *raw* candle's body, on optionally EMA smoothed candles.
+
+``bbw_expansion`` is the rolling ``apply`` of the CryptoFrog strategies as column operations:
+a candle expands when its width is above ``mult`` times the largest width of the candles
+before it in the window (never below 0), NaN while the window has a NaN.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+import talib
+from pandas import DataFrame, Series
+from scipy.signal import lfilter
+
+# Smoothed column of each Heikin-Ashi column
+SMOOTHED_COLUMNS = {'HA_Open': 'Smooth_HA_O', 'HA_Close': 'Smooth_HA_C', 'HA_High': 'Smooth_HA_H', 'HA_Low': 'Smooth_HA_L'}
+
+
+def heikin_ashi_open(first_open: float, first_close: float, ha_close) -> np.ndarray:
+    """Heikin-Ashi open of every candle, from the first candle's open/close and ``ha_close``."""
+    ha_close = np.asarray(ha_close, dtype=np.float64)
+    if len(ha_close) == 0:
+        return np.empty(0)
+    ha_open = np.empty(len(ha_close))
+    ha_open[0] = (first_open + first_close) / 2
+    ha_open[1:] = lfilter([0.5], [1.0, -0.5], ha_close[:-1], zi=[ha_open[0] / 2])[0]
+    return ha_open
+
+
+def heikin_ashi_frame(dataframe: DataFrame, smoothing: Optional[int] = None) -> DataFrame:
+    """
+    ``HA_Open``, ``HA_Close``, ``HA_High`` and ``HA_Low`` of ``dataframe``'s candles, plus their
+    EMAs over ``abs(smoothing)`` candles as ``Smooth_HA_O/C/H/L`` when ``smoothing`` is set.
+    """
+    open_ = dataframe['open'].to_numpy(dtype=np.float64)
+    high = dataframe['high'].to_numpy(dtype=np.float64)
+    low = dataframe['low'].to_numpy(dtype=np.float64)
+    close = dataframe['close'].to_numpy(dtype=np.float64)
+
+    ha_close = (open_ + high + low + close) / 4
+    ha_open = heikin_ashi_open(open_[0], close[0], ha_close) if len(close) else np.empty(0)
+    # fmax / fmin skip NaN like DataFrame.max(axis=1)
+    columns = {
+        'HA_Close': ha_close,
+        'HA_Open': ha_open,
+        'HA_High': np.fmax(np.fmax(ha_open, ha_close), high),
+        'HA_Low': np.fmin(np.fmin(ha_open, ha_close), low),
+    }
+    sml = abs(int(smoothing)) if smoothing is not None else 0
+    if sml > 0:
+        for source, name in SMOOTHED_COLUMNS.items():
+            columns[name] = talib.EMA(columns[source], timeperiod=sml)
+    return DataFrame(columns, index=dataframe.index)
+
+
+def heikin_ashi(dataframe: DataFrame, smoothing: Optional[int] = None) -> DataFrame:
+    """Copy of ``dataframe`` with the ``heikin_ashi_frame`` columns, what ``HA()`` returned."""
+    return dataframe.assign(**heikin_ashi_frame(dataframe, smoothing))
+
+
+def simple_heikin_ashi(dataframe: DataFrame, smooth_inputs: bool = False, smooth_outputs: bool = False,
+                       period: int = 30) -> Tuple[Series, Series, Series]:
+    """
+    Open, close and low of the NostalgiaForInfinity ``heikin_ashi``, missing prices being 0.
+    Its copies ask talib for ``timeframe=length``, which talib ignores: the EMAs there are
+    over talib's default of 30 candles, ``period`` here.
+    """
+    prices = {column: dataframe[column].to_numpy(dtype=np.float64) for column in ('open', 'high', 'low', 'close')}
+    prices = {column: np.where(np.isnan(values), 0.0, values) for column, values in prices.items()}
+    if smooth_inputs:
+        prices = {column: talib.EMA(values, timeperiod=period) for column, values in prices.items()}
+    open_, high, low, close = prices['open'], prices['high'], prices['low'], prices['close']
+
+    ha_open = np.full(len(open_), np.nan)
+    ha_open[1:] = (open_[:-1] + close[:-1]) / 2
+    ha_close = (open_ + high + low + close) / 4
+    # fmin skips NaN like DataFrame.min(axis=1)
+    ha_low = np.fmin(np.fmin(low, open_), close)
+    outputs = [np.where(np.isnan(values), 0.0, values) for values in (ha_open, ha_close, ha_low)]
+    if smooth_outputs:
+        outputs = [talib.EMA(values, timeperiod=period) for values in outputs]
+    return tuple(Series(values, index=dataframe.index) for values in outputs)
+
+
+def bbw_expansion(bb_width: Series, window: int = 4, mult: float = 1.1) -> Series:
+    """1.0 on the candles whose band width expands, 0.0 otherwise, NaN during warm-up or NaN."""
+    previous = bb_width.shift(1).rolling(window - 1, min_periods=1).max().clip(lower=0).fillna(0)
+    expanding = (bb_width > previous * mult).astype(np.float64)
+    return expanding.where(bb_width.rolling(window).count() == window)
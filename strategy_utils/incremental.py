@@ -0,0 +1,268 @@
+"""
+Incremental indicators for strategies that run with ``process_only_new_candles = False``.
+
+Such strategies recompute every indicator over the whole startup window on every throttle
+iteration, although the frame only moved forward by a candle, if at all.
+``IncrementalIndicators`` keeps per pair the columns computed so far plus the recurrence state
+of every indicator and only computes the candles it has not seen yet:
+
+* recurrences (EMA, Wilder's RMA, RSI, ATR) resume from their state, seeded like talib (the
+  first value is the simple average of the first ``period`` inputs),
+* rolling windows (SMA, max, min, standard deviation) are evaluated on the new rows only,
+  reading the ``period - 1`` candles before them from the frame.
+
+The last candle of every call is treated as provisional, the next call recomputes it from the
+state before it, so a forming candle that is updated in place is handled like a closed one.
+When the frame does not continue the stored history (first call, gap, reload, changed
+values) everything is computed from scratch.
+
+Recurrences carried over a rolling window are not reseeded at the first candle of the
+window like a full recompute of the window would, so their values are those of the whole
+history seen so far.
+"""
+from typing import Dict, NamedTuple, Optional
+
+import numpy as np
+from pandas import DataFrame
+
+from ._compat import jit
+from .tail import as_dates, frame_overlap
+
+RECURRENCES = ('ema', 'rma', 'rsi', 'atr')
+WINDOWS = ('sma', 'max', 'min', 'std')
+
+# Sources computed from the candles, the typical price like qtpylib.typical_price
+DERIVED_SOURCES = {
+    'hlc3': lambda df: (df['high'] + df['low'] + df['close']) / 3,
+}
+
+
+class Indicator(NamedTuple):
+    kind: str
+    source: str = 'close'
+    period: int = 14
+    # Delta degrees of freedom of 'std', 1 like pandas' rolling std
+    ddof: int = 0
+    # Rolling windows: shorter windows at the start of the frame are used from this many
+    # candles on, like pandas' min_periods (None: full windows only)
+    min_periods: Optional[int] = None
+
+    @property
+    def lookback(self) -> int:
+        """Candles before the first new one the indicator reads."""
+        return self.period - 1 if self.kind in WINDOWS else 1
+
+
+@jit
+def _average_kernel(values, start, stop, period, wilder, prev, count, seed):
+    """EMA (``wilder`` False) or Wilder's RMA, NaN until ``period`` inputs were seen."""
+    n = len(values)
+    out = np.full(n, np.nan)
+    alpha = 1.0 / period if wilder else 2.0 / (period + 1)
+    for i in range(start, stop):
+        x = values[i]
+        count += 1
+        if count < period:
+            seed += x
+            continue
+        if count == period:
+            prev = (seed + x) / period
+        elif wilder:
+            prev = (prev * (period - 1) + x) / period
+        else:
+            prev = (x - prev) * alpha + prev
+        out[i] = prev
+    return out, prev, count, seed
+
+
+@jit
+def _rsi_kernel(close, start, stop, period, prev_close, gain, loss, count):
+    """talib RSI, ``count`` is the number of price changes seen."""
+    n = len(close)
+    out = np.full(n, np.nan)
+    for i in range(start, stop):
+        x = close[i]
+        if count >= 0:
+            change = x - prev_close
+            up = change if change > 0 else 0.0
+            down = -change if change < 0 else 0.0
+            count += 1
+            if count <= period:
+                gain += up
+                loss += down
+                if count == period:
+                    gain /= period
+                    loss /= period
+            else:
+                gain = (gain * (period - 1) + up) / period
+                loss = (loss * (period - 1) + down) / period
+            if count >= period:
+                total = gain + loss
+                out[i] = 100.0 * gain / total if total != 0 else 0.0
+        else:
+            count = 0
+        prev_close = x
+    return out, prev_close, gain, loss, count
+
+
+@jit
+def _atr_kernel(high, low, close, start, stop, period, prev_close, atr, count):
+    """talib ATR, ``count`` is the number of true ranges seen."""
+    n = len(close)
+    out = np.full(n, np.nan)
+    for i in range(start, stop):
+        if count >= 0:
+            tr = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+            count += 1
+            if count < period:
+                atr += tr
+            elif count == period:
+                atr = (atr + tr) / period
+                out[i] = atr
+            else:
+                atr = (atr * (period - 1) + tr) / period
+                out[i] = atr
+        else:
+            count = 0
+        prev_close = close[i]
+    return out, prev_close, atr, count
+
+
+def _initial_state(indicator: Indicator) -> tuple:
+    if indicator.kind in ('ema', 'rma'):
+        return np.nan, 0, 0.0
+    if indicator.kind == 'rsi':
+        return np.nan, 0.0, 0.0, -1
+    if indicator.kind == 'atr':
+        return np.nan, 0.0, -1
+    return ()
+
+
+def _window_values(indicator: Indicator, windows: np.ndarray) -> np.ndarray:
+    if indicator.kind == 'sma':
+        return windows.mean(axis=1)
+    if indicator.kind == 'max':
+        return windows.max(axis=1)
+    if indicator.kind == 'min':
+        return windows.min(axis=1)
+    if windows.shape[1] <= indicator.ddof:
+        return np.full(len(windows), np.nan)
+    return windows.std(axis=1, ddof=indicator.ddof)
+
+
+def _run_window(indicator: Indicator, values: np.ndarray, start: int, out: np.ndarray) -> None:
+    period = indicator.period
+    if indicator.min_periods is not None:
+        # Growing windows before the first full one
+        for i in range(max(start, indicator.min_periods - 1), min(period - 1, len(values))):
+            out[i] = _window_values(indicator, values[None, :i + 1])[0]
+    first = max(start, period - 1)
+    if first >= len(values):
+        return
+    windows = np.lib.stride_tricks.sliding_window_view(values[first - period + 1:], period)
+    out[first:] = _window_values(indicator, windows)
+
+
+def _run_recurrence(indicator: Indicator, arrays: Dict[str, np.ndarray], start: int, stop: int, state: tuple):
+    period = int(indicator.period)
+    if indicator.kind in ('ema', 'rma'):
+        result = _average_kernel(arrays[indicator.source], start, stop, period, indicator.kind == 'rma', *state)
+    elif indicator.kind == 'rsi':
+        result = _rsi_kernel(arrays[indicator.source], start, stop, period, *state)
+    else:
+        result = _atr_kernel(arrays['high'], arrays['low'], arrays['close'], start, stop, period, *state)
+    return np.asarray(result[0]), tuple(result[1:])
+
+
+def _sources(indicator: Indicator) -> tuple:
+    return ('high', 'low', 'close') if indicator.kind == 'atr' else (indicator.source,)
+
+
+class IncrementalIndicators:
+    """
+    Named indicator columns, per pair for live/dry runs.
+
+        indicators = IncrementalIndicators({'rsi': Indicator('rsi', 'close', 14),
+                                            'ema_200': Indicator('ema', 'close', 200)})
+        columns = indicators.update(metadata['pair'], dataframe)  # live
+        columns = indicators.compute(dataframe)                   # backtest
+    """
+
+    def __init__(self, indicators: Dict[str, Indicator]):
+        for name, indicator in indicators.items():
+            if indicator.kind not in RECURRENCES + WINDOWS:
+                raise ValueError(f"Unknown indicator kind {indicator.kind} for {name}")
+        self.indicators = dict(indicators)
+        self.sources = sorted({s for i in self.indicators.values() for s in _sources(i)})
+        self.lookback = max((i.lookback for i in self.indicators.values()), default=0)
+        self._pairs: Dict[str, dict] = {}
+
+    def reset(self, pair: Optional[str] = None) -> None:
+        if pair is None:
+            self._pairs.clear()
+        else:
+            self._pairs.pop(pair, None)
+
+    def compute(self, dataframe: DataFrame) -> DataFrame:
+        """Every column over the whole frame, nothing is stored."""
+        columns, _ = self._run(self._arrays(dataframe), 0, None)
+        return DataFrame(columns, index=dataframe.index)
+
+    def update(self, pair: str, dataframe: DataFrame) -> DataFrame:
+        """Every column of ``dataframe``, computing only the candles not seen before."""
+        dates = as_dates(dataframe['date'])
+        arrays = self._arrays(dataframe)
+        cached = self._pairs.get(pair)
+        resume = self._resume(cached, dates, arrays)
+        if resume is None:
+            columns, states = self._run(arrays, 0, None)
+        else:
+            first, known = resume
+            columns, states = self._run(arrays, known, cached['states'])
+            for name, values in columns.items():
+                values[:known] = cached['columns'][name][first:first + known]
+
+        self._pairs[pair] = {'dates': dates, 'arrays': arrays, 'columns': columns, 'states': states}
+        return DataFrame(columns, index=dataframe.index)
+
+    def _arrays(self, dataframe: DataFrame) -> Dict[str, np.ndarray]:
+        return {s: (DERIVED_SOURCES[s](dataframe) if s in DERIVED_SOURCES else dataframe[s]).to_numpy(dtype=np.float64)
+                for s in self.sources}
+
+    def _resume(self, cached: Optional[dict], dates: np.ndarray, arrays: Dict[str, np.ndarray]):
+        """(first stored row kept, rows reused) when the frame continues the stored history."""
+        if cached is None:
+            return None
+        overlap = frame_overlap(cached['dates'], dates)
+        if overlap is None:
+            return None
+        first, known = overlap
+        # The last stored candle is provisional and computed again
+        known -= 1
+        if known < self.lookback or known <= 0:
+            return None
+        for name, values in arrays.items():
+            if not np.array_equal(cached['arrays'][name][first:first + known], values[:known], equal_nan=True):
+                return None
+        return first, known
+
+    def _run(self, arrays: Dict[str, np.ndarray], start: int, states: Optional[dict]):
+        """Columns from row ``start`` on (earlier rows left NaN) and the states before the last row."""
+        n = len(next(iter(arrays.values()))) if arrays else 0
+        columns = {}
+        before_last = {}
+        for name, indicator in self.indicators.items():
+            out = np.full(n, np.nan)
+            if indicator.kind in WINDOWS:
+                _run_window(indicator, arrays[indicator.source], start, out)
+                before_last[name] = ()
+            else:
+                state = states[name] if states is not None else _initial_state(indicator)
+                last = max(n - 1, start)
+                head, state = _run_recurrence(indicator, arrays, start, last, state)
+                before_last[name] = state
+                tail, _ = _run_recurrence(indicator, arrays, last, n, state)
+                out[start:last] = head[start:last]
+                out[last:] = tail[last:]
+            columns[name] = out
+        return columns, before_last
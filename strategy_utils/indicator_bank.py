@@ -0,0 +1,231 @@
+"""
+Indicator banks: one indicator over a whole range of parameter values.
+
+Hyperoptable strategies add one column per value of a parameter's ``.range`` (an EMA for
+every ``base_nb_candles_buy``, a CCI for every ``buy_cci_length``, ...), one talib call and
+one ``dataframe[...] =`` insertion at a time. A bank computes the family once into a single
+contiguous (values, candles) float64 array, hands rows out by parameter value and adds all
+its columns to the dataframe in one concat.
+
+``BankStore`` keeps the banks per pair as long as the pair's candles do not change. In
+backtesting and hyperopt it can also save them under ``user_data/indicator_bank``, so a later
+run over the same data loads the array instead of recomputing it. This is opt-in through the
+strategy config, the least recently used files being deleted past ``max_size_mb``:
+
+    "indicator_bank": {"persist": true, "max_size_mb": 1024}
+
+Files are keyed by pair, timerange, family, parameter values and a hash of the candles
+themselves, so corrected or re-downloaded data is never served stale banks. The family name
+is part of the key: a callable family must get a new name whenever what it computes changes.
+"""
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, Mapping, Optional, Tuple, Union
+
+import numpy as np
+from pandas import DataFrame, concat
+
+from .indicator_store import frame_fingerprint, talib_indicator
+
+logger = logging.getLogger(__name__)
+
+# Runmodes worth keeping banks on disk for: the same candles come back run after run
+PERSISTENT_RUNMODES = ('backtest', 'hyperopt')
+DEFAULT_MAX_SIZE_MB = 1024
+# Candle columns hashed into the file names
+CONTENT_COLUMNS = ('date', 'open', 'high', 'low', 'close', 'volume')
+
+Family = Union[str, Callable[[DataFrame, int], object]]
+
+
+class IndicatorBank:
+    """Values of one indicator family, row ``i`` for ``params[i]``."""
+
+    def __init__(self, name: str, params: Iterable[int], values: np.ndarray):
+        self.name = name
+        self.params = tuple(int(p) for p in params)
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
+        self._rows = {p: i for i, p in enumerate(self.params)}
+        if self.values.ndim != 2 or self.values.shape[0] != len(self.params):
+            raise ValueError(f"Bank {name} has {len(self.params)} parameters but values of shape "
+                             f"{self.values.shape}")
+
+    def __len__(self) -> int:
+        return len(self.params)
+
+    def __contains__(self, param: int) -> bool:
+        return int(param) in self._rows
+
+    def column(self, param: int) -> np.ndarray:
+        """The indicator for parameter value ``param``, a view into the bank."""
+        row = self._rows.get(int(param))
+        if row is None:
+            raise KeyError(f"{param} is not in bank {self.name} {self.params}")
+        return self.values[row]
+
+    def frame(self, prefix: str, index=None) -> DataFrame:
+        """The bank as ``{prefix}{param}`` columns."""
+        return DataFrame(self.values.T, columns=[f'{prefix}{p}' for p in self.params], index=index)
+
+
+def compute_bank(dataframe: DataFrame, family: Family, params: Iterable[int],
+                 name: Optional[str] = None) -> IndicatorBank:
+    """
+    ``family`` over ``dataframe`` for every value of ``params``. ``family`` is a talib
+    function name (called with ``timeperiod``) or a callable ``(dataframe, param)``.
+    """
+    params = tuple(int(p) for p in params)
+    name = name or _family_name(family)
+    values = np.empty((len(params), len(dataframe)), dtype=np.float64)
+    for row, param in enumerate(params):
+        if isinstance(family, str):
+            values[row] = talib_indicator(dataframe, family, param)
+        else:
+            values[row] = np.asarray(family(dataframe, param), dtype=np.float64)
+    return IndicatorBank(name, params, values)
+
+
+def bank_directory(config: Mapping) -> Optional[Path]:
+    """Where banks are saved for ``config``, None when they are not."""
+    runmode = config.get('runmode')
+    runmode = getattr(runmode, 'value', runmode)
+    if (runmode not in PERSISTENT_RUNMODES or not config.get('user_data_dir')
+            or not config.get('indicator_bank', {}).get('persist', False)):
+        return None
+    return Path(config['user_data_dir']) / 'indicator_bank'
+
+
+def candles_digest(dataframe: DataFrame) -> str:
+    """Hash of the ``CONTENT_COLUMNS`` values of ``dataframe``."""
+    digest = hashlib.sha1()
+    for column in CONTENT_COLUMNS:
+        if column in dataframe.columns:
+            values = dataframe[column].to_numpy(dtype='datetime64[ns]' if column == 'date' else np.float64)
+            digest.update(column.encode())
+            digest.update(np.ascontiguousarray(values).view(np.uint8))
+    return digest.hexdigest()
+
+
+class BankStore:
+    """``IndicatorBank`` per pair and family, rebuilt only when the pair's candles change."""
+
+    def __init__(self, directory: Optional[Path] = None, max_size_mb: float = DEFAULT_MAX_SIZE_MB):
+        self.directory = Path(directory) if directory else None
+        self.max_bytes = int(max_size_mb * 2 ** 20)
+        self._banks: Dict[Tuple[str, str, Tuple[int, ...]], Tuple[Hashable, IndicatorBank]] = {}
+
+    def __len__(self) -> int:
+        return len(self._banks)
+
+    def configure(self, config: Mapping) -> 'BankStore':
+        """Save banks where ``bank_directory`` says for this config, up to its ``max_size_mb``."""
+        self.directory = bank_directory(config)
+        max_size_mb = config.get('indicator_bank', {}).get('max_size_mb', DEFAULT_MAX_SIZE_MB)
+        self.max_bytes = int(max_size_mb * 2 ** 20)
+        return self
+
+    def get(self, pair: str, dataframe: DataFrame, family: Family, params: Iterable[int],
+            name: Optional[str] = None) -> IndicatorBank:
+        params = tuple(int(p) for p in params)
+        name = name or _family_name(family)
+        key = (pair, name, params)
+        stamp = frame_fingerprint(dataframe)
+        cached = self._banks.get(key)
+        if cached is None or cached[0] != stamp:
+            path = self._path(pair, dataframe, name, params)
+            bank = self._load(path, name, params, len(dataframe))
+            if bank is None:
+                bank = compute_bank(dataframe, family, params, name)
+                self._save(path, bank)
+            cached = self._banks[key] = (stamp, bank)
+        return cached[1]
+
+    def reset(self, pair: Optional[str] = None) -> None:
+        if pair is None:
+            self._banks.clear()
+        else:
+            for key in [key for key in self._banks if key[0] == pair]:
+                del self._banks[key]
+
+    def _path(self, pair: str, dataframe: DataFrame, name: str, params: Tuple[int, ...]) -> Optional[Path]:
+        if self.directory is None or len(dataframe) == 0:
+            return None
+        dates = dataframe['date']
+        timerange = f"{dates.iloc[0]:%Y%m%d%H%M}-{dates.iloc[-1]:%Y%m%d%H%M}"
+        digest = hashlib.sha1(repr((name, params, candles_digest(dataframe))).encode()).hexdigest()[:16]
+        safe_pair = pair.replace('/', '_').replace(':', '_')
+        return self.directory / f"{safe_pair}_{timerange}_{name}_{digest}.npy"
+
+    def _load(self, path: Optional[Path], name: str, params: Tuple[int, ...],
+              candles: int) -> Optional[IndicatorBank]:
+        if path is None or not path.is_file():
+            return None
+        try:
+            values = np.load(path, allow_pickle=False)
+            # Recently used, the last file pruning would delete
+            os.utime(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read indicator bank {path}: {e}")
+            return None
+        if values.shape != (len(params), candles):
+            return None
+        return IndicatorBank(name, params, values)
+
+    def _save(self, path: Optional[Path], bank: IndicatorBank) -> None:
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Written aside and renamed, parallel hyperopt workers never read half a file
+            tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+            with open(tmp, 'wb') as f:
+                np.save(f, bank.values, allow_pickle=False)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not save indicator bank {path}: {e}")
+            return
+        self._prune(keep=path)
+
+    def _prune(self, keep: Path) -> None:
+        """
+        Delete the least recently used bank files while the directory is over ``max_bytes``,
+        never ``keep`` (the file just saved), even when it alone is over the limit.
+        """
+        files = []
+        for path in self.directory.glob('*.npy'):
+            try:
+                files.append((path.stat(), path))
+            except OSError:
+                # Deleted by another hyperopt worker meanwhile
+                continue
+        total = sum(stat.st_size for stat, _ in files)
+        for stat, path in sorted(files, key=lambda file: file[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= stat.st_size
+
+
+def add_banks(dataframe: DataFrame, banks: Mapping[str, IndicatorBank]) -> DataFrame:
+    """``dataframe`` with the ``{prefix}{param}`` columns of every bank, added in one concat."""
+    frames = [bank.frame(prefix, dataframe.index) for prefix, bank in banks.items()]
+    if not frames:
+        return dataframe
+    columns = [c for frame in frames for c in frame.columns]
+    return concat([dataframe.drop(columns=columns, errors='ignore')] + frames, axis=1)
+
+
+def _family_name(family: Family) -> str:
+    if isinstance(family, str):
+        return family
+    name = getattr(family, '__name__', '<lambda>')
+    if name == '<lambda>':
+        raise ValueError("Callable indicator families need a name")
+    return name
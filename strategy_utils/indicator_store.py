@@ -0,0 +1,93 @@
+"""
+Lazy talib indicator store.
+
+Strategies that search over a grid of (talib function, timeperiod) pairs only read the few
+columns the current parameters select. ``IndicatorStore`` computes a column the first time it
+is asked for and keeps it; ``IndicatorCache`` keeps one store per pair and reuses it as long
+as the pair's candles do not change, so hyperopt epochs share everything computed before.
+
+How to call each talib function (does it take a ``timeperiod``, does it return several
+outputs) is read from the talib metadata once at import instead of being found out by trial
+and error on every call.
+"""
+from typing import Dict, Hashable, NamedTuple, Optional, Tuple
+
+import talib.abstract as ta
+from pandas import DataFrame, Series
+
+OHLCV = ['open', 'high', 'low', 'close', 'volume']
+
+
+class TalibSignature(NamedTuple):
+    takes_timeperiod: bool
+    multiple_outputs: bool
+
+
+def _signature(name: str) -> TalibSignature:
+    info = ta.Function(name).info
+    return TalibSignature('timeperiod' in info['parameters'], len(info['output_names']) > 1)
+
+
+# Copied: some strategies edit talib's own list of names
+TALIB_SIGNATURES: Dict[str, TalibSignature] = {name: _signature(name) for name in list(ta.__TA_FUNCTION_NAMES__)}
+
+
+def talib_indicator(source: DataFrame, name: str, period: int) -> Series:
+    """``name`` over ``source`` with ``timeperiod=period`` when it has one, first output only."""
+    signature = TALIB_SIGNATURES.get(name) or _signature(name)
+    kwargs = {'timeperiod': int(period)} if signature.takes_timeperiod else {}
+    result = getattr(ta, name)(source, **kwargs)
+    if signature.multiple_outputs:
+        result = result.iloc[:, 0]
+    return result
+
+
+class IndicatorStore:
+    """Indicators of one frame, computed on first access and kept by (function, period)."""
+
+    def __init__(self, dataframe: DataFrame, shift: int = 0):
+        source = dataframe[OHLCV]
+        self.source = source.shift(shift) if shift else source
+        self._columns: Dict[Tuple[str, int], Series] = {}
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __contains__(self, key: Tuple[str, int]) -> bool:
+        return key in self._columns
+
+    def get(self, name: str, period) -> Series:
+        key = (name, int(period))
+        column = self._columns.get(key)
+        if column is None:
+            column = self._columns[key] = talib_indicator(self.source, name, key[1])
+        return column
+
+
+class IndicatorCache:
+    """``IndicatorStore`` per pair, rebuilt only when the pair's candles change."""
+
+    def __init__(self, shift: int = 0):
+        self.shift = shift
+        self._stores: Dict[str, Tuple[Hashable, IndicatorStore]] = {}
+
+    def store(self, pair: str, dataframe: DataFrame) -> IndicatorStore:
+        key = frame_fingerprint(dataframe)
+        cached = self._stores.get(pair)
+        if cached is None or cached[0] != key:
+            cached = self._stores[pair] = (key, IndicatorStore(dataframe, self.shift))
+        return cached[1]
+
+    def reset(self, pair: Optional[str] = None) -> None:
+        if pair is None:
+            self._stores.clear()
+        else:
+            self._stores.pop(pair, None)
+
+
+def frame_fingerprint(dataframe: DataFrame) -> Hashable:
+    """Cheap identity of a candle frame: length, first and last date, last close."""
+    if len(dataframe) == 0:
+        return 0, None, None, None
+    dates = dataframe['date']
+    return len(dataframe), dates.iloc[0], dates.iloc[-1], float(dataframe['close'].iloc[-1])
@@ -0,0 +1,277 @@
+"""
+Indicators shared by the strategies of this repository.
+
+EWO, Chaikin money flow, Williams %R, VWMA, T3, RMI, the SSL / ATR channels, the pump and
+dip helpers of the NostalgiaForInfinity family, ... used to be pasted into every strategy,
+each copy with its ``dataframe.copy()``, its intermediate columns and the same rolling window
+computed two or three times. Each indicator here is a ``*_values`` function over NumPy arrays
+and a function over the candle frame, under the name and with the parameters the strategies
+call it with, returning Series on the frame's index. Nothing copies the frame.
+
+The values are those of the strategy copies, to the bit: the same talib functions over the
+same inputs, pandas rolling windows (same NaN handling and summation) and the arithmetic in
+the same order. Variants that differ between copies (EWO over the low, with SMAs or another
+scale) are parameters.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+import talib
+from pandas import DataFrame, Series
+
+from .heikin_ashi import heikin_ashi, simple_heikin_ashi  # noqa: F401
+
+
+def _values(dataframe: DataFrame, column: str) -> np.ndarray:
+    return dataframe[column].to_numpy(dtype=np.float64)
+
+
+def _rolling(values: np.ndarray, length: int, **kwargs):
+    return Series(values).rolling(length, **kwargs)
+
+
+def _series(values: np.ndarray, dataframe: DataFrame, name: Optional[str] = None) -> Series:
+    return Series(values, index=dataframe.index, name=name)
+
+
+# --- Trend ---------------------------------------------------------------------------------
+
+def ewo_values(source: np.ndarray, base: np.ndarray, fast: int, slow: int, ma: str = 'EMA',
+               scale: float = 100) -> np.ndarray:
+    """Elliott wave oscillator: gap between a fast and a slow ``ma`` of ``source``, over ``base``."""
+    average = getattr(talib, ma)
+    return (average(source, timeperiod=fast) - average(source, timeperiod=slow)) / base * scale
+
+
+def EWO(dataframe: DataFrame, ema_length: int = 5, ema2_length: int = 35, ma: str = 'EMA',
+        base: str = 'close', scale: float = 100) -> Series:
+    """EWO of the close, in percent of the ``base`` column."""
+    return _series(ewo_values(_values(dataframe, 'close'), _values(dataframe, base), ema_length,
+                              ema2_length, ma, scale), dataframe)
+
+
+def vwma_values(close: np.ndarray, volume: np.ndarray, length: int = 10) -> np.ndarray:
+    return talib.SMA(close * volume, timeperiod=length) / talib.SMA(volume, timeperiod=length)
+
+
+def vwma(dataframe: DataFrame, length: int = 10) -> Series:
+    """Volume weighted moving average."""
+    return _series(vwma_values(_values(dataframe, 'close'), _values(dataframe, 'volume'), length), dataframe)
+
+
+def moderi_values(close: np.ndarray, volume: np.ndarray, len_slow_ma: int = 32) -> np.ndarray:
+    slow_ma = talib.EMA(vwma_values(close, volume, len_slow_ma), timeperiod=len_slow_ma)
+    rising = np.zeros(len(slow_ma), dtype=bool)
+    rising[1:] = slow_ma[1:] >= slow_ma[:-1]
+    return rising
+
+
+def moderi(dataframe: DataFrame, len_slow_ma: int = 32) -> Series:
+    """True while the EMA of the VWMA over ``len_slow_ma`` candles is not falling."""
+    return _series(moderi_values(_values(dataframe, 'close'), _values(dataframe, 'volume'), len_slow_ma), dataframe)
+
+
+def T3_values(close: np.ndarray, length: int = 5, b: float = 0.7) -> np.ndarray:
+    xe3 = talib.EMA(talib.EMA(talib.EMA(close, timeperiod=length), timeperiod=length), timeperiod=length)
+    xe4 = talib.EMA(xe3, timeperiod=length)
+    xe5 = talib.EMA(xe4, timeperiod=length)
+    xe6 = talib.EMA(xe5, timeperiod=length)
+    c1 = -b * b * b
+    c2 = 3 * b * b + 3 * b * b * b
+    c3 = -6 * b * b - 3 * b - 3 * b * b * b
+    c4 = 1 + 3 * b + b * b * b + 3 * b * b
+    return c1 * xe6 + c2 * xe5 + c3 * xe4 + c4 * xe3
+
+
+def T3(dataframe: DataFrame, length: int = 5) -> Series:
+    """T3 average by HPotter, https://www.tradingview.com/script/qzoC9H1I-T3-Average/"""
+    return _series(T3_values(_values(dataframe, 'close'), length), dataframe, 'T3Average')
+
+
+def ssl_channels_atr_values(high: np.ndarray, low: np.ndarray, close: np.ndarray, length: int = 7,
+                            atr_length: int = 14) -> Tuple[np.ndarray, np.ndarray]:
+    atr = talib.ATR(high, low, close, timeperiod=atr_length)
+    sma_high = _rolling(high, length).mean().to_numpy() + atr
+    sma_low = _rolling(low, length).mean().to_numpy() - atr
+    hlv = np.where(close > sma_high, 1, np.where(close < sma_low, -1, np.nan))
+    # Forward fill: every candle takes the last side the close broke out to
+    known = np.where(np.isnan(hlv), 0, np.arange(len(hlv)))
+    hlv = hlv[np.maximum.accumulate(known)] if len(hlv) else hlv
+    ssl_down = np.where(hlv < 0, sma_high, sma_low)
+    ssl_up = np.where(hlv < 0, sma_low, sma_high)
+    return ssl_down, ssl_up
+
+
+def SSLChannels_ATR(dataframe: DataFrame, length: int = 7) -> Tuple[Series, Series]:
+    """
+    SSL Channels with ATR: https://www.tradingview.com/script/SKHqWzql-SSL-ATR-channel/
+    Credit to @JimmyNixx for python
+    """
+    ssl_down, ssl_up = ssl_channels_atr_values(_values(dataframe, 'high'), _values(dataframe, 'low'),
+                                               _values(dataframe, 'close'), length)
+    return _series(ssl_down, dataframe, 'sslDown'), _series(ssl_up, dataframe, 'sslUp')
+
+
+def vwap_bands_values(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray,
+                      window_size: int = 20, num_of_std: float = 1
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # qtpylib.rolling_vwap: infinite values (no volume) give way to the last finite one
+    typical = (high + low + close) / 3
+    vwap = (_rolling(volume * typical, window_size).sum() / _rolling(volume, window_size).sum())
+    vwap = vwap.replace([np.inf, -np.inf], np.nan).ffill()
+    rolling_std = vwap.rolling(window=window_size).std().to_numpy()
+    vwap = vwap.to_numpy()
+    return vwap - (rolling_std * num_of_std), vwap, vwap + (rolling_std * num_of_std)
+
+
+def VWAPB(dataframe: DataFrame, window_size: int = 20, num_of_std: float = 1) -> Tuple[Series, Series, Series]:
+    """Rolling VWAP with bands ``num_of_std`` standard deviations of the VWAP away: low, VWAP, high."""
+    bands = vwap_bands_values(_values(dataframe, 'high'), _values(dataframe, 'low'), _values(dataframe, 'close'),
+                              _values(dataframe, 'volume'), window_size, num_of_std)
+    return tuple(_series(band, dataframe, name) for band, name in zip(bands, ('vwap_low', 'vwap', 'vwap_high')))
+
+
+# --- Oscillators ---------------------------------------------------------------------------
+
+def williams_r_values(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    highest_high = _rolling(high, period).max().to_numpy()
+    lowest_low = _rolling(low, period).min().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (highest_high - close) / (highest_high - lowest_low) * -100
+
+
+def williams_r(dataframe: DataFrame, period: int = 14) -> Series:
+    """
+    Williams %R: the close within the range of the last ``period`` candles, from -100 (at the
+    lowest low) up to 0 (at the highest high).
+    """
+    return _series(williams_r_values(_values(dataframe, 'high'), _values(dataframe, 'low'),
+                                     _values(dataframe, 'close'), period), dataframe, f"{period} Williams %R")
+
+
+def chaikin_money_flow_values(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray,
+                              n: int = 20, fillna: bool = False) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mfv = ((close - low) - (high - close)) / (high - low)
+        # A candle without range has no money flow
+        mfv = np.where(np.isnan(mfv), 0.0, mfv) * volume
+        cmf = (_rolling(mfv, n, min_periods=0).sum().to_numpy()
+               / _rolling(volume, n, min_periods=0).sum().to_numpy())
+    if fillna:
+        cmf[~np.isfinite(cmf)] = 0
+    return cmf
+
+
+def chaikin_money_flow(dataframe: DataFrame, n: int = 20, fillna: bool = False) -> Series:
+    """
+    Chaikin Money Flow (CMF), the money flow volume over ``n`` candles.
+    http://stockcharts.com/school/doku.php?id=chart_school:technical_indicators:chaikin_money_flow_cmf
+    """
+    return _series(chaikin_money_flow_values(_values(dataframe, 'high'), _values(dataframe, 'low'),
+                                             _values(dataframe, 'close'), _values(dataframe, 'volume'), n, fillna),
+                   dataframe, 'cmf')
+
+
+def rmi_values(close: np.ndarray, length: int = 20, mom: int = 5) -> np.ndarray:
+    change = close - Series(close).shift(mom).to_numpy()
+    # The first ``mom`` candles have no momentum, counted as none
+    max_up = np.where(np.isnan(change), 0.0, np.clip(change, 0, None))
+    max_down = np.where(np.isnan(change), 0.0, np.clip(-change, 0, None))
+    ema_inc = talib.EMA(max_up, timeperiod=length)
+    ema_dec = talib.EMA(max_down, timeperiod=length)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(ema_dec == 0, 0, 100 - 100 / (1 + ema_inc / ema_dec))
+
+
+def RMI(dataframe: DataFrame, *, length: int = 20, mom: int = 5) -> Series:
+    """
+    Relative momentum index, the RSI of the ``mom`` candle momentum.
+    Source: https://github.com/freqtrade/technical/blob/master/technical/indicators/indicators.py#L912
+    """
+    return _series(rmi_values(_values(dataframe, 'close'), length, mom), dataframe, 'RMI')
+
+
+def sroc_values(close: np.ndarray, emalen: int = 13, smooth: int = 21) -> np.ndarray:
+    return talib.ROC(talib.EMA(close, timeperiod=emalen), timeperiod=smooth)
+
+
+def SROC(dataframe: DataFrame, roclen: int = 21, emalen: int = 13, smooth: int = 21) -> Series:
+    """Smoothed rate of change: the ``smooth`` candle ROC of the close's EMA. ``roclen`` is unused."""
+    return _series(sroc_values(_values(dataframe, 'close'), emalen, smooth), dataframe)
+
+
+# --- Pumps and dips ------------------------------------------------------------------------
+
+def range_percent_change_values(top: np.ndarray, bottom: np.ndarray, length: int) -> np.ndarray:
+    bottom_min = _rolling(bottom, length).min().to_numpy()
+    return (_rolling(top, length).max().to_numpy() - bottom_min) / bottom_min
+
+
+def range_percent_change(dataframe: DataFrame, method: str, length: int) -> Series:
+    """
+    Rolling percentage change maximum across ``length`` candles, from the lows to the highs
+    (method 'HL') or from the closes to the opens ('OC').
+    """
+    if method == 'HL':
+        top, bottom = 'high', 'low'
+    elif method == 'OC':
+        top, bottom = 'open', 'close'
+    else:
+        raise ValueError(f"Method {method} not defined!")
+    return _series(range_percent_change_values(_values(dataframe, top), _values(dataframe, bottom), length), dataframe)
+
+
+def top_percent_change_values(open_: np.ndarray, close: np.ndarray, length: int) -> np.ndarray:
+    if length == 0:
+        return (open_ - close) / close
+    return (_rolling(open_, length).max().to_numpy() - close) / close
+
+
+def top_percent_change(dataframe: DataFrame, length: int) -> Series:
+    """Percentage change of the current close from the highest open of ``length`` candles."""
+    return _series(top_percent_change_values(_values(dataframe, 'open'), _values(dataframe, 'close'), length),
+                   dataframe)
+
+
+def range_maxgap(dataframe: DataFrame, length: int) -> Series:
+    """Highest open minus lowest close across ``length`` candles."""
+    return dataframe['open'].rolling(length).max() - dataframe['close'].rolling(length).min()
+
+
+def range_height(dataframe: DataFrame, length: int) -> Series:
+    """Distance of the close to the lowest close of ``length`` candles."""
+    return dataframe['close'] - dataframe['close'].rolling(length).min()
+
+
+def safe_pump_values(open_: np.ndarray, close: np.ndarray, length: int, thresh: float, pull_thresh: float,
+                     oc_pct_change: Optional[np.ndarray] = None) -> np.ndarray:
+    open_max = _rolling(open_, length).max().to_numpy()
+    close_min = _rolling(close, length).min().to_numpy()
+    if oc_pct_change is None:
+        oc_pct_change = (open_max - close_min) / close_min
+    return (oc_pct_change < thresh) | ((open_max - close_min) / pull_thresh > close - close_min)
+
+
+def safe_pump(dataframe: DataFrame, length: int, thresh: float, pull_thresh: float,
+              oc_pct_change: Optional[Series] = None) -> Series:
+    """
+    Is a buy after a pump safe: the 'OC' ``range_percent_change`` (or ``oc_pct_change``) is
+    below ``thresh``, or the close pulled back from the range's top by more than the range
+    divided by ``pull_thresh``.
+    """
+    if oc_pct_change is not None:
+        oc_pct_change = oc_pct_change.to_numpy(dtype=np.float64)
+    return _series(safe_pump_values(_values(dataframe, 'open'), _values(dataframe, 'close'), length, thresh,
+                                    pull_thresh, oc_pct_change), dataframe)
+
+
+def pump_warning_values(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                        perc: float = 15) -> np.ndarray:
+    return ((close > open_) & (((high - low) / low) > (perc / 100))).astype('int')
+
+
+def pump_warning(dataframe: DataFrame, perc: float = 15) -> Series:
+    """1 on green candles whose range is more than ``perc`` percent of their low, 0 otherwise."""
+    return _series(pump_warning_values(_values(dataframe, 'open'), _values(dataframe, 'high'),
+                                       _values(dataframe, 'low'), _values(dataframe, 'close'), perc),
+                   dataframe, 'result')
@@ -0,0 +1,112 @@
+"""
+Single-pass join of several informative timeframes into the base frame.
+
+Same result as chaining freqtrade's ``merge_informative_pair(..., ffill=True)`` once per
+informative frame and dropping unwanted columns after each call, without copying the growing
+base frame once per merge: every informative frame is aligned to the base dates on its own
+and all of them are appended in one concat.
+
+The alignment is the one ``merge_informative_pair`` uses: an informative candle is matched
+to the base candle dated ``informative date + informative timeframe - base timeframe`` (the
+last base candle it covers, i.e. the informative candle is used once it closed). With
+``ffill``, base candles without a match take the whole row of the last matched candle (the
+``merge_ordered`` forward fill: the base columns and NaNs inside informative rows are left
+alone), and the base candles before the first match take the last informative candle dated
+before it, when there is one.
+"""
+from typing import Iterable, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+OHLCV_COLUMNS = ['date', 'open', 'high', 'low', 'close', 'volume']
+
+_TIMEFRAME_MINUTES = {'m': 1, 'h': 60, 'd': 1440, 'w': 10080}
+
+
+class Informative(NamedTuple):
+    dataframe: DataFrame
+    timeframe: str
+    # Informative columns (without suffix) left out of the result
+    drop: Sequence[str] = ()
+    # Appended to the column names as ``_<suffix>``, the timeframe by default
+    suffix: Optional[str] = None
+
+
+def timeframe_to_minutes(timeframe: str) -> int:
+    try:
+        return int(timeframe[:-1]) * _TIMEFRAME_MINUTES[timeframe[-1]]
+    except (KeyError, ValueError):
+        raise ValueError(f"Unsupported timeframe {timeframe}") from None
+
+
+def align_informative(dates: pd.DatetimeIndex, informative: Informative, minutes: int,
+                      ffill: bool = True) -> DataFrame:
+    """
+    The columns of ``informative`` on the base candles ``dates``, unmatched rows forward filled
+    with ``ffill`` and NaN otherwise.
+    """
+    inf_minutes = timeframe_to_minutes(informative.timeframe)
+    if inf_minutes < minutes:
+        raise ValueError("Tried to merge a faster timeframe to a slower timeframe. "
+                         "This would create new rows, and can throw off your regular indicators.")
+    source = informative.dataframe
+    columns = [c for c in source.columns if c not in set(informative.drop)]
+    merge_dates = pd.DatetimeIndex(source['date']) + pd.Timedelta(minutes=inf_minutes - minutes)
+    # Exact date match like the left merge on ``date_merge``
+    rows = merge_dates.get_indexer(dates)
+    lead = None
+    if ffill:
+        rows, lead = _ffill_rows(rows, merge_dates)
+    source = source[columns].reset_index(drop=True)
+    block = source.reindex(rows).set_axis(pd.RangeIndex(len(rows)), axis=0)
+    if lead is not None:
+        # Filled after the join like freqtrade does, so the dtypes come out the same
+        first, row = lead
+        block.iloc[:first] = block.iloc[:first].fillna(source.iloc[row])
+    suffix = informative.suffix or informative.timeframe
+    block.columns = [f"{c}_{suffix}" for c in columns]
+    return block
+
+
+def _ffill_rows(rows: np.ndarray, merge_dates: pd.DatetimeIndex) -> Tuple[np.ndarray, Optional[Tuple[int, int]]]:
+    """
+    ``rows`` (-1 = no match) forward filled the way ``merge_informative_pair`` does it, and
+    (first matched candle, informative row) for the candles before the first match: the last
+    informative candle dated before that match, None when there is none.
+    """
+    matched = np.flatnonzero(rows >= 0)
+    if not len(matched):
+        return rows, None
+    last = np.maximum.accumulate(np.where(rows >= 0, np.arange(len(rows)), -1))
+    rows = np.where(last >= 0, rows[np.maximum(last, 0)], -1)
+    first = matched[0]
+    before = np.flatnonzero(merge_dates < merge_dates[rows[first]])
+    if first == 0 or not len(before):
+        return rows, None
+    return rows, (int(first), int(before[-1]))
+
+
+def merge_informatives(dataframe: DataFrame, informatives: Iterable[Informative], timeframe: str,
+                       ffill: bool = True) -> DataFrame:
+    """
+    ``dataframe`` with the columns of every informative frame appended, in order.
+
+    Like ``merge_informative_pair``, the result has a fresh RangeIndex and ``ffill`` only
+    fills the appended informative columns.
+    """
+    informatives = list(informatives)
+    if not informatives:
+        return dataframe
+    minutes = timeframe_to_minutes(timeframe)
+    dates = pd.DatetimeIndex(dataframe['date'])
+    index = pd.RangeIndex(len(dataframe))
+    blocks = [dataframe.set_axis(index, axis=0)]
+    for informative in informatives:
+        blocks.append(align_informative(dates, informative, minutes, ffill).set_axis(index, axis=0))
+    result = pd.concat(blocks, axis=1)
+    duplicated = result.columns[result.columns.duplicated()]
+    if len(duplicated):
+        raise ValueError(f"Informative columns already in the frame: {list(duplicated)}")
+    return result
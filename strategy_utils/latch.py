@@ -0,0 +1,52 @@
+"""
+Latch/reset signal state machine.
+
+A one-shot signal is armed, fires on the first trigger and stays latched (disarmed) until
+a reset candle arms it again, a reset on the same candle as a trigger wins:
+
+    armed[i] = reset[i] or (armed[i - 1] and not trigger[i - 1])
+    fired[i] = armed[i] and trigger[i]
+
+The NowoIchimoku strategies walked this candle by candle with scalar ``.loc``/``.at``
+accesses. ``latch_signal`` computes it as a segmented scan instead: the reset candles cut the
+frame into segments, and a candle is armed when no trigger came before it in its segment
+(counted with one cumulative sum), the segment before the first reset being armed only if
+the machine was armed when it started.
+"""
+from typing import Tuple
+
+import numpy as np
+from pandas import isna
+
+
+def latch_signal(trigger, reset, start: int = 0, armed: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (armed, fired) boolean arrays of the state machine run from row ``start`` on, ``armed``
+    being the state it starts in. Rows before ``start`` are left armed like ``armed`` and
+    never fire. NaN triggers and resets count as False.
+    """
+    trigger = as_flags(trigger)
+    reset = as_flags(reset)
+    n = len(trigger)
+    armed_out = np.full(n, bool(armed))
+    fired = np.zeros(n, dtype=bool)
+    start = max(int(start), 0)
+    if start >= n:
+        return armed_out, fired
+
+    trigger, reset = trigger[start:], reset[start:]
+    idx = np.arange(n - start)
+    # Triggers before each row, and the row each segment starts on
+    before = np.cumsum(trigger) - trigger
+    segment_start = np.maximum.accumulate(np.where(reset, idx, 0))
+    armed_out[start:] = (before == before[segment_start]) & (reset[segment_start] | bool(armed))
+    fired[start:] = armed_out[start:] & trigger
+    return armed_out, fired
+
+
+def as_flags(values) -> np.ndarray:
+    """Boolean array of ``values``, NaN being False."""
+    values = np.asarray(values)
+    if values.dtype.kind in 'fO':
+        values = np.where(isna(values), False, values)
+    return values.astype(bool)
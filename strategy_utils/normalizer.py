@@ -0,0 +1,148 @@
+"""
+Rolling min-max normalisation over several lookbacks (NormalizerStrategy's ``fischer_norm``).
+
+Every candle is scaled to ``(x - min) / (max - min)`` of the ``lookback + 1`` candles ending
+with it, 0 before the first full window and NaN when the window is flat. Instead of taking
+the min and max of a fresh slice per candle and lookback, the extremes come from monotonic
+deques: one compiled pass over the closes serves all lookbacks, and ``RollingNormalizer``
+appends a single candle in amortised constant time for live runs.
+
+The closes must not contain NaN.
+"""
+from collections import deque
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+from pandas import DataFrame
+
+from ._compat import jit
+from .tail import as_dates, frame_overlap
+
+FIBONACCI_LOOKBACKS = (13, 21, 34, 55, 89, 144, 233, 377, 610)
+
+
+@jit
+def _norm_kernel(x, lookbacks):
+    n = len(x)
+    k = len(lookbacks)
+    out = np.zeros((n, k))
+    # Deques of candle positions, values increasing (min) / decreasing (max) from head to tail
+    min_queue = np.zeros((k, n), dtype=np.int64)
+    max_queue = np.zeros((k, n), dtype=np.int64)
+    min_head = np.zeros(k, dtype=np.int64)
+    min_tail = np.zeros(k, dtype=np.int64)
+    max_head = np.zeros(k, dtype=np.int64)
+    max_tail = np.zeros(k, dtype=np.int64)
+    for i in range(n):
+        v = x[i]
+        for j in range(k):
+            lookback = lookbacks[j]
+            while min_tail[j] > min_head[j] and x[min_queue[j, min_tail[j] - 1]] >= v:
+                min_tail[j] -= 1
+            min_queue[j, min_tail[j]] = i
+            min_tail[j] += 1
+            while max_tail[j] > max_head[j] and x[max_queue[j, max_tail[j] - 1]] <= v:
+                max_tail[j] -= 1
+            max_queue[j, max_tail[j]] = i
+            max_tail[j] += 1
+            while min_queue[j, min_head[j]] < i - lookback:
+                min_head[j] += 1
+            while max_queue[j, max_head[j]] < i - lookback:
+                max_head[j] += 1
+            if i >= lookback:
+                lo = x[min_queue[j, min_head[j]]]
+                hi = x[max_queue[j, max_head[j]]]
+                out[i, j] = (v - lo) / (hi - lo) if hi != lo else np.nan
+    return out
+
+
+def minmax_norm(x, lookbacks: Sequence[int] = FIBONACCI_LOOKBACKS) -> np.ndarray:
+    """(candles, lookbacks) array of the normalised ``x``, one column per lookback."""
+    x = np.asarray(x, dtype=np.float64)
+    return np.asarray(_norm_kernel(x, np.asarray(lookbacks, dtype=np.int64))).reshape(len(x), len(lookbacks))
+
+
+class RollingNormalizer:
+    """Streaming ``minmax_norm``: ``append`` one close, get its row."""
+
+    def __init__(self, lookbacks: Sequence[int] = FIBONACCI_LOOKBACKS):
+        self.lookbacks = tuple(int(lb) for lb in lookbacks)
+        self.count = 0
+        self._min = [deque() for _ in self.lookbacks]
+        self._max = [deque() for _ in self.lookbacks]
+
+    def append(self, value: float) -> np.ndarray:
+        i = self.count
+        self.count += 1
+        row = np.zeros(len(self.lookbacks))
+        for j, lookback in enumerate(self.lookbacks):
+            lows, highs = self._min[j], self._max[j]
+            while lows and lows[-1][1] >= value:
+                lows.pop()
+            lows.append((i, value))
+            while highs and highs[-1][1] <= value:
+                highs.pop()
+            highs.append((i, value))
+            while lows[0][0] < i - lookback:
+                lows.popleft()
+            while highs[0][0] < i - lookback:
+                highs.popleft()
+            if i >= lookback:
+                lo, hi = lows[0][1], highs[0][1]
+                row[j] = (value - lo) / (hi - lo) if hi != lo else np.nan
+        return row
+
+    def extend(self, values) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        rows = np.zeros((len(values), len(self.lookbacks)))
+        for i, value in enumerate(values):
+            rows[i] = self.append(value)
+        return rows
+
+
+class MinmaxNormTracker:
+    """
+    Per-pair ``minmax_norm`` for live/dry runs.
+
+    Rows of candles seen before are reused and only the new candles are appended to the
+    pair's ``RollingNormalizer``. A frame that does not continue the stored history is
+    computed from scratch.
+
+    Rows less than a lookback into the frame keep the values of the history seen so far
+    instead of the 0 a recompute of the window gives them.
+    """
+
+    def __init__(self, lookbacks: Sequence[int] = FIBONACCI_LOOKBACKS):
+        self.lookbacks = tuple(int(lb) for lb in lookbacks)
+        self._pairs: Dict[str, dict] = {}
+
+    def reset(self, pair: Optional[str] = None) -> None:
+        if pair is None:
+            self._pairs.clear()
+        else:
+            self._pairs.pop(pair, None)
+
+    def update(self, pair: str, dataframe: DataFrame) -> np.ndarray:
+        dates = as_dates(dataframe['date'])
+        close = dataframe['close'].to_numpy(dtype=np.float64)
+        cached = self._pairs.get(pair)
+        overlap = frame_overlap(cached['dates'] if cached else None, dates)
+        if overlap is None:
+            norm = minmax_norm(close, self.lookbacks)
+            normalizer = self._warm(close)
+        else:
+            first, known = overlap
+            normalizer = cached['normalizer']
+            norm = np.concatenate((cached['norm'][first:], normalizer.extend(close[known:])))
+
+        self._pairs[pair] = {'dates': dates, 'norm': norm, 'normalizer': normalizer}
+        return norm
+
+    def _warm(self, close: np.ndarray) -> RollingNormalizer:
+        # The deques only depend on the last ``max(lookbacks) + 1`` closes, their rows count
+        # from the start of the frame so the warm-up of each lookback is kept
+        normalizer = RollingNormalizer(self.lookbacks)
+        keep = min(len(close), max(self.lookbacks, default=0) + 1)
+        normalizer.count = len(close) - keep
+        normalizer.extend(close[len(close) - keep:])
+        return normalizer
@@ -0,0 +1,65 @@
+"""
+Thread-pool pair analysis.
+
+freqtrade analyses the whitelisted pairs one after the other. Strategies whose indicators
+are thread-safe (no shared state, see ``recurrences``) can compute them for every pair at
+once from ``bot_loop_start``: ``PairPool.precompute`` runs ``compute`` for every pair's
+candles in a thread pool and ``populate_indicators`` then picks up its pair's result with
+``PairPool.get``. The compiled kernels release the GIL, so the threads run in parallel.
+
+A result is only handed out for the candles it was computed from, anything else is computed
+in the calling thread like without the pool.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from pandas import DataFrame
+
+from .indicator_store import frame_fingerprint
+
+
+class PairPool:
+    """Results of ``compute(dataframe)`` by pair, computed for many pairs at once."""
+
+    def __init__(self):
+        self._results: Dict[str, Tuple[Hashable, object]] = {}
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def precompute(self, frames: Mapping[str, DataFrame], compute: Callable[[DataFrame], object],
+                   workers: Optional[int] = None) -> int:
+        """
+        ``compute`` every frame of ``frames`` (pair -> candles) not computed yet, spread over
+        ``workers`` threads (None lets ThreadPoolExecutor pick). Returns the number of pairs
+        computed.
+        """
+        todo = {}
+        for pair, dataframe in frames.items():
+            if dataframe is None or dataframe.empty:
+                continue
+            stamp = frame_fingerprint(dataframe)
+            cached = self._results.get(pair)
+            if cached is None or cached[0] != stamp:
+                todo[pair] = (stamp, dataframe)
+        if not todo:
+            return 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(compute, [dataframe for _, dataframe in todo.values()])
+            for (pair, (stamp, _)), result in zip(todo.items(), results):
+                self._results[pair] = (stamp, result)
+        return len(todo)
+
+    def get(self, pair: str, dataframe: DataFrame, compute: Callable[[DataFrame], object]):
+        """The result for the candles of ``dataframe``, computed now if the pool has none."""
+        stamp = frame_fingerprint(dataframe)
+        cached = self._results.get(pair)
+        if cached is None or cached[0] != stamp:
+            cached = self._results[pair] = (stamp, compute(dataframe))
+        return cached[1]
+
+    def reset(self, pair: Optional[str] = None) -> None:
+        if pair is None:
+            self._results.clear()
+        else:
+            self._results.pop(pair, None)
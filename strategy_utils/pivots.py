@@ -0,0 +1,71 @@
+"""
+Fractal support / resistance pivots.
+
+A resistance pivot at candle ``p`` rises strictly for ``left`` steps into ``p`` and falls
+strictly for ``right`` steps after it; a support pivot is the mirror image. The pivot is only
+known ``right`` candles later, so results are placed on the confirmation candle ``p + right``
+by default (no lookahead), ``shift`` moves them further.
+
+Results are float arrays with 1.0 / 0.0 and NaN where the window is incomplete or contains
+NaN, the same as ``rolling(...).apply(...)``. The NFI ``is_resistance`` / ``is_support``
+callbacks on ``rolling(window=5, center=True)`` followed by ``shift(2)`` came in two
+variants: the symmetric 5-candle fractal of NostalgiaForInfinityNextGen is exactly
+``left=2, right=2``, the half-length loop of NostalgiaForInfinityX (more steps into the
+pivot than out of it) is exactly ``left=3, right=1``.
+"""
+from typing import Optional
+
+import numpy as np
+
+
+def _steps_run(steps: np.ndarray, width: int) -> np.ndarray:
+    """``out[i]`` is True when ``steps[i - width:i]`` are all True (False for i < width)."""
+    out = np.zeros(len(steps) + 1, dtype=bool)
+    if width == 0:
+        out[:] = True
+        return out
+    count = np.concatenate(([0], np.cumsum(steps)))
+    out[width:] = (count[width:] - count[:-width]) == width
+    return out
+
+
+def _fractal(values, left: int, right: int, shift: Optional[int], rising_left: bool) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if shift is None:
+        shift = right
+    out = np.full(n, np.nan)
+    span = left + right + 1
+    if n < span:
+        return out
+
+    with np.errstate(invalid='ignore'):
+        rising = values[1:] > values[:-1]
+        falling = values[1:] < values[:-1]
+    into, out_of = (rising, falling) if rising_left else (falling, rising)
+
+    # Pivot p needs steps p-left .. p-1 into it and p .. p+right-1 out of it
+    before = _steps_run(into, left)[:n]
+    after = _steps_run(out_of, right)
+    pivots = np.arange(left, n - right)
+    signal = before[pivots] & after[pivots + right]
+
+    # Any NaN inside the window makes the whole window NaN
+    nan_count = np.concatenate(([0], np.cumsum(np.isnan(values))))
+    clean = (nan_count[pivots + right + 1] - nan_count[pivots - left]) == 0
+    result = np.where(clean, signal.astype(np.float64), np.nan)
+
+    target = pivots + shift
+    keep = (target >= 0) & (target < n)
+    out[target[keep]] = result[keep]
+    return out
+
+
+def fractal_highs(values, left: int = 2, right: int = 2, shift: Optional[int] = None) -> np.ndarray:
+    """Resistance pivots of ``values`` (usually highs)."""
+    return _fractal(values, left, right, shift, rising_left=True)
+
+
+def fractal_lows(values, left: int = 2, right: int = 2, shift: Optional[int] = None) -> np.ndarray:
+    """Support pivots of ``values`` (usually lows)."""
+    return _fractal(values, left, right, shift, rising_left=False)
@@ -0,0 +1,175 @@
+"""
+Profit Maximizer (PMAX) by KivancOzbilgic
+https://www.tradingview.com/script/sU9molfV/
+
+Single implementation of the ``pmax()`` helper that used to be copied into the NFI,
+BB_RPB_TSL and MultiMA families. The band recurrence runs in a compiled kernel (numba when
+available), the trend is returned as int8 (1 = up, -1 = down, 0 = not yet defined) instead
+of an object array of strings, and ``PmaxTracker`` keeps the recurrence state per pair so a
+live bot only walks the candles it has not seen yet.
+"""
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import talib.abstract as ta
+from pandas import DataFrame, Series
+
+from .bands import band_recurrence, band_trend
+from .tail import as_dates, frame_overlap
+
+@dataclass
+class PmaxState:
+    """Recurrence state after the last processed candle."""
+    final_ub: float = 0.0
+    final_lb: float = 0.0
+    pm: float = 0.0
+    mavalue: float = np.nan
+    # Number of candles consumed so far, used to honour the warm-up of ``period`` candles
+    count: int = 0
+
+
+def pmax_source(df: DataFrame, src: int) -> Series:
+    if src == 1:
+        return df['close']
+    elif src == 2:
+        return (df['high'] + df['low']) / 2
+    elif src == 3:
+        return (df['high'] + df['low'] + df['close'] + df['open']) / 4
+    raise ValueError(f"Unknown PMAX source {src}")
+
+
+def pmax_ma(df: DataFrame, length: int, MAtype: int, src: int) -> np.ndarray:
+    # MAtype==1 --> EMA
+    # MAtype==2 --> DEMA
+    # MAtype==3 --> T3
+    # MAtype==4 --> SMA
+    # MAtype==5 --> VIDYA
+    # MAtype==6 --> TEMA
+    # MAtype==7 --> WMA
+    # MAtype==8 --> VWMA
+    # MAtype==9 --> zema
+    masrc = pmax_source(df, src)
+    if MAtype == 1:
+        mavalue = ta.EMA(masrc, timeperiod=length)
+    elif MAtype == 2:
+        mavalue = ta.DEMA(masrc, timeperiod=length)
+    elif MAtype == 3:
+        mavalue = ta.T3(masrc, timeperiod=length)
+    elif MAtype == 4:
+        mavalue = ta.SMA(masrc, timeperiod=length)
+    elif MAtype == 5:
+        from technical.indicators import VIDYA
+        mavalue = VIDYA(df, length=length)
+    elif MAtype == 6:
+        mavalue = ta.TEMA(masrc, timeperiod=length)
+    elif MAtype == 7:
+        mavalue = ta.WMA(df, timeperiod=length)
+    elif MAtype == 8:
+        pv = df['close'] * df['volume']
+        mavalue = Series(ta.SMA(pv, timeperiod=length) / ta.SMA(df['volume'], timeperiod=length)).fillna(0)
+    elif MAtype == 9:
+        from technical.indicators import zema
+        mavalue = zema(df, period=length)
+    else:
+        raise ValueError(f"Unknown PMAX MAtype {MAtype}")
+    return np.asarray(mavalue, dtype=np.float64)
+
+
+def pmax_bands(df: DataFrame, period: int, multiplier: int, mavalue: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    atr = np.asarray(ta.ATR(df, timeperiod=period), dtype=np.float64)
+    offset = (multiplier / 10) * atr
+    return mavalue + offset, mavalue - offset
+
+
+def pmax_kernel(basic_ub: np.ndarray, basic_lb: np.ndarray, mavalue: np.ndarray, period: int,
+                state: Optional[PmaxState] = None) -> Tuple[np.ndarray, np.ndarray, PmaxState]:
+    """
+    Run the PMAX recurrence over precomputed bands.
+
+    Without ``state`` the arrays are treated as the full history (identical to the legacy
+    helper). With ``state`` they are the candles following the ones ``state`` was built from.
+    Returns the PMAX line, the int8 trend and the state after the last candle.
+    """
+    if state is None:
+        state = PmaxState()
+    n = len(mavalue)
+    # Legacy behaviour: the first ``period`` candles stay at 0 and the first step reads the
+    # moving average of candle ``period - 1``
+    start = min(max(period - state.count, 0), n)
+    ma_prev = state.mavalue if start == 0 else mavalue[start - 1]
+    final_ub, final_lb, pm = band_recurrence(
+        basic_ub, basic_lb, mavalue, start,
+        float(state.final_ub), float(state.final_lb), float(state.pm), float(ma_prev)
+    )
+    if start >= n:
+        new_state = PmaxState(state.final_ub, state.final_lb, state.pm,
+                              mavalue[-1] if n else state.mavalue, state.count + n)
+    else:
+        new_state = PmaxState(final_ub[-1], final_lb[-1], pm[-1], mavalue[-1], state.count + n)
+    return pm, band_trend(pm, mavalue), new_state
+
+
+def pmax(df: DataFrame, period, multiplier, length, MAtype, src) -> Tuple[Series, np.ndarray]:
+    """
+    Drop-in replacement for the per-strategy ``pmax()`` helpers.
+
+    Returns the PMAX line and the int8 trend (1 up, -1 down, 0 where PMAX is not defined).
+    Unlike the old helpers ``df`` is not modified.
+    """
+    period = int(period)
+    multiplier = int(multiplier)
+    length = int(length)
+    MAtype = int(MAtype)
+    src = int(src)
+
+    mavalue = pmax_ma(df, length, MAtype, src)
+    basic_ub, basic_lb = pmax_bands(df, period, multiplier, mavalue)
+    pm, trend, _ = pmax_kernel(basic_ub, basic_lb, mavalue, period)
+    return Series(pm, index=df.index), trend
+
+
+class PmaxTracker:
+    """
+    Per-pair PMAX with persistent recurrence state for live/dry runs.
+
+    ``update`` recomputes the moving average and ATR (cheap talib calls) but only walks the
+    band recurrence for candles newer than the last call. Whenever the new frame does not
+    continue the stored history (gap, reload, first call) it falls back to a full run.
+    """
+
+    def __init__(self, period, multiplier, length, MAtype, src):
+        self.period = int(period)
+        self.multiplier = int(multiplier)
+        self.length = int(length)
+        self.MAtype = int(MAtype)
+        self.src = int(src)
+        self._pairs: Dict[str, dict] = {}
+
+    def reset(self, pair: Optional[str] = None) -> None:
+        if pair is None:
+            self._pairs.clear()
+        else:
+            self._pairs.pop(pair, None)
+
+    def update(self, pair: str, df: DataFrame, dates) -> Tuple[Series, np.ndarray]:
+        dates = as_dates(dates)
+        mavalue = pmax_ma(df, self.length, self.MAtype, self.src)
+        basic_ub, basic_lb = pmax_bands(df, self.period, self.multiplier, mavalue)
+
+        cached = self._pairs.get(pair)
+        overlap = frame_overlap(cached['dates'] if cached else None, dates)
+        if overlap is None:
+            pm, trend, state = pmax_kernel(basic_ub, basic_lb, mavalue, self.period)
+        else:
+            first, known = overlap
+            pm_new, trend_new, state = pmax_kernel(basic_ub[known:], basic_lb[known:], mavalue[known:],
+                                                   self.period, cached['state'])
+            # The known rows keep their trend: the moving average of the new frame is still
+            # warming up on its first candles
+            pm = np.concatenate((cached['pm'][first:], pm_new))
+            trend = np.concatenate((cached['trend'][first:], trend_new))
+
+        self._pairs[pair] = {'dates': dates, 'pm': pm, 'trend': trend, 'state': state}
+        return Series(pm, index=df.index), trend
+
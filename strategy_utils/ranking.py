@@ -0,0 +1,212 @@
+"""
+Cross-sectional coin ranking (top traded / top grossing lists).
+
+Every pair's daily metric is stacked into one date x pair matrix and ranked per date with
+``argpartition``. Membership is kept as a boolean matrix next to dict lookups of the date and
+pair positions, so "is pair P in the top N on date D" is O(1). New daily candles append rows
+and whitelist changes add or drop columns instead of rebuilding everything.
+
+Ties are broken like ``Series.nlargest(keep='first')`` over the whitelist order, which keeps
+the results identical to the old merge/apply implementation.
+"""
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from pandas import DataFrame, Series
+
+import freqtrade.vendor.qtpylib.indicators as qtpylib
+
+
+def traded_volume(dataframe: DataFrame) -> Series:
+    return dataframe['volume'] * qtpylib.typical_price(dataframe)
+
+
+def grossing_rate(dataframe: DataFrame) -> Series:
+    return dataframe['close'].pct_change() * 100
+
+
+def top_n_mask(values: np.ndarray, top_n: int) -> np.ndarray:
+    """
+    Boolean mask of the ``top_n`` largest entries of every row.
+
+    ``argpartition`` finds the n-th largest value per row in O(pairs). Entries strictly above
+    it are in; entries equal to it fill the remaining slots in column order.
+    """
+    rows, cols = values.shape
+    if cols <= top_n:
+        return np.ones((rows, cols), dtype=bool)
+    if top_n <= 0 or rows == 0:
+        return np.zeros((rows, cols), dtype=bool)
+    kth = cols - top_n
+    threshold = np.take_along_axis(values, np.argpartition(values, kth, axis=1)[:, kth:kth + 1], axis=1)
+    above = values > threshold
+    ties = values == threshold
+    free = top_n - above.sum(axis=1, keepdims=True)
+    return above | (ties & (np.cumsum(ties, axis=1) <= free))
+
+
+class CoinRanking:
+    """
+    Date x pair matrix of one daily metric with its per-date top N membership.
+
+    The date axis follows the first pair of the whitelist (the strategies move BTC there for
+    the largest data footprint); missing values count as 0.
+    """
+
+    def __init__(self, metric: Callable[[DataFrame], Series], top_n: int, window: Optional[int] = None):
+        self.metric = metric
+        self.top_n = top_n
+        # Keep only the last ``window`` daily candles (live), None keeps everything (backtest)
+        self.window = window
+        self.pairs: List[str] = []
+        self.dates = np.empty(0, dtype='datetime64[ns]')
+        self.values = np.zeros((0, 0))
+        self.top = np.zeros((0, 0), dtype=bool)
+        self._pair_pos: Dict[str, int] = {}
+        self._date_pos: Dict[np.datetime64, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def _column(self, dataframe: DataFrame, dates: np.ndarray) -> np.ndarray:
+        """Metric of one pair aligned on ``dates`` (0 where the pair has no candle)."""
+        column = np.zeros(len(dates))
+        if dataframe is None or len(dataframe) == 0 or len(dates) == 0:
+            return column
+        pair_dates = _as_datetime64(dataframe['date'])
+        metric = np.nan_to_num(np.asarray(self.metric(dataframe), dtype=np.float64), nan=0.0)
+        pos = np.searchsorted(pair_dates, dates)
+        pos_clipped = np.minimum(pos, len(pair_dates) - 1)
+        found = pair_dates[pos_clipped] == dates
+        column[found] = metric[pos_clipped[found]]
+        return column
+
+    def _reindex(self) -> None:
+        self._pair_pos = {pair: i for i, pair in enumerate(self.pairs)}
+        self._date_pos = {d: i for i, d in enumerate(self.dates)}
+
+    def _trim(self) -> None:
+        if self.window is not None and len(self.dates) > self.window:
+            self.dates = self.dates[-self.window:]
+            self.values = self.values[-self.window:]
+            self.top = self.top[-self.window:]
+
+    def rebuild(self, pairs: List[str], get_frame: Callable[[str], DataFrame]) -> None:
+        """Full build for ``pairs`` (whitelist order), ``get_frame`` returns a pair's daily candles."""
+        self.pairs = list(pairs)
+        if not self.pairs:
+            self.dates = np.empty(0, dtype='datetime64[ns]')
+            self.values = np.zeros((0, 0))
+        else:
+            frames = [get_frame(p) for p in self.pairs]
+            if self.window is not None:
+                frames = [df.iloc[-self.window:] for df in frames]
+            self.dates = _as_datetime64(frames[0]['date'])
+            self.values = np.column_stack([self._column(df, self.dates) for df in frames]) \
+                if len(self.dates) else np.zeros((0, len(self.pairs)))
+        self.top = top_n_mask(self.values, self.top_n)
+        self._reindex()
+
+    def set_pairs(self, pairs: List[str], get_frame: Callable[[str], DataFrame]) -> None:
+        """Follow a whitelist change: keep known columns, fetch and compute only the new pairs."""
+        pairs = list(pairs)
+        if not self.pairs or not pairs or pairs[0] != self.pairs[0]:
+            # The date axis comes from the first pair, start over if it changed
+            self.rebuild(pairs, get_frame)
+            return
+        columns = [self.values[:, self._pair_pos[p]] if p in self._pair_pos
+                   else self._column(get_frame(p), self.dates) for p in pairs]
+        self.pairs = pairs
+        self.values = np.column_stack(columns) if columns else np.zeros((len(self.dates), 0))
+        self.top = top_n_mask(self.values, self.top_n)
+        self._reindex()
+
+    def update(self, get_frame: Callable[[str], DataFrame]) -> bool:
+        """
+        Append the daily candles the first pair gained since the last call. Only the first
+        pair is fetched when there is nothing new. Returns True when rows were added.
+        """
+        if not self.pairs:
+            return False
+        first = get_frame(self.pairs[0])
+        if first is None or len(first) == 0:
+            return False
+        first_dates = _as_datetime64(first['date'])
+        if len(self.dates):
+            new_dates = first_dates[first_dates > self.dates[-1]]
+        else:
+            new_dates = first_dates
+        if len(new_dates) == 0:
+            return False
+
+        rows = np.column_stack([self._column(_since(first if i == 0 else get_frame(p), new_dates[0]), new_dates)
+                                for i, p in enumerate(self.pairs)])
+        self.dates = np.concatenate((self.dates, new_dates))
+        self.values = np.vstack((self.values, rows))
+        self.top = np.vstack((self.top, top_n_mask(rows, self.top_n)))
+        self._trim()
+        self._reindex()
+        return True
+
+    def is_top(self, pair: str, date) -> bool:
+        row = self._date_pos.get(np.datetime64(_as_naive(date), 'ns'))
+        col = self._pair_pos.get(pair)
+        if row is None or col is None:
+            return False
+        return bool(self.top[row, col])
+
+    def top_mask(self, pair: str, dates) -> np.ndarray:
+        """Vectorised ``is_top`` for a whole date column (False for unknown dates)."""
+        dates = _as_datetime64(dates)
+        mask = np.zeros(len(dates), dtype=bool)
+        col = self._pair_pos.get(pair)
+        if col is None or len(self.dates) == 0:
+            return mask
+        pos = np.minimum(np.searchsorted(self.dates, dates), len(self.dates) - 1)
+        found = self.dates[pos] == dates
+        mask[found] = self.top[pos[found], col]
+        return mask
+
+    def top_pairs(self, date=None) -> List[str]:
+        """Pairs in the top N on ``date`` (default: latest), best first."""
+        if len(self.dates) == 0:
+            return []
+        row = -1 if date is None else self._date_pos.get(np.datetime64(_as_naive(date), 'ns'))
+        if row is None:
+            return []
+        cols = np.flatnonzero(self.top[row])
+        cols = cols[np.argsort(-self.values[row, cols], kind='stable')]
+        return [self.pairs[c] for c in cols]
+
+    def to_frame(self, tail: Optional[int] = None) -> DataFrame:
+        """Legacy-style ``date, Coin #1 .. Coin #N`` view of the last ``tail`` dates, for logging."""
+        columns = [f"Coin #{i}" for i in range(1, self.top_n + 1)]
+        first = 0 if tail is None else max(len(self.dates) - tail, 0)
+        rows = []
+        for row in range(first, len(self.dates)):
+            coins = [p.split('/')[0] for p in self.top_pairs(self.dates[row])]
+            rows.append(coins + [None] * (self.top_n - len(coins)))
+        frame = DataFrame(rows, columns=columns)
+        frame.insert(loc=0, column='date', value=self.dates[first:])
+        return frame
+
+
+def _since(dataframe: Optional[DataFrame], date) -> Optional[DataFrame]:
+    """Rows from ``date`` on, plus one earlier candle so one-row lookbacks (pct_change) stay correct."""
+    if dataframe is None:
+        return None
+    start = int(np.searchsorted(_as_datetime64(dataframe['date']), date)) - 1
+    return dataframe.iloc[max(start, 0):]
+
+
+def _as_naive(date):
+    """Timestamps are compared as UTC datetime64, drop the timezone if there is one."""
+    tz = getattr(date, 'tzinfo', None)
+    if tz is not None:
+        return date.tz_convert(None) if hasattr(date, 'tz_convert') else date.replace(tzinfo=None)
+    return date
+
+
+def _as_datetime64(dates) -> np.ndarray:
+    # ``Series.values`` turns tz-aware dates into UTC datetime64 without going through objects
+    return np.asarray(getattr(dates, 'values', dates)).astype('datetime64[ns]')
@@ -0,0 +1,117 @@
+"""
+Recurrences of the LUX SuperTrend Oscillator (LuxOSC) and of the KDJ ``xsa`` average
+(PumpDetector).
+
+Both used to run as ``DataFrame.apply(fn, axis=1)`` with their state in module-level
+``global`` variables, so two pairs analysed at the same time overwrote each other's state.
+Here every recurrence is a compiled loop over arrays that takes its state as arguments and
+hands the state after the last candle back in a state object: kernels share nothing, pairs
+can be analysed in parallel threads and a computation can be resumed where it stopped.
+
+The comparisons keep the semantics of the ``min``/``max`` builtins the original code used,
+so NaN bands (the ATR warm-up) propagate exactly like before.
+"""
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from ._compat import jit
+
+
+@dataclass
+class SuperTrendOscState:
+    """State after the last processed candle, the values of the original ``init``."""
+    upper: float = 0.0
+    lower: float = 0.0
+    src: float = 0.0
+    trend: float = 0.0
+    ama: float = 0.0
+
+
+@jit
+def _supertrend_band_kernel(src, up, dn, upper, lower, prev_src, trend):
+    n = len(src)
+    upper_out = np.zeros(n)
+    lower_out = np.zeros(n)
+    trend_out = np.zeros(n)
+    for i in range(n):
+        x = src[i]
+        # Trend compares with the bands of the previous candle
+        if x > upper:
+            trend = 1.0
+        elif x < lower:
+            trend = 0.0
+        # min(up, upper) / max(dn, lower) of the builtins: the first argument unless the
+        # second one compares smaller / greater
+        if prev_src < upper:
+            upper = upper if upper < up[i] else up[i]
+        else:
+            upper = up[i]
+        if prev_src > lower:
+            lower = lower if lower > dn[i] else dn[i]
+        else:
+            lower = dn[i]
+        prev_src = x
+        upper_out[i] = upper
+        lower_out[i] = lower
+        trend_out[i] = trend
+    return upper_out, lower_out, trend_out, upper, lower, prev_src, trend
+
+
+@jit
+def _adaptive_average_kernel(values, alpha, ama):
+    n = len(values)
+    out = np.zeros(n)
+    for i in range(n):
+        ama = ama + alpha[i] * (values[i] - ama)
+        out[i] = ama
+    return out, ama
+
+
+def supertrend_bands(src, up, dn, state: SuperTrendOscState = None
+                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, SuperTrendOscState]:
+    """
+    Upper band, lower band and trend (1 up, 0 down) of the LUX SuperTrend Oscillator. The trend
+    is int64 like the 1/0 the ``apply`` used to return.
+    """
+    state = state or SuperTrendOscState()
+    upper, lower, trend, *last = _supertrend_band_kernel(
+        np.asarray(src, dtype=np.float64), np.asarray(up, dtype=np.float64), np.asarray(dn, dtype=np.float64),
+        state.upper, state.lower, state.src, state.trend)
+    return (np.asarray(upper), np.asarray(lower), np.asarray(trend).astype(np.int64),
+            SuperTrendOscState(*last, ama=state.ama))
+
+
+def adaptive_average(values, alpha, state: SuperTrendOscState = None) -> Tuple[np.ndarray, SuperTrendOscState]:
+    """``ama += alpha * (value - ama)`` over ``values``, the oscillator's signal line."""
+    state = state or SuperTrendOscState()
+    out, ama = _adaptive_average_kernel(np.asarray(values, dtype=np.float64), np.asarray(alpha, dtype=np.float64),
+                                        state.ama)
+    return np.asarray(out), SuperTrendOscState(state.upper, state.lower, state.src, state.trend, ama)
+
+
+@dataclass
+class XsaState:
+    """Last ``xsa`` value, 0 before the first candle."""
+    out: float = 0.0
+
+
+@jit
+def _xsa_kernel(src, length, weight, out):
+    n = len(src)
+    values = np.zeros(n)
+    for i in range(n):
+        out = (src[i] * weight + out * (length - weight)) / length
+        values[i] = out
+    return values, out
+
+
+def xsa_average(src, length: int, weight: int, state: XsaState = None) -> Tuple[np.ndarray, XsaState]:
+    """
+    ``(src * weight + previous * (length - weight)) / length``, the SMA(X, N, M) of the KDJ
+    formula. NaN inputs must be filled beforehand (the strategies use 0).
+    """
+    state = state or XsaState()
+    values, out = _xsa_kernel(np.asarray(src, dtype=np.float64), int(length), int(weight), state.out)
+    return np.asarray(values), XsaState(out)
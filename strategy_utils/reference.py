@@ -0,0 +1,42 @@
+"""
+Indicators of a market reference pair (BTC/stake) shared by every traded pair.
+
+Strategies that merge BTC indicators into each pair's frame used to recompute them inside
+every pair's ``populate_indicators``, once per pair and candle for identical input.
+``ReferenceIndicators`` computes them once per reference frame and candle and hands every
+pair its own copy of the result, so the shared frame stays untouched (``merge_informative_pair``
+adds and renames columns of the frame it is given).
+"""
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from pandas import DataFrame
+
+from .indicator_store import frame_fingerprint
+
+
+class ReferenceIndicators:
+    """Computed reference frames by caller key, recomputed only when the candles change."""
+
+    def __init__(self):
+        self._frames: Dict[Hashable, Tuple[Hashable, DataFrame]] = {}
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def get(self, key: Hashable, dataframe: DataFrame, compute: Callable[[DataFrame], DataFrame]) -> DataFrame:
+        """
+        ``compute(dataframe)`` for the candles of ``dataframe``, computed the first time these
+        candles are seen under ``key``. ``key`` names the pair, timeframe and anything else
+        the result depends on, e.g. ``("BTC/USDT", "1h")``.
+        """
+        stamp = frame_fingerprint(dataframe)
+        cached = self._frames.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = self._frames[key] = (stamp, compute(dataframe))
+        return cached[1].copy()
+
+    def reset(self, key: Optional[Hashable] = None) -> None:
+        if key is None:
+            self._frames.clear()
+        else:
+            self._frames.pop(key, None)
@@ -0,0 +1,174 @@
+"""
+ATR Renko bricks.
+
+Each candle closes as many bricks as its close moved away from the last brick, in whole brick
+sizes (the latest ATR). Continuing the trend needs one brick, reversing it needs two and the
+first reversal brick starts one brick away from the last close. The walk over the candles
+only stores a brick count per candle, the bricks themselves are then written into arrays
+allocated once for the exact total, and ``RenkoState`` lets a live bot carry on from the last
+brick instead of starting over.
+"""
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from ._compat import jit
+
+BRICK_COLUMNS = ['date', 'open', 'high', 'low', 'close', 'volume', 'ATR', 'trend']
+
+
+@dataclass
+class RenkoState:
+    """The last brick and the brick size in use after the last processed candle."""
+    close: float
+    trend: bool = True
+    brick_size: float = np.nan
+
+
+@jit
+def _renko_counts(close, atr, last_close, trend, brick_size):
+    """Bricks per candle, the price the first of them opens at and the trend after the candle."""
+    n = len(close)
+    count = np.zeros(n, dtype=np.int64)
+    start = np.zeros(n)
+    size = np.zeros(n)
+    up = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        if atr[i] == atr[i]:
+            brick_size = atr[i]
+        ratio = (close[i] - last_close) / brick_size
+        bricks = int(ratio) if np.isfinite(ratio) else 0
+        if trend and bricks <= -2:
+            trend = False
+            bricks += 1
+            last_close -= brick_size
+        elif not trend and bricks >= 2:
+            trend = True
+            bricks -= 1
+            last_close += brick_size
+        elif (trend and bricks < 1) or (not trend and bricks > -1):
+            bricks = 0
+        start[i] = last_close
+        size[i] = brick_size
+        up[i] = trend
+        count[i] = abs(bricks)
+        # Same repeated addition as when the bricks are written out
+        for _ in range(abs(bricks)):
+            last_close = last_close + brick_size if trend else last_close - brick_size
+    return count, start, size, up, last_close, trend, brick_size
+
+
+@jit
+def _renko_fill(count, start, size, up, total):
+    candle = np.zeros(total, dtype=np.int64)
+    opens = np.zeros(total)
+    closes = np.zeros(total)
+    j = 0
+    for i in range(len(count)):
+        price = start[i]
+        for _ in range(count[i]):
+            candle[j] = i
+            opens[j] = price
+            price = price + size[i] if up[i] else price - size[i]
+            closes[j] = price
+            j += 1
+    return candle, opens, closes
+
+
+def renko_bricks(close: np.ndarray, atr: np.ndarray, state: RenkoState) -> Tuple[DataFrame, RenkoState]:
+    """
+    Bricks closed by the candles ``close`` / ``atr`` following ``state``.
+
+    Returns the bricks (``candle`` = position of the candle that closed them, ``open``,
+    ``high``, ``low``, ``close``, ``ATR`` = brick size, ``trend`` = True for up bricks) and
+    the state after the last candle.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    atr = np.asarray(atr, dtype=np.float64)
+    count, start, size, up, last_close, trend, brick_size = _renko_counts(
+        close, atr, float(state.close), bool(state.trend), float(state.brick_size))
+    count = np.asarray(count, dtype=np.int64)
+    candle, opens, closes = _renko_fill(count, start, size, up, int(count.sum()))
+    candle = np.asarray(candle, dtype=np.int64)
+    opens = np.asarray(opens)
+    closes = np.asarray(closes)
+    bricks = DataFrame({
+        'candle': candle,
+        'open': opens,
+        'high': np.maximum(opens, closes),
+        'low': np.minimum(opens, closes),
+        'close': closes,
+        'ATR': np.asarray(size)[candle],
+        'trend': np.asarray(up, dtype=bool)[candle],
+    })
+    return bricks, RenkoState(float(last_close), bool(trend), float(brick_size))
+
+
+def last_brick(brick_dates, candle_dates) -> np.ndarray:
+    """Index of the last brick closed at or before every candle (-1 before the first brick)."""
+    brick_dates = np.asarray(getattr(brick_dates, 'values', brick_dates))
+    candle_dates = np.asarray(getattr(candle_dates, 'values', candle_dates))
+    return np.searchsorted(brick_dates, candle_dates, side='right') - 1
+
+
+class RenkoBuilder:
+    """
+    Per-pair Renko bricks for live/dry runs.
+
+    The first call seeds a brick ending at the first close with the mean ATR of the frame
+    as its size, later calls only walk the candles newer than the last one seen. Bricks older
+    than the current frame are dropped.
+    """
+
+    def __init__(self):
+        self._pairs: Dict[str, dict] = {}
+
+    def reset(self, pair: Optional[str] = None) -> None:
+        if pair is None:
+            self._pairs.clear()
+        else:
+            self._pairs.pop(pair, None)
+
+    def update(self, pair: str, dataframe: DataFrame, atr) -> DataFrame:
+        """Bricks (``BRICK_COLUMNS``) of every candle of ``dataframe``, oldest first."""
+        dates = np.asarray(getattr(dataframe['date'], 'values', dataframe['date']))
+        close = dataframe['close'].to_numpy(dtype=np.float64)
+        volume = dataframe['volume'].to_numpy(dtype=np.float64)
+        atr = np.asarray(atr, dtype=np.float64)
+
+        if len(dates) == 0:
+            return DataFrame(columns=BRICK_COLUMNS)
+        cached = self._pairs.get(pair)
+        first = 0
+        if cached is not None:
+            pos = int(np.searchsorted(dates, cached['last_date']))
+            if pos < len(dates) and dates[pos] == cached['last_date']:
+                first = pos + 1
+            else:
+                cached = None
+
+        if cached is None:
+            brick_size = float(np.nanmean(atr)) if np.isfinite(atr).any() else np.nan
+            state = RenkoState(close[0], True, brick_size)
+            history = DataFrame({
+                'date': dataframe['date'].iloc[:1].reset_index(drop=True),
+                'open': [close[0] - brick_size], 'high': [close[0]], 'low': [close[0] - brick_size],
+                'close': [close[0]], 'volume': volume[:1], 'ATR': [brick_size], 'trend': [True],
+            })
+        else:
+            state = cached['state']
+            history = cached['bricks']
+
+        new, state = renko_bricks(close[first:], atr[first:], state)
+        candle = new.pop('candle').to_numpy() + first
+        new.insert(0, 'date', dataframe['date'].iloc[candle].reset_index(drop=True))
+        new.insert(5, 'volume', volume[candle])
+        # One concat per call, only the new bricks are appended
+        bricks = pd.concat([history, new], ignore_index=True) if len(new) else history
+        bricks = bricks[bricks['date'] >= dataframe['date'].iloc[0]].reset_index(drop=True)
+        self._pairs[pair] = {'last_date': dates[-1], 'state': state, 'bricks': bricks}
+        return bricks
+
@@ -0,0 +1,69 @@
+"""
+Rising / falling streaks (the ``streak`` input of Connors RSI).
+
+``calc_streaks`` is the array version of the helper the NFI Next family used to walk with
+``itertuples()``: +k after k consecutive rises, -k after k consecutive falls, 0 when the value
+did not change. A comparison against NaN counts as a fall, like in the old loop.
+``StreakCounter`` carries the last value and streak so live runs can append one candle at a
+time.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+RISING = 1
+FALLING = -1
+UNCHANGED = 0
+
+
+def streak_steps(values) -> np.ndarray:
+    """Direction of every step: 1 rising, -1 falling (or NaN), 0 unchanged; 0 for the first row."""
+    values = np.asarray(values, dtype=np.float64)
+    steps = np.zeros(len(values), dtype=np.int8)
+    if len(values) > 1:
+        with np.errstate(invalid='ignore'):
+            prev, cur = values[:-1], values[1:]
+            steps[1:] = np.where(cur == prev, UNCHANGED, np.where(cur >= prev, RISING, FALLING))
+    return steps
+
+
+def calc_streaks(series) -> np.ndarray:
+    steps = streak_steps(series)
+    n = len(steps)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    # Length of the run of identical steps ending at each row
+    idx = np.arange(n)
+    starts = np.empty(n, dtype=bool)
+    starts[0] = True
+    starts[1:] = steps[1:] != steps[:-1]
+    run = idx - np.maximum.accumulate(np.where(starts, idx, 0)) + 1
+    return run * steps.astype(np.int64)
+
+
+@dataclass
+class StreakCounter:
+    """Incremental ``calc_streaks``: feed candles one by one with ``append``."""
+    last: float = np.nan
+    streak: int = 0
+    # False until the first value is seen, which always has a streak of 0
+    started: bool = False
+
+    @classmethod
+    def from_history(cls, series) -> 'StreakCounter':
+        values = np.asarray(series, dtype=np.float64)
+        if len(values) == 0:
+            return cls()
+        return cls(last=float(values[-1]), streak=int(calc_streaks(values)[-1]), started=True)
+
+    def append(self, value: float) -> int:
+        if not self.started:
+            self.started = True
+        elif value == self.last:
+            self.streak = 0
+        elif value >= self.last:
+            self.streak = self.streak + 1 if self.streak > 0 else 1
+        else:
+            self.streak = self.streak - 1 if self.streak < 0 else -1
+        self.last = value
+        return self.streak
@@ -0,0 +1,78 @@
+"""
+Supertrend Indicator; adapted for freqtrade
+from: https://github.com/freqtrade/freqtrade-strategies/issues/30
+
+Batched engine for strategies that evaluate many (multiplier, period) pairs, typically one
+per value of a hyperopt parameter range. True range and hl2 are computed once, the ATR once
+per distinct period, and every band lands in a column of one 2D array. The input frame is
+never copied.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import talib.abstract as ta
+from pandas import DataFrame
+
+from .bands import band_recurrence, band_trend
+
+
+class SupertrendBands:
+    """
+    Result of ``supertrend_batch``.
+
+    ``st`` holds the Supertrend line and ``trend`` the int8 direction (1 up, -1 down,
+    0 undefined), both shaped (candles, len(params)) in the order of ``params``.
+    """
+
+    def __init__(self, params: List[Tuple[float, int]], st: np.ndarray, trend: np.ndarray):
+        self.params = params
+        self.st = st
+        self.trend = trend
+        self._columns: Dict[Tuple[float, int], int] = {p: i for i, p in enumerate(params)}
+
+    def column(self, multiplier, period) -> int:
+        return self._columns[(multiplier, int(period))]
+
+    def get(self, multiplier, period) -> Tuple[np.ndarray, np.ndarray]:
+        i = self.column(multiplier, period)
+        return self.st[:, i], self.trend[:, i]
+
+    def trend_frame(self, index, prefix: str = 'supertrend') -> DataFrame:
+        """All trends as ``{prefix}_{multiplier}_{period}`` columns, built in one allocation."""
+        return DataFrame(self.trend, index=index,
+                         columns=[f'{prefix}_{m}_{p}' for m, p in self.params])
+
+
+def supertrend_batch(dataframe: DataFrame, params: Iterable[Tuple[float, int]]) -> SupertrendBands:
+    # Deduplicate while keeping the caller's order
+    params = list(dict.fromkeys((m, int(p)) for m, p in params))
+    high = dataframe['high'].to_numpy(dtype=np.float64)
+    low = dataframe['low'].to_numpy(dtype=np.float64)
+    close = dataframe['close'].to_numpy(dtype=np.float64)
+    n = len(close)
+
+    hl2 = (high + low) / 2
+    tr = np.asarray(ta.TRANGE(dataframe), dtype=np.float64)
+    atr = {p: np.asarray(ta.SMA(tr, timeperiod=p), dtype=np.float64)
+           for p in sorted({p for _, p in params})}
+
+    # Rows are contiguous per parameter set, the transposed views are returned
+    st = np.zeros((len(params), n))
+    for j, (multiplier, period) in enumerate(params):
+        if period >= n:
+            continue
+        offset = multiplier * atr[period]
+        _, _, st[j] = band_recurrence(hl2 + offset, hl2 - offset, close, period,
+                                      0.0, 0.0, 0.0, float(close[period - 1]))
+
+    trend = band_trend(st, close[np.newaxis, :])
+    return SupertrendBands(params, st.T, trend.T)
+
+
+def supertrend(dataframe: DataFrame, multiplier, period) -> DataFrame:
+    """Single (multiplier, period) Supertrend with ST (line) and STX (int8 trend) columns."""
+    bands = supertrend_batch(dataframe, [(multiplier, period)])
+    return DataFrame(index=dataframe.index, data={
+        'ST': bands.st[:, 0],
+        'STX': bands.trend[:, 0],
+    })
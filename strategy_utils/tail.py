@@ -0,0 +1,29 @@
+"""
+Helpers for the live-mode trackers that keep per-pair state between calls.
+
+In live and dry runs every call gets the same rolling window of candles moved forward by a
+candle or a few, so a tracker only has to process the rows it has not seen yet, as long as
+the new frame continues the stored history.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def as_dates(dates) -> np.ndarray:
+    # ``Series.values`` keeps tz-aware dates as datetime64 instead of Timestamp objects
+    return np.asarray(getattr(dates, 'values', dates))
+
+
+def frame_overlap(old_dates: Optional[np.ndarray], dates: np.ndarray) -> Optional[Tuple[int, int]]:
+    """
+    Locate the new frame inside the stored history.
+    Returns (first stored row kept, number of rows already known) or None.
+    """
+    if old_dates is None or len(dates) == 0:
+        return None
+    first = int(np.searchsorted(old_dates, dates[0]))
+    known = len(old_dates) - first
+    if first >= len(old_dates) or known > len(dates) or not np.array_equal(old_dates[first:], dates[:known]):
+        return None
+    return first, known
@@ -0,0 +1,161 @@
+"""
+TD Sequential (Tom DeMark) setup, perfection and countdown.
+
+Setup: consecutive closes below (buy) / above (sell) the close ``lookback`` bars earlier. The
+count keeps running past 9 like the groupby/cumcount columns the strategies used to build.
+
+Perfection (``exceed_low`` / ``exceed_high``): on bar 8 and from bar 10 of a setup on, the low
+(high) of the bar is below (above) the low (high) of bar 6 or bar 7 of the same setup. Bar 9
+takes bar 8's result without checking its own low (high), like the strategies' loop did.
+
+Countdown: starts when a setup reaches 9 and counts the bars whose close is at or below the
+low (buy) / at or above the high (sell) two bars earlier, up to 13. A completed setup in the
+other direction cancels it, a new setup in the same direction restarts it.
+
+Everything runs in one compiled pass that carries its state in ``TDState``, so
+``TDSequentialTracker`` only walks the candles a live bot has not seen yet.
+"""
+from dataclasses import dataclass, fields
+from typing import Dict, Optional
+
+import numpy as np
+from pandas import DataFrame
+
+from ._compat import jit
+from .tail import as_dates, frame_overlap
+
+SETUP_BARS = 9
+COUNTDOWN_BARS = 13
+
+TD_COLUMNS = ['seq_buy', 'seq_sell', 'exceed_low', 'exceed_high', 'countdown_buy', 'countdown_sell']
+
+
+@dataclass
+class TDState:
+    """Counters after the last processed candle (-1 = countdown not running)."""
+    seq_buy: int = 0
+    seq_sell: int = 0
+    bar6_low: float = np.nan
+    bar7_low: float = np.nan
+    bar6_high: float = np.nan
+    bar7_high: float = np.nan
+    exceed_low: bool = False
+    exceed_high: bool = False
+    countdown_buy: int = -1
+    countdown_sell: int = -1
+
+
+@jit
+def td_kernel(close, low, high, start, lookback, seq_buy, seq_sell, bar6_low, bar7_low,
+              bar6_high, bar7_high, exceed_low, exceed_high, countdown_buy, countdown_sell):
+    """
+    TD Sequential from row ``start`` on, the state arguments are those of the row before.
+    Rows before ``start`` are left at 0 / False.
+    """
+    n = len(close)
+    out_seq_buy = np.zeros(n, dtype=np.int64)
+    out_seq_sell = np.zeros(n, dtype=np.int64)
+    out_exceed_low = np.zeros(n, dtype=np.bool_)
+    out_exceed_high = np.zeros(n, dtype=np.bool_)
+    out_cd_buy = np.zeros(n, dtype=np.int64)
+    out_cd_sell = np.zeros(n, dtype=np.int64)
+    for i in range(start, n):
+        # Setup counts, a comparison against a missing close breaks the run
+        seq_buy = seq_buy + 1 if i >= lookback and close[i] < close[i - lookback] else 0
+        seq_sell = seq_sell + 1 if i >= lookback and close[i] > close[i - lookback] else 0
+
+        # Perfection against bars 6 and 7 of the running setup
+        if seq_buy == 6:
+            bar6_low = low[i]
+        elif seq_buy == 7:
+            bar7_low = low[i]
+        if seq_buy >= 8:
+            if seq_buy != 9:
+                exceed_low = low[i] < bar6_low or low[i] < bar7_low
+        else:
+            exceed_low = False
+        if seq_sell == 6:
+            bar6_high = high[i]
+        elif seq_sell == 7:
+            bar7_high = high[i]
+        if seq_sell >= 8:
+            if seq_sell != 9:
+                exceed_high = high[i] > bar6_high or high[i] > bar7_high
+        else:
+            exceed_high = False
+
+        # Countdown, (re)started by a completed setup, cancelled by the opposite one
+        if seq_buy == 9:
+            countdown_buy = 0
+            countdown_sell = -1
+        elif seq_sell == 9:
+            countdown_sell = 0
+            countdown_buy = -1
+        if countdown_buy >= 0 and i >= 2 and close[i] <= low[i - 2]:
+            countdown_buy += 1
+        if countdown_sell >= 0 and i >= 2 and close[i] >= high[i - 2]:
+            countdown_sell += 1
+
+        out_seq_buy[i] = seq_buy
+        out_seq_sell[i] = seq_sell
+        out_exceed_low[i] = exceed_low
+        out_exceed_high[i] = exceed_high
+        out_cd_buy[i] = max(countdown_buy, 0)
+        out_cd_sell[i] = max(countdown_sell, 0)
+        if countdown_buy == 13:
+            countdown_buy = -1
+        if countdown_sell == 13:
+            countdown_sell = -1
+    return (out_seq_buy, out_seq_sell, out_exceed_low, out_exceed_high, out_cd_buy, out_cd_sell,
+            seq_buy, seq_sell, bar6_low, bar7_low, bar6_high, bar7_high, exceed_low, exceed_high,
+            countdown_buy, countdown_sell)
+
+
+def _run(dataframe: DataFrame, start: int, state: TDState, lookback: int):
+    result = td_kernel(
+        dataframe['close'].to_numpy(dtype=np.float64), dataframe['low'].to_numpy(dtype=np.float64),
+        dataframe['high'].to_numpy(dtype=np.float64), start, lookback,
+        *[getattr(state, f.name) for f in fields(TDState)]
+    )
+    columns = {name: np.asarray(values) for name, values in zip(TD_COLUMNS, result[:len(TD_COLUMNS)])}
+    return columns, TDState(*result[len(TD_COLUMNS):])
+
+
+def td_sequential(dataframe: DataFrame, lookback: int = 4) -> DataFrame:
+    """``TD_COLUMNS`` for the whole ``dataframe`` (``close``, ``low``, ``high``)."""
+    columns, _ = _run(dataframe, 0, TDState(), lookback)
+    return DataFrame(columns, index=dataframe.index)
+
+
+class TDSequentialTracker:
+    """
+    Per-pair TD Sequential for live/dry runs.
+
+    Columns of candles seen before are reused, only the new candles go through the kernel.
+    A frame that does not continue the stored history is computed from scratch.
+    """
+
+    def __init__(self, lookback: int = 4):
+        self.lookback = lookback
+        self._pairs: Dict[str, dict] = {}
+
+    def reset(self, pair: Optional[str] = None) -> None:
+        if pair is None:
+            self._pairs.clear()
+        else:
+            self._pairs.pop(pair, None)
+
+    def update(self, pair: str, dataframe: DataFrame) -> DataFrame:
+        dates = as_dates(dataframe['date'])
+        cached = self._pairs.get(pair)
+        overlap = frame_overlap(cached['dates'] if cached else None, dates)
+        if overlap is None:
+            columns, state = _run(dataframe, 0, TDState(), self.lookback)
+        else:
+            first, known = overlap
+            columns, state = _run(dataframe, known, cached['state'], self.lookback)
+            for name in TD_COLUMNS:
+                columns[name][:known] = cached['columns'][name][first:]
+
+        self._pairs[pair] = {'dates': dates, 'columns': columns, 'state': state}
+        return DataFrame(columns, index=dataframe.index)
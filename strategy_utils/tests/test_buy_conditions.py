@@ -0,0 +1,258 @@
+"""
+``ProtectionMasks``, ``all_of`` and ``BuySignals`` against the protection list, ``reduce`` and
+``buy_tag`` loop of NostalgiaForInfinityX's ``populate_buy_trend`` (kept below as it was,
+with the condition logic drawn at random).
+"""
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from strategy_utils.buy_conditions import BuySignals, ProtectionMasks, all_of, standard_protections
+
+EMA_LENGTHS = ['12', '20', '26', '50', '100', '200']
+PIVOTS = ['none', 'pivot', 'sup1', 'res1']
+THRESHOLDS = ['safe_dips_threshold_0', 'safe_dips_threshold_2', 'safe_dips_threshold_12', 'safe_dips_threshold_144',
+              'safe_pump_6h_threshold', 'safe_pump_12h_threshold', 'safe_pump_24h_threshold',
+              'safe_pump_36h_threshold', 'safe_pump_48h_threshold']
+INDICATORS = ['rsi_14', 'cti', 'r_14', 'mfi', 'ewo']
+
+
+def legacy_buy_trend(dataframe: DataFrame, buy_protection_params: dict, buy_params: dict, logic: dict,
+                     live: bool, has_filter: bool) -> DataFrame:
+    conditions = []
+    dataframe.loc[:, 'buy_tag'] = ''
+
+    for index in buy_protection_params:
+        item_buy_protection_list = [True]
+        global_buy_protection_params = buy_protection_params[index]
+
+        if buy_params[f"buy_condition_{index}_enable"]:
+            # Standard protections - Common to every condition
+            # -----------------------------------------------------------------------------------------
+            if global_buy_protection_params["ema_fast"]:
+                item_buy_protection_list.append(dataframe[f"ema_{global_buy_protection_params['ema_fast_len']}"] > dataframe['ema_200'])
+            if global_buy_protection_params["ema_slow"]:
+                item_buy_protection_list.append(dataframe[f"ema_{global_buy_protection_params['ema_slow_len']}_1h"] > dataframe['ema_200_1h'])
+            if global_buy_protection_params["close_above_ema_fast"]:
+                item_buy_protection_list.append(dataframe['close'] > dataframe[f"ema_{global_buy_protection_params['close_above_ema_fast_len']}"])
+            if global_buy_protection_params["close_above_ema_slow"]:
+                item_buy_protection_list.append(dataframe['close'] > dataframe[f"ema_{global_buy_protection_params['close_above_ema_slow_len']}_1h"])
+            if global_buy_protection_params["sma200_rising"]:
+                item_buy_protection_list.append(dataframe['sma_200'] > dataframe['sma_200'].shift(int(global_buy_protection_params['sma200_rising_val'])))
+            if global_buy_protection_params["sma200_1h_rising"]:
+                item_buy_protection_list.append(dataframe['sma_200_1h'] > dataframe['sma_200_1h'].shift(int(global_buy_protection_params['sma200_1h_rising_val'])))
+            if global_buy_protection_params["safe_dips_threshold_0"] is not None:
+                item_buy_protection_list.append(dataframe['tpct_change_0'] < global_buy_protection_params["safe_dips_threshold_0"])
+            if global_buy_protection_params["safe_dips_threshold_2"] is not None:
+                item_buy_protection_list.append(dataframe['tpct_change_2'] < global_buy_protection_params["safe_dips_threshold_2"])
+            if global_buy_protection_params["safe_dips_threshold_12"] is not None:
+                item_buy_protection_list.append(dataframe['tpct_change_12'] < global_buy_protection_params["safe_dips_threshold_12"])
+            if global_buy_protection_params["safe_dips_threshold_144"] is not None:
+                item_buy_protection_list.append(dataframe['tpct_change_144'] < global_buy_protection_params["safe_dips_threshold_144"])
+            if global_buy_protection_params["safe_pump_6h_threshold"] is not None:
+                item_buy_protection_list.append(dataframe['hl_pct_change_6_1h'] < global_buy_protection_params["safe_pump_6h_threshold"])
+            if global_buy_protection_params["safe_pump_12h_threshold"] is not None:
+                item_buy_protection_list.append(dataframe['hl_pct_change_12_1h'] < global_buy_protection_params["safe_pump_12h_threshold"])
+            if global_buy_protection_params["safe_pump_24h_threshold"] is not None:
+                item_buy_protection_list.append(dataframe['hl_pct_change_24_1h'] < global_buy_protection_params["safe_pump_24h_threshold"])
+            if global_buy_protection_params["safe_pump_36h_threshold"] is not None:
+                item_buy_protection_list.append(dataframe['hl_pct_change_36_1h'] < global_buy_protection_params["safe_pump_36h_threshold"])
+            if global_buy_protection_params["safe_pump_48h_threshold"] is not None:
+                item_buy_protection_list.append(dataframe['hl_pct_change_48_1h'] < global_buy_protection_params["safe_pump_48h_threshold"])
+            if global_buy_protection_params['btc_1h_not_downtrend']:
+                item_buy_protection_list.append(dataframe['btc_not_downtrend_1h'])
+            if global_buy_protection_params['close_over_pivot_type'] != 'none':
+                item_buy_protection_list.append(dataframe['close'] > dataframe[f"{global_buy_protection_params['close_over_pivot_type']}_1d"] * global_buy_protection_params['close_over_pivot_offset'])
+            if global_buy_protection_params['close_under_pivot_type'] != 'none':
+                item_buy_protection_list.append(dataframe['close'] < dataframe[f"{global_buy_protection_params['close_under_pivot_type']}_1d"] * global_buy_protection_params['close_under_pivot_offset'])
+            if not live:
+                if has_filter:
+                    item_buy_protection_list.append(dataframe['bt_agefilter_ok'])
+            else:
+                if has_filter:
+                    item_buy_protection_list.append(dataframe['live_data_ok'])
+
+            # Buy conditions
+            # -----------------------------------------------------------------------------------------
+            item_buy_logic = []
+            item_buy_logic.append(reduce(lambda x, y: x & y, item_buy_protection_list))
+
+            item_buy_logic.extend(logic[index](dataframe))
+
+            item_buy_logic.append(dataframe['volume'] > 0)
+            item_buy = reduce(lambda x, y: x & y, item_buy_logic)
+            dataframe.loc[item_buy, 'buy_tag'] += f"{index} "
+            conditions.append(item_buy)
+
+    if conditions:
+        dataframe.loc[:, 'buy'] = reduce(lambda x, y: x | y, conditions)
+
+    return dataframe
+
+
+def buy_trend(dataframe: DataFrame, buy_protection_params: dict, buy_params: dict, logic: dict,
+              live: bool, has_filter: bool) -> DataFrame:
+    """What NostalgiaForInfinityX.populate_buy_trend does now."""
+    enabled = [index for index in buy_protection_params if buy_params[f"buy_condition_{index}_enable"]]
+    signals = BuySignals(len(dataframe), enabled)
+    protections = ProtectionMasks(dataframe)
+    global_buy_protections = ()
+    if not live:
+        if has_filter:
+            global_buy_protections = (('flag', 'bt_agefilter_ok'),)
+    else:
+        if has_filter:
+            global_buy_protections = (('flag', 'live_data_ok'),)
+
+    for index in buy_protection_params:
+        if buy_params[f"buy_condition_{index}_enable"]:
+            item_buy_protection = protections.mask(
+                standard_protections(buy_protection_params[index]) + global_buy_protections)
+            if not item_buy_protection.any():
+                continue
+
+            item_buy_logic = []
+            item_buy_logic.append(item_buy_protection)
+            item_buy_logic.extend(logic[index](dataframe))
+            item_buy_logic.append(dataframe['volume'] > 0)
+            signals.record(index, all_of(item_buy_logic, len(dataframe)))
+
+    dataframe.loc[:, 'buy_tag'] = signals.tags()
+    if enabled:
+        dataframe.loc[:, 'buy'] = signals.buy
+
+    return dataframe
+
+
+def nan_flags(rng, n: int, dtype) -> pd.Series:
+    """A merged-in boolean column: True / False with NaN where the informative had no row."""
+    flags = pd.Series(rng.random(n) < 0.9, dtype=object)
+    flags[rng.random(n) < 0.05] = np.nan
+    return flags if dtype is object else flags.astype(float)
+
+
+def analyzed_frame(n: int, seed: int) -> DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    columns = {'close': close, 'volume': rng.integers(0, 20, n).astype(float)}
+    for length in EMA_LENGTHS:
+        columns[f'ema_{length}'] = close * rng.normal(1, 0.01, n)
+        columns[f'ema_{length}_1h'] = close * rng.normal(1, 0.01, n)
+    columns['ema_200'] = close * rng.normal(0.995, 0.01, n)
+    columns['ema_200_1h'] = close * rng.normal(0.995, 0.01, n)
+    columns['sma_200'] = pd.Series(close).rolling(200).mean().to_numpy()
+    columns['sma_200_1h'] = pd.Series(close).rolling(50).mean().to_numpy()
+    for column in ['tpct_change_0', 'tpct_change_2', 'tpct_change_12', 'tpct_change_144', 'hl_pct_change_6_1h',
+                   'hl_pct_change_12_1h', 'hl_pct_change_24_1h', 'hl_pct_change_36_1h', 'hl_pct_change_48_1h']:
+        values = rng.random(n)
+        values[rng.random(n) < 0.02] = np.nan
+        columns[column] = values
+    for pivot in PIVOTS[1:]:
+        columns[f'{pivot}_1d'] = close * rng.normal(1, 0.02, n)
+    for indicator in INDICATORS:
+        columns[indicator] = rng.random(n)
+    dataframe = DataFrame(columns)
+    dataframe['btc_not_downtrend_1h'] = nan_flags(rng, n, object)
+    dataframe['bt_agefilter_ok'] = nan_flags(rng, n, float)
+    dataframe['live_data_ok'] = nan_flags(rng, n, object)
+    dataframe['nan_flag'] = nan_flags(rng, n, object)
+    return dataframe
+
+
+def random_conditions(count: int, seed: int):
+    """``buy_protection_params``, ``buy_params`` and logic of ``count`` conditions, 1 to count."""
+    rng = np.random.default_rng(seed)
+    protection_params, buy_params, logic = {}, {}, {}
+    for index in range(1, count + 1):
+        params = {
+            'ema_fast': rng.random() < 0.3, 'ema_fast_len': rng.choice(EMA_LENGTHS),
+            'ema_slow': rng.random() < 0.3, 'ema_slow_len': rng.choice(EMA_LENGTHS),
+            'close_above_ema_fast': rng.random() < 0.2, 'close_above_ema_fast_len': rng.choice(EMA_LENGTHS),
+            'close_above_ema_slow': rng.random() < 0.2, 'close_above_ema_slow_len': rng.choice(EMA_LENGTHS),
+            'sma200_rising': rng.random() < 0.3, 'sma200_rising_val': str(rng.choice([20, 30, 50])),
+            'sma200_1h_rising': rng.random() < 0.2, 'sma200_1h_rising_val': str(rng.choice([24, 50])),
+            'btc_1h_not_downtrend': rng.random() < 0.3,
+            'close_over_pivot_type': rng.choice(PIVOTS), 'close_over_pivot_offset': float(rng.choice([0.96, 0.98])),
+            'close_under_pivot_type': rng.choice(PIVOTS), 'close_under_pivot_offset': float(rng.choice([1.02, 1.05])),
+        }
+        for threshold in THRESHOLDS:
+            params[threshold] = float(rng.choice([0.8, 0.9, 0.95])) if rng.random() < 0.3 else None
+        protection_params[index] = params
+        # Most conditions enabled, some of them past the first 64
+        buy_params[f'buy_condition_{index}_enable'] = bool(rng.random() < 0.85)
+
+        terms = [(str(rng.choice(INDICATORS)), float(rng.uniform(0.3, 0.8))) for _ in range(rng.integers(1, 3))]
+        with_nan_flag = rng.random() < 0.2
+        with_scalar = rng.random() < 0.1
+
+        def condition(dataframe, terms=terms, with_nan_flag=with_nan_flag, with_scalar=with_scalar):
+            items = [dataframe[column] < value for column, value in terms]
+            if with_nan_flag:
+                items.append(dataframe['nan_flag'])
+            if with_scalar:
+                items.append(True)
+            return items
+        logic[index] = condition
+    return protection_params, buy_params, logic
+
+
+@pytest.mark.parametrize('count', [5, 64, 71, 130])
+@pytest.mark.parametrize('live, has_filter', [(False, False), (False, True), (True, True)])
+@pytest.mark.parametrize('seed', range(2))
+def test_buy_trend_matches_the_reduce_loop(count, live, has_filter, seed):
+    dataframe = analyzed_frame(3000, seed)
+    protection_params, buy_params, logic = random_conditions(count, seed)
+    expected = legacy_buy_trend(dataframe.copy(), protection_params, buy_params, logic, live, has_filter)
+    result = buy_trend(dataframe.copy(), protection_params, buy_params, logic, live, has_filter)
+
+    assert expected['buy'].any() and not expected['buy'].all()
+    assert result['buy'].dtype == bool
+    np.testing.assert_array_equal(result['buy'].to_numpy(), expected['buy'].to_numpy(dtype=bool))
+    assert result['buy_tag'].tolist() == expected['buy_tag'].tolist()
+    if count > 64:
+        # Tags from both words, several on a candle
+        fired = {int(label) for tag in expected['buy_tag'] for label in tag.split()}
+        assert max(fired) > 64 and min(fired) <= 64
+        assert expected['buy_tag'].str.count(' ').max() > 1
+
+
+def test_no_enabled_condition():
+    dataframe = analyzed_frame(500, 0)
+    protection_params, buy_params, logic = random_conditions(10, 0)
+    buy_params = {key: False for key in buy_params}
+    expected = legacy_buy_trend(dataframe.copy(), protection_params, buy_params, logic, False, True)
+    result = buy_trend(dataframe.copy(), protection_params, buy_params, logic, False, True)
+    assert 'buy' not in expected and 'buy' not in result
+    assert (result['buy_tag'] == '').all() and result['buy_tag'].tolist() == expected['buy_tag'].tolist()
+
+    signals = BuySignals(4, [])
+    assert signals.words.shape == (0, 4) and not signals.buy.any()
+    assert signals.tags().tolist() == [''] * 4
+
+
+def test_protection_masks_are_shared():
+    dataframe = analyzed_frame(500, 1)
+    protections = ProtectionMasks(dataframe)
+    atoms = (('above', 'ema_12', 'ema_200', 1.0), ('rising', 'sma_200', 30), ('flag', 'btc_not_downtrend_1h'))
+    mask = protections.mask(atoms)
+    assert protections.mask(atoms) is mask
+    # Every prefix is kept for the conditions that share it
+    assert len(protections) == 5
+    np.testing.assert_array_equal(protections.mask(()), np.ones(500, dtype=bool))
+    expected = (dataframe['ema_12'] > dataframe['ema_200']) & \
+        (dataframe['sma_200'] > dataframe['sma_200'].shift(30)) & dataframe['btc_not_downtrend_1h']
+    np.testing.assert_array_equal(mask, expected.to_numpy(dtype=bool))
+    with pytest.raises(ValueError):
+        protections.mask([('between', 'close', 'ema_12', 1.0)])
+
+
+def test_all_of_treats_nan_as_false():
+    flags = pd.Series([True, np.nan, False, True], dtype=object)
+    values = pd.Series([1.0, 1.0, np.nan, 0.0])
+    np.testing.assert_array_equal(all_of([flags], 4), [True, False, False, True])
+    np.testing.assert_array_equal(all_of([values, True], 4), [True, True, False, False])
+    np.testing.assert_array_equal(all_of([flags, np.bool_(False)], 4), [False] * 4)
+    np.testing.assert_array_equal(all_of([], 4), [True] * 4)
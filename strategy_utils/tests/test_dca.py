@@ -0,0 +1,155 @@
+"""
+``DcaTracker`` and ``SafetyOrderLadder`` against the ``trade.orders`` walk and the trigger and
+stake formulas of EI3v2_tag_cofi_dca_green's ``adjust_trade_position`` (kept below as they were).
+"""
+import math
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from strategy_utils.dca import DcaTracker, SafetyOrderLadder, safety_order_ladder
+
+
+def legacy_count_of_buys(trade) -> int:
+    count_of_buys = 0
+    for order in trade.orders:
+        if order.ft_is_open or order.ft_order_side != 'buy':
+            continue
+        if order.status == "closed":
+            count_of_buys += 1
+    return count_of_buys
+
+
+def legacy_safety_order(count_of_buys, current_profit, initial_safety_order_trigger=-0.018, max_safety_orders=8,
+                        safety_order_step_scale=1.2, safety_order_volume_scale=1.4):
+    """The stake multiplier of the safety order due, None when there is none."""
+    if 1 <= count_of_buys <= max_safety_orders:
+
+        safety_order_trigger = abs(initial_safety_order_trigger) + (abs(initial_safety_order_trigger) * safety_order_step_scale * (math.pow(safety_order_step_scale,(count_of_buys - 1)) - 1) / (safety_order_step_scale - 1))
+
+        if current_profit <= (-1 * abs(safety_order_trigger)):
+            return math.pow(safety_order_volume_scale,(count_of_buys - 1))
+
+    return None
+
+
+class FakeOrder:
+    def __init__(self, side: str):
+        self.ft_order_side = side
+        self.ft_is_open = True
+        self.status = 'open'
+
+    def fill(self):
+        self.ft_is_open = False
+        self.status = 'closed'
+
+    def cancel(self):
+        self.ft_is_open = False
+        self.status = 'canceled'
+
+
+class FakeTrade:
+    def __init__(self, id: int, pair: str = 'BTC/USDT'):
+        self.id = id
+        self.pair = pair
+        self.open_date = datetime(2022, 1, id)
+        self.orders = []
+
+
+def random_order_flow(trade: FakeTrade, rng, steps: int):
+    """
+    Place, fill and cancel buy and sell orders at random, several open at once and settling in
+    any order. Yields after every event.
+    """
+    open_orders = []
+    for _ in range(steps):
+        event = rng.random()
+        if event < 0.35 or not open_orders:
+            order = FakeOrder('buy' if rng.random() < 0.75 else 'sell')
+            trade.orders.append(order)
+            open_orders.append(order)
+        else:
+            order = open_orders.pop(int(rng.integers(len(open_orders))))
+            if event < 0.85:
+                order.fill()
+            else:
+                order.cancel()
+        yield
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_state_matches_the_order_walk(seed):
+    rng = np.random.default_rng(seed)
+    tracker = DcaTracker()
+    trade = FakeTrade(1)
+    seen_pending = False
+    for _ in random_order_flow(trade, rng, 200):
+        # adjust_trade_position runs every loop, order_filled only on some of the fills
+        if rng.random() < 0.3:
+            tracker.order_filled(trade)
+        if rng.random() < 0.7:
+            state = tracker.state(trade)
+            assert state.count_of_buys == legacy_count_of_buys(trade)
+            assert state.settled <= len(trade.orders)
+            seen_pending |= state.pending_buys > 0
+    assert tracker.count_of_buys(trade) == legacy_count_of_buys(trade) > 0
+    # Some filled buys came after an order still open
+    assert seen_pending
+
+
+def test_trades_are_tracked_apart_and_closed_ones_dropped():
+    tracker = DcaTracker()
+    trades = [FakeTrade(i, pair) for i, pair in enumerate(['BTC/USDT', 'ETH/USDT', 'BTC/USDT'], start=1)]
+    rng = np.random.default_rng(0)
+    for trade in trades:
+        for _ in random_order_flow(trade, rng, 30):
+            assert tracker.count_of_buys(trade) == legacy_count_of_buys(trade)
+    assert len(tracker) == 3
+    for trade in trades:
+        assert tracker.count_of_buys(trade) == legacy_count_of_buys(trade)
+
+    # The second trade closed by the stoploss on exchange, the third one force exited
+    tracker.retain(trades[:1])
+    assert len(tracker) == 1
+    assert tracker.count_of_buys(trades[0]) == legacy_count_of_buys(trades[0])
+    tracker.retain([])
+    assert len(tracker) == 0
+
+    # A trade whose orders were reloaded shorter starts over
+    trade = trades[0]
+    tracker.count_of_buys(trade)
+    trade.orders = trade.orders[:3]
+    assert tracker.count_of_buys(trade) == legacy_count_of_buys(trade)
+    tracker.reset()
+    assert len(tracker) == 0
+
+
+@pytest.mark.parametrize('initial_trigger, max_orders, step_scale, volume_scale', [
+    (-0.018, 8, 1.2, 1.4), (-0.02, 3, 2, 1), (0.03, 5, 0.8, 2.5),
+])
+def test_ladder_matches_the_formulas(initial_trigger, max_orders, step_scale, volume_scale):
+    ladder = safety_order_ladder(initial_trigger, max_orders, step_scale, volume_scale)
+    assert safety_order_ladder(initial_trigger, max_orders, step_scale, volume_scale) is ladder
+    for count_of_buys in range(0, max_orders + 3):
+        for current_profit in np.linspace(-0.5, 0.05, 221):
+            expected = legacy_safety_order(count_of_buys, current_profit, initial_trigger, max_orders,
+                                           step_scale, volume_scale)
+            assert ladder.is_due(count_of_buys, current_profit) == (expected is not None)
+            if expected is not None:
+                assert ladder.stake_multiplier(count_of_buys) == expected
+        if 1 <= count_of_buys <= max_orders:
+            assert ladder.trigger(count_of_buys) > 0
+        else:
+            assert ladder.trigger(count_of_buys) is None
+
+
+def test_ladder_with_a_step_scale_of_one():
+    # The formula divides by zero, the ladder takes its limit
+    with pytest.raises(ZeroDivisionError):
+        legacy_safety_order(2, -0.5, safety_order_step_scale=1)
+    ladder = SafetyOrderLadder(-0.02, 4, 1, 1.5)
+    assert ladder.triggers == pytest.approx((0.02, 0.04, 0.06, 0.08))
+    near = SafetyOrderLadder(-0.02, 4, 1 + 1e-9, 1.5)
+    assert near.triggers == pytest.approx(ladder.triggers, rel=1e-6)
+    assert ladder.stake_multipliers == (1, 1.5, 2.25, 3.375)
@@ -0,0 +1,321 @@
+"""
+``pivot_points`` and ``divergences`` against the deque pivot walk and the divergence finder of
+HarmonicDivergence (kept below as they were, but for the writes noted in
+``divergence_finder_dataframe``).
+"""
+from collections import deque
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from strategy_utils.divergence import PivotSource, divergences, pivot_points
+
+
+def initialize_divergences_lists(dataframe: DataFrame):
+    dataframe["total_bullish_divergences"] = np.empty(len(dataframe['close'])) * np.nan
+    dataframe["total_bullish_divergences_count"] = np.empty(len(dataframe['close'])) * np.nan
+    dataframe["total_bullish_divergences_count"] = [0 if x != x else x for x in dataframe["total_bullish_divergences_count"]]
+    dataframe["total_bullish_divergences_names"] = np.empty(len(dataframe['close'])) * np.nan
+    dataframe["total_bullish_divergences_names"] = ['' if x != x else x for x in dataframe["total_bullish_divergences_names"]]
+    dataframe["total_bearish_divergences"] = np.empty(len(dataframe['close'])) * np.nan
+    dataframe["total_bearish_divergences_count"] = np.empty(len(dataframe['close'])) * np.nan
+    dataframe["total_bearish_divergences_count"] = [0 if x != x else x for x in dataframe["total_bearish_divergences_count"]]
+    dataframe["total_bearish_divergences_names"] = np.empty(len(dataframe['close'])) * np.nan
+    dataframe["total_bearish_divergences_names"] = ['' if x != x else x for x in dataframe["total_bearish_divergences_names"]]
+
+def add_divergences(dataframe: DataFrame, indicator: str):
+    (bearish_divergences, bearish_lines, bullish_divergences, bullish_lines) = divergence_finder_dataframe(dataframe, indicator)
+    dataframe['bearish_divergence_' + indicator + '_occurence'] = bearish_divergences
+    # for index, bearish_line in enumerate(bearish_lines):
+    #     dataframe['bearish_divergence_' + indicator + '_line_'+ str(index)] = bearish_line
+    dataframe['bullish_divergence_' + indicator + '_occurence'] = bullish_divergences
+    # for index, bullish_line in enumerate(bullish_lines):
+    #     dataframe['bullish_divergence_' + indicator + '_line_'+ str(index)] = bullish_line
+
+# ``dataframe[col][index] = ...`` writes to a copy under pandas copy-on-write (the total_*
+# columns stayed empty), so the writes go through ``dataframe.at``
+def divergence_finder_dataframe(dataframe: DataFrame, indicator_source: str) -> Tuple[pd.Series, pd.Series]:
+    bearish_lines = [np.empty(len(dataframe['close'])) * np.nan]
+    bearish_divergences = np.empty(len(dataframe['close'])) * np.nan
+    bullish_lines = [np.empty(len(dataframe['close'])) * np.nan]
+    bullish_divergences = np.empty(len(dataframe['close'])) * np.nan
+    low_iterator = []
+    high_iterator = []
+
+    for index, row in enumerate(dataframe.itertuples(index=True, name='Pandas')):
+        if np.isnan(row.pivot_lows):
+            low_iterator.append(0 if len(low_iterator) == 0 else low_iterator[-1])
+        else:
+            low_iterator.append(index)
+        if np.isnan(row.pivot_highs):
+            high_iterator.append(0 if len(high_iterator) == 0 else high_iterator[-1])
+        else:
+            high_iterator.append(index)
+
+    for index, row in enumerate(dataframe.itertuples(index=True, name='Pandas')):
+
+        bearish_occurence = bearish_divergence_finder(dataframe,
+            dataframe[indicator_source],
+            high_iterator,
+            index)
+
+        if bearish_occurence != None:
+            (prev_pivot , current_pivot) = bearish_occurence
+            bearish_prev_pivot = dataframe['close'][prev_pivot]
+            bearish_current_pivot = dataframe['close'][current_pivot]
+            bearish_ind_prev_pivot = dataframe[indicator_source][prev_pivot]
+            bearish_ind_current_pivot = dataframe[indicator_source][current_pivot]
+            length = current_pivot - prev_pivot
+            bearish_lines_index = 0
+            can_exist = True
+            while(True):
+                can_draw = True
+                if bearish_lines_index <= len(bearish_lines):
+                    bearish_lines.append(np.empty(len(dataframe['close'])) * np.nan)
+                actual_bearish_lines = bearish_lines[bearish_lines_index]
+                for i in range(length + 1):
+                    point = bearish_prev_pivot + (bearish_current_pivot - bearish_prev_pivot) * i / length
+                    indicator_point =  bearish_ind_prev_pivot + (bearish_ind_current_pivot - bearish_ind_prev_pivot) * i / length
+                    if i != 0 and i != length:
+                        if (point <= dataframe['close'][prev_pivot + i]
+                        or indicator_point <= dataframe[indicator_source][prev_pivot + i]):
+                            can_exist = False
+                    if not np.isnan(actual_bearish_lines[prev_pivot + i]):
+                        can_draw = False
+                if not can_exist:
+                    break
+                if can_draw:
+                    for i in range(length + 1):
+                        actual_bearish_lines[prev_pivot + i] = bearish_prev_pivot + (bearish_current_pivot - bearish_prev_pivot) * i / length
+                    break
+                bearish_lines_index = bearish_lines_index + 1
+            if can_exist:
+                bearish_divergences[index] = row.close
+                dataframe.at[index, "total_bearish_divergences"] = row.close
+                if index > 30:
+                    dataframe.at[index-30, "total_bearish_divergences_count"] = dataframe["total_bearish_divergences_count"][index-30] + 1
+                    dataframe.at[index-30, "total_bearish_divergences_names"] = dataframe["total_bearish_divergences_names"][index-30] + indicator_source.upper() + '<br>'
+
+        bullish_occurence = bullish_divergence_finder(dataframe,
+            dataframe[indicator_source],
+            low_iterator,
+            index)
+
+        if bullish_occurence != None:
+            (prev_pivot , current_pivot) = bullish_occurence
+            bullish_prev_pivot = dataframe['close'][prev_pivot]
+            bullish_current_pivot = dataframe['close'][current_pivot]
+            bullish_ind_prev_pivot = dataframe[indicator_source][prev_pivot]
+            bullish_ind_current_pivot = dataframe[indicator_source][current_pivot]
+            length = current_pivot - prev_pivot
+            bullish_lines_index = 0
+            can_exist = True
+            while(True):
+                can_draw = True
+                if bullish_lines_index <= len(bullish_lines):
+                    bullish_lines.append(np.empty(len(dataframe['close'])) * np.nan)
+                actual_bullish_lines = bullish_lines[bullish_lines_index]
+                for i in range(length + 1):
+                    point = bullish_prev_pivot + (bullish_current_pivot - bullish_prev_pivot) * i / length
+                    indicator_point =  bullish_ind_prev_pivot + (bullish_ind_current_pivot - bullish_ind_prev_pivot) * i / length
+                    if i != 0 and i != length:
+                        if (point >= dataframe['close'][prev_pivot + i]
+                        or indicator_point >= dataframe[indicator_source][prev_pivot + i]):
+                            can_exist = False
+                    if not np.isnan(actual_bullish_lines[prev_pivot + i]):
+                        can_draw = False
+                if not can_exist:
+                    break
+                if can_draw:
+                    for i in range(length + 1):
+                        actual_bullish_lines[prev_pivot + i] = bullish_prev_pivot + (bullish_current_pivot - bullish_prev_pivot) * i / length
+                    break
+                bullish_lines_index = bullish_lines_index + 1
+            if can_exist:
+                bullish_divergences[index] = row.close
+                dataframe.at[index, "total_bullish_divergences"] = row.close
+                if index > 30:
+                    dataframe.at[index-30, "total_bullish_divergences_count"] = dataframe["total_bullish_divergences_count"][index-30] + 1
+                    dataframe.at[index-30, "total_bullish_divergences_names"] = dataframe["total_bullish_divergences_names"][index-30] + indicator_source.upper() + '<br>'
+
+    return (bearish_divergences, bearish_lines, bullish_divergences, bullish_lines)
+
+def bearish_divergence_finder(dataframe, indicator, high_iterator, index):
+    if high_iterator[index] == index:
+        current_pivot = high_iterator[index]
+        occurences = list(dict.fromkeys(high_iterator))
+        current_index = occurences.index(high_iterator[index])
+        for i in range(current_index-1,current_index-6,-1):
+            prev_pivot = occurences[i]
+            if np.isnan(prev_pivot):
+                return
+            if ((dataframe['pivot_highs'][current_pivot] < dataframe['pivot_highs'][prev_pivot] and indicator[current_pivot] > indicator[prev_pivot])
+            or (dataframe['pivot_highs'][current_pivot] > dataframe['pivot_highs'][prev_pivot] and indicator[current_pivot] < indicator[prev_pivot])):
+                return (prev_pivot , current_pivot)
+    return None
+
+def bullish_divergence_finder(dataframe, indicator, low_iterator, index):
+    if low_iterator[index] == index:
+        current_pivot = low_iterator[index]
+        occurences = list(dict.fromkeys(low_iterator))
+        current_index = occurences.index(low_iterator[index])
+        for i in range(current_index-1,current_index-6,-1):
+            prev_pivot = occurences[i]
+            if np.isnan(prev_pivot):
+                return
+            if ((dataframe['pivot_lows'][current_pivot] < dataframe['pivot_lows'][prev_pivot] and indicator[current_pivot] > indicator[prev_pivot])
+            or (dataframe['pivot_lows'][current_pivot] > dataframe['pivot_lows'][prev_pivot] and indicator[current_pivot] < indicator[prev_pivot])):
+                return (prev_pivot, current_pivot)
+    return None
+
+def reference_pivot_points(dataframe: DataFrame, window: int = 5, pivot_source: PivotSource = PivotSource.Close) -> DataFrame:
+    high_source = None
+    low_source = None
+
+    if pivot_source == PivotSource.Close:
+        high_source = 'close'
+        low_source = 'close'
+    elif pivot_source == PivotSource.HighLow:
+        high_source = 'high'
+        low_source = 'low'
+
+    pivot_points_lows = np.empty(len(dataframe['close'])) * np.nan
+    pivot_points_highs = np.empty(len(dataframe['close'])) * np.nan
+    last_values = deque()
+
+    # find pivot points
+    for index, row in enumerate(dataframe.itertuples(index=True, name='Pandas')):
+        last_values.append(row)
+        if len(last_values) >= window * 2 + 1:
+            current_value = last_values[window]
+            is_greater = True
+            is_less = True
+            for window_index in range(0, window):
+                left = last_values[window_index]
+                right = last_values[2 * window - window_index]
+                local_is_greater, local_is_less = check_if_pivot_is_greater_or_less(current_value, high_source, low_source, left, right)
+                is_greater &= local_is_greater
+                is_less &= local_is_less
+            if is_greater:
+                pivot_points_highs[index - window] = getattr(current_value, high_source)
+            if is_less:
+                pivot_points_lows[index - window] = getattr(current_value, low_source)
+            last_values.popleft()
+
+    # find last one
+    if len(last_values) >= window + 2:
+        current_value = last_values[-2]
+        is_greater = True
+        is_less = True
+        for window_index in range(0, window):
+            left = last_values[-2 - window_index - 1]
+            right = last_values[-1]
+            local_is_greater, local_is_less = check_if_pivot_is_greater_or_less(current_value, high_source, low_source, left, right)
+            is_greater &= local_is_greater
+            is_less &= local_is_less
+        if is_greater:
+            pivot_points_highs[index - 1] = getattr(current_value, high_source)
+        if is_less:
+            pivot_points_lows[index - 1] = getattr(current_value, low_source)
+
+    return pd.DataFrame(index=dataframe.index, data={
+        'pivot_lows': pivot_points_lows,
+        'pivot_highs': pivot_points_highs
+    })
+
+def check_if_pivot_is_greater_or_less(current_value, high_source: str, low_source: str, left, right) -> Tuple[bool, bool]:
+    is_greater = True
+    is_less = True
+    if (getattr(current_value, high_source) < getattr(left, high_source) or
+        getattr(current_value, high_source) < getattr(right, high_source)):
+        is_greater = False
+
+    if (getattr(current_value, low_source) > getattr(left, low_source) or
+        getattr(current_value, low_source) > getattr(right, low_source)):
+        is_less = False
+    return (is_greater, is_less)
+
+
+INDICATORS = ['osc', 'anti', 'walk']
+
+
+def candles(n: int, seed: int, nans: bool = False) -> DataFrame:
+    """Closes in 0.1 ticks that tie now and then, with three indicators to diverge from."""
+    rng = np.random.default_rng(seed)
+    close = 100 + 0.1 * np.cumsum(rng.choice([-2, -1, 0, 1, 2], n))
+    frame = DataFrame({
+        'open': close,
+        'high': close + 0.1 * rng.integers(0, 3, n),
+        'low': close - 0.1 * rng.integers(0, 3, n),
+        'close': close,
+    })
+    frame['osc'] = frame['close'].diff(7).rolling(3).mean()
+    frame['anti'] = np.round(-close + rng.normal(0, 0.5, n), 1)
+    frame['walk'] = np.cumsum(rng.normal(size=n))
+    if nans:
+        for column in ('close', 'high', 'low', 'walk'):
+            frame.loc[rng.random(n) < 0.01, column] = np.nan
+    return frame
+
+
+@pytest.mark.parametrize('window', [1, 2, 5])
+@pytest.mark.parametrize('pivot_source', [PivotSource.Close, PivotSource.HighLow])
+@pytest.mark.parametrize('n', [0, 3, 6, 7, 12, 500])
+@pytest.mark.parametrize('nans', [False, True])
+def test_pivot_points_match_the_deque_walk(window, pivot_source, n, nans):
+    frame = candles(n, n + window, nans)
+    pd.testing.assert_frame_equal(pivot_points(frame, window, pivot_source),
+                                  reference_pivot_points(frame, window, pivot_source))
+
+
+def reference_divergences(frame: DataFrame) -> DataFrame:
+    frame = frame.copy()
+    initialize_divergences_lists(frame)
+    for indicator in INDICATORS:
+        add_divergences(frame, indicator)
+    return frame
+
+
+@pytest.mark.parametrize('seed', range(4))
+@pytest.mark.parametrize('nans', [False, True])
+def test_divergences_match_the_finder(seed, nans):
+    frame = candles(600, seed, nans)
+    frame = pd.concat([frame, pivot_points(frame)], axis=1)
+    expected = reference_divergences(frame)
+    result = divergences(frame, INDICATORS)
+
+    for side, pivot_column in (('bearish', 'pivot_highs'), ('bullish', 'pivot_lows')):
+        # The old finder read the first pivots' predecessors through negative list indices,
+        # the next pivots of the frame; they are left out
+        early = np.flatnonzero(frame[pivot_column].notna())[:5]
+        rows = np.setdiff1d(np.arange(len(frame)), early)
+        labels = np.setdiff1d(np.arange(len(frame)), early - 30)
+        found = 0
+        for indicator in INDICATORS:
+            column = f'{side}_divergence_{indicator}_occurence'
+            np.testing.assert_array_equal(result[column].to_numpy()[rows], expected[column].to_numpy()[rows])
+            found += result[column].notna().sum()
+        assert found >= 5
+        column = f'total_{side}_divergences'
+        np.testing.assert_array_equal(result[column].to_numpy()[rows], expected[column].to_numpy()[rows])
+        for column in (f'total_{side}_divergences_count', f'total_{side}_divergences_names'):
+            assert result[column].to_numpy()[labels].tolist() == expected[column].to_numpy()[labels].tolist()
+
+
+def test_no_pivots_and_no_indicators():
+    frame = candles(50, 0)
+    frame['pivot_highs'] = np.nan
+    frame['pivot_lows'] = np.nan
+    result = divergences(frame, INDICATORS)
+    assert result.filter(like='_occurence').isna().all().all()
+    assert not result['total_bearish_divergences_count'].any()
+
+    frame = pd.concat([candles(50, 0), pivot_points(candles(50, 0))], axis=1)
+    result = divergences(frame, [])
+    assert list(result.columns) == [
+        'total_bearish_divergences', 'total_bearish_divergences_count', 'total_bearish_divergences_names',
+        'total_bullish_divergences', 'total_bullish_divergences_count', 'total_bullish_divergences_names']
+    assert result['total_bullish_divergences'].isna().all()
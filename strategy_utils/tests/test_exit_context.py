@@ -0,0 +1,123 @@
+"""
+``ExitContext`` against the rows NostalgiaForInfinityNext's ``custom_sell`` used to take with
+``iloc`` and the date filter that found the buy signal candle (kept below as they were).
+"""
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from strategy_utils.exit_context import ExitContext, ExitContextCache
+
+
+def legacy_candles(dataframe: DataFrame, trade_open_date):
+    last_candle = dataframe.iloc[-1].squeeze()
+    previous_candle_1 = dataframe.iloc[-2].squeeze()
+    previous_candle_2 = dataframe.iloc[-3].squeeze()
+    previous_candle_3 = dataframe.iloc[-4].squeeze()
+    previous_candle_4 = dataframe.iloc[-5].squeeze()
+    previous_candle_5 = dataframe.iloc[-6].squeeze()
+
+    buy_signal_candle = None
+    buy_signal = dataframe.loc[dataframe['date'] < trade_open_date]
+    if not buy_signal.empty:
+        buy_signal_candle = buy_signal.iloc[-1].squeeze()
+
+    return [last_candle, previous_candle_1, previous_candle_2, previous_candle_3,
+            previous_candle_4, previous_candle_5], buy_signal_candle
+
+
+def analyzed_frame(n: int, seed: int) -> DataFrame:
+    """Candles on 5 minutes with float, int, bool, NaN and string columns."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    rsi = rng.uniform(0, 100, n)
+    rsi[rng.random(n) < 0.1] = np.nan
+    return DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n, freq='5min', tz='UTC'),
+        'close': close,
+        'volume': rng.integers(0, 1000, n),
+        'rsi_14': rsi,
+        'buy': rng.random(n) < 0.3,
+        'buy_tag': rng.choice(['1 ', '2 4 ', ''], n),
+    })
+
+
+def assert_same_candle(record, row):
+    for column, value in row.items():
+        if isinstance(value, float) and np.isnan(value):
+            assert np.isnan(record[column])
+        else:
+            assert record[column] == value, column
+
+
+def open_dates(dataframe: DataFrame) -> list:
+    first, last = dataframe['date'].iloc[0], dataframe['date'].iloc[-1]
+    return [
+        first - timedelta(minutes=5), first, first + timedelta(minutes=2),
+        dataframe['date'].iloc[37], dataframe['date'].iloc[37] + timedelta(seconds=1),
+        last, last + timedelta(hours=1),
+        # Trades carry a datetime, possibly in another time zone
+        datetime(2021, 1, 1, 5, 3, tzinfo=timezone.utc),
+        datetime(2021, 1, 1, 9, 0, tzinfo=timezone(timedelta(hours=2))),
+    ]
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_context_matches_the_rows(seed):
+    dataframe = analyzed_frame(200, seed)
+    cache = ExitContextCache()
+    for open_date in open_dates(dataframe):
+        expected, expected_signal = legacy_candles(dataframe, open_date)
+        candles = cache.context('BTC/USDT', dataframe)
+        for shift, row in enumerate(expected):
+            assert_same_candle(candles.candle(shift), row)
+        signal = candles.signal_candle(open_date)
+        if expected_signal is None:
+            assert signal is None
+        else:
+            assert_same_candle(signal, expected_signal)
+            # Memoized per open date
+            assert candles.signal_candle(open_date) is signal
+
+
+def test_records_read_only_the_columns_asked_for():
+    dataframe = analyzed_frame(50, 0)
+    candles = ExitContext(dataframe)
+    last = candles.candle(0)
+    assert candles.candle(0) is last
+    assert last['close'] == dataframe['close'].iat[-1]
+    assert candles.candle(3)['close'] == dataframe['close'].iat[-4]
+    assert list(candles._columns) == ['close']
+
+    assert 'rsi_14' in last and 'sma_200' not in last
+    assert last.get('sma_200', 7) == 7
+    assert last.get('volume') == dataframe['volume'].iat[-1]
+    with pytest.raises(KeyError):
+        last['sma_200']
+    with pytest.raises(IndexError):
+        candles.candle(50)
+    with pytest.raises(IndexError):
+        candles.candle(-1)
+
+
+def test_cache_rebuilds_when_the_frame_changes():
+    history = analyzed_frame(300, 1)
+    cache = ExitContextCache()
+    frame = history.iloc[:200]
+    context = cache.context('BTC/USDT', frame)
+    # Every trade of the pair and every loop of the candle
+    assert cache.context('BTC/USDT', frame.copy()) is context
+    other = cache.context('ETH/USDT', frame)
+    assert other is not context
+
+    moved = history.iloc[1:201]
+    assert cache.context('BTC/USDT', moved) is not context
+    assert cache.context('BTC/USDT', moved).candle(0)['close'] == moved['close'].iat[-1]
+
+    cache.reset('BTC/USDT')
+    assert cache.context('ETH/USDT', frame) is other
+    cache.reset()
+    assert cache.context('ETH/USDT', frame) is not other
@@ -0,0 +1,136 @@
+"""
+``causal_extrema`` and ``ExtremaTracker`` against the slice loop of Minmax (kept below as it
+was, the frame and lookback sizes made parameters), and ``relative_extrema`` against
+``scipy.signal.argrelextrema``.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from strategy_utils.extrema import ExtremaTracker, causal_extrema, relative_extrema
+
+signal = pytest.importorskip('scipy.signal')
+argrelextrema = signal.argrelextrema
+
+
+def reference_minmax(dataframe: DataFrame, frame_size: int = 500, lookback_size: int = 100) -> DataFrame:
+    dataframe_copy = dataframe.copy()
+    len_df = len(dataframe)
+    dataframe['buy_signal'] = False
+    dataframe['sell_signal'] = False
+    # Let's calculate argrelextrema on separated data slices and get only last result to avoid lookahead bias!
+    for i in range(len_df):
+        if i + frame_size < len_df:
+            slice = dataframe_copy[i : i+frame_size]
+            min_peaks = argrelextrema(slice['close'].values, np.less, order=lookback_size)
+            max_peaks = argrelextrema(slice['close'].values, np.greater, order=lookback_size)
+            # Somehow we never getting last index of a frame as min or max. What a surprise :)
+            # So lets take penultimate result and use it as a signal to buy/sell.
+            if len(min_peaks[0]) and min_peaks[0][-1] == frame_size - 2:
+                # signal that penultimate candle is min
+                # lets buy here
+                dataframe.at[i + frame_size,'buy_signal'] = True
+            if len(max_peaks[0]) and max_peaks[0][-1] == frame_size - 2:
+                # oh it seams that penultimate candle is max
+                # lets sell ASAP
+                dataframe.at[i + frame_size, 'sell_signal'] = True
+    return dataframe
+
+
+def minmax_signals(min_peaks: np.ndarray, max_peaks: np.ndarray, frame_size: int = 500):
+    # What Minmax.populate_indicators does with the confirmed extrema
+    buy_signal = np.zeros(len(min_peaks), dtype=bool)
+    sell_signal = np.zeros(len(max_peaks), dtype=bool)
+    buy_signal[frame_size:] = min_peaks[frame_size - 1:-1]
+    sell_signal[frame_size:] = max_peaks[frame_size - 1:-1]
+    return buy_signal, sell_signal
+
+
+def random_closes(n: int, seed: int) -> np.ndarray:
+    """Random walk in 0.1 ticks, flat half of the time, with a few NaNs."""
+    rng = np.random.default_rng(seed)
+    close = 100 + 0.1 * np.cumsum(rng.choice([-1, 0, 0, 1], n))
+    close[rng.random(n) < 0.005] = np.nan
+    return close
+
+
+def candles(close: np.ndarray) -> DataFrame:
+    return DataFrame({
+        'date': pd.date_range('2021-01-01', periods=len(close), freq='5min', tz='UTC'),
+        'close': close,
+    })
+
+
+@pytest.mark.parametrize('frame_size, lookback_size, n', [(500, 100, 1500), (40, 10, 1500), (12, 3, 600)])
+@pytest.mark.parametrize('seed', range(3))
+def test_causal_extrema_match_the_minmax_slices(frame_size, lookback_size, n, seed):
+    close = random_closes(n, seed)
+    expected = reference_minmax(candles(close), frame_size, lookback_size)
+
+    min_peaks, max_peaks = causal_extrema(close, lookback_size, 1)
+    buy_signal, sell_signal = minmax_signals(min_peaks, max_peaks, frame_size)
+    np.testing.assert_array_equal(buy_signal, expected['buy_signal'].to_numpy(dtype=bool))
+    np.testing.assert_array_equal(sell_signal, expected['sell_signal'].to_numpy(dtype=bool))
+
+
+def test_short_frames_have_no_signal():
+    close = random_closes(500, 0)
+    buy_signal, sell_signal = minmax_signals(*causal_extrema(close, 100, 1))
+    assert not buy_signal.any() and not sell_signal.any()
+
+
+@pytest.mark.parametrize('frame_size, lookback_size', [(500, 100), (40, 10)])
+@pytest.mark.parametrize('seed', range(3))
+def test_tracker_on_a_window_moving_one_candle_forward(frame_size, lookback_size, seed):
+    history = random_closes(900, seed)
+    frames = candles(history)
+    expected = reference_minmax(frames.copy(), frame_size, lookback_size)
+    causal = causal_extrema(history, lookback_size, 1)
+    window = 600
+
+    tracker = ExtremaTracker(before=lookback_size, after=1)
+    for start in range(0, len(history) - window + 1):
+        frame = frames.iloc[start:start + window].reset_index(drop=True)
+        min_peaks, max_peaks = tracker.update('BTC/USDT', frame)
+        np.testing.assert_array_equal(min_peaks, causal[0][start:start + window])
+        np.testing.assert_array_equal(max_peaks, causal[1][start:start + window])
+
+        # A signal only depends on the slice before it, so the signals of the whole history apply
+        buy_signal, sell_signal = minmax_signals(min_peaks, max_peaks, frame_size)
+        np.testing.assert_array_equal(
+            buy_signal[frame_size:], expected['buy_signal'].to_numpy(dtype=bool)[start + frame_size:start + window])
+        np.testing.assert_array_equal(
+            sell_signal[frame_size:], expected['sell_signal'].to_numpy(dtype=bool)[start + frame_size:start + window])
+
+
+def test_tracker_recomputes_a_frame_that_does_not_continue_the_history():
+    frames = candles(random_closes(900, 0))
+    tracker = ExtremaTracker(before=10, after=1)
+    tracker.update('BTC/USDT', frames.iloc[:600].reset_index(drop=True))
+
+    gap = frames.iloc[[*range(0, 300), *range(301, 700)]].reset_index(drop=True)
+    lows, highs = tracker.update('BTC/USDT', gap)
+    expected_lows, expected_highs = causal_extrema(gap['close'].to_numpy(), 10, 1)
+    np.testing.assert_array_equal(lows, expected_lows)
+    np.testing.assert_array_equal(highs, expected_highs)
+
+
+@pytest.mark.parametrize('order', [1, 2, 5, 100])
+@pytest.mark.parametrize('n', [1, 2, 3, 10, 1000])
+@pytest.mark.parametrize('seed', range(3))
+def test_relative_extrema_match_argrelextrema(order, n, seed):
+    x = random_closes(n, seed)
+    if n >= 10:
+        # NaNs at both ends and in the middle, on top of the random ones
+        x[[0, n // 2, n - 1]] = np.nan
+    lows, highs = relative_extrema(x, order)
+    np.testing.assert_array_equal(lows, argrelextrema(x, np.less, order=order)[0])
+    np.testing.assert_array_equal(highs, argrelextrema(x, np.greater, order=order)[0])
+
+
+def test_relative_extrema_reject_order_zero():
+    with pytest.raises(ValueError):
+        relative_extrema(random_closes(10, 0), 0)
+    with pytest.raises(ValueError):
+        argrelextrema(random_closes(10, 0), np.less, order=0)
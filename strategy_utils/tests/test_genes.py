@@ -0,0 +1,196 @@
+"""
+``gene_calculator`` and ``GeneCache`` against the ``gene_calculator`` GodStraNew, GodStraNew40,
+GodStraNew_SMAonly and DevilStra copied (kept below as it was, without the prints).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+ta = pytest.importorskip('talib.abstract')
+
+from strategy_utils.genes import GeneCache, gene_calculator, reachable_genes, trend_gene  # noqa: E402
+
+TREND_CHECK_CANDLES = 4
+
+# One of each gene shape: no period, period, output-period and the two trend forms
+GENES = ['BOP', 'SMA-9', 'RSI-14', 'ADD-20', 'ASIN-6', 'CDLHAMMER-50', 'CDLEVENINGSTAR-12',
+         'BBANDS-1-20', 'STOCH-0-5', 'SMA-9-SMA-4', 'CDLHAMMER-5-SMA-4', 'BBANDS-2-20-SMA-4',
+         'AROON-1-14-SMA-4']
+
+
+def normalize(df):
+    df = (df-df.min())/(df.max()-df.min())
+    return df
+
+
+def legacy_gene_calculator(dataframe, indicator):
+    # Cuz Timeperiods not effect calculating CDL patterns recognations
+    if 'CDL' in indicator:
+        splited_indicator = indicator.split('-')
+        splited_indicator[1] = "0"
+        new_indicator = "-".join(splited_indicator)
+        indicator = new_indicator
+
+    gene = indicator.split("-")
+
+    gene_name = gene[0]
+    gene_len = len(gene)
+
+    if indicator in dataframe.keys():
+        return dataframe[indicator]
+    else:
+        result = None
+        # For Pattern Recognations
+        if gene_len == 1:
+            result = getattr(ta, gene_name)(
+                dataframe
+            )
+            return normalize(result)
+        elif gene_len == 2:
+            gene_timeperiod = int(gene[1])
+            result = getattr(ta, gene_name)(
+                dataframe,
+                timeperiod=gene_timeperiod,
+            )
+            return normalize(result)
+        # For
+        elif gene_len == 3:
+            gene_timeperiod = int(gene[2])
+            gene_index = int(gene[1])
+            result = getattr(ta, gene_name)(
+                dataframe,
+                timeperiod=gene_timeperiod,
+            ).iloc[:, gene_index]
+            return normalize(result)
+        # For trend operators(MA-5-SMA-4)
+        elif gene_len == 4:
+            gene_timeperiod = int(gene[1])
+            sharp_indicator = f'{gene_name}-{gene_timeperiod}'
+            dataframe[sharp_indicator] = getattr(ta, gene_name)(
+                dataframe,
+                timeperiod=gene_timeperiod,
+            )
+            return normalize(ta.SMA(dataframe[sharp_indicator].fillna(0), TREND_CHECK_CANDLES))
+        # For trend operators(STOCH-0-4-SMA-4)
+        elif gene_len == 5:
+            gene_timeperiod = int(gene[2])
+            gene_index = int(gene[1])
+            sharp_indicator = f'{gene_name}-{gene_index}-{gene_timeperiod}'
+            dataframe[sharp_indicator] = getattr(ta, gene_name)(
+                dataframe,
+                timeperiod=gene_timeperiod,
+            ).iloc[:, gene_index]
+            return normalize(ta.SMA(dataframe[sharp_indicator].fillna(0), TREND_CHECK_CANDLES))
+
+
+def candles(n: int, seed: int) -> DataFrame:
+    """Geometric random walk candles on 5 minutes."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n, freq='5min', tz='UTC'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + 0.005 * rng.random(n)),
+        'low': np.minimum(open_, close) * (1 - 0.005 * rng.random(n)),
+        'close': close,
+        'volume': 1000 * rng.random(n),
+    })
+
+
+def assert_same_columns(result: DataFrame, expected: DataFrame):
+    assert list(result.columns) == list(expected.columns)
+    for column in expected.columns:
+        np.testing.assert_array_equal(result[column].to_numpy(), expected[column].to_numpy(), err_msg=column)
+
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_gene_calculator_matches_the_copies(cached):
+    dataframe = candles(500, 0)
+    expected = dataframe.copy()
+    cache = GeneCache()
+    # A second epoch on the same candles reads every gene from the cache
+    for _ in range(2 if cached else 1):
+        result = dataframe.copy()
+        genes = cache.bind('BTC/USDT', result) if cached else None
+        for gene in GENES:
+            result[gene] = gene_calculator(result, gene, genes)
+    for gene in GENES:
+        expected[gene] = legacy_gene_calculator(expected, gene)
+    assert_same_columns(result, expected)
+
+
+def test_existing_columns_win():
+    dataframe = candles(200, 1)
+    dataframe['SMA-9'] = 1.0
+    dataframe['CDLHAMMER-0'] = 2.0
+    assert (gene_calculator(dataframe, 'SMA-9') == 1).all()
+    assert (gene_calculator(dataframe, 'CDLHAMMER-50', GeneCache().bind('BTC/USDT', dataframe)) == 2).all()
+
+
+def test_cache_is_keyed_by_pair_and_candles():
+    history = candles(600, 2)
+    cache = GeneCache()
+    frame = history.iloc[:500]
+    fingerprint = cache.bind('BTC/USDT', frame).fingerprint
+    first = cache.values('BTC/USDT', fingerprint, frame, 'SMA-9')
+    np.testing.assert_array_equal(first[0], legacy_gene_calculator(frame.copy(), 'SMA-9').to_numpy())
+    # Each epoch hands over a copy of the same candles
+    assert cache.values('BTC/USDT', fingerprint, frame.copy(), 'SMA-9') is first
+    assert len(cache) == 1
+    # CDL genes share their entry whatever the period
+    cache.values('BTC/USDT', fingerprint, frame, 'CDLHAMMER-5')
+    cache.values('BTC/USDT', fingerprint, frame, 'CDLHAMMER-50')
+    assert len(cache) == 2
+
+    moved = cache.bind('BTC/USDT', history.iloc[1:501]).get('SMA-9')[0]
+    np.testing.assert_array_equal(moved.to_numpy(), legacy_gene_calculator(history.iloc[1:501].copy(), 'SMA-9').to_numpy())
+    assert len(cache) == 3
+    cache.bind('ETH/USDT', frame).get('SMA-9')
+    assert len(cache) == 4
+    cache.reset('BTC/USDT')
+    assert len(cache) == 1 and cache.nbytes == len(frame) * 8
+    cache.reset()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_cache_evicts_the_least_recently_used_genes():
+    dataframe = candles(1000, 3)
+    # Room for three genes of 1000 floats
+    cache = GeneCache(max_bytes=3 * 8000)
+    genes = cache.bind('BTC/USDT', dataframe)
+    for gene in ['SMA-5', 'SMA-6', 'SMA-7']:
+        genes.get(gene)
+    genes.get('SMA-5')
+    genes.get('SMA-8')
+    keys = [key[2] for key in cache._entries]
+    assert keys == ['SMA-7', 'SMA-5', 'SMA-8'] and cache.nbytes == 3 * 8000
+
+    # A trend gene keeps its raw column too, and is never evicted as it is added
+    genes.get('SMA-9-SMA-4')
+    assert [key[2] for key in cache._entries] == ['SMA-8', 'SMA-9-SMA-4']
+    small = GeneCache(max_bytes=1000)
+    small.bind('BTC/USDT', dataframe).get('SMA-9-SMA-4')
+    assert len(small) == 1 and small.nbytes == 2 * 8000
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_precompute_fills_the_cache(processes):
+    dataframe = candles(500, 4)
+    genes = reachable_genes(['SMA-9', 'CDLHAMMER-5', 'CDLHAMMER-50', 'BBANDS-1-20'], ['>', 'UT'])
+    assert genes == ['SMA-9', 'CDLHAMMER-0', 'BBANDS-1-20', 'SMA-9-SMA-4', 'CDLHAMMER-0-SMA-4', 'BBANDS-1-20-SMA-4']
+    assert reachable_genes(['SMA-9'], ['>', 'C']) == ['SMA-9']
+
+    cache = GeneCache()
+    assert cache.precompute('BTC/USDT', dataframe, genes, processes) == len(genes)
+    assert cache.precompute('BTC/USDT', dataframe, genes, processes) == 0
+
+    result = dataframe.copy()
+    expected = dataframe.copy()
+    bound = cache.bind('BTC/USDT', result)
+    for gene in genes + [trend_gene('SMA-9')]:
+        result[gene] = gene_calculator(result, gene, bound)
+        expected[gene] = legacy_gene_calculator(expected, gene)
+    assert len(cache) == len(genes)
+    assert_same_columns(result, expected)
@@ -0,0 +1,110 @@
+"""
+``heikin_ashi`` and ``bbw_expansion`` against the ``HA()`` helper and the rolling
+``bbw_expansion`` callback of the CryptoFrog strategies (kept below as they were).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame, Series
+
+from strategy_utils.heikin_ashi import heikin_ashi, bbw_expansion
+
+ta = pytest.importorskip('talib.abstract')
+
+
+class CryptoFrogHelpers:
+    ## smoothed Heiken Ashi
+    def HA(self, dataframe, smoothing=None):
+        df = dataframe.copy()
+
+        df['HA_Close']=(df['open'] + df['high'] + df['low'] + df['close'])/4
+
+        df.reset_index(inplace=True)
+
+        ha_open = [ (df['open'][0] + df['close'][0]) / 2 ]
+        [ ha_open.append((ha_open[i] + df['HA_Close'].values[i]) / 2) for i in range(0, len(df)-1) ]
+        df['HA_Open'] = ha_open
+
+        df.set_index('index', inplace=True)
+
+        df['HA_High']=df[['HA_Open','HA_Close','high']].max(axis=1)
+        df['HA_Low']=df[['HA_Open','HA_Close','low']].min(axis=1)
+
+        if smoothing is not None:
+            sml = abs(int(smoothing))
+            if sml > 0:
+                df['Smooth_HA_O']=ta.EMA(df['HA_Open'], sml)
+                df['Smooth_HA_C']=ta.EMA(df['HA_Close'], sml)
+                df['Smooth_HA_H']=ta.EMA(df['HA_High'], sml)
+                df['Smooth_HA_L']=ta.EMA(df['HA_Low'], sml)
+
+        return df
+
+    ## detect BB width expansion to indicate possible volatility
+    def bbw_expansion(self, bbw_rolling, mult=1.1):
+        bbw = list(bbw_rolling)
+
+        m = 0.0
+        for i in range(len(bbw)-1):
+            if bbw[i] > m:
+                m = bbw[i]
+
+        if (bbw[-1] > (m * mult)):
+            return 1
+        return 0
+
+
+def random_candles(n: int, seed: int, start: int = 0, nan_closes: bool = False) -> DataFrame:
+    """Random walk OHLC on an index starting at ``start``, optionally with NaN closes."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(size=n))
+    open_ = close + rng.normal(size=n)
+    frame = DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n, freq='5min', tz='UTC'),
+        'open': open_,
+        'high': np.maximum(open_, close) + rng.random(n),
+        'low': np.minimum(open_, close) - rng.random(n),
+        'close': close,
+        'volume': rng.integers(0, 1000, size=n).astype(float),
+    }, index=pd.RangeIndex(start, start + n))
+    if nan_closes:
+        frame.loc[frame.index[rng.random(n) < 0.01], 'close'] = np.nan
+    return frame
+
+
+@pytest.mark.parametrize('smoothing', [None, 0, 4, -3])
+@pytest.mark.parametrize('n, start, nan_closes', [
+    (1, 0, False), (2, 0, False), (5000, 0, False), (5000, 1000, False), (5000, 0, True),
+], ids=['one', 'two', 'plain', 'offset-index', 'nan-closes'])
+def test_heikin_ashi_matches_the_ha_loop(smoothing, n, start, nan_closes):
+    dataframe = random_candles(n, seed=n + start, start=start, nan_closes=nan_closes)
+    before = dataframe.copy()
+    expected = CryptoFrogHelpers().HA(dataframe, smoothing)
+
+    result = heikin_ashi(dataframe, smoothing)
+    pd.testing.assert_frame_equal(dataframe, before)
+    assert list(result.columns) == list(expected.columns)
+    np.testing.assert_array_equal(result.index, expected.index)
+    for column in expected.columns:
+        np.testing.assert_array_equal(result[column].to_numpy(), expected[column].to_numpy(), err_msg=column)
+
+
+def random_widths(n: int, seed: int) -> Series:
+    """Band widths with a 19 candle warm-up, NaN gaps, flat runs and a few negative widths."""
+    rng = np.random.default_rng(seed)
+    width = np.round(rng.lognormal(-3, 0.5, size=n), 3)
+    width[rng.random(n) < 0.2] = np.nan
+    width = Series(width).ffill().to_numpy(copy=True)
+    width[rng.random(n) < 0.01] = np.nan
+    width[rng.random(n) < 0.01] *= -1
+    width[:19] = np.nan
+    return Series(width, name='bb_width')
+
+
+@pytest.mark.parametrize('n', [1, 4, 25, 5000])
+@pytest.mark.parametrize('seed', range(3))
+def test_bbw_expansion_matches_the_rolling_callback(n, seed):
+    bb_width = random_widths(n, seed)
+    expected = bb_width.rolling(window=4).apply(CryptoFrogHelpers().bbw_expansion)
+
+    np.testing.assert_array_equal(bbw_expansion(bb_width).to_numpy(), expected.to_numpy())
@@ -0,0 +1,72 @@
+"""
+``IncrementalIndicators`` against the indicators the backtest path of BBRSIStrategy /
+BBRSINaiveStrategy computes: ``qtpylib.bollinger_bands`` of the typical price and talib RSI.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategy_utils.incremental import IncrementalIndicators, Indicator
+
+qtpylib = pytest.importorskip('freqtrade.vendor.qtpylib.indicators')
+ta = pytest.importorskip('talib.abstract')
+
+WINDOW = 20
+LIVE_CANDLES = 400
+
+# The declaration of BBRSIStrategy / BBRSINaiveStrategy
+INDICATORS = {
+    'rsi': Indicator('rsi', 'close', 14),
+    'bb_mid': Indicator('sma', 'hlc3', WINDOW, min_periods=1),
+    'bb_std': Indicator('std', 'hlc3', WINDOW, ddof=1, min_periods=1),
+}
+
+
+def candles(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[100, close[:-1]]
+    high = np.maximum(open_, close) * (1 + rng.random(n) * 0.005)
+    low = np.minimum(open_, close) * (1 - rng.random(n) * 0.005)
+    return pd.DataFrame({'date': pd.date_range('2022-01-01', periods=n, freq='5min', tz='UTC'),
+                         'open': open_, 'high': high, 'low': low, 'close': close,
+                         'volume': rng.random(n) * 1000})
+
+
+def assert_bands_match(columns: pd.DataFrame, dataframe: pd.DataFrame, rows: slice = slice(None)) -> None:
+    for stds in (1, 4):
+        bands = qtpylib.bollinger_bands(qtpylib.typical_price(dataframe), window=WINDOW, stds=stds)
+        for name, values in (('upper', columns['bb_mid'] + columns['bb_std'] * stds),
+                             ('lower', columns['bb_mid'] - columns['bb_std'] * stds)):
+            np.testing.assert_allclose(values.to_numpy()[rows], bands[name].to_numpy()[rows],
+                                       rtol=1e-10, atol=1e-10, err_msg=f'{name} {stds}sd')
+
+
+def test_compute_matches_qtpylib_from_the_first_row():
+    dataframe = candles(1000)
+    columns = IncrementalIndicators(INDICATORS).compute(dataframe)
+    assert_bands_match(columns, dataframe)
+    np.testing.assert_allclose(columns['rsi'], ta.RSI(dataframe), rtol=1e-10, equal_nan=True)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_update_matches_qtpylib_on_a_moving_window(seed):
+    history = candles(LIVE_CANDLES + 300, seed)
+    indicators = IncrementalIndicators(INDICATORS)
+    for stop in range(LIVE_CANDLES, len(history) + 1):
+        dataframe = history.iloc[stop - LIVE_CANDLES:stop].reset_index(drop=True)
+        # The forming candle first, then the closed one
+        forming = dataframe.copy()
+        forming.iloc[-1, forming.columns.get_loc('close')] = forming['open'].iloc[-1]
+        indicators.update('ETH/USDT', forming)
+        columns = indicators.update('ETH/USDT', dataframe)
+
+        if stop == LIVE_CANDLES:
+            # Computed from scratch: the growing windows of the first rows too
+            assert_bands_match(columns, dataframe)
+        else:
+            # The first rows keep the values of full windows from earlier candles
+            assert_bands_match(columns, dataframe, slice(WINDOW - 1, None))
+        # RSI carries on over the whole history seen
+        np.testing.assert_allclose(columns['rsi'].iloc[-50:],
+                                   ta.RSI(history.iloc[:stop]).iloc[-50:], rtol=1e-9)
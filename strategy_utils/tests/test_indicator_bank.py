@@ -0,0 +1,82 @@
+"""``BankStore`` persistence: opt-in, keyed on the candles themselves, size capped."""
+import os
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from strategy_utils.indicator_bank import BankStore, bank_directory, candles_digest
+from strategy_utils.indicator_store import frame_fingerprint
+
+
+def candles(n: int = 300, seed: int = 0) -> DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(size=n))
+    return DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n, freq='5min', tz='UTC'),
+        'open': close, 'high': close + 1, 'low': close - 1, 'close': close, 'volume': rng.random(n),
+    })
+
+
+class CountingFamily:
+    """A rolling mean that counts how often it is computed."""
+    __name__ = 'counting_mean'
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, dataframe: DataFrame, param: int):
+        self.calls += 1
+        return dataframe['close'].rolling(param).mean()
+
+
+def config(tmp_path, **bank) -> dict:
+    return {'runmode': 'backtest', 'user_data_dir': tmp_path, 'indicator_bank': bank}
+
+
+def test_persistence_is_opt_in(tmp_path):
+    assert bank_directory({'runmode': 'backtest', 'user_data_dir': tmp_path}) is None
+    assert bank_directory(config(tmp_path, persist=False)) is None
+    assert bank_directory(config(tmp_path, persist=True)) == tmp_path / 'indicator_bank'
+    assert bank_directory({**config(tmp_path, persist=True), 'runmode': 'live'}) is None
+
+
+def test_saved_banks_are_loaded_for_the_same_candles(tmp_path):
+    family = CountingFamily()
+    dataframe = candles()
+    first = BankStore().configure(config(tmp_path, persist=True)).get('ETH/USDT', dataframe, family, [5, 10])
+
+    second = BankStore().configure(config(tmp_path, persist=True)).get('ETH/USDT', dataframe.copy(), family, [5, 10])
+
+    assert family.calls == 2
+    np.testing.assert_array_equal(second.values, first.values)
+
+
+def test_corrected_candles_are_not_served_stale_banks(tmp_path):
+    family = CountingFamily()
+    dataframe = candles()
+    BankStore().configure(config(tmp_path, persist=True)).get('ETH/USDT', dataframe, family, [5])
+    corrected = dataframe.copy()
+    corrected.loc[100, 'close'] += 1
+    assert frame_fingerprint(corrected) == frame_fingerprint(dataframe)
+    assert candles_digest(corrected) != candles_digest(dataframe)
+
+    bank = BankStore().configure(config(tmp_path, persist=True)).get('ETH/USDT', corrected, family, [5])
+
+    assert family.calls == 2
+    np.testing.assert_array_equal(bank.column(5), corrected['close'].rolling(5).mean().to_numpy())
+
+
+def test_least_recently_used_files_are_deleted_over_the_cap(tmp_path):
+    family = CountingFamily()
+    # One bank of 2 x 300 float64 is about 4.8 kB
+    store = BankStore().configure(config(tmp_path, persist=True, max_size_mb=12_000 / 2 ** 20))
+    directory = tmp_path / 'indicator_bank'
+    for seed in range(5):
+        store.get(f'PAIR{seed}/USDT', candles(seed=seed), family, [5, 10])
+        # Distinct modification times whatever the file system's resolution
+        for path in directory.glob(f'PAIR{seed}_*.npy'):
+            os.utime(path, (1_600_000_000 + seed, 1_600_000_000 + seed))
+
+    files = sorted(path.name.split('_')[0] for path in directory.glob('*.npy'))
+    assert files == ['PAIR3', 'PAIR4']
@@ -0,0 +1,113 @@
+"""
+``IndicatorStore`` and ``IndicatorCache`` against the column loop of Persia's
+``populate_indicators`` (kept below as it was).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+ta = pytest.importorskip('talib.abstract')
+
+from strategy_utils.indicator_store import IndicatorCache, IndicatorStore  # noqa: E402
+
+# Persia's own indicators and periods, and talib functions with several outputs or no period
+INDICATORS = ['SMA', 'EMA', 'TEMA', 'DEMA', 'RSI', 'BBANDS', 'AROON', 'MACD', 'STOCH', 'BOP', 'OBV', 'HT_TRENDLINE']
+TIMEFRAMES = [3, 7, 9, 21, 27, 63, 81, 189]
+
+
+def persia_indicators(dataframe: DataFrame, indicators, timeframes) -> DataFrame:
+    dataframe1 = dataframe.shift(1)
+    for indicator in indicators:
+        for tf_idx in timeframes:
+            tf_idx = int(tf_idx)
+            try:
+                dataframe[f'{indicator}-{tf_idx}'] = getattr(
+                    ta, indicator)(dataframe1, timeperiod=tf_idx)
+            except:
+                try:
+                    dataframe[f'{indicator}-{tf_idx}'] = getattr(
+                        ta, indicator)(dataframe1, timeperiod=float(tf_idx))
+                except:
+                    try:
+                        dataframe[f'{indicator}-{tf_idx}'] = getattr(ta, indicator)(
+                            dataframe1,  timeperiod=tf_idx).iloc[:, 0]
+                    except:
+                        raise
+    return dataframe
+
+
+def candles(n: int, seed: int) -> DataFrame:
+    """Geometric random walk candles on 5 minutes."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n, freq='5min', tz='UTC'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + 0.005 * rng.random(n)),
+        'low': np.minimum(open_, close) * (1 - 0.005 * rng.random(n)),
+        'close': close,
+        'volume': 1000 * rng.random(n),
+    })
+
+
+def test_store_matches_the_column_loop():
+    dataframe = candles(1000, 0)
+    expected = persia_indicators(dataframe.copy(), INDICATORS, TIMEFRAMES)
+
+    store = IndicatorStore(dataframe, shift=1)
+    for indicator in INDICATORS:
+        for period in TIMEFRAMES:
+            np.testing.assert_array_equal(store.get(indicator, period).to_numpy(),
+                                          expected[f'{indicator}-{period}'].to_numpy(),
+                                          err_msg=f'{indicator}-{period}')
+
+
+def test_store_computes_on_first_access_and_keeps_the_column():
+    dataframe = candles(300, 1)
+    before = dataframe.copy()
+    store = IndicatorStore(dataframe, shift=1)
+    assert len(store) == 0
+
+    sma = store.get('SMA', 9)
+    assert ('SMA', 9) in store and len(store) == 1
+    # The period is read as Persia's parameters give it, as a string or a number
+    assert store.get('SMA', '9') is sma and store.get('SMA', 9.0) is sma
+    assert len(store) == 1
+    store.get('EMA', 9)
+    assert len(store) == 2
+    pd.testing.assert_frame_equal(dataframe, before)
+
+    unshifted = IndicatorStore(dataframe).get('SMA', 9)
+    np.testing.assert_array_equal(sma.to_numpy(), unshifted.shift(1).to_numpy())
+
+
+def test_cache_reuses_the_store_until_the_candles_change():
+    history = candles(600, 2)
+    cache = IndicatorCache(shift=1)
+    frame = history.iloc[:500]
+    store = cache.store('BTC/USDT', frame)
+    store.get('SMA', 21)
+
+    # Each hyperopt epoch passes a copy of the same candles
+    assert cache.store('BTC/USDT', frame.copy()) is store
+    assert ('SMA', 21) in cache.store('BTC/USDT', frame)
+    # Other pairs have their own store
+    other = cache.store('ETH/USDT', frame)
+    assert other is not store and len(other) == 0
+
+    # A new candle, or the last one updated, builds a new store
+    moved = cache.store('BTC/USDT', history.iloc[1:501])
+    assert moved is not store and len(moved) == 0
+    np.testing.assert_array_equal(moved.get('SMA', 21).to_numpy(),
+                                  IndicatorStore(history.iloc[1:501], shift=1).get('SMA', 21).to_numpy())
+    updated = history.iloc[1:501].copy()
+    updated.loc[updated.index[-1], 'close'] *= 1.01
+    assert cache.store('BTC/USDT', updated) is not moved
+
+    cache.reset('BTC/USDT')
+    assert cache.store('ETH/USDT', frame) is other
+    assert cache.store('BTC/USDT', updated) is not moved
+    cache.reset()
+    assert cache.store('ETH/USDT', frame) is not other
@@ -0,0 +1,800 @@
+"""
+The shared indicators against the copies the strategies carried before.
+
+One copy of every variant still in use is kept below as it was (docstrings left out, np.NAN
+spelled np.nan for NumPy 2), named after the first strategy that had it, with the strategies
+it was pasted into. Each is run next to what those strategies call now, on candles with flat
+bars, zero volume and missing candles, and has to give the same values to the bit.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame, Series
+
+ta = pytest.importorskip('talib.abstract')
+qtpylib = pytest.importorskip('freqtrade.vendor.qtpylib.indicators')
+
+from strategy_utils.indicators import (  # noqa: E402
+    EWO, RMI, SROC, SSLChannels_ATR, T3, VWAPB, chaikin_money_flow, moderi, pump_warning,
+    range_height, range_maxgap, range_percent_change, safe_pump, simple_heikin_ashi,
+    top_percent_change, vwma, williams_r
+)
+
+
+def candles(seed: int, n: int = 1200) -> DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 10 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]] * np.exp(rng.normal(0, 0.002, n))
+    high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, 0.004, n)))
+    low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, 0.004, n)))
+    dataframe = DataFrame({'date': pd.date_range('2022-01-01', periods=n, freq='5min', tz='UTC'),
+                           'open': open_, 'high': high, 'low': low, 'close': close,
+                           'volume': rng.lognormal(8, 1, n)})
+    # Flat candles and candles without volume
+    flat = rng.choice(n, 20, replace=False)
+    for column in ('open', 'high', 'low'):
+        dataframe.loc[flat, column] = dataframe.loc[flat, 'close']
+    dataframe.loc[rng.choice(n, 15, replace=False), 'volume'] = 0
+    if seed % 2:
+        # Missing candles and a quiet start
+        dataframe.loc[rng.choice(n, 5, replace=False), ['open', 'high', 'low', 'close']] = np.nan
+        dataframe.loc[:30, 'volume'] = 0
+    for length in (12, 24, 36, 48):
+        dataframe[f'oc_pct_change_{length}'] = (
+            (dataframe['open'].rolling(length).max() - dataframe['close'].rolling(length).min())
+            / dataframe['close'].rolling(length).min())
+    return dataframe
+
+
+def assert_same(old, new):
+    if isinstance(old, tuple):
+        assert isinstance(new, tuple) and len(new) == len(old)
+        for a, b in zip(old, new):
+            assert_same(a, b)
+        return
+    old, new = np.asarray(old), np.asarray(new)
+    assert old.shape == new.shape
+    if old.dtype.kind == 'b' or new.dtype.kind == 'b':
+        assert old.dtype.kind == new.dtype.kind == 'b'
+        np.testing.assert_array_equal(old, new)
+    else:
+        np.testing.assert_array_equal(old.astype(np.float64), new.astype(np.float64))
+
+
+# --- The strategy copies ------------------------------------------------------------------
+
+# BB_RPB_TSL_SMA_Tranz, BB_RPB_TSL_SMA_Tranz_TB_1_1_1, BB_RPB_TSL_SMA_Tranz_TB_MOD,
+# BB_RPB_TSL_Tranz, NfiNextModded, NostalgiaForInfinityNextV7155
+def vwma_BB_RPB_TSL_SMA_Tranz(dataframe: DataFrame, length: int = 10):
+    # Calculate Result
+    pv = dataframe['close'] * dataframe['volume']
+    vwma = Series(ta.SMA(pv, timeperiod=length) / ta.SMA(dataframe['volume'], timeperiod=length))
+    return vwma
+
+
+# BBMod1, BB_RPB_TSL, BB_RPB_TSL_SMA_Tranz, BB_RPB_TSL_SMA_Tranz_TB_1_1_1,
+# BB_RPB_TSL_SMA_Tranz_TB_MOD, BB_RPB_TSL_Tranz, BB_RPB_TSLmeneguzzo, NFI731_BUSD,
+# NFINextMultiOffsetAndHO, NFINextMultiOffsetAndHO2, NfiNextModded, Nostalgia,
+# NostalgiaForInfinityNext, NostalgiaForInfinityNextV7155,
+# NostalgiaForInfinityNext_ChangeToTower_V5_2, NostalgiaForInfinityNext_ChangeToTower_V5_3,
+# NostalgiaForInfinityNext_ChangeToTower_V6, NostalgiaForInfinityNext_maximizer,
+# NostalgiaForInfinityV7_7_2, SMA_BBRSI
+def moderi_BBMod1(dataframe: DataFrame, len_slow_ma: int = 32) -> Series:
+    slow_ma = Series(ta.EMA(vwma_BB_RPB_TSL_SMA_Tranz(dataframe, length=len_slow_ma), timeperiod=len_slow_ma))
+    return slow_ma >= slow_ma.shift(1)  # we just need true & false for ERI trend
+
+
+# BBMod1, BB_RPB_TSL, BB_RPB_TSL_2, BB_RPB_TSL_BI, BB_RPB_TSL_BIV1, BB_RPB_TSL_RNG,
+# BB_RPB_TSL_RNG_2, BB_RPB_TSL_RNG_TBS, BB_RPB_TSL_RNG_TBS_GOLD, BB_RPB_TSL_RNG_VWAP,
+# BB_RPB_TSL_SMA_Tranz, BB_RPB_TSL_SMA_Tranz_TB_1_1_1, BB_RPB_TSL_SMA_Tranz_TB_MOD,
+# BB_RPB_TSL_Tranz, BB_RPB_TSL_c7c477d_20211030, BB_RPB_TSLmeneguzzo, ClucHAnix5m,
+# ClucHAnix_BB_RPB_MOD, ClucHAnix_BB_RPB_MOD2_ROI, ClucHAnix_BB_RPB_MOD_CTT,
+# ClucHAnix_BB_RPB_MOD_E0V1E_ROI, Gumbo1, MacheteV8bRallimod2, MiniLambo,
+# NASOSRv6_private_Reinuvader_20211121, NASOSv4, NASOSv5, NASOSv5_mod1, NASOSv5_mod1_DanMod,
+# NotAnotherSMAOffSetStrategy_V2, NotAnotherSMAOffsetStrategy, NotAnotherSMAOffsetStrategyHO,
+# NotAnotherSMAOffsetStrategyHOv3, NotAnotherSMAOffsetStrategyModHO,
+# NotAnotherSMAOffsetStrategyModHO_LamineDz_20210901, NotAnotherSMAOffsetStrategy_uzi, RalliV1,
+# RalliV1_disable56, true_lambo
+def EWO_BBMod1(dataframe, ema_length=5, ema2_length=35):
+    df = dataframe.copy()
+    ema1 = ta.EMA(df, timeperiod=ema_length)
+    ema2 = ta.EMA(df, timeperiod=ema2_length)
+    emadif = (ema1 - ema2) / df['low'] * 100
+    return emadif
+
+
+# BBMod1, BB_RPB_TSL, BB_RPB_TSL_SMA_Tranz, BB_RPB_TSL_SMA_Tranz_TB_1_1_1,
+# BB_RPB_TSL_SMA_Tranz_TB_MOD, BB_RPB_TSL_Tranz, BB_RPB_TSLmeneguzzo, ClucHAnix_hhll
+def range_percent_change_BBMod1(dataframe: DataFrame, method, length: int) -> float:
+    if method == 'HL':
+        return (dataframe['high'].rolling(length).max() - dataframe['low'].rolling(length).min()) / dataframe[
+            'low'].rolling(length).min()
+    elif method == 'OC':
+        return (dataframe['open'].rolling(length).max() - dataframe['close'].rolling(length).min()) / dataframe[
+            'close'].rolling(length).min()
+    else:
+        raise ValueError(f"Method {method} not defined!")
+
+
+# BBMod1
+def williams_r_BBMod1(dataframe: DataFrame, period: int = 14) -> Series:
+
+    highest_high = dataframe["high"].rolling(center=False, window=period).max()
+    lowest_low = dataframe["low"].rolling(center=False, window=period).min()
+
+    wr = Series(
+        (highest_high - dataframe["close"]) / (highest_high - lowest_low),
+        name=f"{period} Williams %R",
+        )
+
+    return wr * -100
+
+
+# BBMod1, BB_RPB_TSL, BB_RPB_TSL_2, BB_RPB_TSL_BI, BB_RPB_TSL_BIV1, BB_RPB_TSL_SMA_Tranz,
+# BB_RPB_TSL_SMA_Tranz_TB_1_1_1, BB_RPB_TSL_SMA_Tranz_TB_MOD, BB_RPB_TSL_Tranz,
+# BB_RPB_TSL_c7c477d_20211030, BB_RPB_TSLmeneguzzo, ClucHAnix_hhll, NFIX_BB_RPB,
+# NFIX_BB_RPB_c7c477d_20211030, NfiNextModded, NostalgiaForInfinityNextGen,
+# NostalgiaForInfinityNextGen_TSL, NostalgiaForInfinityNextV7155,
+# NostalgiaForInfinityNext_ChangeToTower_V5_2, NostalgiaForInfinityNext_ChangeToTower_V5_3,
+# NostalgiaForInfinityNext_ChangeToTower_V6, NostalgiaForInfinityNext_maximizer,
+# NostalgiaForInfinityV7_7_2, NostalgiaForInfinityX, NostalgiaForInfinityXw
+def chaikin_money_flow_BBMod1(dataframe, n=20, fillna=False) -> Series:
+    mfv = ((dataframe['close'] - dataframe['low']) - (dataframe['high'] - dataframe['close'])) / (
+                dataframe['high'] - dataframe['low'])
+    mfv = mfv.fillna(0.0)  # float division by zero
+    mfv *= dataframe['volume']
+    cmf = (mfv.rolling(n, min_periods=0).sum()
+           / dataframe['volume'].rolling(n, min_periods=0).sum())
+    if fillna:
+        cmf = cmf.replace([np.inf, -np.inf], np.nan).fillna(0)
+    return Series(cmf, name='cmf')
+
+
+# BBMod1, BB_RPB_TSL_RNG_VWAP, NASOSv5_mod1_DanMod, VWAP, true_lambo
+def top_percent_change_BBMod1(dataframe: DataFrame, length: int) -> float:
+    if length == 0:
+        return (dataframe['open'] - dataframe['close']) / dataframe['close']
+    else:
+        return (dataframe['open'].rolling(length).max() - dataframe['close']) / dataframe['close']
+
+
+# BBRSITV, BinClucMadSMADevelop, CoreStrategy, ElliotV2, ElliotV4, ElliotV531, ElliotV5HO,
+# ElliotV5HOMod2, ElliotV5HOMod3, ElliotV7, ElliotV8HO, ElliotV8_original, Elliotv8,
+# MultiOffsetLamboV0, NotAnotherSMAOffsetStrategyX1, NotAnotherSMAOffsetStrategy_uzi3, SMAOPv1_TTF,
+# SMAOffsetProtectOpt, SMAOffsetProtectOptV0, SMAOffsetProtectOptV1, SMAOffsetProtectOptV1HO1,
+# SMAOffsetProtectOptV1Mod, SMAOffsetProtectOptV1Mod2, SMA_BBRSI, bestV2, custom
+def EWO_BBRSITV(dataframe, ema_length=5, ema2_length=35):
+    df = dataframe.copy()
+    ema1 = ta.EMA(df, timeperiod=ema_length)
+    ema2 = ta.EMA(df, timeperiod=ema2_length)
+    emadif = (ema1 - ema2) / df['close'] * 100
+    return emadif
+
+
+# CryptoFrog, CryptoFrogHO, CryptoFrogHO2, CryptoFrogHO2A, CryptoFrogHO3A1, CryptoFrogHO3A2,
+# CryptoFrogHO3A3, CryptoFrogHO3A4, CryptoFrogNFI, CryptoFrogNFIHO1A, CryptoFrogOffset, Dyna_opti,
+# MacheteV8b, MacheteV8bRallimod2, NFI46Frog, NFI46FrogZ, NFI4Frog
+def SROC_CryptoFrog(dataframe, roclen=21, emalen=13, smooth=21):
+    df = dataframe.copy()
+
+    roc = ta.ROC(df, timeperiod=roclen)
+    ema = ta.EMA(df, timeperiod=emalen)
+    sroc = ta.ROC(ema, timeperiod=smooth)
+
+    return sroc
+
+
+# BB_RPB_TSL, BB_RPB_TSL_2, BB_RPB_TSL_BI, BB_RPB_TSL_BIV1, BB_RPB_TSL_RNG, BB_RPB_TSL_RNG_2,
+# BB_RPB_TSL_RNG_TBS, BB_RPB_TSL_RNG_TBS_GOLD, BB_RPB_TSL_RNG_VWAP, BB_RPB_TSL_SMA_Tranz,
+# BB_RPB_TSL_SMA_Tranz_TB_1_1_1, BB_RPB_TSL_SMA_Tranz_TB_MOD, BB_RPB_TSL_Tranz,
+# BB_RPB_TSL_c7c477d_20211030, BB_RPB_TSLmeneguzzo, KC_BB, NFIX_BB_RPB,
+# NFIX_BB_RPB_c7c477d_20211030, NfiNextModded, NostalgiaForInfinityNextGen,
+# NostalgiaForInfinityNextGen_TSL, NostalgiaForInfinityNextV7155, NostalgiaForInfinityX,
+# NostalgiaForInfinityX2, NostalgiaForInfinityXw, adaptive, true_lambo
+def williams_r_BB_RPB_TSL(dataframe: DataFrame, period: int = 14) -> Series:
+
+    highest_high = dataframe["high"].rolling(center=False, window=period).max()
+    lowest_low = dataframe["low"].rolling(center=False, window=period).min()
+
+    WR = Series(
+        (highest_high - dataframe["close"]) / (highest_high - lowest_low),
+        name=f"{period} Williams %R",
+        )
+
+    return WR * -100
+
+
+# BB_RPB_TSL, BB_RPB_TSL_SMA_Tranz, BB_RPB_TSL_SMA_Tranz_TB_1_1_1, BB_RPB_TSL_SMA_Tranz_TB_MOD,
+# BB_RPB_TSL_Tranz, BB_RPB_TSLmeneguzzo, Gumbo1, NFIX_BB_RPB, NostalgiaForInfinityX, true_lambo
+def T3_BB_RPB_TSL(dataframe, length=5):
+    df = dataframe.copy()
+
+    df['xe1'] = ta.EMA(df['close'], timeperiod=length)
+    df['xe2'] = ta.EMA(df['xe1'], timeperiod=length)
+    df['xe3'] = ta.EMA(df['xe2'], timeperiod=length)
+    df['xe4'] = ta.EMA(df['xe3'], timeperiod=length)
+    df['xe5'] = ta.EMA(df['xe4'], timeperiod=length)
+    df['xe6'] = ta.EMA(df['xe5'], timeperiod=length)
+    b = 0.7
+    c1 = -b * b * b
+    c2 = 3 * b * b + 3 * b * b * b
+    c3 = -6 * b * b - 3 * b - 3 * b * b * b
+    c4 = 1 + 3 * b + b * b * b + 3 * b * b
+    df['T3Average'] = c1 * df['xe6'] + c2 * df['xe5'] + c3 * df['xe4'] + c4 * df['xe3']
+
+    return df['T3Average']
+
+
+# BB_RPB_TSL_SMA_Tranz, NASOSv5_mod1_DanMod, VWAP, true_lambo
+def VWAPB_BB_RPB_TSL_SMA_Tranz(dataframe, window_size=20, num_of_std=1):
+    df = dataframe.copy()
+    df['vwap'] = qtpylib.rolling_vwap(df,window=window_size)
+    rolling_std = df['vwap'].rolling(window=window_size).std()
+    df['vwap_low'] = df['vwap'] - (rolling_std * num_of_std)
+    df['vwap_high'] = df['vwap'] + (rolling_std * num_of_std)
+    return df['vwap_low'], df['vwap'], df['vwap_high']
+
+
+# BB_RPB_TSL_SMA_Tranz, BB_RPB_TSL_SMA_Tranz_TB_MOD, MultiMA_TSL3
+def pump_warning_BB_RPB_TSL_SMA_Tranz(dataframe, perc=15):
+    df = dataframe.copy()
+    df["change"] = df["high"] - df["low"]
+    df["test1"] = (df["close"] > df["open"])
+    df["test2"] = ((df["change"]/df["low"]) > (perc/100))
+    df["result"] = (df["test1"] & df["test2"]).astype('int')
+    return df['result']
+
+
+# BB_RPB_TSL_Tranz, NFIX_BB_RPB, NFIX_BB_RPB_c7c477d_20211030, NfiNextModded,
+# NostalgiaForInfinityNextV7155, NostalgiaForInfinityNext_ChangeToTower_V5_2,
+# NostalgiaForInfinityNext_ChangeToTower_V5_3, NostalgiaForInfinityNext_ChangeToTower_V6,
+# NostalgiaForInfinityNext_maximizer, NostalgiaForInfinityV7_7_2, NostalgiaForInfinityX,
+# NostalgiaForInfinityX2, NostalgiaForInfinityXw
+def ewo_BB_RPB_TSL_Tranz(dataframe, sma1_length=5, sma2_length=35):
+    sma1 = ta.EMA(dataframe, timeperiod=sma1_length)
+    sma2 = ta.EMA(dataframe, timeperiod=sma2_length)
+    smadif = (sma1 - sma2) / dataframe['close'] * 100
+    return smadif
+
+
+# BB_RPB_TSL_SMA_Tranz, BB_RPB_TSL_SMA_Tranz_TB_1_1_1, BB_RPB_TSL_SMA_Tranz_TB_MOD,
+# BB_RPB_TSL_Tranz, NFIX_BB_RPB, NFIX_BB_RPB_c7c477d_20211030, NostalgiaForInfinityNextGen,
+# NostalgiaForInfinityNextGen_TSL, NostalgiaForInfinityX, NostalgiaForInfinityX2,
+# NostalgiaForInfinityXw
+def heikin_ashi_BB_RPB_TSL_SMA_Tranz(dataframe, smooth_inputs = False, smooth_outputs = False, length = 10):
+    df = dataframe[['open','close','high','low']].copy().fillna(0)
+    if smooth_inputs:
+        df['open_s']  = ta.EMA(df['open'], timeframe = length)
+        df['high_s']  = ta.EMA(df['high'], timeframe = length)
+        df['low_s']   = ta.EMA(df['low'],  timeframe = length)
+        df['close_s'] = ta.EMA(df['close'],timeframe = length)
+
+        open_ha  = (df['open_s'].shift(1) + df['close_s'].shift(1)) / 2
+        high_ha  = df.loc[:, ['high_s', 'open_s', 'close_s']].max(axis=1)
+        low_ha   = df.loc[:, ['low_s', 'open_s', 'close_s']].min(axis=1)
+        close_ha = (df['open_s'] + df['high_s'] + df['low_s'] + df['close_s'])/4
+    else:
+        open_ha  = (df['open'].shift(1) + df['close'].shift(1)) / 2
+        high_ha  = df.loc[:, ['high', 'open', 'close']].max(axis=1)
+        low_ha   = df.loc[:, ['low', 'open', 'close']].min(axis=1)
+        close_ha = (df['open'] + df['high'] + df['low'] + df['close'])/4
+
+    open_ha = open_ha.fillna(0)
+    high_ha = high_ha.fillna(0)
+    low_ha  = low_ha.fillna(0)
+    close_ha = close_ha.fillna(0)
+
+    if smooth_outputs:
+        open_sha  = ta.EMA(open_ha, timeframe = length)
+        high_sha  = ta.EMA(high_ha, timeframe = length)
+        low_sha   = ta.EMA(low_ha, timeframe = length)
+        close_sha = ta.EMA(close_ha, timeframe = length)
+
+        return open_sha, close_sha, low_sha
+    else:
+        return open_ha, close_ha, low_ha
+
+
+# BigZ0307HO, BigZ0407, BigZ0407HO, Combined_NFIv6_SMA, Combined_NFIv7_SMA,
+# Combined_NFIv7_SMA_Rallipanos_20210707, Combined_NFIv7_SMA_bAdBoY_20211204, CryptoFrogNFI,
+# CryptoFrogNFIHO1A, CryptoFrogOffset, MultiMA_TSL, MultiMA_TSL3, MultiMA_TSL3_Mod, NFI46,
+# NFI46Frog, NFI46FrogZ, NFI46Offset, NFI46OffsetHOA1, NFI46Z, NFI47V2, NFI4Frog, NFI5MOHO,
+# NFI5MOHO2, NFI5MOHO_WIP, NFI5MOHO_WIP_1, NFI5MOHO_WIP_2, NFI7MOHO, NFINextMOHO, NFINextMOHO2,
+# NostalgiaForInfinityV4, NostalgiaForInfinityV4HO, NostalgiaForInfinityV5,
+# NostalgiaForInfinityV5MultiOffsetAndHO, NostalgiaForInfinityV5MultiOffsetAndHO2,
+# NostalgiaForInfinityV6, NostalgiaForInfinityV6HO, NostalgiaForInfinityV7,
+# NostalgiaForInfinityV7_SMA, NostalgiaForInfinityV7_SMAv2, NostalgiaForInfinityV7_SMAv2_1,
+# SampleStrategy
+def EWO_BigZ0307HO(dataframe, sma1_length=5, sma2_length=35):
+    df = dataframe.copy()
+    sma1 = ta.EMA(df, timeperiod=sma1_length)
+    sma2 = ta.EMA(df, timeperiod=sma2_length)
+    smadif = (sma1 - sma2) / df['close'] * 100
+    return smadif
+
+
+# BigZ0307HO, BigZ0407, BigZ0407HO, BigZ07Next, BigZ07Next2, Combined_NFIv6_SMA, Combined_NFIv7_SMA,
+# Combined_NFIv7_SMA_Rallipanos_20210707, Combined_NFIv7_SMA_bAdBoY_20211204, CryptoFrogNFI,
+# CryptoFrogNFIHO1A, Dracula, HarmonicDivergence, NFI46, NFI46Frog, NFI46FrogZ, NFI46Offset,
+# NFI46OffsetHOA1, NFI46Z, NFI47V2, NFI731_BUSD, NFI7MOHO, NFINextMOHO, NFINextMOHO2,
+# NFINextMultiOffsetAndHO, NFINextMultiOffsetAndHO2, Nostalgia, NostalgiaForInfinityNext,
+# NostalgiaForInfinityV6, NostalgiaForInfinityV6HO, NostalgiaForInfinityV7,
+# NostalgiaForInfinityV7_SMA, NostalgiaForInfinityV7_SMAv2, NostalgiaForInfinityV7_SMAv2_1,
+# SampleStrategy
+def chaikin_money_flow_BigZ0307HO(dataframe, n=20, fillna=False):
+    df = dataframe.copy()
+    mfv = ((df['close'] - df['low']) - (df['high'] - df['close'])) / (df['high'] - df['low'])
+    mfv = mfv.fillna(0.0)  # float division by zero
+    mfv *= df['volume']
+    cmf = (mfv.rolling(n, min_periods=0).sum()
+           / df['volume'].rolling(n, min_periods=0).sum())
+    if fillna:
+        cmf = cmf.replace([np.inf, -np.inf], np.nan).fillna(0)
+    return Series(cmf, name='cmf')
+
+
+# CombinedBinHAndClucV6H, CryptoFrog, CryptoFrogHO, CryptoFrogHO2, CryptoFrogHO2A, CryptoFrogHO3A1,
+# CryptoFrogHO3A2, CryptoFrogHO3A3, CryptoFrogHO3A4, CryptoFrogNFI, CryptoFrogNFIHO1A,
+# CryptoFrogOffset, Dyna_opti, MacheteV8b, MacheteV8bRallimod2, NFI46Frog, NFI46FrogZ, NFI4Frog
+def SSLChannels_ATR_CombinedBinHAndClucV6H(dataframe, length=7):
+    df = dataframe.copy()
+
+    df['ATR'] = ta.ATR(df, timeperiod=14)
+    df['smaHigh'] = df['high'].rolling(length).mean() + df['ATR']
+    df['smaLow'] = df['low'].rolling(length).mean() - df['ATR']
+    df['hlv'] = np.where(df['close'] > df['smaHigh'], 1, np.where(df['close'] < df['smaLow'], -1, np.nan))
+    df['hlv'] = df['hlv'].ffill()
+    df['sslDown'] = np.where(df['hlv'] < 0, df['smaHigh'], df['smaLow'])
+    df['sslUp'] = np.where(df['hlv'] < 0, df['smaLow'], df['smaHigh'])
+
+    return df['sslDown'], df['sslUp']
+
+
+# CryptoFrog, CryptoFrogHO, CryptoFrogHO2, CryptoFrogHO2A, CryptoFrogHO3A1, CryptoFrogHO3A2,
+# CryptoFrogHO3A3, CryptoFrogHO3A4, CryptoFrogNFI, CryptoFrogNFIHO1A, CryptoFrogOffset, Dyna_opti,
+# MacheteV8b, MacheteV8bRallimod2, NFI46Frog, NFI46FrogZ, NFI4Frog, custom
+def RMI_CryptoFrog(dataframe, *, length=20, mom=5):
+    df = dataframe.copy()
+
+    df['maxup'] = (df['close'] - df['close'].shift(mom)).clip(lower=0)
+    df['maxdown'] = (df['close'].shift(mom) - df['close']).clip(lower=0)
+
+    df.fillna(0, inplace=True)
+
+    df["emaInc"] = ta.EMA(df, price='maxup', timeperiod=length)
+    df["emaDec"] = ta.EMA(df, price='maxdown', timeperiod=length)
+
+    df['RMI'] = np.where(df['emaDec'] == 0, 0, 100 - 100 / (1 + df["emaInc"] / df["emaDec"]))
+
+    return df["RMI"]
+
+
+# EI3v2_tag_cofi_green, ElliotV8_original_ichiv2, ElliotV8_original_ichiv3
+def EWO_EI3v2_tag_cofi_green(dataframe, ema_length=5, ema2_length=3):
+    df = dataframe.copy()
+    ema1 = ta.EMA(df, timeperiod=ema_length)
+    ema2 = ta.EMA(df, timeperiod=ema2_length)
+    emadif = (ema1 - ema2) / df['close'] * 100
+    return emadif
+
+
+# NASOSRv6_private_Reinuvader_20211121
+def williams_r_NASOSRv6_private_Reinuvader_20211121(dataframe: DataFrame, timeperiod: int = 14) -> Series:
+
+    highest_high = dataframe["high"].rolling(center=False, window=timeperiod).max()
+    lowest_low = dataframe["low"].rolling(center=False, window=timeperiod).min()
+
+    WR = Series(
+        (highest_high - dataframe["close"]) / (highest_high - lowest_low),
+        name=f"{timeperiod} Williams %R",
+        )
+
+    return WR * -100
+
+
+# NASOSv5_mod2, NASOSv5_mod3
+def EWO_NASOSv5_mod2(dataframe, ema_length=5, ema2_length=50):
+    df = dataframe.copy()
+    ema1 = ta.EMA(df, timeperiod=ema_length)
+    ema2 = ta.EMA(df, timeperiod=ema2_length)
+    emadif = (ema1 - ema2) / df['low'] * 120
+    return emadif
+
+
+# NFI731_BUSD, NFINextMultiOffsetAndHO, NFINextMultiOffsetAndHO2, Nostalgia,
+# NostalgiaForInfinityNext
+def ewo_NFI731_BUSD(dataframe, sma1_length=5, sma2_length=35):
+    df = dataframe.copy()
+    sma1 = ta.EMA(df, timeperiod=sma1_length)
+    sma2 = ta.EMA(df, timeperiod=sma2_length)
+    smadif = (sma1 - sma2) / df['close'] * 100
+    return smadif
+
+
+# NFI731_BUSD, NFINextMultiOffsetAndHO, NFINextMultiOffsetAndHO2, Nostalgia,
+# NostalgiaForInfinityNext, NostalgiaForInfinityNext_ChangeToTower_V5_2,
+# NostalgiaForInfinityNext_ChangeToTower_V5_3, NostalgiaForInfinityNext_ChangeToTower_V6,
+# NostalgiaForInfinityNext_maximizer, NostalgiaForInfinityV7_7_2
+def williams_r_NFI731_BUSD(dataframe: DataFrame, period: int = 14) -> Series:
+
+    highest_high = dataframe["high"].rolling(center=False, window=period).max()
+    lowest_low = dataframe["low"].rolling(center=False, window=period).min()
+
+    WR = Series(
+        (highest_high - dataframe["close"]) / (highest_high - lowest_low),
+        name="{0} Williams %R".format(period),
+    )
+
+    return WR * -100
+
+
+# NostalgiaForInfinityNextGen, NostalgiaForInfinityNextGen_TSL
+def ewo_NostalgiaForInfinityNextGen(dataframe, sma1_length=5, sma2_length=35):
+    sma1 = ta.SMA(dataframe, timeperiod=sma1_length)
+    sma2 = ta.SMA(dataframe, timeperiod=sma2_length)
+    smadif = (sma1 - sma2) / dataframe['close'] * 100
+    return smadif
+
+
+# NotAnotherSMAOffsetStrategyLite
+def ewo_NotAnotherSMAOffsetStrategyLite(dataframe, ema_length=5, ema2_length=35):
+    df = dataframe.copy()
+    ema1 = ta.EMA(df, timeperiod=ema_length)
+    ema2 = ta.EMA(df, timeperiod=ema2_length)
+    emadif = (ema1 - ema2) / df['close'] * 100
+    return emadif
+
+
+# SMAOffsetProtectOptV1_kkeue_20210619
+def EWO_SMAOffsetProtectOptV1_kkeue_20210619(dataframe, ema_length=5, ema2_length=35):
+    #df = dataframe.copy()
+    ema1 = ta.EMA(dataframe, timeperiod=ema_length)
+    ema2 = ta.EMA(dataframe, timeperiod=ema2_length)
+    emadif = (ema1 - ema2) / dataframe['close'] * 100
+    return emadif
+
+
+# range_percent_change: BB_RPB_TSL_SMA_Tranz, BB_RPB_TSL_SMA_Tranz_TB_1_1_1,
+# BB_RPB_TSL_SMA_Tranz_TB_MOD, BigZ0307HO, BigZ0407, BigZ0407HO, BigZ07Next, BigZ07Next2,
+# Combined_NFIv7_SMA, Combined_NFIv7_SMA_Rallipanos_20210707, Combined_NFIv7_SMA_bAdBoY_20211204,
+# NFI731_BUSD, NFI7MOHO, NFINextMOHO, NFINextMOHO2, NFINextMultiOffsetAndHO,
+# NFINextMultiOffsetAndHO2, Nostalgia, NostalgiaForInfinityNext, NostalgiaForInfinityV7,
+# NostalgiaForInfinityV7_SMA, NostalgiaForInfinityV7_SMAv2, NostalgiaForInfinityV7_SMAv2_1,
+# SampleStrategy
+# top_percent_change: BB_RPB_TSL_SMA_Tranz, BB_RPB_TSL_SMA_Tranz_TB_1_1_1,
+# BB_RPB_TSL_SMA_Tranz_TB_MOD, BigZ0307HO, BigZ0407, BigZ0407HO, BigZ07Next, BigZ07Next2,
+# Combined_NFIv7_SMA, Combined_NFIv7_SMA_Rallipanos_20210707, Combined_NFIv7_SMA_bAdBoY_20211204,
+# NASOSRv6_private_Reinuvader_20211121, NFI731_BUSD, NFI7MOHO, NFINextMOHO, NFINextMOHO2,
+# NFINextMultiOffsetAndHO, NFINextMultiOffsetAndHO2, Nostalgia, NostalgiaForInfinityNext,
+# NostalgiaForInfinityV7, NostalgiaForInfinityV7_SMA, NostalgiaForInfinityV7_SMAv2,
+# NostalgiaForInfinityV7_SMAv2_1, SampleStrategy, ichiV1_Marius
+# range_maxgap: BB_RPB_TSL_SMA_Tranz, BB_RPB_TSL_SMA_Tranz_TB_1_1_1, BB_RPB_TSL_SMA_Tranz_TB_MOD,
+# BigZ0307HO, BigZ0407, BigZ0407HO, BigZ07Next, BigZ07Next2, Combined_NFIv6_SMA, Combined_NFIv7_SMA,
+# Combined_NFIv7_SMA_Rallipanos_20210707, Combined_NFIv7_SMA_bAdBoY_20211204, CryptoFrogNFI,
+# CryptoFrogNFIHO1A, CryptoFrogOffset, NFI46, NFI46Frog, NFI46FrogZ, NFI46Offset, NFI46OffsetHOA1,
+# NFI46Z, NFI47V2, NFI731_BUSD, NFI7MOHO, NFINextMOHO, NFINextMOHO2, NFINextMultiOffsetAndHO,
+# NFINextMultiOffsetAndHO2, Nostalgia, NostalgiaForInfinityNext, NostalgiaForInfinityV6,
+# NostalgiaForInfinityV6HO, NostalgiaForInfinityV7, NostalgiaForInfinityV7_SMA,
+# NostalgiaForInfinityV7_SMAv2, NostalgiaForInfinityV7_SMAv2_1, SampleStrategy
+# range_height: BB_RPB_TSL_SMA_Tranz, BB_RPB_TSL_SMA_Tranz_TB_1_1_1, BB_RPB_TSL_SMA_Tranz_TB_MOD,
+# BigZ0307HO, BigZ0407, BigZ0407HO, BigZ07Next, BigZ07Next2, Combined_NFIv6_SMA, Combined_NFIv7_SMA,
+# Combined_NFIv7_SMA_Rallipanos_20210707, Combined_NFIv7_SMA_bAdBoY_20211204, CryptoFrogNFI,
+# CryptoFrogNFIHO1A, CryptoFrogOffset, NFI46, NFI46Frog, NFI46FrogZ, NFI46Offset, NFI46OffsetHOA1,
+# NFI46Z, NFI47V2, NFI731_BUSD, NFI7MOHO, NFINextMOHO, NFINextMOHO2, NFINextMultiOffsetAndHO,
+# NFINextMultiOffsetAndHO2, Nostalgia, NostalgiaForInfinityNext, NostalgiaForInfinityV6,
+# NostalgiaForInfinityV6HO, NostalgiaForInfinityV7, NostalgiaForInfinityV7_SMA,
+# NostalgiaForInfinityV7_SMAv2, NostalgiaForInfinityV7_SMAv2_1, SampleStrategy
+# safe_pump: BB_RPB_TSL_SMA_Tranz, BB_RPB_TSL_SMA_Tranz_TB_1_1_1, BB_RPB_TSL_SMA_Tranz_TB_MOD,
+# BigZ0307HO, BigZ0407, BigZ0407HO, BigZ07Next, BigZ07Next2, Combined_NFIv7_SMA,
+# Combined_NFIv7_SMA_Rallipanos_20210707, Combined_NFIv7_SMA_bAdBoY_20211204, NFI731_BUSD, NFI7MOHO,
+# NFINextMOHO, NFINextMOHO2, NFINextMultiOffsetAndHO, NFINextMultiOffsetAndHO2, Nostalgia,
+# NostalgiaForInfinityNext, NostalgiaForInfinityV7, NostalgiaForInfinityV7_SMA,
+# NostalgiaForInfinityV7_SMAv2, NostalgiaForInfinityV7_SMAv2_1, SampleStrategy
+class BB_RPB_TSL_SMA_TranzMethods:
+    def range_percent_change(self, dataframe: DataFrame, method, length: int) -> float:
+        df = dataframe.copy()
+        if method == 'HL':
+            return ((df['high'].rolling(length).max() - df['low'].rolling(length).min()) / df['low'].rolling(length).min())
+        elif method == 'OC':
+            return ((df['open'].rolling(length).max() - df['close'].rolling(length).min()) / df['close'].rolling(length).min())
+        else:
+            raise ValueError(f"Method {method} not defined!")
+
+    def top_percent_change(self, dataframe: DataFrame, length: int) -> float:
+        df = dataframe.copy()
+        if length == 0:
+            return ((df['open'] - df['close']) / df['close'])
+        else:
+            return ((df['open'].rolling(length).max() - df['close']) / df['close'])
+
+    def range_maxgap(self, dataframe: DataFrame, length: int) -> float:
+        df = dataframe.copy()
+        return (df['open'].rolling(length).max() - df['close'].rolling(length).min())
+
+    def range_maxgap_adjusted(self, dataframe: DataFrame, length: int, adjustment: float) -> float:
+        return (self.range_maxgap(dataframe,length) / adjustment)
+
+    def range_height(self, dataframe: DataFrame, length: int) -> float:
+        df = dataframe.copy()
+        return (df['close'] - df['close'].rolling(length).min())
+
+    def safe_pump(self, dataframe: DataFrame, length: int, thresh: float, pull_thresh: float) -> bool:
+        df = dataframe.copy()
+        return (df[f'oc_pct_change_{length}'] < thresh) | (self.range_maxgap_adjusted(df, length, pull_thresh) > self.range_height(df, length))
+
+
+# range_percent_change: Combined_NFIv6_SMA, CryptoFrogNFI, CryptoFrogNFIHO1A, CryptoFrogOffset,
+# NFI46, NFI46Frog, NFI46FrogZ, NFI46Offset, NFI46OffsetHOA1, NFI46Z, NFI47V2,
+# NostalgiaForInfinityV6, NostalgiaForInfinityV6HO
+# safe_pump: Combined_NFIv6_SMA, CryptoFrogNFI, CryptoFrogNFIHO1A, CryptoFrogOffset, NFI46,
+# NFI46Frog, NFI46FrogZ, NFI46Offset, NFI46OffsetHOA1, NFI46Z, NFI47V2, NostalgiaForInfinityV6,
+# NostalgiaForInfinityV6HO
+class Combined_NFIv6_SMAMethods:
+    def range_percent_change(self, dataframe: DataFrame, length: int) -> float:
+        df = dataframe.copy()
+        return ((df['open'].rolling(length).max() - df['close'].rolling(length).min()) / df['close'].rolling(length).min())
+
+    def range_maxgap(self, dataframe: DataFrame, length: int) -> float:
+        df = dataframe.copy()
+        return (df['open'].rolling(length).max() - df['close'].rolling(length).min())
+
+    def range_maxgap_adjusted(self, dataframe: DataFrame, length: int, adjustment: float) -> float:
+        return (self.range_maxgap(dataframe,length) / adjustment)
+
+    def range_height(self, dataframe: DataFrame, length: int) -> float:
+        df = dataframe.copy()
+        return (df['close'] - df['close'].rolling(length).min())
+
+    def safe_pump(self, dataframe: DataFrame, length: int, thresh: float, pull_thresh: float) -> bool:
+        df = dataframe.copy()
+        return (self.range_percent_change(df, length) < thresh) | (self.range_maxgap_adjusted(df, length, pull_thresh) > self.range_height(df, length))
+
+
+# range_percent_change: NFIX_BB_RPB, NFIX_BB_RPB_c7c477d_20211030, NfiNextModded,
+# NostalgiaForInfinityNextGen, NostalgiaForInfinityNextGen_TSL, NostalgiaForInfinityNextV7155,
+# NostalgiaForInfinityNext_ChangeToTower_V5_2, NostalgiaForInfinityNext_ChangeToTower_V5_3,
+# NostalgiaForInfinityNext_ChangeToTower_V6, NostalgiaForInfinityNext_maximizer,
+# NostalgiaForInfinityV7_7_2, NostalgiaForInfinityX, NostalgiaForInfinityX2, NostalgiaForInfinityXw
+# top_percent_change: NFIX_BB_RPB, NFIX_BB_RPB_c7c477d_20211030, NfiNextModded,
+# NostalgiaForInfinityNextGen, NostalgiaForInfinityNextGen_TSL, NostalgiaForInfinityNextV7155,
+# NostalgiaForInfinityNext_ChangeToTower_V5_2, NostalgiaForInfinityNext_ChangeToTower_V5_3,
+# NostalgiaForInfinityNext_ChangeToTower_V6, NostalgiaForInfinityNext_maximizer,
+# NostalgiaForInfinityV7_7_2, NostalgiaForInfinityX, NostalgiaForInfinityX2, NostalgiaForInfinityXw
+class NFIX_BB_RPBMethods:
+    def range_percent_change(self, dataframe: DataFrame, method, length: int) -> float:
+        if method == 'HL':
+            return (dataframe['high'].rolling(length).max() - dataframe['low'].rolling(length).min()) / dataframe['low'].rolling(length).min()
+        elif method == 'OC':
+            return (dataframe['open'].rolling(length).max() - dataframe['close'].rolling(length).min()) / dataframe['close'].rolling(length).min()
+        else:
+            raise ValueError(f"Method {method} not defined!")
+
+    def top_percent_change(self, dataframe: DataFrame, length: int) -> float:
+        if length == 0:
+            return (dataframe['open'] - dataframe['close']) / dataframe['close']
+        else:
+            return (dataframe['open'].rolling(length).max() - dataframe['close']) / dataframe['close']
+
+
+# range_maxgap: NfiNextModded, NostalgiaForInfinityNextV7155,
+# NostalgiaForInfinityNext_ChangeToTower_V5_2, NostalgiaForInfinityNext_ChangeToTower_V5_3,
+# NostalgiaForInfinityNext_ChangeToTower_V6, NostalgiaForInfinityNext_maximizer,
+# NostalgiaForInfinityV7_7_2
+# range_height: NfiNextModded, NostalgiaForInfinityNextV7155,
+# NostalgiaForInfinityNext_ChangeToTower_V5_2, NostalgiaForInfinityNext_ChangeToTower_V5_3,
+# NostalgiaForInfinityNext_ChangeToTower_V6, NostalgiaForInfinityNext_maximizer,
+# NostalgiaForInfinityV7_7_2
+# safe_pump: NfiNextModded, NostalgiaForInfinityNextV7155,
+# NostalgiaForInfinityNext_ChangeToTower_V5_2, NostalgiaForInfinityNext_ChangeToTower_V5_3,
+# NostalgiaForInfinityNext_ChangeToTower_V6, NostalgiaForInfinityNext_maximizer,
+# NostalgiaForInfinityV7_7_2
+class NfiNextModdedMethods:
+    def range_percent_change(self, dataframe: DataFrame, method, length: int) -> float:
+        if method == 'HL':
+            return (dataframe['high'].rolling(length).max() - dataframe['low'].rolling(length).min()) / dataframe[
+                'low'].rolling(length).min()
+        elif method == 'OC':
+            return (dataframe['open'].rolling(length).max() - dataframe['close'].rolling(length).min()) / dataframe[
+                'close'].rolling(length).min()
+        else:
+            raise ValueError(f"Method {method} not defined!")
+
+    def top_percent_change(self, dataframe: DataFrame, length: int) -> float:
+        if length == 0:
+            return (dataframe['open'] - dataframe['close']) / dataframe['close']
+        else:
+            return (dataframe['open'].rolling(length).max() - dataframe['close']) / dataframe['close']
+
+    def range_maxgap(self, dataframe: DataFrame, length: int) -> float:
+        return dataframe['open'].rolling(length).max() - dataframe['close'].rolling(length).min()
+
+    def range_maxgap_adjusted(self, dataframe: DataFrame, length: int, adjustment: float) -> float:
+        return self.range_maxgap(dataframe, length) / adjustment
+
+    def range_height(self, dataframe: DataFrame, length: int) -> float:
+        return dataframe['close'] - dataframe['close'].rolling(length).min()
+
+    def safe_pump(self, dataframe: DataFrame, length: int, thresh: float, pull_thresh: float) -> bool:
+        return (dataframe[f'oc_pct_change_{length}'] < thresh) | (
+                self.range_maxgap_adjusted(dataframe, length, pull_thresh) > self.range_height(dataframe, length))
+
+
+# --- Copy, shared replacement, calls ------------------------------------------------------
+
+VARIANTS = [
+    pytest.param(vwma_BB_RPB_TSL_SMA_Tranz,
+                 vwma,
+                 [(32,), (64,), ()],
+                 id='vwma-BB_RPB_TSL_SMA_Tranz'),
+    pytest.param(moderi_BBMod1,
+                 moderi,
+                 [(32,), (64,), ()],
+                 id='moderi-BBMod1'),
+    pytest.param(EWO_BBMod1,
+                 lambda dataframe, ema_length=5, ema2_length=35: EWO(dataframe, ema_length, ema2_length, base='low'),
+                 [(5, 35), (8, 50), ()],
+                 id='EWO-BBMod1'),
+    pytest.param(range_percent_change_BBMod1,
+                 range_percent_change,
+                 [('HL', 24), ('OC', 36), ('OC', 12)],
+                 id='range_percent_change-BBMod1'),
+    pytest.param(williams_r_BBMod1,
+                 williams_r,
+                 [(14,), (480,), ()],
+                 id='williams_r-BBMod1'),
+    pytest.param(chaikin_money_flow_BBMod1,
+                 chaikin_money_flow,
+                 [(20,), (20, True), (5,)],
+                 id='chaikin_money_flow-BBMod1'),
+    pytest.param(top_percent_change_BBMod1,
+                 top_percent_change,
+                 [(0,), (24,), (36,)],
+                 id='top_percent_change-BBMod1'),
+    pytest.param(EWO_BBRSITV,
+                 EWO,
+                 [(5, 35), (8, 50), ()],
+                 id='EWO-BBRSITV'),
+    pytest.param(SROC_CryptoFrog,
+                 SROC,
+                 [(21, 13, 21), (10, 30, 5), ()],
+                 id='SROC-CryptoFrog'),
+    pytest.param(williams_r_BB_RPB_TSL,
+                 williams_r,
+                 [(14,), (480,), ()],
+                 id='williams_r-BB_RPB_TSL'),
+    pytest.param(T3_BB_RPB_TSL,
+                 T3,
+                 [(), (10,)],
+                 id='T3-BB_RPB_TSL'),
+    pytest.param(VWAPB_BB_RPB_TSL_SMA_Tranz,
+                 VWAPB,
+                 [(20, 1), (30, 2), ()],
+                 id='VWAPB-BB_RPB_TSL_SMA_Tranz'),
+    pytest.param(pump_warning_BB_RPB_TSL_SMA_Tranz,
+                 pump_warning,
+                 [(), (5,)],
+                 id='pump_warning-BB_RPB_TSL_SMA_Tranz'),
+    pytest.param(ewo_BB_RPB_TSL_Tranz,
+                 lambda dataframe, sma1_length=5, sma2_length=35: EWO(dataframe, sma1_length, sma2_length),
+                 [(5, 35), (50, 200), ()],
+                 id='ewo-BB_RPB_TSL_Tranz'),
+    pytest.param(heikin_ashi_BB_RPB_TSL_SMA_Tranz,
+                 lambda dataframe, smooth_inputs=False, smooth_outputs=False, length=10: simple_heikin_ashi(dataframe, smooth_inputs, smooth_outputs),
+                 [(False, False), (False, True), (True, False), (True, True)],
+                 id='heikin_ashi-BB_RPB_TSL_SMA_Tranz'),
+    pytest.param(BB_RPB_TSL_SMA_TranzMethods().range_percent_change,
+                 lambda dataframe, method, length: range_percent_change(dataframe, method, length),
+                 [('HL', 24), ('OC', 36), ('OC', 12)],
+                 id='range_percent_change-BB_RPB_TSL_SMA_Tranz'),
+    pytest.param(BB_RPB_TSL_SMA_TranzMethods().top_percent_change,
+                 lambda dataframe, length: top_percent_change(dataframe, length),
+                 [(0,), (24,), (36,)],
+                 id='top_percent_change-BB_RPB_TSL_SMA_Tranz'),
+    pytest.param(BB_RPB_TSL_SMA_TranzMethods().range_maxgap,
+                 lambda dataframe, length: range_maxgap(dataframe, length),
+                 [(24,), (48,)],
+                 id='range_maxgap-BB_RPB_TSL_SMA_Tranz'),
+    pytest.param(BB_RPB_TSL_SMA_TranzMethods().range_height,
+                 lambda dataframe, length: range_height(dataframe, length),
+                 [(24,), (48,)],
+                 id='range_height-BB_RPB_TSL_SMA_Tranz'),
+    pytest.param(BB_RPB_TSL_SMA_TranzMethods().safe_pump,
+                 lambda dataframe, length, thresh, pull_thresh: safe_pump(dataframe, length, thresh, pull_thresh, dataframe[f'oc_pct_change_{length}']),
+                 [(24, 0.5, 1.75), (36, 0.1, 3.0), (48, 0.9, 2.0), (12, 0.2, 1.5)],
+                 id='safe_pump-BB_RPB_TSL_SMA_Tranz'),
+    pytest.param(EWO_BigZ0307HO,
+                 EWO,
+                 [(5, 35), (8, 50), ()],
+                 id='EWO-BigZ0307HO'),
+    pytest.param(chaikin_money_flow_BigZ0307HO,
+                 chaikin_money_flow,
+                 [(20,), (20, True), (5,)],
+                 id='chaikin_money_flow-BigZ0307HO'),
+    pytest.param(SSLChannels_ATR_CombinedBinHAndClucV6H,
+                 SSLChannels_ATR,
+                 [(), (10,)],
+                 id='SSLChannels_ATR-CombinedBinHAndClucV6H'),
+    pytest.param(Combined_NFIv6_SMAMethods().range_percent_change,
+                 lambda dataframe, length: range_percent_change(dataframe, 'OC', length),
+                 [(24,), (36,), (12,)],
+                 id='range_percent_change-Combined_NFIv6_SMA'),
+    pytest.param(Combined_NFIv6_SMAMethods().safe_pump,
+                 lambda dataframe, length, thresh, pull_thresh: safe_pump(dataframe, length, thresh, pull_thresh),
+                 [(24, 0.5, 1.75), (36, 0.1, 3.0), (48, 0.9, 2.0), (12, 0.2, 1.5)],
+                 id='safe_pump-Combined_NFIv6_SMA'),
+    pytest.param(RMI_CryptoFrog,
+                 RMI,
+                 [dict(length=20, mom=5), dict(length=24, mom=5), dict(length=3, mom=9)],
+                 id='RMI-CryptoFrog'),
+    pytest.param(EWO_EI3v2_tag_cofi_green,
+                 lambda dataframe, ema_length=5, ema2_length=3: EWO(dataframe, ema_length, ema2_length),
+                 [(5, 35), (8, 50), ()],
+                 id='EWO-EI3v2_tag_cofi_green'),
+    pytest.param(williams_r_NASOSRv6_private_Reinuvader_20211121,
+                 lambda dataframe, timeperiod=14: williams_r(dataframe, timeperiod),
+                 [(14,), (480,), ()],
+                 id='williams_r-NASOSRv6_private_Reinuvader_20211121'),
+    pytest.param(EWO_NASOSv5_mod2,
+                 lambda dataframe, ema_length=5, ema2_length=50: EWO(dataframe, ema_length, ema2_length, base='low', scale=120),
+                 [(5, 35), (8, 50), ()],
+                 id='EWO-NASOSv5_mod2'),
+    pytest.param(ewo_NFI731_BUSD,
+                 lambda dataframe, sma1_length=5, sma2_length=35: EWO(dataframe, sma1_length, sma2_length),
+                 [(5, 35), (50, 200), ()],
+                 id='ewo-NFI731_BUSD'),
+    pytest.param(williams_r_NFI731_BUSD,
+                 williams_r,
+                 [(14,), (480,), ()],
+                 id='williams_r-NFI731_BUSD'),
+    pytest.param(NFIX_BB_RPBMethods().range_percent_change,
+                 lambda dataframe, method, length: range_percent_change(dataframe, method, length),
+                 [('HL', 24), ('OC', 36), ('OC', 12)],
+                 id='range_percent_change-NFIX_BB_RPB'),
+    pytest.param(NFIX_BB_RPBMethods().top_percent_change,
+                 lambda dataframe, length: top_percent_change(dataframe, length),
+                 [(0,), (24,), (36,)],
+                 id='top_percent_change-NFIX_BB_RPB'),
+    pytest.param(NfiNextModdedMethods().range_maxgap,
+                 lambda dataframe, length: range_maxgap(dataframe, length),
+                 [(24,), (48,)],
+                 id='range_maxgap-NfiNextModded'),
+    pytest.param(NfiNextModdedMethods().range_height,
+                 lambda dataframe, length: range_height(dataframe, length),
+                 [(24,), (48,)],
+                 id='range_height-NfiNextModded'),
+    pytest.param(NfiNextModdedMethods().safe_pump,
+                 lambda dataframe, length, thresh, pull_thresh: safe_pump(dataframe, length, thresh, pull_thresh, dataframe[f'oc_pct_change_{length}']),
+                 [(24, 0.5, 1.75), (36, 0.1, 3.0), (48, 0.9, 2.0), (12, 0.2, 1.5)],
+                 id='safe_pump-NfiNextModded'),
+    pytest.param(ewo_NostalgiaForInfinityNextGen,
+                 lambda dataframe, sma1_length=5, sma2_length=35: EWO(dataframe, sma1_length, sma2_length, ma='SMA'),
+                 [(5, 35), (50, 200), ()],
+                 id='ewo-NostalgiaForInfinityNextGen'),
+    pytest.param(ewo_NotAnotherSMAOffsetStrategyLite,
+                 lambda dataframe, ema_length=5, ema2_length=35: EWO(dataframe, ema_length, ema2_length),
+                 [(5, 35), (50, 200), ()],
+                 id='ewo-NotAnotherSMAOffsetStrategyLite'),
+    pytest.param(EWO_SMAOffsetProtectOptV1_kkeue_20210619,
+                 EWO,
+                 [(5, 35), (8, 50), ()],
+                 id='EWO-SMAOffsetProtectOptV1_kkeue_20210619'),
+]
+
+
+@pytest.mark.parametrize('seed', [1, 2])
+@pytest.mark.parametrize('copy, shared, calls', VARIANTS)
+def test_shared_indicator_matches_strategy_copy(copy, shared, calls, seed):
+    dataframe = candles(seed)
+    for args in calls:
+        args, kwargs = ((), args) if isinstance(args, dict) else (args, {})
+        assert_same(copy(dataframe.copy(), *args, **kwargs), shared(dataframe.copy(), *args, **kwargs))
+
+
+def test_shared_indicators_leave_the_frame_alone():
+    dataframe = candles(1)
+    before = dataframe.copy()
+    for _, shared, calls in (param.values for param in VARIANTS):
+        for args in calls:
+            args, kwargs = ((), args) if isinstance(args, dict) else (args, {})
+            shared(dataframe, *args, **kwargs)
+    pd.testing.assert_frame_equal(dataframe, before)
@@ -0,0 +1,78 @@
+"""
+``merge_informatives`` against the chained ``merge_informative_pair`` calls and column drops
+NostalgiaForInfinityX and NostalgiaForInfinityNextGen made before, on synthetic 5m candles
+with the BTC 1d / 1h / 5m and pair 1d / 1h / 15m informative frames.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from strategy_utils.informative import OHLCV_COLUMNS, Informative, merge_informatives, timeframe_to_minutes
+
+strategy_helper = pytest.importorskip('freqtrade.strategy.strategy_helper')
+
+
+def candles(timeframe: str, start: str, end: str, seed: int) -> DataFrame:
+    """OHLCV with indicator columns: a warm-up, NaNs inside the data and a boolean."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start, end, freq=pd.Timedelta(minutes=timeframe_to_minutes(timeframe)), tz='UTC')
+    n = len(dates)
+    close = 100 + np.cumsum(rng.normal(size=n))
+    frame = DataFrame({'date': dates, 'open': close + rng.normal(size=n), 'high': close + 1, 'low': close - 1,
+                       'close': close, 'volume': rng.integers(1, 1000, size=n).astype(float)})
+    frame['rsi'] = frame['close'].rolling(14).mean()
+    frame.loc[rng.random(n) < 0.05, 'rsi'] = np.nan
+    frame['up'] = frame['close'] > frame['open']
+    return frame
+
+
+def reference_merge(dataframe: DataFrame, informatives, timeframe: str) -> DataFrame:
+    for informative, inf_timeframe, drop in informatives:
+        dataframe = strategy_helper.merge_informative_pair(dataframe, informative, timeframe, inf_timeframe,
+                                                           ffill=True)
+        drop_columns = [f"{s}_{inf_timeframe}" for s in drop]
+        dataframe.drop(columns=dataframe.columns.intersection(drop_columns), inplace=True)
+    return dataframe
+
+
+@pytest.mark.parametrize('base_start, info_start', [
+    # Informative history from before the base candles: the leading candles are filled
+    ('2021-03-01 00:00', '2021-02-01 00:00'),
+    # Base candles starting mid-hour and mid-day
+    ('2021-03-01 07:35', '2021-02-01 00:00'),
+    # Informative history starting after the base candles: the leading candles stay NaN
+    ('2021-03-01 00:00', '2021-03-02 00:00'),
+], ids=['aligned', 'mid-candle', 'short-history'])
+@pytest.mark.parametrize('seed', range(2))
+def test_merge_informatives_matches_the_chained_merges(base_start, info_start, seed):
+    end = '2021-03-08 23:55'
+    dataframe = candles('5m', base_start, end, seed)
+    dataframe.loc[5, 'volume'] = np.nan
+    frames = [
+        (candles('1d', info_start, end, seed + 1), '1d', OHLCV_COLUMNS),
+        (candles('1h', info_start, end, seed + 2), '1h', OHLCV_COLUMNS),
+        (candles('5m', base_start, end, seed + 3), '5m', OHLCV_COLUMNS),
+        (candles('1d', info_start, end, seed + 4), '1d', ['date']),
+        (candles('1h', info_start, end, seed + 5), '1h', ['date']),
+        (candles('15m', info_start, end, seed + 6), '15m', ['date']),
+    ]
+    # BTC and pair frames of the same timeframe, told apart with a column prefix
+    for i, (frame, _, drop) in enumerate(frames):
+        frame.columns = [c if c in OHLCV_COLUMNS else f'{c}_{i}' for c in frame.columns]
+
+    expected = reference_merge(dataframe.copy(), frames, '5m')
+    result = merge_informatives(dataframe.copy(), [Informative(frame, tf, drop=drop) for frame, tf, drop in frames],
+                                '5m')
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_merge_informatives_without_a_match():
+    dataframe = candles('5m', '2021-03-01 00:00', '2021-03-01 12:00', 0)
+    informative = candles('1h', '2021-03-02 00:00', '2021-03-03 00:00', 1)
+
+    expected = reference_merge(dataframe.copy(), [(informative, '1h', ['date'])], '5m')
+    result = merge_informatives(dataframe.copy(), [Informative(informative, '1h', drop=['date'])], '5m')
+
+    pd.testing.assert_frame_equal(result, expected)
@@ -0,0 +1,88 @@
+"""
+``latch_signal`` against the row loop of the NowoIchimoku strategies (NowoIchimoku1hV2's, kept
+below as it was, the start candle and the state before it made parameters).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from strategy_utils.latch import latch_signal
+
+
+def reference_latch(df: DataFrame, start: int) -> DataFrame:
+    # df carries should_buy, is_cloud_green and the buy / buy_allowed state before ``start``
+    for row in df.itertuples():
+        if row.Index >= start:
+            df.loc[row.Index, 'buy_allowed'] = df.at[row.Index - 1, 'buy_allowed']
+
+            if df.at[row.Index - 1, 'buy']:
+                df.loc[row.Index, 'buy_allowed'] = False
+
+            if not df.at[row.Index, 'is_cloud_green']:
+                df.loc[row.Index, 'buy_allowed'] = True
+
+            df.loc[row.Index, 'buy'] = df.at[row.Index, 'buy_allowed'] & df.at[row.Index, 'should_buy']
+    return df
+
+
+def random_signals(n: int, seed: int, p_buy: float = 0.3, p_red: float = 0.1) -> DataFrame:
+    rng = np.random.default_rng(seed)
+    return DataFrame({'should_buy': rng.random(n) < p_buy, 'is_cloud_green': rng.random(n) >= p_red})
+
+
+@pytest.mark.parametrize('start', [1, 101])
+@pytest.mark.parametrize('n', [1, 2, 101, 102, 600])
+@pytest.mark.parametrize('seed', range(4))
+def test_latch_signal_matches_the_v2_loop(start, n, seed):
+    df = random_signals(n, seed)
+    expected = reference_latch(df.assign(buy=False, buy_allowed=True), start)
+
+    buy_allowed, buy = latch_signal(df['should_buy'], ~df['is_cloud_green'], start=start)
+
+    np.testing.assert_array_equal(buy_allowed, expected['buy_allowed'].astype(bool))
+    np.testing.assert_array_equal(buy, expected['buy'].astype(bool))
+
+
+def v1_buy_allowed(df: DataFrame) -> np.ndarray:
+    # NowoIchimoku1hV1.populate_buy_trend
+    is_cloud_red = ~df['is_cloud_green'].to_numpy()
+    buy_allowed, _ = latch_signal(df['should_buy'], is_cloud_red, start=100, armed=False)
+    buy_allowed[:100] = is_cloud_red[:100]
+    return buy_allowed
+
+
+def reference_v1(df: DataFrame) -> DataFrame:
+    # Allowed on a red cloud up to candle 100, a buy there latches like any later one
+    df = df.assign(buy_allowed=~df['is_cloud_green'])
+    df['buy'] = df['buy_allowed'] & df['should_buy']
+    df = reference_latch(df, 101)
+    df['buy'] = df['buy_allowed'] & df['should_buy']
+    return df
+
+
+@pytest.mark.parametrize('n', [1, 100, 101, 102, 600])
+@pytest.mark.parametrize('seed', range(4))
+def test_v1_buy_allowed_matches_the_loop(n, seed):
+    df = random_signals(n, seed, p_red=0.5)
+    np.testing.assert_array_equal(v1_buy_allowed(df), reference_v1(df)['buy_allowed'].astype(bool))
+
+
+def test_v1_buy_on_candle_100_latches():
+    df = DataFrame({'should_buy': False, 'is_cloud_green': True}, index=range(105))
+    df.loc[100, ['should_buy', 'is_cloud_green']] = [True, False]
+
+    buy_allowed = v1_buy_allowed(df)
+
+    np.testing.assert_array_equal(buy_allowed, reference_v1(df)['buy_allowed'].astype(bool))
+    assert buy_allowed[100] and not buy_allowed[101:].any()
+
+
+def test_nan_triggers_and_resets_count_as_false():
+    trigger = pd.Series([np.nan, 1.0, np.nan, 1.0, 0.0])
+    reset = pd.Series([np.nan, np.nan, 1.0, np.nan, np.nan])
+
+    armed, fired = latch_signal(trigger, reset)
+
+    np.testing.assert_array_equal(armed, [True, True, True, True, False])
+    np.testing.assert_array_equal(fired, [False, True, False, True, False])
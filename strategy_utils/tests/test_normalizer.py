@@ -0,0 +1,91 @@
+"""
+``minmax_norm``, ``RollingNormalizer`` and ``MinmaxNormTracker`` against the ``fischer_norm``
+slice loop of NormalizerStrategy / NormalizerStrategyHO2 (kept below as it was).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from strategy_utils.normalizer import FIBONACCI_LOOKBACKS, MinmaxNormTracker, RollingNormalizer, minmax_norm
+
+
+def fischer_norm(x, lookback):
+    res = np.zeros_like(x)
+    for i in range(lookback, len(x)):
+        x_min = np.min(x[i-lookback: i +1])
+        x_max = np.max(x[i-lookback: i +1])
+        #res[i] = (2*(x[i] - x_min) / (x_max - x_min)) - 1
+        res[i] = (x[i] - x_min) / (x_max - x_min)
+    return res
+
+
+def reference_norm(close: np.ndarray, lookbacks=FIBONACCI_LOOKBACKS) -> np.ndarray:
+    with np.errstate(invalid='ignore'):
+        return np.column_stack([fischer_norm(close, look) for look in lookbacks]).reshape(len(close), len(lookbacks))
+
+
+def random_closes(n: int, seed: int) -> np.ndarray:
+    """Random walk in 0.1 ticks, flat half of the time, with a flat stretch longer than 21 candles."""
+    rng = np.random.default_rng(seed)
+    close = 100 + 0.1 * np.cumsum(rng.choice([-1, 0, 0, 1], n))
+    if n > 200:
+        close[150:180] = close[150] + 0.05
+    return close
+
+
+def candles(close: np.ndarray) -> DataFrame:
+    return DataFrame({
+        'date': pd.date_range('2021-01-01', periods=len(close), freq='5min', tz='UTC'),
+        'close': close,
+    })
+
+
+@pytest.mark.parametrize('n', [1, 13, 14, 700, 2000])
+@pytest.mark.parametrize('seed', range(3))
+def test_minmax_norm_matches_fischer_norm(n, seed):
+    close = random_closes(n, seed)
+    expected = reference_norm(close)
+
+    np.testing.assert_array_equal(minmax_norm(close, FIBONACCI_LOOKBACKS), expected)
+    np.testing.assert_array_equal(RollingNormalizer(FIBONACCI_LOOKBACKS).extend(close), expected)
+    for i, look in enumerate(FIBONACCI_LOOKBACKS):
+        np.testing.assert_array_equal(minmax_norm(close, [look])[:, 0], expected[:, i])
+
+
+def test_flat_windows_are_nan():
+    norm = minmax_norm(random_closes(700, 0), FIBONACCI_LOOKBACKS)
+    # 30 equal closes from candle 150: the 13 and 21 candle windows inside them are flat
+    assert np.isnan(norm[179, 0]) and np.isnan(norm[179, 1])
+    assert not np.isnan(norm[179, 2:]).any()
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_tracker_on_a_window_moving_one_candle_forward(seed):
+    history = random_closes(1000, seed)
+    # Flat stretch entering the window after the first call
+    history[900:930] = history[900]
+    expected = reference_norm(history)
+    frames = candles(history)
+    window = 800
+
+    tracker = MinmaxNormTracker(FIBONACCI_LOOKBACKS)
+    for start in range(0, len(history) - window + 1):
+        frame = frames.iloc[start:start + window].reset_index(drop=True)
+        norm = tracker.update('BTC/USDT', frame)
+        # A row only depends on the closes up to it, so the rows of the whole history apply
+        np.testing.assert_array_equal(norm, expected[start:start + window])
+
+
+def test_tracker_recomputes_a_frame_that_does_not_continue_the_history():
+    history = random_closes(1000, 0)
+    frames = candles(history)
+    tracker = MinmaxNormTracker(FIBONACCI_LOOKBACKS)
+    tracker.update('BTC/USDT', frames.iloc[:700].reset_index(drop=True))
+
+    gap = frames.iloc[[*range(0, 300), *range(301, 800)]].reset_index(drop=True)
+    np.testing.assert_array_equal(tracker.update('BTC/USDT', gap),
+                                  reference_norm(gap['close'].to_numpy()))
+    tracker.reset('BTC/USDT')
+    np.testing.assert_array_equal(tracker.update('BTC/USDT', frames.iloc[200:900].reset_index(drop=True)),
+                                  reference_norm(history[200:900]))
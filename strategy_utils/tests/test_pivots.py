@@ -0,0 +1,77 @@
+"""
+``fractal_highs`` / ``fractal_lows`` against the ``rolling(window=5, center=True).apply(...)
+.shift(2)`` pivots of the NFI strategies. Their ``is_resistance`` / ``is_support`` callbacks
+came in two variants, kept below as they were.
+"""
+from functools import reduce
+
+import numpy as np
+import pytest
+from pandas import Series
+
+from strategy_utils.pivots import fractal_highs, fractal_lows
+
+
+class SymmetricCallbacks:
+    # NostalgiaForInfinityNextGen, NostalgiaForInfinityNextGen_TSL
+    def is_support(self, row_data) -> bool:
+        if row_data[0] > row_data[1] and row_data[1] > row_data[2] and row_data[2] < row_data[3] and row_data[3] < row_data[4]:
+            return True
+        return False
+
+    def is_resistance(self, row_data) -> bool:
+        if row_data[0] < row_data[1] and row_data[1] < row_data[2] and row_data[2] > row_data[3] and row_data[3] > row_data[4]:
+            return True
+        return False
+
+
+class HalfLengthCallbacks:
+    # NostalgiaForInfinityX, NostalgiaForInfinityXw, NFIX_BB_RPB, NFIX_BB_RPB_c7c477d_20211030
+    def is_support(self, row_data) -> bool:
+        conditions = []
+        for row in range(len(row_data)-1):
+            if row < len(row_data)/2:
+                conditions.append(row_data[row] > row_data[row+1])
+            else:
+                conditions.append(row_data[row] < row_data[row+1])
+        return reduce(lambda x, y: x & y, conditions)
+
+    def is_resistance(self, row_data) -> bool:
+        conditions = []
+        for row in range(len(row_data)-1):
+            if row < len(row_data)/2:
+                conditions.append(row_data[row] < row_data[row+1])
+            else:
+                conditions.append(row_data[row] > row_data[row+1])
+        return reduce(lambda x, y: x & y, conditions)
+
+
+def random_prices(n: int, seed: int) -> Series:
+    """Random walk on a 0.1 tick, flat about a third of the time, with a few NaNs."""
+    rng = np.random.default_rng(seed)
+    prices = 100 + np.cumsum(rng.choice([-0.1, 0.0, 0.1], size=n))
+    prices[rng.random(n) < 0.01] = np.nan
+    return Series(prices)
+
+
+@pytest.mark.parametrize('callbacks, left, right', [
+    (SymmetricCallbacks(), 2, 2),
+    (HalfLengthCallbacks(), 3, 1),
+], ids=['symmetric', 'half-length'])
+@pytest.mark.parametrize('n', [1, 4, 5, 6, 5000])
+@pytest.mark.parametrize('seed', range(3))
+def test_fractals_match_the_rolling_callbacks(callbacks, left, right, n, seed):
+    self = callbacks
+    high, low = random_prices(n, seed), random_prices(n, seed + 100)
+
+    res_series = high.rolling(window = 5, center=True).apply(lambda row: self.is_resistance(row), raw=True).shift(2)
+    sup_series = low.rolling(window = 5, center=True).apply(lambda row: self.is_support(row), raw=True).shift(2)
+
+    np.testing.assert_array_equal(fractal_highs(high, left=left, right=right), res_series.to_numpy())
+    np.testing.assert_array_equal(fractal_lows(low, left=left, right=right), sup_series.to_numpy())
+
+
+def test_symmetric_and_half_length_pivots_differ():
+    high = random_prices(5000, 0)
+    assert not np.array_equal(fractal_highs(high, left=2, right=2), fractal_highs(high, left=3, right=1),
+                              equal_nan=True)
@@ -0,0 +1,195 @@
+"""
+``pmax`` and ``PmaxTracker`` against the ``pmax()`` helper the NFI, BB_RPB_TSL and MultiMA
+families copied (kept below as it was in BBMod1).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame, Series
+
+ta = pytest.importorskip('talib.abstract')
+technical = pytest.importorskip('technical.indicators')
+VIDYA, zema = technical.VIDYA, technical.zema
+
+from strategy_utils.pmax import PmaxTracker, pmax  # noqa: E402
+
+
+def vwma(dataframe: DataFrame, length: int = 10):
+    """Indicator: Volume Weighted Moving Average (VWMA)"""
+    # Calculate Result
+    pv = dataframe['close'] * dataframe['volume']
+    vwma = Series(ta.SMA(pv, timeperiod=length) / ta.SMA(dataframe['volume'], timeperiod=length))
+    # The copies had ``vwma = vwma.fillna(0, inplace=True)``, which returns None: MAtype 8
+    # raised a TypeError below
+    vwma = vwma.fillna(0)
+    return vwma
+
+
+# PMAX
+def reference_pmax(df, period, multiplier, length, ma_type, src):
+
+    period = int(period)
+    multiplier = int(multiplier)
+    length = int(length)
+    ma_type = int(ma_type)
+    src = int(src)
+
+    mavalue = f'MA_{ma_type}_{length}'
+    atr = f'ATR_{period}'
+
+    if src == 1:
+        masrc = df["close"]
+    elif src == 2:
+        masrc = (df["high"] + df["low"]) / 2
+    elif src == 3:
+        masrc = (df["high"] + df["low"] + df["close"] + df["open"]) / 4
+
+    if ma_type == 1:
+        mavalue = ta.EMA(masrc, timeperiod=length)
+    elif ma_type == 2:
+        mavalue = ta.DEMA(masrc, timeperiod=length)
+    elif ma_type == 3:
+        mavalue = ta.T3(masrc, timeperiod=length)
+    elif ma_type == 4:
+        mavalue = ta.SMA(masrc, timeperiod=length)
+    elif ma_type == 5:
+        mavalue = VIDYA(df, length=length)
+    elif ma_type == 6:
+        mavalue = ta.TEMA(masrc, timeperiod=length)
+    elif ma_type == 7:
+        mavalue = ta.WMA(df, timeperiod=length)
+    elif ma_type == 8:
+        mavalue = vwma(df, length)
+    elif ma_type == 9:
+        mavalue = zema(df, period=length)
+
+    df[atr] = ta.ATR(df, timeperiod=period)
+    df['basic_ub'] = mavalue + ((multiplier/10) * df[atr])
+    df['basic_lb'] = mavalue - ((multiplier/10) * df[atr])
+
+    basic_ub = df['basic_ub'].values
+    final_ub = np.full(len(df), 0.00)
+    basic_lb = df['basic_lb'].values
+    final_lb = np.full(len(df), 0.00)
+
+    for i in range(period, len(df)):
+        final_ub[i] = basic_ub[i] if (
+            basic_ub[i] < final_ub[i - 1]
+            or mavalue[i - 1] > final_ub[i - 1]) else final_ub[i - 1]
+        final_lb[i] = basic_lb[i] if (
+            basic_lb[i] > final_lb[i - 1]
+            or mavalue[i - 1] < final_lb[i - 1]) else final_lb[i - 1]
+
+    df['final_ub'] = final_ub
+    df['final_lb'] = final_lb
+
+    pm_arr = np.full(len(df), 0.00)
+    for i in range(period, len(df)):
+        pm_arr[i] = (
+            final_ub[i] if (pm_arr[i - 1] == final_ub[i - 1]
+                            and mavalue[i] <= final_ub[i])
+            else final_lb[i] if (
+                    pm_arr[i - 1] == final_ub[i - 1]
+                    and mavalue[i] > final_ub[i]) else final_lb[i]
+            if (pm_arr[i - 1] == final_lb[i - 1]
+                and mavalue[i] >= final_lb[i]) else final_ub[i]
+            if (pm_arr[i - 1] == final_lb[i - 1]
+                and mavalue[i] < final_lb[i]) else 0.00)
+
+    pm = Series(pm_arr)
+
+    # Mark the trend direction up/down (np.NaN, which numpy 1 turned into the string 'nan')
+    pmx = np.where((pm_arr > 0.00), np.where((mavalue < pm_arr), 'down',  'up'), 'nan')
+
+    return pm, pmx
+
+
+def candles(n: int, seed: int) -> DataFrame:
+    """Geometric random walk candles on 5 minutes."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n, freq='5min', tz='UTC'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + 0.005 * rng.random(n)),
+        'low': np.minimum(open_, close) * (1 - 0.005 * rng.random(n)),
+        'close': close,
+        'volume': 1000 * rng.random(n),
+    })
+
+
+def legacy_trend(pmx: np.ndarray) -> np.ndarray:
+    return np.select([pmx == 'up', pmx == 'down'], [1, -1], 0)
+
+
+@pytest.mark.filterwarnings('ignore:zema is deprecated')
+@pytest.mark.parametrize('MAtype', range(1, 10))
+@pytest.mark.parametrize('src', [1, 2, 3])
+@pytest.mark.parametrize('period, multiplier, length', [(10, 27, 9), (5, 10, 20)])
+def test_pmax_matches_the_helper(MAtype, src, period, multiplier, length):
+    df = candles(600, MAtype * 10 + src)
+    before = df.copy()
+    expected_pm, expected_pmx = reference_pmax(df.copy(), period, multiplier, length, MAtype, src)
+
+    pm, trend = pmax(df, period, multiplier, length, MAtype, src)
+    pd.testing.assert_frame_equal(df, before)
+    np.testing.assert_array_equal(pm.to_numpy(), expected_pm.to_numpy())
+    np.testing.assert_array_equal(trend, legacy_trend(expected_pmx))
+    assert trend.dtype == np.int8
+    # Both go up and down on these candles
+    assert (trend == 1).any() and (trend == -1).any()
+
+
+def test_pmax_keeps_the_index():
+    df = candles(300, 0)
+    df.index += 1000
+    pm, _ = pmax(df, 10, 27, 9, 1, 3)
+    pd.testing.assert_index_equal(pm.index, df.index)
+
+
+def test_pmax_rejects_unknown_types():
+    df = candles(100, 0)
+    with pytest.raises(ValueError):
+        pmax(df, 10, 27, 9, 10, 1)
+    with pytest.raises(ValueError):
+        pmax(df, 10, 27, 9, 1, 4)
+
+
+@pytest.mark.filterwarnings('ignore:zema is deprecated')
+@pytest.mark.parametrize('MAtype', range(1, 10))
+@pytest.mark.parametrize('src', [1, 3])
+def test_tracker_on_a_window_moving_one_candle_forward(MAtype, src):
+    history = candles(1100, src)
+    expected_pm, expected_trend = pmax(history, 10, 27, 9, MAtype, src)
+    window = 800
+
+    tracker = PmaxTracker(period=10, multiplier=27, length=9, MAtype=MAtype, src=src)
+    for start in range(0, len(history) - window + 1, 3):
+        frame = history.iloc[start:start + window].reset_index(drop=True)
+        pm, trend = tracker.update('BTC/USDT', frame, frame['date'])
+        # After 800 candles the recursive averages no longer depend on where the window
+        # starts; the running sums of SMA, WMA and VWMA do, by a few ulps
+        if MAtype in (4, 7, 8):
+            np.testing.assert_allclose(pm.to_numpy(), expected_pm[start:start + window], rtol=1e-12)
+        else:
+            np.testing.assert_array_equal(pm.to_numpy(), expected_pm[start:start + window])
+        np.testing.assert_array_equal(trend, expected_trend[start:start + window])
+
+
+def test_tracker_recomputes_a_frame_that_does_not_continue_the_history():
+    history = candles(1000, 0)
+    tracker = PmaxTracker(period=10, multiplier=27, length=9, MAtype=1, src=3)
+    frame = history.iloc[:700].reset_index(drop=True)
+    tracker.update('BTC/USDT', frame, frame['date'])
+
+    gap = history.iloc[[*range(0, 300), *range(301, 800)]].reset_index(drop=True)
+    pm, trend = tracker.update('BTC/USDT', gap, gap['date'])
+    expected_pm, expected_trend = pmax(gap, 10, 27, 9, 1, 3)
+    np.testing.assert_array_equal(pm.to_numpy(), expected_pm.to_numpy())
+    np.testing.assert_array_equal(trend, expected_trend)
+
+    # Another pair starts from scratch
+    frame = history.iloc[200:900].reset_index(drop=True)
+    pm, _ = tracker.update('ETH/USDT', frame, frame['date'])
+    np.testing.assert_array_equal(pm.to_numpy(), pmax(frame, 10, 27, 9, 1, 3)[0].to_numpy())
@@ -0,0 +1,242 @@
+"""
+``CoinRanking`` against the ``top_traded_list`` / ``top_grossing_list`` merges and the
+``is_top_coin`` apply of NostalgiaForInfinityX (kept below as they were, without the logging).
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+qtpylib = pytest.importorskip('freqtrade.vendor.qtpylib.indicators')
+
+from strategy_utils.ranking import CoinRanking, grossing_rate, top_n_mask, traded_volume  # noqa: E402
+
+
+class LegacyCoinMetrics:
+    info_timeframe_1d = '1d'
+
+    def __init__(self, frames, runmode='backtest', top_traded_len=10, top_grossing_len=20):
+        self.frames = frames
+        self.dp = SimpleNamespace(get_pair_dataframe=lambda pair, timeframe: frames[pair].copy())
+        self.config = {'runmode': SimpleNamespace(value=runmode)}
+        self.coin_metrics = {
+            'top_traded_len': top_traded_len,
+            'tt_dataframe': DataFrame(),
+            'top_grossing_len': top_grossing_len,
+            'tg_dataframe': DataFrame(),
+            'current_whitelist': list(frames),
+        }
+
+    def top_traded_list(self):
+        self.coin_metrics['tt_dataframe'] = DataFrame()
+
+        # Build traded volume dataframe
+        for coin_pair in self.coin_metrics['current_whitelist']:
+            coin = coin_pair.split('/')[0]
+
+            # Get the volume for the daily informative timeframe and name the column for the coin
+            pair_dataframe = self.dp.get_pair_dataframe(pair=coin_pair, timeframe=self.info_timeframe_1d)
+            pair_dataframe.set_index('date')
+
+            if self.config['runmode'].value in ('live', 'dry_run'):
+                pair_dataframe = pair_dataframe.iloc[-7:,:]
+
+            # Set the date index of the self.coin_metrics['tt_dataframe'] once
+            if not 'date' in self.coin_metrics['tt_dataframe']:
+                self.coin_metrics['tt_dataframe']['date'] = pair_dataframe['date']
+                self.coin_metrics['tt_dataframe'].set_index('date')
+
+            # Calculate daily traded volume
+            pair_dataframe[coin] = pair_dataframe['volume'] * qtpylib.typical_price(pair_dataframe)
+
+            # Drop the columns we don't need
+            pair_dataframe.drop(columns=['open', 'high', 'low', 'close', 'volume'], inplace=True)
+
+            # Merge it in on the date key
+            self.coin_metrics['tt_dataframe'] = self.coin_metrics['tt_dataframe'].merge(pair_dataframe, on='date', how='left')
+
+        # Forward fill empty cells (due to different df shapes)
+        self.coin_metrics['tt_dataframe'].fillna(0, inplace=True)
+
+        # Store and drop date column for value sorting
+        pair_dates = self.coin_metrics['tt_dataframe']['date']
+        self.coin_metrics['tt_dataframe'].drop(columns=['date'], inplace=True)
+
+        # Build columns and top traded coins
+        column_names = [f"Coin #{i}" for i in range(1, self.coin_metrics['top_traded_len'] + 1)]
+        self.coin_metrics['tt_dataframe'][column_names] = self.coin_metrics['tt_dataframe'].apply(lambda x: x.nlargest(self.coin_metrics['top_traded_len']).index.values, axis=1, result_type='expand')
+        self.coin_metrics['tt_dataframe'].drop(columns=[col for col in self.coin_metrics['tt_dataframe'] if col not in column_names], inplace=True)
+
+        # Re-add stored date column
+        self.coin_metrics['tt_dataframe'].insert(loc = 0, column = 'date', value = pair_dates)
+        self.coin_metrics['tt_dataframe'].set_index('date')
+
+    def top_grossing_list(self):
+        self.coin_metrics['tg_dataframe'] = DataFrame()
+
+        # Build grossing volume dataframe
+        for coin_pair in self.coin_metrics['current_whitelist']:
+            coin = coin_pair.split('/')[0]
+
+            # Get the volume for the daily informative timeframe and name the column for the coin
+            pair_dataframe = self.dp.get_pair_dataframe(pair=coin_pair, timeframe=self.info_timeframe_1d)
+            pair_dataframe.set_index('date')
+
+            if self.config['runmode'].value in ('live', 'dry_run'):
+                pair_dataframe = pair_dataframe.iloc[-7:,:]
+
+            # Set the date index of the self.coin_metrics['tg_dataframe'] once
+            if not 'date' in self.coin_metrics['tg_dataframe']:
+                self.coin_metrics['tg_dataframe']['date'] = pair_dataframe['date']
+                self.coin_metrics['tg_dataframe'].set_index('date')
+
+            # Calculate daily grossing rate
+            pair_dataframe[coin] = pair_dataframe['close'].pct_change() * 100
+
+            # Drop the columns we don't need
+            pair_dataframe.drop(columns=['open', 'high', 'low', 'close', 'volume'], inplace=True)
+
+            # Merge it in on the date key
+            self.coin_metrics['tg_dataframe'] = self.coin_metrics['tg_dataframe'].merge(pair_dataframe, on='date', how='left')
+
+        # Forward fill empty cells (due to different df shapes)
+        self.coin_metrics['tg_dataframe'].fillna(0, inplace=True)
+
+        # Store and drop date column for value sorting
+        pair_dates = self.coin_metrics['tg_dataframe']['date']
+        self.coin_metrics['tg_dataframe'].drop(columns=['date'], inplace=True)
+
+        # Build columns and top grossing coins
+        column_names = [f"Coin #{i}" for i in range(1, self.coin_metrics['top_grossing_len'] + 1)]
+        self.coin_metrics['tg_dataframe'][column_names] = self.coin_metrics['tg_dataframe'].apply(lambda x: x.nlargest(self.coin_metrics['top_grossing_len']).index.values, axis=1, result_type='expand')
+        self.coin_metrics['tg_dataframe'].drop(columns=[col for col in self.coin_metrics['tg_dataframe'] if col not in column_names], inplace=True)
+
+        # Re-add stored date column
+        self.coin_metrics['tg_dataframe'].insert(loc = 0, column = 'date', value = pair_dates)
+        self.coin_metrics['tg_dataframe'].set_index('date')
+
+    def is_top_coin(self, coin_pair, row_data, top_length) -> bool:
+        return coin_pair.split('/')[0] in row_data.loc['Coin #1':f"Coin #{top_length}"].values
+
+    def is_top(self, key: str, length_key: str, pair: str) -> np.ndarray:
+        # What informative_1d_indicators did with the lists
+        informative_1d = self.frames[pair].copy()
+        informative_1d = informative_1d.merge(self.coin_metrics[key], on='date', how='left')
+        informative_1d['is_top'] = informative_1d.apply(lambda row: self.is_top_coin(pair, row, self.coin_metrics[length_key]), axis=1)
+        return informative_1d['is_top'].to_numpy(dtype=bool)
+
+
+def daily_frames(pairs: int, days: int, seed: int) -> dict:
+    """
+    Daily candles of ``pairs`` pairs, BTC first with every day. The others list later, skip
+    days or stop early, and the volumes and closes are coarse enough to tie.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2021-01-01', periods=days, freq='1D', tz='UTC')
+    frames = {}
+    for i, base in enumerate(['BTC'] + [f'C{i:02d}' for i in range(1, pairs)]):
+        close = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.05, days))), 0)
+        frame = DataFrame({
+            'date': dates,
+            'open': close,
+            'high': close + 1,
+            'low': close - 1,
+            'close': close,
+            'volume': rng.integers(1, 5, days) * 1000.0,
+        })
+        if i:
+            keep = rng.random(days) > 0.1
+            keep[:rng.integers(0, days // 4)] = False
+            if i % 5 == 0:
+                keep[-3:] = False
+            frame = frame[keep].reset_index(drop=True)
+        frames[f'{base}/USDT'] = frame
+    return frames
+
+
+def coin_lists(ranking: CoinRanking, tail=None) -> list:
+    return [[c for c in row if c is not None] for row in ranking.to_frame(tail).drop(columns='date').values.tolist()]
+
+
+def legacy_lists(frame: DataFrame) -> list:
+    return [[c for c in row if isinstance(c, str)] for row in frame.drop(columns='date').values.tolist()]
+
+
+@pytest.mark.parametrize('runmode, window', [('backtest', None), ('live', 7)])
+@pytest.mark.parametrize('seed', range(3))
+def test_ranking_matches_the_merged_lists(runmode, window, seed):
+    frames = daily_frames(25, 60, seed)
+    legacy = LegacyCoinMetrics(frames, runmode)
+    legacy.top_traded_list()
+    legacy.top_grossing_list()
+
+    for metric, top_n, key, length_key in [(traded_volume, 10, 'tt_dataframe', 'top_traded_len'),
+                                           (grossing_rate, 20, 'tg_dataframe', 'top_grossing_len')]:
+        ranking = CoinRanking(metric, top_n, window)
+        ranking.rebuild(list(frames), lambda pair: frames[pair])
+        assert coin_lists(ranking) == legacy_lists(legacy.coin_metrics[key])
+        for pair, frame in frames.items():
+            np.testing.assert_array_equal(ranking.top_mask(pair, frame['date']),
+                                          legacy.is_top(key, length_key, pair), err_msg=pair)
+            assert [ranking.is_top(pair, date) for date in frame['date']] == \
+                ranking.top_mask(pair, frame['date']).tolist()
+
+
+def test_whitelist_change_only_computes_the_new_pairs():
+    frames = daily_frames(25, 60, 0)
+    pairs = list(frames)
+    fetched = []
+
+    def get_frame(pair):
+        fetched.append(pair)
+        return frames[pair]
+
+    ranking = CoinRanking(traded_volume, 10)
+    ranking.rebuild(pairs[:20], get_frame)
+    fetched.clear()
+    whitelist = pairs[:5] + pairs[8:25]
+    ranking.set_pairs(whitelist, get_frame)
+    assert fetched == pairs[20:25]
+
+    legacy = LegacyCoinMetrics({pair: frames[pair] for pair in whitelist})
+    legacy.top_traded_list()
+    assert coin_lists(ranking) == legacy_lists(legacy.coin_metrics['tt_dataframe'])
+
+
+@pytest.mark.parametrize('window', [None, 7])
+def test_update_appends_the_new_days(window):
+    frames = daily_frames(25, 60, 1)
+    last = frames['BTC/USDT']['date'].iloc[-1]
+
+    def until(days: int) -> dict:
+        return {pair: frame[frame['date'] <= last - pd.Timedelta(days=days)] for pair, frame in frames.items()}
+
+    start = until(5)
+    ranking = CoinRanking(grossing_rate, 20, window)
+    ranking.rebuild(list(frames), lambda pair: start[pair])
+    assert not ranking.update(lambda pair: start[pair])
+
+    for days in (4, 2, 0):
+        current = until(days)
+        assert ranking.update(lambda pair: current[pair])
+        assert len(ranking) == (len(current['BTC/USDT']) if window is None else window)
+        # Live used to rank the last 7 candles of each pair, their first grossing rate was
+        # NaN (0). The days appended keep their rate, as over the whole history.
+        legacy = LegacyCoinMetrics(current)
+        legacy.top_grossing_list()
+        expected = legacy_lists(legacy.coin_metrics['tg_dataframe'])
+        assert coin_lists(ranking) == expected[-len(ranking):]
+        assert ranking.top_pairs() == [f'{coin}/USDT' for coin in expected[-1]]
+
+
+@pytest.mark.parametrize('top_n', [0, 1, 3, 7, 8, 12])
+@pytest.mark.parametrize('seed', range(3))
+def test_top_n_mask_matches_nlargest(top_n, seed):
+    rng = np.random.default_rng(seed)
+    values = rng.integers(0, 4, size=(200, 8)).astype(float)
+    expected = np.zeros(values.shape, dtype=bool)
+    for row, data in enumerate(values):
+        expected[row, pd.Series(data).nlargest(top_n, keep='first').index] = True
+    np.testing.assert_array_equal(top_n_mask(values, top_n), expected)
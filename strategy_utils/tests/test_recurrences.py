@@ -0,0 +1,269 @@
+"""
+``supertrend_bands``, ``adaptive_average`` and ``xsa_average`` against the ``apply`` callbacks
+of LuxOSC's ``LUX_SuperTrendOscillator`` and PumpDetector's ``xsa`` (kept below as they were,
+module-level state included), and ``PairPool`` against computing every pair in turn.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+ta = pytest.importorskip('talib.abstract')
+
+from strategy_utils.parallel import PairPool  # noqa: E402
+from strategy_utils.recurrences import SuperTrendOscState, adaptive_average, supertrend_bands, xsa_average  # noqa: E402
+
+
+def lux_recurrences(dtloc, source='close', length=6, mult=9):
+    """The band, trend and AMA columns of ``LUX_SuperTrendOscillator``."""
+    def_proc_name = '_LUX_SuperTrendOscillator'
+    atrcol        = 'atr'    + def_proc_name
+    hl2col        = 'hl2'    + def_proc_name
+    upcol         = 'up'     + def_proc_name
+    dncol         = 'dn'     + def_proc_name
+    uppercol      = 'upper'  + def_proc_name
+    lowercol      = 'lower'  + def_proc_name
+    trendcol      = 'trend'  + def_proc_name
+    sptcol        = 'spt'    + def_proc_name
+    osc1col       = 'osc1'   + def_proc_name
+    osc2col       = 'osc2'   + def_proc_name
+    osccol        = 'osc'    + def_proc_name
+    alphacol      = 'alpha'  + def_proc_name
+    amacol        = 'ama'    + def_proc_name
+
+    dtS = dtloc.copy().fillna(0)
+    dtS[atrcol] = ta.ATR(dtloc, timeperiod = length) * mult
+    dtS[hl2col] =  (dtS['high'] + dtS['low'] )/2
+    dtS[upcol] =  dtS[hl2col] + dtS[atrcol]
+    dtS[dncol] =  dtS[hl2col] - dtS[atrcol]
+    def calc_upper(dfr, init=0):
+        global calc_Lux_STO_upper
+        global calc_Lux_STO_src
+        if init == 1:
+            calc_Lux_STO_upper = 0.0
+            calc_Lux_STO_src = 0.0
+            return
+        if calc_Lux_STO_src < calc_Lux_STO_upper:
+            calc_Lux_STO_upper = min(dfr[upcol], calc_Lux_STO_upper)
+        else:
+            calc_Lux_STO_upper = dfr[upcol]
+        calc_Lux_STO_src = dfr[source]
+        return calc_Lux_STO_upper
+    calc_upper(None, init=1)
+    dtS[uppercol] = dtS.apply(calc_upper, axis = 1)
+    def calc_lower(dfr, init=0):
+        global calc_Lux_STO_lower
+        global calc_Lux_STO_src
+        if init == 1:
+            calc_Lux_STO_lower = 0.0
+            calc_Lux_STO_src = 0.0
+            return
+        if calc_Lux_STO_src > calc_Lux_STO_lower:
+            calc_Lux_STO_lower= max(dfr[dncol], calc_Lux_STO_lower)
+        else:
+            calc_Lux_STO_lower = dfr[dncol]
+        calc_Lux_STO_src = dfr[source]
+        return calc_Lux_STO_lower
+    calc_lower(None, init=1)
+    dtS[lowercol] = dtS.apply(calc_lower, axis = 1)
+    def calc_trend(dfr, init=0):
+        global calc_Lux_STO_trend
+        global calc_Lux_STO_lower
+        global calc_Lux_STO_upper
+        if init == 1:
+            calc_Lux_STO_trend = 0.0
+            calc_Lux_STO_lower = 0.0
+            calc_Lux_STO_upper = 0.0
+            return
+        if dfr[source] > calc_Lux_STO_upper:
+            calc_Lux_STO_trend = 1
+        elif dfr[source] < calc_Lux_STO_lower:
+            calc_Lux_STO_trend = 0
+        calc_Lux_STO_upper = dfr[uppercol]
+        calc_Lux_STO_lower = dfr[lowercol]
+        return calc_Lux_STO_trend
+    calc_trend(None, init=1)
+    dtS[trendcol] = dtS.apply(calc_trend, axis = 1)
+    dtS[sptcol] = dtS[trendcol] * dtS[lowercol] + (1-dtS[trendcol] ) * dtS[uppercol]
+    dtS[osc1col] = (dtS[source] - dtS[sptcol]) / (dtS[uppercol] - dtS[lowercol])
+    dtS[osc2col] = np.where(dtS[osc1col] < 1, dtS[osc1col], 1 )
+    dtS[osccol] = np.where(dtS[osc2col] > -1, dtS[osc2col], -1)
+    dtS[alphacol] = dtS[osccol].pow(2)/length
+    def calc_ama(dfr, init=0):
+        global calc_Lux_STO_ama
+        if init == 1:
+            calc_Lux_STO_ama = 0.0
+            return
+        calc_Lux_STO_ama = calc_Lux_STO_ama + dfr[alphacol] * (dfr[osccol] - calc_Lux_STO_ama)
+        return calc_Lux_STO_ama
+    calc_ama(None, init=1)
+    dtS[amacol] = dtS.apply(calc_ama, axis = 1)
+
+    return dtS.rename(columns=lambda name: name.replace(def_proc_name, ''))
+
+
+def xsa(dataframe, source, len, wei):
+    df = dataframe.copy().fillna(0)
+    def calc_xsa(dfr, init=0):
+        global calc_sumf_value
+        global calc_src_value
+        global calc_out_value
+        if init == 1:
+            calc_sumf_value = [0.0] * len
+            calc_src_value = [0.0] * len
+            calc_out_value = [0.0] * len
+            return
+        calc_src_value.pop(0)
+        calc_src_value.append(dfr[source])
+        sumf_val = calc_sumf_value[-1] - calc_src_value[0]
+        ma_val = sumf_val / len
+        out_val = (calc_src_value[-1] * wei + calc_out_value[-1] * (len-wei))/len
+        calc_sumf_value.pop(0)
+        calc_sumf_value.append(sumf_val)
+        calc_out_value.pop(0)
+        calc_out_value.append(out_val)
+        return out_val
+    calc_xsa(None, init=1)
+    df['retxsa'] = df.apply(calc_xsa, axis = 1)
+
+    return df['retxsa']
+
+
+def candles(n: int, seed: int) -> DataFrame:
+    """Geometric random walk candles on 5 minutes."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n, freq='5min', tz='UTC'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + 0.005 * rng.random(n)),
+        'low': np.minimum(open_, close) * (1 - 0.005 * rng.random(n)),
+        'close': close,
+        'volume': 1000 * rng.random(n),
+    })
+
+
+@pytest.mark.parametrize('length, mult', [(6, 9), (2, 1), (20, 3)])
+@pytest.mark.parametrize('seed', range(2))
+def test_supertrend_bands_and_ama_match_the_callbacks(length, mult, seed):
+    expected = lux_recurrences(candles(1000, seed), length=length, mult=mult)
+    # Both trends, and the NaN bands of the ATR warm-up
+    assert expected['trend'].nunique() == 2 and expected['upper'].isna().any()
+
+    upper, lower, trend, state = supertrend_bands(expected['close'], expected['up'], expected['dn'])
+    np.testing.assert_array_equal(upper, expected['upper'].to_numpy())
+    np.testing.assert_array_equal(lower, expected['lower'].to_numpy())
+    np.testing.assert_array_equal(trend, expected['trend'].to_numpy())
+    assert trend.dtype == expected['trend'].dtype == np.int64
+    assert state.trend == trend[-1] and state.src == expected['close'].iat[-1]
+
+    ama, state = adaptive_average(expected['osc'], expected['alpha'])
+    np.testing.assert_array_equal(ama, expected['ama'].to_numpy())
+    assert ama.dtype == expected['ama'].dtype and state.ama == ama[-1]
+
+
+@pytest.mark.parametrize('length, weight', [(3, 1), (13, 8), (4, 1), (1, 1)])
+def test_xsa_average_matches_the_callback(length, weight):
+    dataframe = candles(1000, length)
+    dataframe['rsv'] = (dataframe['close'] - dataframe['low'].rolling(9).min()) / \
+        (dataframe['high'].rolling(9).max() - dataframe['low'].rolling(9).min()) * 100
+    expected = xsa(dataframe, 'rsv', length, weight)
+
+    values, state = xsa_average(dataframe['rsv'].fillna(0), length, weight)
+    np.testing.assert_array_equal(values, expected.to_numpy())
+    assert state.out == values[-1]
+
+
+@pytest.mark.parametrize('split', [1, 7, 500, 999])
+def test_split_runs_resume_from_the_state(split):
+    dataframe = lux_recurrences(candles(1000, 3))
+    src, up, dn = dataframe['close'].to_numpy(), dataframe['up'].to_numpy(), dataframe['dn'].to_numpy()
+    osc, alpha = dataframe['osc'].to_numpy(), dataframe['alpha'].to_numpy()
+
+    upper, lower, trend, state = supertrend_bands(src, up, dn)
+    ama, state = adaptive_average(osc, alpha, state)
+    head = supertrend_bands(src[:split], up[:split], dn[:split])
+    tail = supertrend_bands(src[split:], up[split:], dn[split:], head[3])
+    np.testing.assert_array_equal(np.r_[head[0], tail[0]], upper)
+    np.testing.assert_array_equal(np.r_[head[1], tail[1]], lower)
+    np.testing.assert_array_equal(np.r_[head[2], tail[2]], trend)
+    assert tail[3] == SuperTrendOscState(state.upper, state.lower, state.src, state.trend)
+    ama_head, ama_state = adaptive_average(osc[:split], alpha[:split], head[3])
+    ama_tail, ama_state = adaptive_average(osc[split:], alpha[split:], ama_state)
+    np.testing.assert_array_equal(np.r_[ama_head, ama_tail], ama)
+    assert ama_state.ama == state.ama
+
+    xsa_values, xsa_state = xsa_average(osc, 3, 1)
+    xsa_head, head_state = xsa_average(osc[:split], 3, 1)
+    xsa_tail, tail_state = xsa_average(osc[split:], 3, 1, head_state)
+    np.testing.assert_array_equal(np.r_[xsa_head, xsa_tail], xsa_values)
+    assert tail_state == xsa_state
+
+
+def oscillator_columns(dataframe: DataFrame, length=6, mult=9) -> dict:
+    # Only the kernels: the callbacks above share their globals between threads
+    atr = ta.ATR(dataframe, timeperiod=length) * mult
+    hl2 = (dataframe['high'] + dataframe['low']) / 2
+    upper, lower, trend, _ = supertrend_bands(dataframe['close'], hl2 + atr, hl2 - atr)
+    spt = trend * lower + (1 - trend) * upper
+    osc = np.clip((dataframe['close'].to_numpy() - spt) / (upper - lower), -1, 1)
+    ama, _ = adaptive_average(osc, osc ** 2 / length)
+    return {'upper': upper, 'lower': lower, 'trend': trend, 'ama': ama}
+
+
+class CountingCompute:
+    def __init__(self, compute):
+        self.compute = compute
+        self.threads = set()
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, dataframe):
+        with self._lock:
+            self.calls += 1
+            self.threads.add(threading.get_ident())
+        return self.compute(dataframe)
+
+
+def test_pair_pool_matches_computing_every_pair_in_turn():
+    frames = {f'C{i:02d}/USDT': candles(500, i) for i in range(12)}
+    frames['EMPTY/USDT'] = candles(10, 0).iloc[:0]
+    frames['NONE/USDT'] = None
+    compute = CountingCompute(oscillator_columns)
+    pool = PairPool()
+    assert pool.precompute(frames, compute, workers=4) == 12
+    assert compute.calls == 12 and len(pool) == 12
+    # Another loop on the same candles has nothing to do
+    assert pool.precompute(frames, compute, workers=4) == 0
+
+    for pair in list(frames)[:12]:
+        columns = pool.get(pair, frames[pair], compute)
+        expected = oscillator_columns(frames[pair])
+        for name, values in expected.items():
+            np.testing.assert_array_equal(columns[name], values, err_msg=f'{pair} {name}')
+    assert compute.calls == 12
+
+
+def test_pair_pool_computes_stale_and_missing_pairs_inline():
+    history = candles(600, 0)
+    compute = CountingCompute(oscillator_columns)
+    pool = PairPool()
+    pool.precompute({'BTC/USDT': history.iloc[:500]}, compute)
+
+    # The next candle arrived after bot_loop_start
+    moved = history.iloc[1:501]
+    columns = pool.get('BTC/USDT', moved, compute)
+    assert compute.calls == 2 and threading.get_ident() in compute.threads
+    np.testing.assert_array_equal(columns['ama'], oscillator_columns(moved)['ama'])
+    assert pool.get('BTC/USDT', moved, compute) is columns
+    pool.get('ETH/USDT', moved, compute)
+    assert compute.calls == 3 and len(pool) == 2
+
+    pool.reset('BTC/USDT')
+    assert len(pool) == 1
+    assert pool.precompute({'BTC/USDT': moved, 'ETH/USDT': moved}, compute) == 1
+    pool.reset()
+    assert len(pool) == 0
@@ -0,0 +1,98 @@
+"""
+``ReferenceIndicators`` against computing the BTC indicators inside every pair's
+``populate_indicators``, as the NFI and BigZ strategies did.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from strategy_utils.reference import ReferenceIndicators
+
+
+def candles(n: int, seed: int, freq: str = '1h') -> DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n, freq=freq, tz='UTC'),
+        'open': close,
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'volume': 1000 * rng.random(n),
+    })
+
+
+class CountingIndicators:
+    """A BTC indicator set that counts how often it runs."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, dataframe: DataFrame) -> DataFrame:
+        self.calls += 1
+        dataframe = dataframe.copy()
+        dataframe['not_downtrend'] = (dataframe['close'] > dataframe['close'].shift()).astype(int)
+        dataframe['sma_20'] = dataframe['close'].rolling(20).mean()
+        return dataframe
+
+
+def test_one_computation_per_candle_for_every_pair():
+    btc = candles(300, 0)
+    compute = CountingIndicators()
+    reference = ReferenceIndicators()
+    results = [reference.get(('BTC/USDT', '1h'), btc, compute) for _ in range(5)]
+    assert compute.calls == 1 and len(reference) == 1
+    for result in results:
+        pd.testing.assert_frame_equal(result, CountingIndicators()(btc))
+
+    # Every pair gets its own copy to rename and merge
+    results[0].rename(columns={'sma_20': 'btc_sma_20_1h'}, inplace=True)
+    results[1].loc[:, 'close'] = 0.0
+    pd.testing.assert_frame_equal(reference.get(('BTC/USDT', '1h'), btc, compute), CountingIndicators()(btc))
+    assert compute.calls == 1
+
+
+def test_recomputes_when_the_candles_change():
+    history = candles(400, 1)
+    compute = CountingIndicators()
+    reference = ReferenceIndicators()
+    key = ('BTC/USDT', '1h')
+    reference.get(key, history.iloc[:300], compute)
+    reference.get(key, history.iloc[:300].copy(), compute)
+    assert compute.calls == 1
+
+    # The next candle
+    moved = history.iloc[1:301]
+    pd.testing.assert_frame_equal(reference.get(key, moved, compute), CountingIndicators()(moved))
+    assert compute.calls == 2
+    # The last candle updated in place
+    updated = moved.copy()
+    updated.loc[updated.index[-1], 'close'] *= 1.01
+    pd.testing.assert_frame_equal(reference.get(key, updated, compute), CountingIndicators()(updated))
+    assert compute.calls == 3
+
+    # Other timeframes and parameters are cached on their own
+    reference.get(('BTC/USDT', '5m'), candles(300, 2, '5min'), compute)
+    reference.get(key, updated, compute)
+    assert compute.calls == 4 and len(reference) == 2
+
+    reference.reset(key)
+    reference.get(key, updated, compute)
+    assert compute.calls == 5
+    reference.reset()
+    assert len(reference) == 0
+
+
+def test_merged_pairs_match_the_per_pair_computation():
+    strategy = pytest.importorskip('freqtrade.strategy')
+    btc = candles(300, 3)
+    reference = ReferenceIndicators()
+
+    for seed in range(4):
+        pair_frame = candles(300, 10 + seed, '5min')
+        expected = strategy.merge_informative_pair(pair_frame.copy(), CountingIndicators()(btc.copy()),
+                                                   '5m', '1h', ffill=True)
+        shared = reference.get(('BTC/USDT', '1h'), btc, CountingIndicators())
+        result = strategy.merge_informative_pair(pair_frame.copy(), shared, '5m', '1h', ffill=True)
+        pd.testing.assert_frame_equal(result, expected)
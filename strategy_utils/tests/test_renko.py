@@ -0,0 +1,163 @@
+"""
+``RenkoBuilder`` against the iterrows / concat brick builder of Renko's ``populate_indicators``
+(kept below as it was, but for the seed brick size of the live windows).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+ta = pytest.importorskip('talib.abstract')
+
+from strategy_utils.renko import BRICK_COLUMNS, RenkoBuilder, RenkoState, last_brick, renko_bricks  # noqa: E402
+
+
+def legacy_bricks(dataframe: DataFrame, brick_size=None) -> DataFrame:
+    """Every brick of the old loop, before its ``groupby(['date']).last()``."""
+    if brick_size is None:
+        brick_size = np.mean(dataframe['ATR'])
+    columns = ['date', 'open', 'high', 'low', 'close', 'volume', 'ATR']
+    df = dataframe[columns]
+    cdf = pd.DataFrame(
+        columns=columns,
+        data=[],
+    )
+    cdf.loc[0] = df.loc[0]
+    close = df.loc[0]['close']
+    volume = df.loc[0]['volume']
+    cdf.iloc[0, 1:] = [close - brick_size, close, close - brick_size, close, volume, brick_size]
+    cdf['trend'] = True
+    columns = ['date', 'open', 'high', 'low', 'close', 'volume', 'ATR', 'trend']
+
+    for index, row in df.iterrows():
+        if not np.isnan(row['ATR']): brick_size = row['ATR']
+        close = row['close']
+        date = row['date']
+        volume = row['volume']
+        row_p1 = cdf.iloc[-1]
+        trend = row_p1['trend']
+        close_p1 = row_p1['close']
+        bricks = int(np.nan_to_num((close - close_p1) / brick_size))
+        data = []
+        if trend and bricks >= 1:
+            for i in range(bricks):
+                r = [date, close_p1, close_p1 + brick_size, close_p1, close_p1 + brick_size, volume, brick_size, trend]
+                data.append(r)
+                close_p1 += brick_size
+        elif trend and bricks <= -2:
+            trend = not trend
+            bricks += 1
+            close_p1 -= brick_size
+            for i in range(abs(bricks)):
+                r = [date, close_p1, close_p1, close_p1 - brick_size, close_p1 - brick_size, volume, brick_size, trend]
+                data.append(r)
+                close_p1 -= brick_size
+        elif not trend and bricks <= -1:
+            for i in range(abs(bricks)):
+                r = [date, close_p1, close_p1, close_p1 - brick_size, close_p1 - brick_size, volume, brick_size, trend]
+                data.append(r)
+                close_p1 -= brick_size
+        elif not trend and bricks >= 2:
+            trend = not trend
+            bricks -= 1
+            close_p1 += brick_size
+            for i in range(abs(bricks)):
+                r = [date, close_p1, close_p1 + brick_size, close_p1, close_p1 + brick_size, volume, brick_size, trend]
+                data.append(r)
+                close_p1 += brick_size
+        else:
+            continue
+
+        sdf = pd.DataFrame(data=data, columns=columns)
+        cdf = pd.concat([cdf, sdf])
+
+    return cdf.reset_index(drop=True)
+
+
+def candles(n: int, seed: int) -> DataFrame:
+    """Geometric random walk candles on 15 minutes, with the ATR(5) of the strategy."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    dataframe = DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n, freq='15min', tz='UTC'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + 0.005 * rng.random(n)),
+        'low': np.minimum(open_, close) * (1 - 0.005 * rng.random(n)),
+        'close': close,
+        'volume': 1000 * rng.random(n),
+    })
+    dataframe['ATR'] = ta.ATR(dataframe, timeperiod=5)
+    return dataframe
+
+
+def assert_bricks_equal(bricks: DataFrame, expected: DataFrame):
+    assert list(bricks.columns) == BRICK_COLUMNS
+    assert len(bricks) == len(expected)
+    np.testing.assert_array_equal(bricks['date'].to_numpy(), expected['date'].to_numpy())
+    for column in ['open', 'high', 'low', 'close', 'volume', 'ATR']:
+        np.testing.assert_array_equal(bricks[column].to_numpy(dtype=float),
+                                      expected[column].to_numpy(dtype=float), err_msg=column)
+    np.testing.assert_array_equal(bricks['trend'].to_numpy(dtype=bool), expected['trend'].to_numpy(dtype=bool))
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_builder_matches_the_loop(seed):
+    dataframe = candles(1500, seed)
+    expected = legacy_bricks(dataframe)
+    # Enough moves both ways to go through every branch
+    assert expected['trend'].sum() > 20 and (~expected['trend'].astype(bool)).sum() > 20
+
+    bricks = RenkoBuilder().update('BTC/USDT', dataframe, dataframe['ATR'])
+    assert_bricks_equal(bricks, expected)
+
+    # The strategy keeps the last brick of every candle that closed one
+    grouped = expected.groupby(['date']).last().reset_index()
+    closed = np.unique(last_brick(bricks['date'], dataframe['date']))
+    assert_bricks_equal(bricks.iloc[closed[closed >= 0]].reset_index(drop=True), grouped)
+
+
+def test_walk_resumes_from_its_state():
+    dataframe = candles(1000, 0)
+    close, atr = dataframe['close'].to_numpy(), dataframe['ATR'].to_numpy()
+    seed = RenkoState(close[0], True, np.nanmean(atr))
+    expected, expected_state = renko_bricks(close, atr, seed)
+
+    head, state = renko_bricks(close[:400], atr[:400], seed)
+    tail, state = renko_bricks(close[400:], atr[400:], state)
+    tail['candle'] += 400
+    pd.testing.assert_frame_equal(pd.concat([head, tail], ignore_index=True), expected)
+    assert state == expected_state
+
+
+@pytest.mark.parametrize('step', [1, 7, 50])
+def test_builder_on_a_window_moving_forward(step):
+    history = candles(1600, 1)
+    window = 1000
+    # The bricks of a live bot start from the first frame it saw
+    seed_size = np.mean(history['ATR'].iloc[:window])
+
+    # The walk only looks back: the bricks up to a candle are those of the history up to it
+    everything = legacy_bricks(history, seed_size).infer_objects()
+
+    builder = RenkoBuilder()
+    for start in range(0, len(history) - window + 1, step):
+        frame = history.iloc[start:start + window].reset_index(drop=True)
+        bricks = builder.update('BTC/USDT', frame, frame['ATR'])
+        dates = everything['date']
+        expected = everything[(dates >= frame['date'].iloc[0]) & (dates <= frame['date'].iloc[-1])]
+        assert_bricks_equal(bricks, expected)
+
+
+def test_builder_starts_over_on_a_frame_that_does_not_continue_the_history():
+    history = candles(1000, 2)
+    builder = RenkoBuilder()
+    builder.update('BTC/USDT', history.iloc[:600].reset_index(drop=True), history['ATR'].iloc[:600])
+
+    gap = history.iloc[700:].reset_index(drop=True)
+    bricks = builder.update('BTC/USDT', gap, gap['ATR'])
+    assert_bricks_equal(bricks, legacy_bricks(gap))
+
+    builder.reset('BTC/USDT')
+    frame = history.iloc[:800].reset_index(drop=True)
+    assert_bricks_equal(builder.update('BTC/USDT', frame, frame['ATR']), legacy_bricks(frame))
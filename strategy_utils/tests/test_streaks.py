@@ -0,0 +1,85 @@
+"""
+``calc_streaks`` and ``StreakCounter`` against the ``itertuples`` helper the NFI Next family
+used before (kept below as it was).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import Series, concat
+
+from strategy_utils.streaks import StreakCounter, calc_streaks
+
+
+def reference_calc_streaks(series: Series):
+    # logic tables
+    geq = series >= series.shift(1)  # True if rising
+    eq = series == series.shift(1)  # True if equal
+    logic_table = concat([geq, eq], axis=1)
+
+    streaks = [0]  # holds the streak duration, starts with 0
+
+    for row in logic_table.iloc[1:].itertuples():  # iterate through logic table
+        if row[2]:  # same value as before
+            streaks.append(0)
+            continue
+        last_value = streaks[-1]
+        if row[1]:  # higher value than before
+            streaks.append(last_value + 1 if last_value >=
+                                             0 else 1)  # increase or reset to +1
+        else:  # lower value than before
+            streaks.append(last_value - 1 if last_value <
+                                             0 else -1)  # decrease or reset to -1
+
+    return streaks
+
+
+def random_closes(n: int, seed: int) -> Series:
+    """Random walk in 0.1 ticks that stays flat half of the time, with NaNs and an inf."""
+    rng = np.random.default_rng(seed)
+    close = 100 + 0.1 * np.cumsum(rng.choice([-1, 0, 0, 1], n) * rng.integers(1, 3, n))
+    close[rng.random(n) < 0.03] = np.nan
+    if n > 20:
+        close[10:13] = np.nan
+        close[15] = np.inf
+    return Series(close)
+
+
+@pytest.mark.parametrize('n', [1, 2, 3, 50, 5000])
+@pytest.mark.parametrize('seed', range(5))
+def test_calc_streaks_matches_reference(n, seed):
+    series = random_closes(n, seed)
+    assert calc_streaks(series).tolist() == reference_calc_streaks(series)
+
+
+def test_calc_streaks_empty():
+    # The old helper answered [0] for no rows, one value more than there are rows
+    assert calc_streaks(Series([], dtype=float)).tolist() == []
+
+
+def test_calc_streaks_accepts_arrays_and_lists():
+    series = random_closes(300, 42)
+    expected = reference_calc_streaks(series)
+    assert calc_streaks(series.to_numpy()).tolist() == expected
+    assert calc_streaks(series.tolist()).tolist() == expected
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_streak_counter_append_matches_reference(seed):
+    series = random_closes(2000, seed)
+    counter = StreakCounter()
+    assert [counter.append(value) for value in series] == reference_calc_streaks(series)
+
+
+@pytest.mark.parametrize('split', [1, 2, 11, 12, 13, 16, 500, 1999])
+def test_streak_counter_from_history_then_append(split):
+    series = random_closes(2000, 7)
+    expected = reference_calc_streaks(series)
+    counter = StreakCounter.from_history(series.iloc[:split])
+    assert counter.streak == expected[split - 1]
+    assert [counter.append(value) for value in series.iloc[split:]] == expected[split:]
+
+
+def test_streak_counter_from_empty_history():
+    series = random_closes(100, 3)
+    counter = StreakCounter.from_history(pd.Series([], dtype=float))
+    assert [counter.append(value) for value in series] == reference_calc_streaks(series)
@@ -0,0 +1,187 @@
+"""
+``supertrend_batch`` against the ``supertrend()`` methods of SuperTrend and FastSupertrend
+(kept below as they were, but for the writes noted in ``SuperTrendLoop``).
+"""
+from itertools import product
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+ta = pytest.importorskip('talib.abstract')
+
+from strategy_utils.supertrend import supertrend, supertrend_batch  # noqa: E402
+
+# Every pair the IntParameter(1, 7) multipliers and IntParameter(7, 21) periods reach
+GRID = list(product(range(1, 8), range(7, 22)))
+
+
+class SuperTrendLoop:
+    """
+        Supertrend Indicator; adapted for freqtrade
+        from: https://github.com/freqtrade/freqtrade-strategies/issues/30
+    """
+    # ``df[col].iat[i] = ...`` writes to a copy under pandas copy-on-write, so the writes go
+    # through ``df.iat``; ``'nan'`` is what numpy 1 made of ``np.NaN`` next to strings
+    def supertrend(self, dataframe: DataFrame, multiplier, period):
+        df = dataframe.copy()
+
+        df['TR'] = ta.TRANGE(df)
+        df['ATR'] = ta.SMA(df['TR'], period)
+
+        st = 'ST_' + str(period) + '_' + str(multiplier)
+        stx = 'STX_' + str(period) + '_' + str(multiplier)
+
+        # Compute basic upper and lower bands
+        df['basic_ub'] = (df['high'] + df['low']) / 2 + multiplier * df['ATR']
+        df['basic_lb'] = (df['high'] + df['low']) / 2 - multiplier * df['ATR']
+
+        # Compute final upper and lower bands
+        df['final_ub'] = 0.00
+        df['final_lb'] = 0.00
+        ub, lb = df.columns.get_loc('final_ub'), df.columns.get_loc('final_lb')
+        for i in range(period, len(df)):
+            df.iat[i, ub] = df['basic_ub'].iat[i] if df['basic_ub'].iat[i] < df['final_ub'].iat[i - 1] or df['close'].iat[i - 1] > df['final_ub'].iat[i - 1] else df['final_ub'].iat[i - 1]
+            df.iat[i, lb] = df['basic_lb'].iat[i] if df['basic_lb'].iat[i] > df['final_lb'].iat[i - 1] or df['close'].iat[i - 1] < df['final_lb'].iat[i - 1] else df['final_lb'].iat[i - 1]
+
+        # Set the Supertrend value
+        df[st] = 0.00
+        line = df.columns.get_loc(st)
+        for i in range(period, len(df)):
+            df.iat[i, line] = df['final_ub'].iat[i] if df[st].iat[i - 1] == df['final_ub'].iat[i - 1] and df['close'].iat[i] <= df['final_ub'].iat[i] else \
+                              df['final_lb'].iat[i] if df[st].iat[i - 1] == df['final_ub'].iat[i - 1] and df['close'].iat[i] >  df['final_ub'].iat[i] else \
+                              df['final_lb'].iat[i] if df[st].iat[i - 1] == df['final_lb'].iat[i - 1] and df['close'].iat[i] >= df['final_lb'].iat[i] else \
+                              df['final_ub'].iat[i] if df[st].iat[i - 1] == df['final_lb'].iat[i - 1] and df['close'].iat[i] <  df['final_lb'].iat[i] else 0.00
+        # Mark the trend direction up/down
+        df[stx] = np.where((df[st] > 0.00), np.where((df['close'] < df[st]), 'down',  'up'), 'nan')
+
+        # Remove basic and final bands from the columns
+        df.drop(['basic_ub', 'basic_lb', 'final_ub', 'final_lb'], inplace=True, axis=1)
+
+        df.fillna(0, inplace=True)
+
+        return DataFrame(index=df.index, data={
+            'ST' : df[st],
+            'STX' : df[stx]
+        })
+
+
+class FastSupertrendLoop:
+    """
+        Supertrend Indicator; adapted for freqtrade
+        from: https://github.com/freqtrade/freqtrade-strategies/issues/30
+    """
+    def supertrend(self, dataframe: DataFrame, multiplier, period):
+        df = dataframe.copy()
+        last_row = dataframe.tail(1).index.item()
+
+        df['TR'] = ta.TRANGE(df)
+        df['ATR'] = ta.SMA(df['TR'], period)
+
+        st = 'ST_' + str(period) + '_' + str(multiplier)
+        stx = 'STX_' + str(period) + '_' + str(multiplier)
+
+        # Compute basic upper and lower bands
+        BASIC_UB = ((df['high'] + df['low']) / 2 + multiplier * df['ATR']).values
+        BASIC_LB = ((df['high'] + df['low']) / 2 - multiplier * df['ATR']).values
+        FINAL_UB = np.zeros(last_row + 1)
+        FINAL_LB = np.zeros(last_row + 1)
+        ST = np.zeros(last_row + 1)
+        CLOSE = df['close'].values
+
+        # Compute final upper and lower bands
+        for i in range(period, last_row):
+            FINAL_UB[i] = BASIC_UB[i] if BASIC_UB[i] < FINAL_UB[i - 1] or CLOSE[i - 1] > FINAL_UB[i - 1] else FINAL_UB[i - 1]
+            FINAL_LB[i] = BASIC_LB[i] if BASIC_LB[i] > FINAL_LB[i - 1] or CLOSE[i - 1] < FINAL_LB[i - 1] else FINAL_LB[i - 1]
+
+        # Set the Supertrend value
+        for i in range(period, last_row):
+            ST[i] = FINAL_UB[i] if ST[i - 1] == FINAL_UB[i - 1] and CLOSE[i] <= FINAL_UB[i] else \
+                    FINAL_LB[i] if ST[i - 1] == FINAL_UB[i - 1] and CLOSE[i] >  FINAL_UB[i] else \
+                    FINAL_LB[i] if ST[i - 1] == FINAL_LB[i - 1] and CLOSE[i] >= FINAL_LB[i] else \
+                    FINAL_UB[i] if ST[i - 1] == FINAL_LB[i - 1] and CLOSE[i] <  FINAL_LB[i] else 0.00
+        df_ST = pd.DataFrame(ST, columns=[st])
+        df = pd.concat([df, df_ST],axis=1)
+
+        # Mark the trend direction up/down
+        df[stx] = np.where((df[st] > 0.00), np.where((df['close'] < df[st]), 'down',  'up'), 'nan')
+
+        df.fillna(0, inplace=True)
+
+        return DataFrame(index=df.index, data={
+            'ST' : df[st],
+            'STX' : df[stx]
+        })
+
+
+def candles(n: int, seed: int) -> DataFrame:
+    """Geometric random walk candles on an hour."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n, freq='1h', tz='UTC'),
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + 0.005 * rng.random(n)),
+        'low': np.minimum(open_, close) * (1 - 0.005 * rng.random(n)),
+        'close': close,
+        'volume': 1000 * rng.random(n),
+    })
+
+
+def legacy_trend(stx) -> np.ndarray:
+    stx = np.asarray(stx)
+    return np.select([stx == 'up', stx == 'down'], [1, -1], 0)
+
+
+@pytest.mark.parametrize('seed', range(2))
+def test_supertrend_batch_matches_the_loop(seed):
+    dataframe = candles(300, seed)
+    before = dataframe.copy()
+    bands = supertrend_batch(dataframe, GRID)
+    pd.testing.assert_frame_equal(dataframe, before)
+    assert bands.st.shape == bands.trend.shape == (len(dataframe), len(GRID))
+
+    loop = SuperTrendLoop()
+    for multiplier, period in GRID:
+        expected = loop.supertrend(dataframe, multiplier, period)
+        st, trend = bands.get(multiplier, period)
+        np.testing.assert_array_equal(st, expected['ST'].to_numpy(), err_msg=f'{multiplier} {period}')
+        np.testing.assert_array_equal(trend, legacy_trend(expected['STX']), err_msg=f'{multiplier} {period}')
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_fast_supertrend_now_defines_the_last_candle(seed):
+    dataframe = candles(300, seed)
+    bands = supertrend_batch(dataframe, GRID)
+
+    loop = FastSupertrendLoop()
+    for multiplier, period in GRID:
+        expected = loop.supertrend(dataframe, multiplier, period)
+        st, trend = bands.get(multiplier, period)
+        np.testing.assert_array_equal(st[:-1], expected['ST'].to_numpy()[:-1])
+        np.testing.assert_array_equal(trend[:-1], legacy_trend(expected['STX'])[:-1])
+        # Its loops stopped before the last candle, which stayed undefined
+        assert expected['ST'].iat[-1] == 0 and expected['STX'].iat[-1] == 'nan'
+        assert st[-1] > 0 and trend[-1] != 0
+
+
+def test_duplicates_and_trend_frame():
+    dataframe = candles(100, 0)
+    dataframe.index += 500
+    bands = supertrend_batch(dataframe, [(3, 10), (2, 7), (3, 10.0)])
+    assert bands.params == [(3, 10), (2, 7)]
+    frame = bands.trend_frame(dataframe.index)
+    assert list(frame.columns) == ['supertrend_3_10', 'supertrend_2_7']
+    pd.testing.assert_index_equal(frame.index, dataframe.index)
+    assert (frame.dtypes == np.int8).all()
+
+    single = supertrend(dataframe, 2, 7)
+    np.testing.assert_array_equal(single['ST'].to_numpy(), bands.get(2, 7)[0])
+    np.testing.assert_array_equal(single['STX'].to_numpy(), bands.get(2, 7)[1])
+
+
+def test_period_longer_than_the_frame_stays_undefined():
+    bands = supertrend_batch(candles(10, 0), [(3, 10), (3, 21)])
+    assert not bands.st.any() and not bands.trend.any()
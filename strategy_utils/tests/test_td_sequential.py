@@ -0,0 +1,105 @@
+"""
+``td_sequential`` and ``TDSequentialTracker`` against the ``iterrows`` loop TDSequentialStrategy
+and NostalgiaForInfinityNext_ChangeToTower_V6 used before (kept below as it was).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from strategy_utils.td_sequential import TDSequentialTracker, td_sequential
+
+COLUMNS = ['seq_buy', 'seq_sell', 'exceed_low', 'exceed_high']
+
+
+def reference_td(dataframe: DataFrame) -> DataFrame:
+    dataframe['exceed_high'] = False
+    dataframe['exceed_low'] = False
+
+    # count consecutive closes “lower” than the close 4 bars prior.
+    dataframe['seq_buy'] = dataframe['close'] < dataframe['close'].shift(4)
+    dataframe['seq_buy'] = dataframe['seq_buy'] * (dataframe['seq_buy'].groupby(
+        (dataframe['seq_buy'] != dataframe['seq_buy'].shift()).cumsum()).cumcount() + 1)
+
+    # count consecutive closes “higher” than the close 4 bars prior.
+    dataframe['seq_sell'] = dataframe['close'] > dataframe['close'].shift(4)
+    dataframe['seq_sell'] = dataframe['seq_sell'] * (dataframe['seq_sell'].groupby(
+        (dataframe['seq_sell'] != dataframe['seq_sell'].shift()).cumsum()).cumcount() + 1)
+
+    for index, row in dataframe.iterrows():
+        # check if the low of bars 6 and 7 in the count are exceeded by the low of bars 8 or 9.
+        seq_b = row['seq_buy']
+        if seq_b == 8:
+            dataframe.loc[index, 'exceed_low'] = (row['low'] < dataframe.loc[index - 2, 'low']) | \
+                                (row['low'] < dataframe.loc[index - 1, 'low'])
+        if seq_b > 8:
+            dataframe.loc[index, 'exceed_low'] = (row['low'] < dataframe.loc[index - 3 - (seq_b - 9), 'low']) | \
+                                (row['low'] < dataframe.loc[index - 2 - (seq_b - 9), 'low'])
+            if seq_b == 9:
+                dataframe.loc[index, 'exceed_low'] = row['exceed_low'] | dataframe.loc[index-1, 'exceed_low']
+
+        # check if the high of bars 6 and 7 in the count are exceeded by the high of bars 8 or 9.
+        seq_s = row['seq_sell']
+        if seq_s == 8:
+            dataframe.loc[index, 'exceed_high'] = (row['high'] > dataframe.loc[index - 2, 'high']) | \
+                                (row['high'] > dataframe.loc[index - 1, 'high'])
+        if seq_s > 8:
+            dataframe.loc[index, 'exceed_high'] = (row['high'] > dataframe.loc[index - 3 - (seq_s - 9), 'high']) | \
+                                (row['high'] > dataframe.loc[index - 2 - (seq_s - 9), 'high'])
+            if seq_s == 9:
+                dataframe.loc[index, 'exceed_high'] = row['exceed_high'] | dataframe.loc[index-1, 'exceed_high']
+    return dataframe
+
+
+def random_candles(n: int, seed: int) -> DataFrame:
+    """Trending random walk on a 0.1 tick (long setups, equal lows and highs)."""
+    rng = np.random.default_rng(seed)
+    drift = np.repeat(rng.choice([-0.06, 0.06], size=n // 40 + 1), 40)[:n]
+    close = 100 + np.round(np.cumsum(rng.choice([-0.1, 0.0, 0.1], size=n) + drift), 1)
+    spread = rng.choice([0.0, 0.1, 0.2], size=(2, n))
+    return DataFrame({
+        'date': pd.date_range('2021-01-01', periods=n, freq='5min', tz='UTC'),
+        'close': close, 'low': close - spread[0], 'high': close + spread[1],
+    })
+
+
+@pytest.mark.parametrize('n', [1, 5, 9, 30, 2000])
+@pytest.mark.parametrize('seed', range(4))
+def test_td_sequential_matches_the_loop(n, seed):
+    candles = random_candles(n, seed)
+    expected = reference_td(candles.copy())
+
+    result = td_sequential(candles)
+
+    for column in COLUMNS:
+        np.testing.assert_array_equal(result[column].to_numpy(), expected[column].to_numpy().astype(result[column].dtype),
+                                      err_msg=column)
+
+
+def test_bar_9_takes_the_bar_8_perfection():
+    # Lows fall for 12 bars, bar 8 above bars 6 and 7, bar 9 below them
+    close = np.r_[np.full(4, 100.0), 99.0 - np.arange(12)]
+    low = close - 0.5
+    low[4 + 7] = low[4 + 5] + 1
+    candles = DataFrame({'close': close, 'low': low, 'high': close + 0.5})
+    expected = reference_td(candles.copy())
+
+    result = td_sequential(candles)
+
+    bar9 = int(np.flatnonzero(result['seq_buy'].to_numpy() == 9)[0])
+    assert not result['exceed_low'][bar9 - 1] and not result['exceed_low'][bar9]
+    np.testing.assert_array_equal(result['exceed_low'].to_numpy(), expected['exceed_low'].to_numpy().astype(bool))
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_tracker_matches_the_loop_on_a_growing_frame(seed):
+    candles = random_candles(600, seed)
+    expected = reference_td(candles.copy())
+    tracker = TDSequentialTracker()
+
+    for end in [300, 301, 302, 350, 351, 600]:
+        result = tracker.update('ETH/USDT', candles.iloc[:end])
+        for column in COLUMNS:
+            np.testing.assert_array_equal(result[column].to_numpy(),
+                                          expected[column].to_numpy()[:end].astype(result[column].dtype),
+                                          err_msg=f'{column} up to {end}')
@@ -0,0 +1,196 @@
+"""
+``TradeSnapshot.trade_data`` against the per-pair ``populate_trades`` and ``get_current_price``
+of Schism2 (kept below as they were, but for the database queries and the clock, which the
+fakes below stand in for).
+"""
+from datetime import datetime, timedelta, timezone
+from statistics import mean
+
+import pytest
+
+from strategy_utils.trade_snapshot import TradeSnapshot, current_rates
+
+NOW = datetime(2021, 6, 1, 12, 0, 30, tzinfo=timezone.utc)
+
+
+class FakeTrade:
+    def __init__(self, pair: str, open_rate: float, minutes: int, max_rate: float = None, timeframe: int = 5):
+        self.pair = pair
+        self.open_rate = open_rate
+        # freqtrade keeps naive UTC dates
+        self.open_date = (NOW - timedelta(minutes=minutes)).replace(tzinfo=None)
+        self.max_rate = max_rate or open_rate
+        self.min_rate = open_rate
+        self.timeframe = timeframe
+
+    def adjust_min_max_rates(self, current_price: float) -> None:
+        self.max_rate = max(current_price, self.max_rate)
+        self.min_rate = min(current_price, self.min_rate)
+
+    def calc_profit_ratio(self, rate: float) -> float:
+        return rate / self.open_rate - 1 - 0.002
+
+
+class FakeDataProvider:
+    def __init__(self, rates: dict):
+        self.rates = rates
+        self.calls = []
+
+    def ticker(self, pair):
+        self.calls.append(pair)
+        return {'last': self.rates[pair]}
+
+    def orderbook(self, pair, maximum):
+        self.calls.append(pair)
+        return {'bids': [[self.rates[pair] * 0.999, 1]], 'asks': [[self.rates[pair] * 1.001, 1]]}
+
+
+class LegacySchism2:
+    def __init__(self, trades, rates, config):
+        self.trades = trades
+        self.dp = FakeDataProvider(rates)
+        self.config = config
+        self.custom_trade_info = {}
+        self.custom_current_price_cache = {}
+
+    def get_trades(self, pair, same):
+        # Trade.get_trades([Trade.pair == pair / != pair, Trade.is_open.is_(True)]).all()
+        return [trade for trade in self.trades if (trade.pair == pair) == same]
+
+    def populate_trades(self, pair: str) -> dict:
+        # Initialize the trades dict if it doesn't exist, persist it otherwise
+        if not pair in self.custom_trade_info:
+            self.custom_trade_info[pair] = {}
+
+        # init the temp dicts and set the trade stuff to false
+        trade_data = {}
+        trade_data['active_trade'] = trade_data['other_trades'] = trade_data['biggest_loser'] = False
+
+        # find out if we have an open trade for this pair
+        active_trade = self.get_trades(pair, True)
+
+        # if so, get some information
+        if active_trade:
+            # get current price and update the min/max rate
+            current_rate = self.get_current_price(pair, True)
+            active_trade[0].adjust_min_max_rates(current_rate)
+
+            # get how long the trade has been open in minutes and candles
+            present = NOW
+            trade_start  = active_trade[0].open_date.replace(tzinfo=timezone.utc)
+            open_minutes = (present - trade_start).total_seconds() // 60  # floor
+
+            # set up the things we use in the strategy
+            trade_data['active_trade']   = True
+            trade_data['current_profit'] = active_trade[0].calc_profit_ratio(current_rate)
+            trade_data['peak_profit']    = max(0, active_trade[0].calc_profit_ratio(active_trade[0].max_rate))
+            trade_data['open_minutes']   : int = open_minutes
+            trade_data['open_candles']   : int = (open_minutes // active_trade[0].timeframe) # floor
+        else:
+            trade_data['current_profit'] = trade_data['peak_profit']  = 0.0
+            trade_data['open_minutes']   = trade_data['open_candles'] = 0
+
+        # if there are open trades not including the current pair, get some information
+        other_trades = self.get_trades(pair, False)
+
+        if other_trades:
+            trade_data['other_trades'] = True
+            other_profit = tuple(trade.calc_profit_ratio(self.get_current_price(trade.pair, False)) for trade in other_trades)
+            trade_data['avg_other_profit'] = mean(other_profit)
+            # find which of our trades is the biggest loser
+            if trade_data['current_profit'] < min(other_profit):
+                trade_data['biggest_loser'] = True
+        else:
+            trade_data['avg_other_profit'] = 0
+
+        # get the number of free trade slots, storing in every pairs dict due to laziness
+        open_trades = len(self.trades)
+        trade_data['free_slots'] = max(0, self.config['max_open_trades'] - open_trades)
+
+        return trade_data
+
+    def get_current_price(self, pair: str, refresh: bool) -> float:
+        if not refresh:
+            rate = self.custom_current_price_cache.get(pair)
+            # Check if cache has been invalidated
+            if rate:
+                return rate
+
+        ask_strategy = self.config.get('ask_strategy', {})
+        if ask_strategy.get('use_order_book', False):
+            ob = self.dp.orderbook(pair, 1)
+            rate = ob[f"{ask_strategy['price_side']}s"][0][0]
+        else:
+            ticker = self.dp.ticker(pair)
+            rate = ticker['last']
+
+        self.custom_current_price_cache[pair] = rate
+        return rate
+
+
+RATES = {'BTC/USDT': 101.0, 'ETH/USDT': 95.0, 'XRP/USDT': 1.2, 'ADA/USDT': 2.0, 'DOT/USDT': 30.0}
+
+
+def open_trades(*pairs) -> list:
+    trades = {
+        'BTC/USDT': lambda: FakeTrade('BTC/USDT', 100.0, 125, max_rate=104.0),
+        'ETH/USDT': lambda: FakeTrade('ETH/USDT', 100.0, 61, timeframe=15),
+        'XRP/USDT': lambda: FakeTrade('XRP/USDT', 1.0, 3000),
+        'ADA/USDT': lambda: FakeTrade('ADA/USDT', 2.1, 0),
+    }
+    return [trades[pair]() for pair in pairs]
+
+
+def assert_same_data(data: dict, expected: dict):
+    assert data.keys() == expected.keys()
+    for key, value in expected.items():
+        assert data[key] == pytest.approx(value, rel=1e-15, abs=0) and type(data[key]) == type(value), key
+
+
+@pytest.mark.parametrize('config', [
+    {'max_open_trades': 3},
+    {'max_open_trades': 5, 'ask_strategy': {'use_order_book': True, 'price_side': 'ask'}},
+])
+@pytest.mark.parametrize('pairs', [
+    (), ('BTC/USDT',), ('ETH/USDT',), ('BTC/USDT', 'ETH/USDT'), ('XRP/USDT', 'ADA/USDT'),
+    ('BTC/USDT', 'ETH/USDT', 'XRP/USDT', 'ADA/USDT'),
+], ids=['no-trade', 'one-winner', 'one-loser', 'two', 'loser-and-winner', 'more-than-slots'])
+def test_trade_data_matches_populate_trades(config, pairs):
+    snapshot = TradeSnapshot.take(FakeDataProvider(RATES), config, open_trades(*pairs), NOW)
+    for pair in RATES:
+        expected = LegacySchism2(open_trades(*pairs), RATES, config).populate_trades(pair)
+        assert_same_data(snapshot.trade_data(pair), expected)
+
+
+def test_own_trade_is_left_out_of_the_other_trades():
+    snapshot = TradeSnapshot.take(FakeDataProvider(RATES), {'max_open_trades': 4},
+                                  open_trades('BTC/USDT', 'ETH/USDT', 'XRP/USDT'), NOW)
+    profits = snapshot.profits
+    # XRP is the winner: not the biggest loser, the average is over BTC and ETH only
+    xrp = snapshot.trade_data('XRP/USDT')
+    assert xrp['avg_other_profit'] == mean([profits['BTC/USDT'], profits['ETH/USDT']])
+    assert not xrp['biggest_loser'] and xrp['free_slots'] == 1
+    # ETH is the biggest loser among the three
+    eth = snapshot.trade_data('ETH/USDT')
+    assert eth['biggest_loser'] and eth['avg_other_profit'] == mean([profits['BTC/USDT'], profits['XRP/USDT']])
+    # A pair without a trade compares its 0 profit with every open trade
+    ada = snapshot.trade_data('ADA/USDT')
+    assert not ada['active_trade'] and ada['other_trades'] and not ada['biggest_loser']
+    assert ada['avg_other_profit'] == mean(profits.values())
+    alone = TradeSnapshot.take(FakeDataProvider(RATES), {'max_open_trades': 4}, open_trades('XRP/USDT'), NOW)
+    assert alone.trade_data('ADA/USDT')['biggest_loser'] and not alone.trade_data('XRP/USDT')['other_trades']
+
+
+def test_take_prices_every_open_trade_once():
+    dp = FakeDataProvider(RATES)
+    trades = open_trades('BTC/USDT', 'ETH/USDT')
+    snapshot = TradeSnapshot.take(dp, {'max_open_trades': 1}, trades, NOW)
+    assert sorted(dp.calls) == ['BTC/USDT', 'ETH/USDT']
+    assert snapshot.rates == {'BTC/USDT': 101.0, 'ETH/USDT': 95.0}
+    assert snapshot.free_slots == 0
+    # The min/max rates move with the snapshot's rate
+    assert trades[0].max_rate == 104.0 and trades[1].min_rate == 95.0
+
+    empty = TradeSnapshot.take(dp, {'max_open_trades': 2}, [], NOW)
+    assert empty.avg_profit == 0 and empty.min_profit is None and empty.free_slots == 2
+    assert current_rates(dp, ['BTC/USDT', 'BTC/USDT'], {}) == {'BTC/USDT': 101.0}
@@ -0,0 +1,92 @@
+"""
+Open trade snapshot, taken once per bot loop.
+
+The Schism family, Stinkfist and SuperHV27 describe the open trades to their indicators
+(``populate_trades``): is there a trade on this pair, its profit and age, the average
+profit of the other trades, whether this pair is the biggest loser, the free slots. Built
+per pair, that is three database queries and a price lookup per other open trade for every
+pair of the whitelist on every loop.
+
+``TradeSnapshot.take`` reads the open trades once, fetches the rate of each of them once
+and keeps the profits and the aggregates over all open trades, so ``trade_data`` only has
+to take the pair's own trade out of them.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from statistics import mean
+from typing import Dict, Iterable, List, Mapping, Optional
+
+
+def current_rates(dp, pairs: Iterable[str], config: Mapping) -> Dict[str, float]:
+    """Current rate of every pair, like the strategies' ``get_current_price``."""
+    # One public DataProvider lookup per open trade and loop: the DataProvider has no
+    # accessor for all tickers at once, and open trades are few
+    pairs = list(dict.fromkeys(pairs))
+    ask_strategy = config.get('ask_strategy', {})
+    if ask_strategy.get('use_order_book', False):
+        side = f"{ask_strategy['price_side']}s"
+        return {pair: dp.orderbook(pair, 1)[side][0][0] for pair in pairs}
+    return {pair: dp.ticker(pair)['last'] for pair in pairs}
+
+
+@dataclass
+class TradeSnapshot:
+    """Open trades by pair with their current rate and profit, and the free trade slots."""
+    trades: Dict[str, object] = field(default_factory=dict)
+    rates: Dict[str, float] = field(default_factory=dict)
+    profits: Dict[str, float] = field(default_factory=dict)
+    free_slots: int = 0
+    taken_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def __post_init__(self):
+        # Aggregates over every open trade, the "other trades" of the pairs without one
+        self._all_profits = tuple(self.profits.values())
+        self.avg_profit = mean(self._all_profits) if self._all_profits else 0
+        self.min_profit = min(self._all_profits) if self._all_profits else None
+
+    @classmethod
+    def take(cls, dp, config: Mapping, open_trades: List, now: Optional[datetime] = None) -> 'TradeSnapshot':
+        """Snapshot of ``open_trades`` (``Trade.get_open_trades()``), updating their min/max rates."""
+        trades = {trade.pair: trade for trade in open_trades}
+        rates = current_rates(dp, trades, config)
+        profits = {}
+        for pair, trade in trades.items():
+            trade.adjust_min_max_rates(rates[pair])
+            profits[pair] = trade.calc_profit_ratio(rates[pair])
+        return cls(trades, rates, profits, max(0, config['max_open_trades'] - len(open_trades)),
+                   now or datetime.now(timezone.utc))
+
+    def trade_data(self, pair: str) -> dict:
+        """The ``populate_trades`` dict of ``pair`` in live and dry runs."""
+        data = {'active_trade': False, 'other_trades': False, 'biggest_loser': False}
+        trade = self.trades.get(pair)
+        if trade is not None:
+            open_date = trade.open_date
+            if open_date.tzinfo is None:
+                open_date = open_date.replace(tzinfo=timezone.utc)
+            open_minutes = (self.taken_at - open_date).total_seconds() // 60
+            data['active_trade'] = True
+            data['current_profit'] = self.profits[pair]
+            data['peak_profit'] = max(0, trade.calc_profit_ratio(trade.max_rate))
+            data['open_minutes'] = open_minutes
+            data['open_candles'] = open_minutes // trade.timeframe
+        else:
+            data['current_profit'] = data['peak_profit'] = 0.0
+            data['open_minutes'] = data['open_candles'] = 0
+
+        if trade is None:
+            # The other trades are all of them
+            other_profit, avg_other, min_other = self._all_profits, self.avg_profit, self.min_profit
+        else:
+            other_profit = tuple(profit for other, profit in self.profits.items() if other != pair)
+            avg_other = mean(other_profit) if other_profit else 0
+            min_other = min(other_profit) if other_profit else None
+        if other_profit:
+            data['other_trades'] = True
+            data['avg_other_profit'] = avg_other
+            if data['current_profit'] < min_other:
+                data['biggest_loser'] = True
+        else:
+            data['avg_other_profit'] = 0
+        data['free_slots'] = self.free_slots
+        return data